@@ -0,0 +1,302 @@
+"""CLI batch and merge commands for analyzing many repositories."""
+
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+import click
+
+from ..metrics.batch_runner import BatchQueue, BatchRunner, PipelineLimits, load_repository_list
+from ..metrics.job_queue import JobQueue, JobQueueError
+from ..metrics.jvm_daemons import JvmDaemonPool
+from ..metrics.leaderboard import (
+    load_shard_summaries,
+    merge_summaries,
+    write_leaderboard,
+    write_shard_summary,
+)
+from ..metrics.models.batch_job import JobState
+from ..metrics.package_cache import PackageCache
+from ..metrics.runtime_history import TOOL_HISTORY_ENV, RuntimeHistory
+from ..metrics.sandbox import CGROUP_ROOT_ENV, ToolSandbox, limits_from_options
+from ..metrics.shared_queue import (
+    SharedDirectoryQueue,
+    default_node_id,
+    parse_shard_spec,
+    shard_for_repository,
+)
+from ..metrics.workspace_pool import WorkspacePool
+
+
+def _parse_shard_option(ctx: click.Context, param: click.Parameter,
+                        value: str | None) -> tuple[int, int] | None:
+    """Click callback turning ``i/N`` into a 0-based (index, total) tuple."""
+    if value is None:
+        return None
+    try:
+        return parse_shard_spec(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+
+
+@click.command()
+@click.argument('repos_file', required=False, type=click.Path(exists=True, path_type=Path))
+@click.option('--queue-db', default='./output/batch_queue.db',
+              help='SQLite job queue file (reused to resume an interrupted batch)')
+@click.option('--output-dir', default='./output', help='Root directory for per-repository outputs')
+@click.option('--format', 'output_format', default='both',
+              type=click.Choice(['json', 'markdown', 'both']),
+              help='Output format')
+@click.option('--workers', default=1, type=click.IntRange(min=1),
+              help='Concurrent analysis workers (CPU-bound stage)')
+@click.option('--clone-workers', default=2, type=click.IntRange(min=1), help='Concurrent git clones')
+@click.option('--llm-workers', default=1, type=click.IntRange(min=1), help='Concurrent LLM report generations')
+@click.option('--prefetch', default=2, type=click.IntRange(min=1),
+              help='Repositories cloned ahead of the analysis workers')
+@click.option('--max-checkouts', default=4, type=click.IntRange(min=1),
+              help='Maximum repository checkouts on disk at once')
+@click.option('--min-free-disk-mb', default=1024, type=click.IntRange(min=0),
+              help='Pause new clones while free space on the checkout disk is below this')
+@click.option('--workspace-root', type=click.Path(file_okay=False, path_type=Path), default=None,
+              help='Keep checkouts in a reusable workspace pool under this directory (e.g. tmpfs)')
+@click.option('--workspace-pool-size', type=click.IntRange(min=1), default=None,
+              help='Workspaces in the pool (default: --max-checkouts)')
+@click.option('--workspace-quota-mb', type=click.FloatRange(min=1), default=None,
+              help='Fail repositories whose checkout exceeds this size')
+@click.option('--advisory-db', type=click.Path(exists=True), envvar='CODE_SCORE_ADVISORY_DB', default=None,
+              help='Audit dependencies offline against this OSV advisory snapshot (directory, .zip or .json)')
+@click.option('--jvm-daemons/--no-jvm-daemons', default=True,
+              help='Run Java builds through warm Gradle/Maven (mvnd) daemons with shared caches')
+@click.option('--jvm-cache-dir', type=click.Path(file_okay=False, path_type=Path), default=None,
+              help='Shared Maven repository and Gradle user home for --jvm-daemons')
+@click.option('--package-cache', 'package_cache_dir', type=click.Path(file_okay=False, path_type=Path), default=None,
+              help='Share npm/yarn/uv/pip/Go/Maven/Gradle caches of all builds under this directory')
+@click.option('--package-cache-max-mb', type=click.FloatRange(min=1), default=None,
+              help='Evict least recently used --package-cache entries above this size')
+@click.option('--offline', is_flag=True, default=False,
+              help='Build only from --package-cache contents, without downloading packages')
+@click.option('--tool-limit', 'tool_limits', multiple=True, metavar='CLASS.FIELD=VALUE',
+              help='Override a tool resource limit, e.g. build.memory_mb=4096 or lint.cpu_seconds=none '
+                   '(classes: lint, audit, build, jvm; fields: cpu_seconds, memory_mb, max_processes, '
+                   'address_space_mb, user_processes; memory_mb and max_processes need --cgroup-root)')
+@click.option('--cgroup-root', type=click.Path(exists=True, file_okay=False), envvar=CGROUP_ROOT_ENV, default=None,
+              help='Delegated cgroup v2 directory; each tool runs in its own child cgroup')
+@click.option('--tool-history', type=click.Path(dir_okay=False, path_type=Path), envvar=TOOL_HISTORY_ENV,
+              default=None, help='Tool runtime history used to budget stages (default: next to --queue-db, or in the '
+                   'temp directory with --shared-dir)')
+@click.option('--adaptive-timeouts/--fixed-timeouts', default=True,
+              help='Budget lint/audit/build stages from predicted runtimes instead of a fixed per-tool timeout')
+@click.option('--timeout', type=click.IntRange(min=1), default=None,
+              help='Per-repository timeout in seconds (default: 300 for new jobs)')
+@click.option('--retry-failed', is_flag=True, default=False,
+              help='Return failed jobs to the queue (with --timeout, using the new timeout)')
+@click.option('--shard', callback=_parse_shard_option, default=None, metavar='i/N',
+              help='Process shard i of N (1-based), assigned by hash of the repository URL')
+@click.option('--shared-dir', type=click.Path(file_okay=False, path_type=Path), default=None,
+              help='Shared directory for multi-node runs (lease-based claims, outputs and summaries)')
+@click.option('--node-id', default=None, help='Node name for --shared-dir, unique among running batches; reuse it after a crash '
+                   'to resume the jobs it held (default: hostname-pid-random)')
+@click.option('--lease-seconds', default=600.0, type=click.FloatRange(min=0.1),
+              help='Lease duration for --shared-dir claims before other nodes may take over')
+@click.option('--work-stealing/--no-work-stealing', default=True,
+              help='With --shared-dir, take jobs from other shards once the own shard is done')
+@click.option('--enable-checklist', type=bool, default=True, help='Enable checklist evaluation (default: enabled)')
+@click.option('--checklist-config', help='Path to checklist configuration YAML file')
+@click.option('--generate-llm-report', is_flag=True, default=False, help='Generate LLM reports using Gemini')
+@click.option('--llm-template', help='Path to custom LLM prompt template')
+@click.option('--status', 'show_status', is_flag=True, default=False, help='Show queue status and exit')
+@click.option('--verbose', is_flag=True, help='Enable verbose logging')
+def batch(repos_file: Path | None, queue_db: str, output_dir: str, output_format: str,
+          workers: int, clone_workers: int, llm_workers: int, prefetch: int, max_checkouts: int,
+          min_free_disk_mb: int, workspace_root: Path | None, workspace_pool_size: int | None,
+          workspace_quota_mb: float | None, advisory_db: str | None, jvm_daemons: bool,
+          jvm_cache_dir: Path | None, package_cache_dir: Path | None, package_cache_max_mb: float | None,
+          offline: bool, tool_limits: tuple[str, ...], cgroup_root: str | None,
+          tool_history: Path | None, adaptive_timeouts: bool, timeout: int | None, retry_failed: bool, shard: tuple[int, int] | None,
+          shared_dir: Path | None, node_id: str | None, lease_seconds: float, work_stealing: bool,
+          enable_checklist: bool, checklist_config: str | None, generate_llm_report: bool,
+          llm_template: str | None, show_status: bool, verbose: bool) -> None:
+    """
+    Analyze many repositories with a crash-safe job queue.
+
+    REPOS_FILE: Optional file with one repository URL per line, optionally
+    followed by a commit SHA. Omit it to resume the jobs already queued.
+
+    Examples:
+        # Start (or resume) a batch, cloning up to 3 repositories ahead
+        code-score batch repos.txt --workers 4 --prefetch 3
+
+        # Retry only the failed jobs with a longer timeout
+        code-score batch --retry-failed --timeout 900
+
+        # Reuse checkouts from a tmpfs workspace pool across runs
+        code-score batch repos.txt --workspace-root /dev/shm/code-score
+
+        # Air-gapped nodes: audit dependencies against a local OSV export
+        code-score batch repos.txt --advisory-db /srv/osv/all.zip
+
+        # Download each package version once for the whole batch
+        code-score batch repos.txt --package-cache /var/cache/code-score --package-cache-max-mb 20000
+
+        # Inspect progress
+        code-score batch --status
+
+        # Node 2 of 3 sharing an NFS directory, then merge shard summaries
+        code-score batch repos.txt --shared-dir /mnt/judging --shard 2/3
+        code-score merge /mnt/judging/summaries --output-dir ./leaderboard
+    """
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format='%(levelname)s - %(name)s - %(message)s',
+        force=True
+    )
+
+    try:
+        queue: BatchQueue
+        if shared_dir is not None:
+            node_id = node_id or default_node_id()
+            queue = SharedDirectoryQueue(
+                shared_dir, node_id=node_id, shard=shard,
+                lease_seconds=lease_seconds, work_stealing=work_stealing
+            )
+            output_root = queue.outputs_dir
+            summary_name = node_id
+            summary_path = queue.summaries_dir / f"{node_id}.json"
+            # SQLite should not live on the shared (network) filesystem
+            default_history = Path(tempfile.gettempdir()) / "code_score_tool_history.db"
+        else:
+            queue = JobQueue(queue_db)
+            output_root = Path(output_dir)
+            summary_name = f"shard-{shard[0] + 1}-of-{shard[1]}" if shard else "batch"
+            summary_path = output_root / "summaries" / f"{summary_name}.json"
+            default_history = Path(queue_db).parent / "tool_history.db"
+
+        if show_status:
+            _echo_counts(queue.get_counts())
+            for job in queue.list_jobs(JobState.FAILED):
+                click.echo(f"  ✗ [{job.attempts} attempt(s)] {job.repository_url}: {job.error}")
+            return
+
+        if repos_file is not None:
+            repositories = load_repository_list(repos_file)
+            if shard is not None and shared_dir is None:
+                # Without a shared directory each node only ever sees its own shard
+                repositories = [
+                    repo for repo in repositories
+                    if shard_for_repository(repo[0], shard[1]) == shard[0]
+                ]
+            added = queue.enqueue(repositories, timeout_seconds=timeout or 300)
+            click.echo(f"Queued {added} new job(s) ({len(repositories) - added} already queued)")
+
+        if retry_failed:
+            retried = queue.retry_failed(timeout_seconds=timeout)
+            click.echo(f"Retrying {retried} failed job(s)")
+
+        workspace_pool = None
+        if workspace_root is not None:
+            workspace_pool = WorkspacePool(
+                workspace_root,
+                pool_size=workspace_pool_size or max_checkouts,
+                quota_mb=workspace_quota_mb
+            )
+
+        package_cache = None
+        if package_cache_dir is not None:
+            package_cache = PackageCache(package_cache_dir, max_size_mb=package_cache_max_mb, offline=offline)
+        elif offline or package_cache_max_mb is not None:
+            raise click.UsageError("--offline and --package-cache-max-mb require --package-cache")
+
+        try:
+            tool_sandbox = ToolSandbox(limits_from_options(list(tool_limits)), cgroup_root=cgroup_root)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--tool-limit") from e
+
+        runner = BatchRunner(
+            queue=queue,
+            output_root=output_root,
+            enable_checklist=enable_checklist,
+            checklist_config=checklist_config,
+            generate_llm_report=generate_llm_report,
+            llm_template=llm_template,
+            output_format=output_format,
+            limits=PipelineLimits(
+                clone_workers=clone_workers,
+                analyze_workers=workers,
+                llm_workers=llm_workers,
+                prefetch_depth=prefetch,
+                max_checkouts=max_checkouts,
+                min_free_disk_mb=min_free_disk_mb
+            ),
+            workspace_pool=workspace_pool,
+            advisory_db=advisory_db,
+            jvm_daemons=JvmDaemonPool(jvm_cache_dir or package_cache_dir, pool_size=workers,
+                                      offline=offline) if jvm_daemons else None,
+            package_cache=package_cache,
+            tool_sandbox=tool_sandbox,
+            tool_history=RuntimeHistory(tool_history or default_history) if adaptive_timeouts else None
+        )
+        try:
+            counts = runner.run(verbose=verbose)
+        finally:
+            if isinstance(queue, SharedDirectoryQueue):
+                queue.close()
+
+        finished = [
+            job for job in queue.list_jobs()
+            if job.state in (JobState.DONE, JobState.FAILED)
+            and (shared_dir is None or (job.worker_id or "").startswith(f"{node_id}/"))
+        ]
+        write_shard_summary(finished, summary_path, summary_name)
+
+    except KeyboardInterrupt:
+        click.echo("\nBatch interrupted; rerun the same command to resume", err=True)
+        sys.exit(130)
+    except JobQueueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    click.echo("Batch completed!")
+    _echo_counts(counts)
+    cache_report = runner.stats.get("package_cache")
+    if cache_report and cache_report["builds"]:
+        click.echo(f"Package cache: {cache_report['hit_rate']:.0%} of {cache_report['builds']} build(s) "
+                   f"fully cached, {cache_report['bytes_downloaded'] / (1024 * 1024):.1f} MB downloaded, "
+                   f"{cache_report['size_mb']:.1f} MB on disk")
+    daemon_report = runner.stats.get("jvm_daemons")
+    if daemon_report and daemon_report["builds"]:
+        click.echo(f"JVM daemons: {daemon_report['builds']} build(s), {daemon_report['reuse_rate']:.0%} on warm daemons, "
+                   f"~{daemon_report['estimated_seconds_saved']:.0f}s startup saved")
+    click.echo(f"Shard summary: {summary_path}")
+    if counts[JobState.FAILED.value]:
+        sys.exit(1)
+
+
+@click.command()
+@click.argument('summaries', nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
+@click.option('--output-dir', default='./output', help='Directory for leaderboard.json and leaderboard.md')
+def merge(summaries: tuple[Path, ...], output_dir: str) -> None:
+    """
+    Merge batch shard summaries into one leaderboard.
+
+    SUMMARIES: Shard summary files, or directories containing them.
+
+    Example:
+        code-score merge /mnt/judging/summaries --output-dir ./leaderboard
+    """
+    loaded = load_shard_summaries(list(summaries))
+    if not loaded:
+        click.echo("Error: No shard summaries found", err=True)
+        sys.exit(1)
+
+    entries = merge_summaries(loaded)
+    for file_path in write_leaderboard(entries, output_dir):
+        click.echo(f"  - {file_path}")
+    click.echo(f"Merged {len(loaded)} shard summary file(s), {len(entries)} repositories")
+
+
+def _echo_counts(counts: dict[str, int]) -> None:
+    """Print job counts by state."""
+    click.echo("Job status:")
+    for state, count in counts.items():
+        click.echo(f"  {state}: {count}")
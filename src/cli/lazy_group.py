@@ -0,0 +1,53 @@
+"""Click group that imports subcommand modules only when they are used."""
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """A click group whose subcommands are loaded on first use.
+
+    ``lazy_subcommands`` maps a command name to ``(import_path, short_help)``
+    where ``import_path`` is ``"module:attribute"`` (relative module names
+    are resolved against ``package``). The short help is shown by ``--help``
+    so listing commands does not import them.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, tuple[str, str]] | None = None,
+                 package: str | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self.package = package
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List commands using the registered short help for unloaded ones."""
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_subcommands and name not in self.commands:
+                rows.append((name, self.lazy_subcommands[name][1]))
+                continue
+            command = self.get_command(ctx, name)
+            if command is None or command.hidden:
+                continue
+            rows.append((name, command.get_short_help_str(formatter.width)))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        import_path = self.lazy_subcommands[cmd_name][0]
+        module_name, attribute = import_path.split(":")
+        command = getattr(importlib.import_module(module_name, self.package), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy command {import_path} is not a click command")
+        return command
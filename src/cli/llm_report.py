@@ -7,10 +7,15 @@ human-readable evaluation reports from score_input.json files.
 
 import logging
 import sys
+from pathlib import Path
 
 import click
 
+from ..llm.batch_reports import BatchReportGenerator, ReportJob
+from ..llm.providers import LLM_API_FORMAT_ENV, LLM_ENDPOINT_ENV
+from ..llm.rate_limiter import RetryPolicy, TokenBucketLimiter
 from ..llm.report_generator import LLMProviderError, ReportGenerator, ReportGeneratorError
+from ..llm.response_cache import LLM_CACHE_ENV, LLMResponseCache
 from ..llm.template_loader import TemplateLoaderError
 
 # Configure logging
@@ -43,13 +48,32 @@ logger = logging.getLogger(__name__)
 @click.option('--validate-only',
               is_flag=True,
               help='Validate inputs and prerequisites without generating report')
+@click.option('--max-prompt-tokens',
+              type=click.IntRange(min=500),
+              help='Token budget of the prompt; lowest-value evidence is left out to fit (default: 8000)')
+@click.option('--llm-cache',
+              type=click.Path(file_okay=False),
+              envvar=LLM_CACHE_ENV,
+              help='Reuse responses to identical prompts cached in this directory')
+@click.option('--llm-endpoint',
+              envvar=LLM_ENDPOINT_ENV,
+              help='Call this Gemini or OpenAI-compatible HTTP API instead of the provider CLI')
+@click.option('--llm-api-format',
+              type=click.Choice(['gemini', 'openai']),
+              default='gemini',
+              envvar=LLM_API_FORMAT_ENV,
+              help='Request format of --llm-endpoint (default: gemini)')
 def main(score_input_path: str,
          prompt: str | None,
          output: str,
          provider: str,
          verbose: bool,
          timeout: int | None,
-         validate_only: bool):
+         validate_only: bool,
+         max_prompt_tokens: int | None,
+         llm_cache: str | None,
+         llm_endpoint: str | None,
+         llm_api_format: str):
     """
     Generate human-readable evaluation reports from code quality analysis data.
 
@@ -71,6 +95,14 @@ def main(score_input_path: str,
       # Use custom timeout
       uv run python -m src.cli.llm_report output/score_input.json \\
         --timeout 60
+
+      # Reuse the response when the prompt has not changed
+      uv run python -m src.cli.llm_report output/score_input.json \\
+        --llm-cache .cache/llm
+
+      # Call an OpenAI-compatible HTTP API instead of the Gemini CLI
+      uv run python -m src.cli.llm_report output/score_input.json \\
+        --llm-endpoint http://localhost:8000/v1 --llm-api-format openai
     """
     try:
         # Validate argument combinations
@@ -93,7 +125,11 @@ def main(score_input_path: str,
         logger.info("🤖 Code Score LLM Report Generator")
         logger.info(f"📊 Processing: {score_input_path}")
 
-        generator = ReportGenerator()
+        generator = ReportGenerator(response_cache=LLMResponseCache(llm_cache) if llm_cache else None,
+                                    api_base_url=llm_endpoint,
+                                    api_format=llm_api_format)
+        if max_prompt_tokens:
+            generator.prompt_builder.set_context_limits({'max_prompt_tokens': max_prompt_tokens})
 
         # Handle validation-only mode
         if validate_only:
@@ -165,6 +201,134 @@ def main(score_input_path: str,
         sys.exit(99)
 
 
+@click.command(name='llm-batch')
+@click.argument('paths', nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
+@click.option('--prompt', '--template',
+              type=click.Path(exists=True, dir_okay=False),
+              help='Path to custom prompt template file (default: specs/prompts/llm_report.md)')
+@click.option('--provider',
+              type=click.Choice(['gemini'], case_sensitive=False),
+              default='gemini',
+              help='LLM provider (currently only Gemini is supported)')
+@click.option('--output-name', default='final_report.md',
+              help='File name of each report, written next to its score_input.json')
+@click.option('--workers', default=4, type=click.IntRange(min=1), help='Concurrent LLM calls')
+@click.option('--requests-per-minute', type=click.FloatRange(min=0, min_open=True),
+              help='Provider request quota shared by all workers')
+@click.option('--tokens-per-minute', type=click.FloatRange(min=0, min_open=True),
+              help='Provider token quota shared by all workers (prompt and response)')
+@click.option('--max-attempts', default=4, type=click.IntRange(min=1),
+              help='Calls per report when the provider fails transiently (rate limits, timeouts)')
+@click.option('--checkpoint', type=click.Path(dir_okay=False),
+              default='./output/llm_reports_checkpoint.jsonl',
+              help='File recording completed reports; unchanged inputs are skipped on rerun')
+@click.option('--timeout', type=click.IntRange(min=10), help='Override default timeout for LLM calls (seconds)')
+@click.option('--max-prompt-tokens',
+              type=click.IntRange(min=500),
+              help='Token budget of the prompt; lowest-value evidence is left out to fit (default: 8000)')
+@click.option('--llm-cache',
+              type=click.Path(file_okay=False),
+              envvar=LLM_CACHE_ENV,
+              help='Reuse responses to identical prompts cached in this directory')
+@click.option('--llm-endpoint',
+              envvar=LLM_ENDPOINT_ENV,
+              help='Call this Gemini or OpenAI-compatible HTTP API instead of the provider CLI')
+@click.option('--llm-api-format',
+              type=click.Choice(['gemini', 'openai']),
+              default='gemini',
+              envvar=LLM_API_FORMAT_ENV,
+              help='Request format of --llm-endpoint (default: gemini)')
+@click.option('--verbose', '-v', is_flag=True, help='Enable detailed logging')
+def batch_main(paths: tuple[Path, ...],
+               prompt: str | None,
+               provider: str,
+               output_name: str,
+               workers: int,
+               requests_per_minute: float | None,
+               tokens_per_minute: float | None,
+               max_attempts: int,
+               checkpoint: str,
+               timeout: int | None,
+               max_prompt_tokens: int | None,
+               llm_cache: str | None,
+               llm_endpoint: str | None,
+               llm_api_format: str,
+               verbose: bool):
+    """
+    Generate reports for many score_input.json files concurrently.
+
+    \b
+    PATHS: score_input.json files, or directories searched for them
+
+    \b
+    Examples:
+      # Reports for every analyzed repository, within the provider quota
+      uv run python -m src.cli.main llm-batch output/ \\
+        --workers 8 --requests-per-minute 60 --tokens-per-minute 1000000
+    """
+    if verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    jobs = [ReportJob(path, path.with_name(output_name)) for path in _find_score_inputs(paths)]
+    if not jobs:
+        logger.error("❌ No score_input.json files found")
+        sys.exit(1)
+
+    generator = ReportGenerator(response_cache=LLMResponseCache(llm_cache) if llm_cache else None,
+                                show_progress=False,
+                                api_base_url=llm_endpoint,
+                                api_format=llm_api_format)
+    if max_prompt_tokens:
+        generator.prompt_builder.set_context_limits({'max_prompt_tokens': max_prompt_tokens})
+    validation_result = generator.validate_prerequisites(provider)
+    if not validation_result['valid']:
+        logger.error("❌ Prerequisites validation failed:")
+        for issue in validation_result['issues']:
+            logger.error(f"   • {issue}")
+        _print_setup_help(provider)
+        sys.exit(2)
+
+    limiter = None
+    if requests_per_minute or tokens_per_minute:
+        limiter = TokenBucketLimiter(requests_per_minute=requests_per_minute,
+                                     tokens_per_minute=tokens_per_minute)
+    batch = BatchReportGenerator(generator, workers=workers, rate_limiter=limiter,
+                                 retry_policy=RetryPolicy(max_attempts=max_attempts),
+                                 checkpoint_path=checkpoint)
+
+    logger.info(f"🚀 Generating {len(jobs)} reports with {workers} workers")
+    try:
+        summary = batch.run(jobs, template_path=prompt, provider=provider, timeout=timeout)
+    finally:
+        generator.close()
+    _handle_batch_output(summary.to_dict())
+    sys.exit(1 if summary.failed else 0)
+
+
+def _find_score_inputs(paths: tuple[Path, ...]) -> list[Path]:
+    """score_input.json files named directly or found below directories, without duplicates."""
+    found: dict[Path, None] = {}
+    for path in paths:
+        candidates = sorted(path.rglob('score_input.json')) if path.is_dir() else [path]
+        for candidate in candidates:
+            found.setdefault(candidate.resolve(), None)
+    return list(found)
+
+
+def _handle_batch_output(summary: dict) -> None:
+    """Print the outcome of a batch run."""
+    logger.info(f"✅ {summary['completed']} generated, {summary['skipped']} up to date, "
+                f"{len(summary['failed'])} failed in {summary['wall_seconds']:.1f}s")
+    logger.info(f"   • LLM calls: {summary['llm_calls']} ({summary['retries']} retries, "
+                f"{summary['cache_hits']} cache hits)")
+    latency = summary['latency_seconds']
+    if latency['p50'] is not None:
+        logger.info(f"   • Latency: p50 {latency['p50']:.1f}s, p90 {latency['p90']:.1f}s, "
+                    f"p99 {latency['p99']:.1f}s")
+    for path, error in summary['failed'].items():
+        logger.error(f"❌ {path}: {error}")
+
+
 def _handle_validation_only(generator: ReportGenerator,
                            provider: str,
                            template_path: str | None) -> None:
@@ -234,6 +398,16 @@ def _handle_generation_output(result: dict, verbose: bool) -> None:
         logger.info(f"   • Provider: {provider_info['provider_name']}")
         logger.info(f"   • Model: {provider_info['model_name']}")
         logger.info(f"   • Response time: {provider_info['response_time_seconds']:.1f}s")
+        if provider_info.get('time_to_first_byte_seconds') is not None:
+            logger.info(f"   • Time to first byte: {provider_info['time_to_first_byte_seconds']:.1f}s")
+        if provider_info.get('cache_status'):
+            logger.info(f"   • Response cache: {provider_info['cache_status']}")
+
+        budget = result.get('prompt_budget')
+        if budget and budget['dropped']:
+            logger.info(f"\n✂️  Evidence left out of the prompt ({budget['budget_tokens']} token budget):")
+            for label in budget['dropped']:
+                logger.info(f"   • {label}")
 
         logger.info("\n📋 Template Details:")
         logger.info(f"   • Template: {template_info['template_name']}")
@@ -6,24 +6,30 @@ from pathlib import Path
 
 import click
 
-from ..metrics.cleanup import get_cleanup_manager
-from ..metrics.error_handling import ToolchainValidationError, get_error_handler
-from ..metrics.git_operations import GitOperationError, GitOperations
-from ..metrics.language_detection import LanguageDetector
-from ..metrics.output_generators import OutputManager
-from ..metrics.tool_executor import ToolExecutor
-from ..metrics.toolchain_manager import ToolchainManager
+from .lazy_group import LazyGroup
 
 
 def _run_analysis(repository_url: str, commit_sha: str | None, output_dir: str,
                   output_format: str, timeout: int, verbose: bool, log_level: str,
                   skip_toolchain_check: bool, enable_checklist: bool, checklist_config: str | None,
-                  generate_llm_report: bool, llm_template: str | None) -> None:
+                  generate_llm_report: bool, llm_template: str | None,
+                  workspace_root: str | None = None, advisory_db: str | None = None,
+                  llm_cache: str | None = None) -> None:
     """
     Internal function to run code quality analysis.
 
     This is the core implementation called by the CLI commands.
     """
+    # Imported here so `--help`, `version` and the other subcommands start fast
+    from ..metrics.cleanup import get_cleanup_manager
+    from ..metrics.error_handling import ToolchainValidationError, get_error_handler
+    from ..metrics.git_operations import GitOperationError, GitOperations
+    from ..metrics.language_detection import LanguageDetector
+    from ..metrics.output_generators import OutputManager
+    from ..metrics.tool_executor import ToolExecutor
+    from ..metrics.toolchain_manager import ToolchainManager
+    from ..metrics.workspace_pool import WorkspacePool
+
     # Configure logging based on log_level (FR-027)
     # Map log levels: minimal → WARNING, standard → INFO, detailed → DEBUG
     # --verbose flag overrides to detailed for backward compatibility
@@ -58,9 +64,10 @@ def _run_analysis(repository_url: str, commit_sha: str | None, output_dir: str,
                 click.echo(f"Target commit: {commit_sha}")
 
         # Initialize components
-        git_ops = GitOperations(timeout_seconds=timeout)
+        workspace_pool = WorkspacePool(workspace_root) if workspace_root else None
+        git_ops = GitOperations(timeout_seconds=timeout, workspace_pool=workspace_pool)
         language_detector = LanguageDetector()
-        tool_executor = ToolExecutor(timeout_seconds=timeout)
+        tool_executor = ToolExecutor(timeout_seconds=timeout, advisory_db=advisory_db)
         output_manager = OutputManager(output_dir=output_dir)
 
         # Step 1: Clone repository
@@ -82,7 +89,9 @@ def _run_analysis(repository_url: str, commit_sha: str | None, output_dir: str,
             if verbose:
                 click.echo("Detecting primary language...")
 
-            detected_language = language_detector.detect_primary_language(repository.local_path)
+            detected_language = language_detector.detect_primary_language(
+                repository.local_path, repository.commit_sha
+            )
             repository.detected_language = detected_language
 
             if verbose:
@@ -122,7 +131,14 @@ def _run_analysis(repository_url: str, commit_sha: str | None, output_dir: str,
             if verbose:
                 click.echo("Running analysis tools...")
 
-            metrics = tool_executor.execute_tools(detected_language, repository.local_path)
+            # Polyglot repositories: every language above the threshold gets its tools run
+            metrics = tool_executor.execute_tools(
+                detected_language, repository.local_path,
+                languages=language_detector.get_languages_above_threshold(
+                    repository.local_path, commit_sha=repository.commit_sha
+                )
+            )
+            metrics.execution_metadata.workspace = git_ops.workspace_usage(repository)
 
             if verbose:
                 tools_used = metrics.execution_metadata.tools_used
@@ -185,6 +201,7 @@ def _run_analysis(repository_url: str, commit_sha: str | None, output_dir: str,
                         ReportGenerator,
                         ReportGeneratorError,
                     )
+                    from ..llm.response_cache import LLMResponseCache
 
                     # Find score_input.json file
                     score_input_file = None
@@ -195,7 +212,9 @@ def _run_analysis(repository_url: str, commit_sha: str | None, output_dir: str,
 
                     if score_input_file:
                         # Initialize report generator
-                        generator = ReportGenerator()
+                        generator = ReportGenerator(
+                            response_cache=LLMResponseCache(llm_cache) if llm_cache else None
+                        )
 
                         # Validate Gemini prerequisites
                         validation_result = generator.validate_prerequisites('gemini')
@@ -225,7 +244,9 @@ def _run_analysis(repository_url: str, commit_sha: str | None, output_dir: str,
                                 saved_files.append(final_report_path)
                                 if verbose:
                                     metadata = result.get('report_metadata', {})
-                                    click.echo(f"✅ Gemini report generated: {metadata.get('word_count', 0)} words")
+                                    cache_status = result.get('provider_metadata', {}).get('cache_status')
+                                    cached = " (cached response)" if cache_status == "hit" else ""
+                                    click.echo(f"✅ Gemini report generated: {metadata.get('word_count', 0)} words{cached}")
                             else:
                                 if verbose:
                                     click.echo("⚠️  Gemini report generation failed")
@@ -311,10 +332,17 @@ def _run_analysis(repository_url: str, commit_sha: str | None, output_dir: str,
 @click.option('--checklist-config', help='Path to checklist configuration YAML file')
 @click.option('--generate-llm-report', is_flag=True, default=False, help='Generate human-readable LLM report using Gemini after analysis')
 @click.option('--llm-template', help='Path to custom LLM prompt template')
+@click.option('--llm-cache', type=click.Path(file_okay=False), envvar='CODE_SCORE_LLM_CACHE', default=None,
+              help='Reuse LLM responses to identical prompts cached in this directory')
+@click.option('--workspace-root', default=None,
+              help='Reuse checkouts from a workspace pool under this directory (e.g. tmpfs)')
+@click.option('--advisory-db', type=click.Path(exists=True), envvar='CODE_SCORE_ADVISORY_DB', default=None,
+              help='Audit dependencies offline against this OSV advisory snapshot (directory, .zip or .json)')
 def main(repository_url: str, commit_sha: str | None, output_dir: str,
          output_format: str, timeout: int, verbose: bool, log_level: str,
          skip_toolchain_check: bool, enable_checklist: bool, checklist_config: str | None,
-         generate_llm_report: bool, llm_template: str | None) -> None:
+         generate_llm_report: bool, llm_template: str | None, llm_cache: str | None,
+         workspace_root: str | None, advisory_db: str | None) -> None:
     """
     Analyze code quality metrics for a Git repository.
 
@@ -327,10 +355,24 @@ def main(repository_url: str, commit_sha: str | None, output_dir: str,
                   timeout=timeout, verbose=verbose, log_level=log_level,
                   skip_toolchain_check=skip_toolchain_check, enable_checklist=enable_checklist,
                   checklist_config=checklist_config, generate_llm_report=generate_llm_report,
-                  llm_template=llm_template)
+                  llm_template=llm_template, workspace_root=workspace_root, advisory_db=advisory_db,
+                  llm_cache=llm_cache)
+
 
+# Subcommands defined in other modules, imported only when invoked
+LAZY_SUBCOMMANDS = {
+    'evaluate': ('.evaluate:evaluate',
+                 'Evaluate a repository submission against the quality checklist.'),
+    'llm-report': ('.llm_report:main',
+                   'Generate human-readable evaluation reports from code quality analysis data.'),
+    'llm-batch': ('.llm_report:batch_main',
+                  'Generate reports for many score_input.json files concurrently.'),
+    'batch': ('.batch:batch', 'Analyze many repositories with a crash-safe job queue.'),
+    'merge': ('.batch:merge', 'Merge batch shard summaries into one leaderboard.'),
+}
 
-@click.group()
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS, package=__package__)
 def cli() -> None:
     """Code Score - Git Repository Metrics Collection Tool."""
     pass
@@ -352,10 +394,17 @@ def cli() -> None:
 @click.option('--checklist-config', help='Path to checklist configuration YAML file')
 @click.option('--generate-llm-report', is_flag=True, default=False, help='Generate human-readable LLM report using Gemini after analysis')
 @click.option('--llm-template', help='Path to custom LLM prompt template')
+@click.option('--llm-cache', type=click.Path(file_okay=False), envvar='CODE_SCORE_LLM_CACHE', default=None,
+              help='Reuse LLM responses to identical prompts cached in this directory')
+@click.option('--workspace-root', default=None,
+              help='Reuse checkouts from a workspace pool under this directory (e.g. tmpfs)')
+@click.option('--advisory-db', type=click.Path(exists=True), envvar='CODE_SCORE_ADVISORY_DB', default=None,
+              help='Audit dependencies offline against this OSV advisory snapshot (directory, .zip or .json)')
 def analyze(repository_url: str, commit_sha: str | None, output_dir: str,
            output_format: str, timeout: int, verbose: bool, log_level: str,
            skip_toolchain_check: bool, enable_checklist: bool, checklist_config: str | None,
-           generate_llm_report: bool, llm_template: str | None) -> None:
+           generate_llm_report: bool, llm_template: str | None, llm_cache: str | None,
+           workspace_root: str | None, advisory_db: str | None) -> None:
     """
     Analyze code quality metrics for a Git repository.
 
@@ -369,7 +418,8 @@ def analyze(repository_url: str, commit_sha: str | None, output_dir: str,
                timeout=timeout, verbose=verbose, log_level=log_level,
                skip_toolchain_check=skip_toolchain_check, enable_checklist=enable_checklist,
                checklist_config=checklist_config, generate_llm_report=generate_llm_report,
-               llm_template=llm_template)
+               llm_template=llm_template, llm_cache=llm_cache, workspace_root=workspace_root,
+               advisory_db=advisory_db)
 
 
 @cli.command()
@@ -378,40 +428,39 @@ def version() -> None:
     click.echo("Code Score v0.1.0")
 
 
-# Import and add the evaluate command
-from .evaluate import evaluate
-
-cli.add_command(evaluate)
-
-# Import and add the llm-report command
-from .llm_report import main as llm_report_main
-
-cli.add_command(llm_report_main)
-
-
 @cli.command()
 @click.argument('repository_url')
-def detect_language(repository_url: str) -> None:
+@click.option('--by-bytes', is_flag=True, help='Weight languages by source bytes instead of file count')
+@click.option('--sample-margin', type=click.FloatRange(0.001, 0.5), default=None,
+              help='Stop scanning once the primary language share is known to +/- this margin')
+def detect_language(repository_url: str, by_bytes: bool, sample_margin: float | None) -> None:
     """Detect the primary language of a repository without full analysis."""
+    from ..metrics.git_operations import GitOperations
+    from ..metrics.language_detection import LanguageDetector
+
     try:
         git_ops = GitOperations()
         language_detector = LanguageDetector()
+        language_detector.weight_by_bytes = by_bytes
+        language_detector.sample_margin = sample_margin
 
         # Clone repository
         repository = git_ops.clone_repository(repository_url)
 
         try:
             # Detect language
-            stats = language_detector.get_language_statistics(repository.local_path)
+            stats = language_detector.get_language_statistics(repository.local_path, repository.commit_sha)
 
             click.echo(f"Primary language: {stats['primary_language']}")
             click.echo(f"Confidence: {stats['confidence_score']:.2f}")
-            click.echo(f"Files analyzed: {stats['total_files_analyzed']}")
+            sampled = " (sampled)" if stats['sampled'] else ""
+            click.echo(f"Files analyzed: {stats['total_files_analyzed']}{sampled}")
 
             if stats['detected_languages']:
                 click.echo("\nLanguage breakdown:")
                 for lang, info in stats['detected_languages'].items():
-                    click.echo(f"  {lang}: {info['file_count']} files ({info['percentage']:.1f}%)")
+                    size = f", {info['byte_count']} bytes" if 'byte_count' in info else ""
+                    click.echo(f"  {lang}: {info['file_count']} files{size} ({info['percentage']:.1f}%)")
 
         finally:
             git_ops.cleanup_repository(repository)
@@ -424,7 +473,7 @@ def detect_language(repository_url: str) -> None:
 if __name__ == '__main__':
     # Support both legacy and modern CLI invocations
     # Check if any subcommand is present in arguments
-    subcommands = ['analyze', 'evaluate', 'llm-report', 'version', 'detect-language']
+    subcommands = ['analyze', 'evaluate', 'llm-report', 'llm-batch', 'batch', 'merge', 'version', 'detect-language']
     has_subcommand = any(arg in subcommands for arg in sys.argv[1:])
 
     if has_subcommand:
@@ -0,0 +1,223 @@
+"""
+Concurrent LLM report generation for many score_input.json files.
+
+BatchReportGenerator runs ReportGenerator calls on a thread pool. All
+workers share one TokenBucketLimiter so the provider's request and token
+quotas hold across the batch, transient provider failures are retried
+with backoff, and each completed report is recorded in a checkpoint file
+so an interrupted batch resumes where it stopped.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .rate_limiter import RetryPolicy, TokenBucketLimiter
+from .report_generator import ReportGenerator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ReportJob:
+    """One report to generate: its input and where the report is written."""
+
+    score_input_path: Path
+    output_path: Path
+
+
+@dataclass
+class BatchReportSummary:
+    """Outcome and latency statistics of a batch run."""
+
+    completed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    latencies: list[float] = field(default_factory=list)
+    llm_calls: int = 0
+    cache_hits: int = 0
+    wall_seconds: float = 0.0
+
+    @property
+    def retries(self) -> int:
+        """Provider calls beyond the first one per report."""
+        return self.llm_calls - (len(self.completed) - self.cache_hits)
+
+    def latency_percentile(self, fraction: float) -> float | None:
+        """Nearest-rank percentile of per-report latency in seconds."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[max(1, math.ceil(fraction * len(ordered))) - 1]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable summary."""
+        return {
+            'completed': len(self.completed),
+            'skipped': len(self.skipped),
+            'failed': dict(self.failed),
+            'llm_calls': self.llm_calls,
+            'retries': self.retries,
+            'cache_hits': self.cache_hits,
+            'wall_seconds': round(self.wall_seconds, 3),
+            'latency_seconds': {
+                name: self.latency_percentile(fraction)
+                for name, fraction in (('p50', 0.50), ('p90', 0.90), ('p99', 0.99))
+            },
+        }
+
+
+class BatchReportGenerator:
+    """
+    Generate many LLM reports concurrently within provider rate limits.
+
+    Reports are generated by ``workers`` threads sharing one ReportGenerator.
+    A job is skipped when the checkpoint records a report for the same input
+    content, template and provider and that report still exists.
+    """
+
+    def __init__(self, generator: ReportGenerator | None = None,
+                 workers: int = 4,
+                 rate_limiter: TokenBucketLimiter | None = None,
+                 retry_policy: RetryPolicy | None = None,
+                 checkpoint_path: str | Path | None = None):
+        """
+        Initialize BatchReportGenerator.
+
+        Args:
+            generator: ReportGenerator to use (creates one without a spinner if None);
+                rate_limiter and retry_policy replace its own when given
+            workers: Reports generated concurrently
+            rate_limiter: Limits shared by all workers (keeps the generator's if None)
+            retry_policy: Retry policy for transient failures (keeps the generator's if
+                None; RetryPolicy() for a created generator)
+            checkpoint_path: JSONL file recording completed reports (disabled if None)
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.generator = generator or ReportGenerator(show_progress=False, retry_policy=RetryPolicy())
+        if rate_limiter is not None:
+            self.generator.rate_limiter = rate_limiter
+        if retry_policy is not None:
+            self.generator.retry_policy = retry_policy
+        self.generator.show_progress = False
+        self.workers = workers
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self._lock = threading.Lock()
+
+    def run(self, jobs: Iterable[ReportJob], template_path: str | None = None,
+            provider: str = 'gemini', timeout: int | None = None) -> BatchReportSummary:
+        """
+        Generate the reports of all jobs.
+
+        Failures of single reports are recorded in the summary rather than raised.
+
+        Args:
+            jobs: Reports to generate
+            template_path: Custom prompt template shared by all reports
+            provider: LLM provider
+            timeout: Per-call timeout override in seconds
+
+        Returns:
+            BatchReportSummary of the run
+        """
+        summary = BatchReportSummary()
+        done = self._load_checkpoint()
+        start = time.monotonic()
+
+        pending = []
+        for job in jobs:
+            digest = self._job_digest(job, template_path, provider)
+            key = str(job.score_input_path)
+            if done.get(key) == digest and job.output_path.exists():
+                logger.info(f"Skipping {key}: report is up to date")
+                summary.skipped.append(key)
+            else:
+                pending.append((job, digest))
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="llm-report") as pool:
+            for job, digest in pending:
+                pool.submit(self._run_job, job, digest, template_path, provider, timeout, summary)
+
+        summary.wall_seconds = time.monotonic() - start
+        return summary
+
+    def _run_job(self, job: ReportJob, digest: str, template_path: str | None,
+                 provider: str, timeout: int | None, summary: BatchReportSummary) -> None:
+        key = str(job.score_input_path)
+        job_start = time.monotonic()
+        try:
+            result = self.generator.generate_report(
+                score_input_path=key,
+                output_path=str(job.output_path),
+                template_path=template_path,
+                provider=provider,
+                timeout=timeout
+            )
+        except Exception as e:
+            logger.error(f"Report for {key} failed: {e}")
+            with self._lock:
+                summary.failed[key] = str(e)
+            return
+
+        latency = time.monotonic() - job_start
+        with self._lock:
+            summary.completed.append(key)
+            summary.latencies.append(latency)
+            summary.llm_calls += result.get('llm_attempts', 1)
+            if result['provider_metadata'].get('cache_status') == 'hit':
+                summary.cache_hits += 1
+            self._append_checkpoint(key, digest, str(job.output_path))
+
+    def _job_digest(self, job: ReportJob, template_path: str | None, provider: str) -> str:
+        """Digest of everything a job's report depends on."""
+        digest = hashlib.sha256(json.dumps(
+            [provider, template_path, str(job.output_path)]
+        ).encode("utf-8"))
+        for path in (job.score_input_path, template_path):
+            if path is None:
+                continue
+            try:
+                digest.update(Path(path).read_bytes())
+            except OSError:
+                # Unreadable inputs never match; generation reports the error
+                digest.update(str(time.time_ns()).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_checkpoint(self) -> dict[str, str]:
+        """Digest of the latest completed report per input path."""
+        if self.checkpoint_path is None or not self.checkpoint_path.exists():
+            return {}
+        done = {}
+        with open(self.checkpoint_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    done[entry['score_input_path']] = entry['digest']
+                except (ValueError, KeyError, TypeError):
+                    # A line cut short by an interrupted run
+                    continue
+        return done
+
+    def _append_checkpoint(self, key: str, digest: str, output_path: str) -> None:
+        if self.checkpoint_path is None:
+            return
+        try:
+            self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.checkpoint_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({
+                    'score_input_path': key,
+                    'digest': digest,
+                    'output_path': output_path,
+                    'completed_at': time.time(),
+                }) + "\n")
+        except OSError as e:
+            logger.warning(f"Could not write report checkpoint: {e}")
@@ -0,0 +1,21 @@
+"""
+Exceptions raised by LLM report generation.
+
+Kept in their own module so the provider backends and the report
+generator can share them without importing each other.
+"""
+
+
+class ReportGeneratorError(Exception):
+    """Base exception for report generation errors."""
+    pass
+
+
+class LLMProviderError(ReportGeneratorError):
+    """Exception raised when Gemini fails."""
+    pass
+
+
+class LLMTransientError(LLMProviderError):
+    """Provider failure that may succeed when retried (timeouts, rate limits, outages)."""
+    pass
@@ -80,6 +80,17 @@ class ProviderMetadata(BaseModel):
         description="Token usage statistics (prompt_tokens, completion_tokens, total_tokens)"
     )
 
+    cache_status: str | None = Field(
+        None,
+        description="Response cache result ('hit' or 'miss'), None when caching is disabled"
+    )
+
+    time_to_first_byte_seconds: float | None = Field(
+        None,
+        description="Time until the first response text arrived, None for cached responses",
+        ge=0.0
+    )
+
 
 class TemplateMetadata(BaseModel):
     """Metadata about the template used for generation."""
@@ -303,11 +314,15 @@ class GeneratedReport(BaseModel):
         Returns:
             Complete file content including metadata and report
         """
+        provider = self.provider_used.provider_name
+        if self.provider_used.cache_status:
+            provider += f" (response cache {self.provider_used.cache_status})"
+
         metadata_header = f"""<!--
 Generated Report Metadata:
 - Generated: {self.generation_timestamp.isoformat()}
 - Template: {self.template_used.template_name} ({self.template_used.template_type})
-- Provider: {self.provider_used.provider_name}
+- Provider: {provider}
 - Repository: {self.input_metadata.repository_url}
 - Score: {self.input_metadata.total_score}/{self.input_metadata.max_possible_score}
 - Word Count: {self.word_count}
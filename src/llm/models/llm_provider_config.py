@@ -5,6 +5,8 @@ This module defines the LLMProviderConfig Pydantic model for configuring
 external LLM services and CLI command generation.
 """
 
+from typing import Literal
+
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -58,6 +60,24 @@ class LLMProviderConfig(BaseModel):
         None, description="Maximum context window size in tokens", gt=0
     )
 
+    api_base_url: str | None = Field(
+        default=None, description="Base URL of the provider's HTTP API; calls go over HTTP instead of the CLI when set"
+    )
+
+    api_format: Literal["gemini", "openai"] = Field(
+        default="gemini", description="Request format of the HTTP API (Gemini or OpenAI-compatible)"
+    )
+
+    @field_validator("api_base_url")
+    @classmethod
+    def validate_api_base_url(cls, v: str | None) -> str | None:
+        """Require an absolute http(s) URL without a trailing slash."""
+        if v is None:
+            return v
+        if not v.startswith(("http://", "https://")):
+            raise ValueError(f"API base URL must start with http:// or https://: {v}")
+        return v.rstrip("/")
+
     @classmethod
     @field_validator("cli_command")
     def validate_cli_command(cls, v):
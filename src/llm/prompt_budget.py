@@ -0,0 +1,233 @@
+"""
+Token budgeting for LLM prompts.
+
+Rather than cutting the rendered prompt at a character limit, the budget is
+enforced on the template context before rendering: the lowest-value
+evidence is first summarized and then dropped until the rendered prompt
+fits. Repository information, scores and checklist items are always kept.
+"""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .models.template_context import EvidenceContext, EvidenceSummary, TemplateContext
+
+logger = logging.getLogger(__name__)
+
+# Same heuristic as PromptBuilder.estimate_token_usage: ~4 characters per token for Gemini
+CHARS_PER_TOKEN = 4
+
+# Descriptions of low-value evidence are shortened to this many characters before any is dropped
+SUMMARY_LENGTH = 80
+
+# Markup around each rendered evidence line (bullet, bold source, confidence)
+_EVIDENCE_LINE_TOKENS = 8
+
+# Evidence about met requirements explains the least; unmet requirements the most
+_STATUS_RANK = {'met_requirements': 0, 'partial_requirements': 2, 'unmet_requirements': 3}
+_UNKNOWN_STATUS_RANK = 1
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimated tokens of a text."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+@dataclass
+class PromptBudgetReport:
+    """What budgeting found and changed for one prompt."""
+
+    budget_tokens: int
+    initial_tokens: int
+    final_tokens: int = 0
+    section_tokens: dict[str, int] = field(default_factory=dict)
+    summarized: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+    truncated: bool = False
+
+    @property
+    def within_budget(self) -> bool:
+        return self.final_tokens <= self.budget_tokens
+
+    def summary(self) -> str | None:
+        """One-line description of the changes, or None if the prompt was not reduced."""
+        if not (self.summarized or self.dropped or self.truncated):
+            return None
+        changes = []
+        if self.summarized:
+            changes.append(f"{len(self.summarized)} evidence descriptions shortened")
+        if self.dropped:
+            changes.append(f"{len(self.dropped)} evidence items dropped")
+        if self.truncated:
+            changes.append("prompt truncated")
+        return (f"Prompt reduced from ~{self.initial_tokens} to ~{self.final_tokens} tokens "
+                f"(budget {self.budget_tokens}): {', '.join(changes)}")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'budget_tokens': self.budget_tokens,
+            'initial_tokens': self.initial_tokens,
+            'final_tokens': self.final_tokens,
+            'section_tokens': dict(self.section_tokens),
+            'summarized': list(self.summarized),
+            'dropped': list(self.dropped),
+            'truncated': self.truncated,
+        }
+
+
+def section_token_estimates(context: TemplateContext) -> dict[str, int]:
+    """
+    Estimated tokens of each part of a context as rendered into a prompt.
+
+    Returns:
+        Tokens for 'repository' (with scores), 'checklist_items' and 'evidence'
+    """
+    repository = context.repository
+    repository_text = " ".join(str(value) for value in (
+        repository.url, repository.commit_sha, repository.primary_language,
+        repository.analysis_timestamp, context.total.score, context.total.max_score,
+        context.total.percentage,
+        *(f"{category}: {scores.score}/{scores.max_points} ({scores.percentage}%)"
+          for category, scores in context.category_scores.items())
+    ))
+    items_tokens = sum(
+        estimate_tokens(f"{item.name} {item.score}/{item.max_points} points") + _EVIDENCE_LINE_TOKENS
+        for item in context.get_all_items()
+    )
+    evidence_tokens = sum(
+        _evidence_tokens(item) for summary in context.evidence_summary for item in summary.items
+    )
+    return {
+        'repository': estimate_tokens(repository_text),
+        'checklist_items': items_tokens,
+        'evidence': evidence_tokens,
+    }
+
+
+class PromptBudgeter:
+    """
+    Fits a rendered prompt into a token budget by trimming evidence.
+
+    Each pass estimates how many tokens the prompt is over budget and frees
+    at least that many from the evidence, lowest value first: evidence for
+    met requirements before partial and unmet ones, lower confidence first.
+    Long descriptions are shortened before any item is dropped. The prompt
+    is re-rendered after each pass, so the result is deterministic.
+    """
+
+    def __init__(self, budget_tokens: int, max_passes: int = 4):
+        """
+        Initialize PromptBudgeter.
+
+        Args:
+            budget_tokens: Tokens the rendered prompt may use
+            max_passes: Re-renders attempted before giving up
+        """
+        if budget_tokens <= 0:
+            raise ValueError("budget_tokens must be positive")
+        self.budget_tokens = budget_tokens
+        self.max_passes = max_passes
+
+    def fit(self, context: TemplateContext,
+            render: Callable[[TemplateContext], str]) -> tuple[str, PromptBudgetReport]:
+        """
+        Render a context, trimming its evidence until the prompt fits the budget.
+
+        The context is modified in place. When evidence was trimmed, a warning
+        saying so is added to the context (and so to the prompt).
+
+        Args:
+            context: Template context to render
+            render: Renders a context into the prompt text
+
+        Returns:
+            Tuple of (prompt, budget report); the prompt may still exceed the
+            budget when trimming all evidence is not enough
+        """
+        prompt = render(context)
+        report = PromptBudgetReport(
+            budget_tokens=self.budget_tokens,
+            initial_tokens=estimate_tokens(prompt),
+            section_tokens=section_token_estimates(context)
+        )
+
+        warning: str | None = None
+        for _ in range(self.max_passes):
+            over = estimate_tokens(prompt) - self.budget_tokens
+            if over <= 0 or not self._trim(context, over, report):
+                break
+            if warning is not None and warning in context.warnings:
+                context.warnings.remove(warning)
+            warning = (f"Evidence trimmed to fit the prompt budget: {len(report.dropped)} items dropped, "
+                       f"{len(report.summarized)} shortened")
+            context.add_warning(warning)
+            prompt = render(context)
+
+        report.final_tokens = estimate_tokens(prompt)
+        if report.dropped or report.summarized:
+            logger.info(f"Prompt budget: dropped {len(report.dropped)} and shortened "
+                        f"{len(report.summarized)} evidence items "
+                        f"(~{report.initial_tokens} -> ~{report.final_tokens} tokens)")
+        return prompt, report
+
+    def _trim(self, context: TemplateContext, over: int, report: PromptBudgetReport) -> bool:
+        """Free at least ``over`` tokens of evidence; returns whether anything changed."""
+        ranked = _ranked_evidence(context)
+        saved = 0
+        changed = False
+
+        for _, item in ranked:
+            if saved >= over:
+                return changed
+            if len(item.description) > SUMMARY_LENGTH:
+                before = _evidence_tokens(item)
+                report.summarized.append(_label(item))
+                item.description = _summarize(item.description)
+                saved += before - _evidence_tokens(item)
+                changed = True
+
+        for summary, item in ranked:
+            if saved >= over:
+                break
+            report.dropped.append(_label(item))
+            saved += _evidence_tokens(item)
+            if not summary.truncated:
+                summary.total_items = max(summary.total_items, len(summary.items))
+                summary.truncated = True
+            summary.items.remove(item)
+            changed = True
+
+        return changed
+
+
+def _ranked_evidence(context: TemplateContext) -> list[tuple[EvidenceSummary, EvidenceContext]]:
+    """Evidence items ordered from lowest to highest value."""
+    entries = [
+        (summary, item, position)
+        for summary in context.evidence_summary
+        for position, item in enumerate(summary.items)
+    ]
+    # Ties are broken towards items listed later, which the evaluator ranks lower
+    entries.sort(key=lambda entry: (
+        _STATUS_RANK.get(entry[0].category, _UNKNOWN_STATUS_RANK), entry[1].confidence, -entry[2]
+    ))
+    return [(summary, item) for summary, item, _ in entries]
+
+
+def _evidence_tokens(item: EvidenceContext) -> int:
+    return estimate_tokens(f"{item.source}: {item.description}") + _EVIDENCE_LINE_TOKENS
+
+
+def _summarize(description: str) -> str:
+    """First sentence of a description, cut to SUMMARY_LENGTH characters."""
+    first_sentence = description.split(". ", 1)[0]
+    if len(first_sentence) <= SUMMARY_LENGTH:
+        return first_sentence
+    return first_sentence[:SUMMARY_LENGTH - 3].rstrip() + "..."
+
+
+def _label(item: EvidenceContext) -> str:
+    description = item.description if len(item.description) <= 60 else item.description[:57] + "..."
+    return f"{item.category}: {description}"
@@ -2,7 +2,7 @@
 Prompt building and data filtering utilities.
 
 This module provides functionality for building LLM prompts from evaluation data
-with proper content truncation and context management for optimal generation.
+with token budgeting and context management for optimal generation.
 """
 
 import logging
@@ -13,6 +13,7 @@ from jinja2 import Template
 
 from .models.report_template import ReportTemplate
 from .models.template_context import TemplateContext
+from .prompt_budget import PromptBudgeter, PromptBudgetReport, estimate_tokens
 from .template_loader import TemplateLoader
 
 logger = logging.getLogger(__name__)
@@ -48,7 +49,8 @@ class PromptBuilder:
             'max_evidence_items': 3,
             'max_checklist_items': 20,
             'max_description_length': 200,
-            'max_prompt_length': 32000  # characters
+            'max_prompt_tokens': 8000,  # evidence is trimmed to fit
+            'max_prompt_length': 32000  # characters, hard cut if still too long
         }
 
     def build_prompt(self, score_input_data: dict[str, Any],
@@ -93,6 +95,28 @@ class PromptBuilder:
             >>> print(f"Prompt length: {len(prompt)} characters")
             >>> # Use prompt with LLM service
         """
+        prompt, _ = self.build_prompt_with_budget(score_input_data, template_config, custom_limits)
+        return prompt
+
+    def build_prompt_with_budget(self, score_input_data: dict[str, Any],
+                                 template_config: ReportTemplate,
+                                 custom_limits: dict[str, int] | None = None
+                                 ) -> tuple[str, PromptBudgetReport]:
+        """
+        Build the LLM prompt and report how it was fitted into the token budget.
+
+        Args:
+            score_input_data: Loaded score_input.json data
+            template_config: Template configuration with rendering instructions
+            custom_limits: Custom content limits override (optional), e.g.
+                {"max_prompt_tokens": 4000}
+
+        Returns:
+            Tuple of (prompt, PromptBudgetReport listing the evidence shortened or dropped)
+
+        Raises:
+            PromptBuilderError: If template rendering or data processing fails
+        """
         try:
             # Create template context from score input
             context = TemplateContext.from_score_input(score_input_data)
@@ -110,29 +134,39 @@ class PromptBuilder:
             # Compile template
             compiled_template = self.template_loader.compile_template(template_config)
 
-            # Render prompt
-            prompt = self._render_prompt(compiled_template, context)
+            # Render prompt, trimming the lowest-value evidence to fit the token budget.
+            # Stamp the evaluation's own timestamp so the same input always
+            # renders the same prompt (and LLM responses can be reused)
+            generation_time = score_input_data.get('generation_timestamp')
+            budgeter = PromptBudgeter(limits.get('max_prompt_tokens', 8000))
+            prompt, budget_report = budgeter.fit(
+                context, lambda ctx: self._render_prompt(compiled_template, ctx, generation_time)
+            )
 
             # Validate prompt length
             if len(prompt) > limits.get('max_prompt_length', 32000):
                 context.add_warning(f"Prompt length ({len(prompt)}) exceeds limit")
                 prompt = self._truncate_prompt(prompt, limits.get('max_prompt_length', 32000))
+                budget_report.truncated = True
+                budget_report.final_tokens = estimate_tokens(prompt)
 
             logger.info(f"Built prompt: {len(prompt)} characters, "
                        f"{len(context.warnings)} warnings")
 
-            return prompt
+            return prompt, budget_report
 
         except Exception as e:
             raise PromptBuilderError(f"Failed to build prompt: {e}")
 
-    def _render_prompt(self, template: Template, context: TemplateContext) -> str:
+    def _render_prompt(self, template: Template, context: TemplateContext,
+                       generation_time: str | None = None) -> str:
         """
         Render template with context data.
 
         Args:
             template: Compiled Jinja2 template
             context: Template context data
+            generation_time: Timestamp shown in the prompt (current time if None)
 
         Returns:
             Rendered prompt string
@@ -143,7 +177,7 @@ class PromptBuilder:
 
             # Add additional helper data
             template_data.update({
-                'generation_time': datetime.utcnow().isoformat(),
+                'generation_time': generation_time or datetime.utcnow().isoformat(),
                 'has_warnings': len(context.warnings) > 0,
                 'warning_count': len(context.warnings)
             })
@@ -273,7 +307,7 @@ class PromptBuilder:
         """
         # Rough estimation: ~4 characters per token for Gemini
         char_count = len(prompt)
-        estimated_tokens = char_count // 4
+        estimated_tokens = estimate_tokens(prompt)
 
         return {
             'character_count': char_count,
@@ -0,0 +1,396 @@
+"""
+Backends that deliver prompts to LLM providers.
+
+CLIBackend runs the provider's command line tool once per call and streams
+its standard output. HTTPBackend
+talks to a Gemini or OpenAI-compatible HTTP API in process: the prompt is
+sent in the request body rather than argv, the response is streamed as
+server-sent events, and keep-alive connections are pooled and reused
+across calls and threads.
+"""
+
+import codecs
+import http.client
+import io
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from typing import Any
+from urllib.parse import SplitResult, urlsplit
+
+from .errors import LLMProviderError, LLMTransientError
+from .models.llm_provider_config import LLMProviderConfig
+
+logger = logging.getLogger(__name__)
+
+LLM_ENDPOINT_ENV = "CODE_SCORE_LLM_ENDPOINT"
+LLM_API_FORMAT_ENV = "CODE_SCORE_LLM_API_FORMAT"
+
+# Provider error output that indicates a temporary condition
+_TRANSIENT_ERROR_MARKERS = (
+    "429", "rate limit", "resource_exhausted", "quota", "502", "503", "504",
+    "unavailable", "deadline exceeded", "timed out", "timeout", "connection reset",
+)
+
+# HTTP statuses worth retrying
+_TRANSIENT_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class LLMBackend(ABC):
+    """Delivers a prompt to a provider and streams back the response text."""
+
+    @abstractmethod
+    def stream(self, prompt: str, config: LLMProviderConfig) -> Iterator[str]:
+        """
+        Send a prompt and yield the response text as it arrives.
+
+        Args:
+            prompt: Prompt text
+            config: Provider configuration
+
+        Yields:
+            Chunks of response text
+
+        Raises:
+            LLMTransientError: For failures worth retrying (timeouts, rate limits, outages)
+            LLMProviderError: For other provider failures
+        """
+
+    def generate(self, prompt: str, config: LLMProviderConfig,
+                 on_chunk: Callable[[str], None] | None = None) -> str:
+        """
+        Send a prompt and return the complete, stripped response.
+
+        Args:
+            prompt: Prompt text
+            config: Provider configuration
+            on_chunk: Called with each chunk of response text as it arrives
+
+        Returns:
+            The response text
+        """
+        chunks = []
+        for chunk in self.stream(prompt, config):
+            chunks.append(chunk)
+            if on_chunk is not None:
+                on_chunk(chunk)
+        response = "".join(chunks).strip()
+        if not response:
+            raise LLMProviderError("Empty response from Gemini")
+        logger.debug(f"LLM response: {len(response)} characters")
+        return response
+
+    @abstractmethod
+    def check_available(self, config: LLMProviderConfig) -> str | None:
+        """Problem that prevents calling the provider, or None if it can be called."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release resources held between calls."""
+
+
+class CLIBackend(LLMBackend):
+    """Runs the provider's CLI with the prompt as its last argument."""
+
+    def stream(self, prompt: str, config: LLMProviderConfig) -> Iterator[str]:
+        cmd = config.build_cli_command(prompt)
+        logger.debug(f"Executing LLM command: {cmd[0]} [args hidden for security]")
+
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except FileNotFoundError as e:
+            raise LLMProviderError(
+                f"LLM provider CLI not found: {config.cli_command[0]}. "
+                f"Ensure {config.provider_name} CLI is installed and in PATH."
+            ) from e
+
+        # Buffered binary pipes (the Popen defaults), so read1 returns what is available
+        assert isinstance(process.stdout, io.BufferedReader) and process.stderr is not None
+        stdout_pipe, stderr_pipe = process.stdout, process.stderr
+
+        # stderr is drained concurrently so a chatty CLI cannot block on a full pipe
+        stderr_chunks: list[bytes] = []
+        stderr_thread = threading.Thread(target=lambda: stderr_chunks.append(stderr_pipe.read()),
+                                         daemon=True)
+        stderr_thread.start()
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            process.kill()
+
+        watchdog = threading.Timer(config.timeout_seconds, kill_on_timeout)
+        watchdog.daemon = True
+        watchdog.start()
+
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        try:
+            while chunk := stdout_pipe.read1(65536):
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+            returncode = process.wait()
+        finally:
+            watchdog.cancel()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            stdout_pipe.close()
+            stderr_thread.join(timeout=5)
+            stderr_pipe.close()
+
+        if timed_out.is_set():
+            timeout_msg = f"LLM call timed out after {config.timeout_seconds}s"
+            if config.timeout_seconds < 60:
+                timeout_msg += " (consider increasing timeout for complex prompts)"
+            raise LLMTransientError(timeout_msg)
+
+        if returncode != 0:
+            stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace").strip()
+            error_msg = stderr or "Unknown error"
+            transient = (returncode in [124, 128, 130] or
+                         any(marker in error_msg.lower() for marker in _TRANSIENT_ERROR_MARKERS))
+
+            # Enhanced error context based on return code
+            if returncode == 1:
+                error_msg += " (likely authentication or API issue)"
+            elif returncode == 2:
+                error_msg += " (likely invalid arguments or configuration)"
+            elif returncode in [124, 128, 130]:
+                error_msg += " (process interrupted or killed)"
+
+            error_class = LLMTransientError if transient else LLMProviderError
+            raise error_class(f"LLM provider failed (exit {returncode}): {error_msg}")
+
+    def check_available(self, config: LLMProviderConfig) -> str | None:
+        try:
+            subprocess.run([config.cli_command[0], '--version'],
+                           capture_output=True, timeout=5, check=True)
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            return f"Provider CLI not available: {config.cli_command[0]}"
+        return None
+
+    def close(self) -> None:
+        """Nothing is held between CLI runs."""
+
+
+class HTTPBackend(LLMBackend):
+    """
+    Calls a Gemini or OpenAI-compatible HTTP API over pooled keep-alive connections.
+
+    One instance is meant to be shared: idle connections are kept per host
+    and handed to whichever thread makes the next call.
+    """
+
+    def __init__(self, max_idle_per_host: int = 8):
+        """
+        Initialize HTTPBackend.
+
+        Args:
+            max_idle_per_host: Idle connections kept open per host
+        """
+        self.max_idle_per_host = max_idle_per_host
+        self.connections_opened = 0
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def stream(self, prompt: str, config: LLMProviderConfig) -> Iterator[str]:
+        if not config.api_base_url:
+            raise LLMProviderError(f"No API base URL configured for {config.provider_name}")
+
+        if config.api_format == "openai":
+            url = f"{config.api_base_url}/chat/completions"
+            body: dict[str, Any] = {
+                "model": config.model_name,
+                "messages": [{"role": "user", "content": prompt}],
+                "stream": True,
+            }
+            if config.temperature is not None:
+                body["temperature"] = config.temperature
+            if config.max_tokens is not None:
+                body["max_tokens"] = config.max_tokens
+        else:
+            url = f"{config.api_base_url}/models/{config.model_name}:streamGenerateContent?alt=sse"
+            generation_config: dict[str, Any] = {}
+            if config.temperature is not None:
+                generation_config["temperature"] = config.temperature
+            if config.max_tokens is not None:
+                generation_config["maxOutputTokens"] = config.max_tokens
+            body = {
+                "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                "generationConfig": generation_config,
+            }
+
+        headers = {"Content-Type": "application/json", "Accept": "text/event-stream"}
+        api_key = next((os.environ[name] for name in config.environment_variables
+                        if os.environ.get(name)), None)
+        if api_key:
+            if config.api_format == "openai":
+                headers["Authorization"] = f"Bearer {api_key}"
+            else:
+                headers["x-goog-api-key"] = api_key
+
+        target = urlsplit(url)
+        deadline = time.monotonic() + config.timeout_seconds
+        conn = response = None
+        reusable = False
+        try:
+            conn, response = self._send(target, json.dumps(body).encode("utf-8"),
+                                        headers, config.timeout_seconds)
+            if response.status != 200:
+                detail = response.read().decode("utf-8", errors="replace").strip()
+                # The error body was read completely, so the connection stays usable
+                reusable = True
+                error_class = LLMTransientError if response.status in _TRANSIENT_STATUSES else LLMProviderError
+                raise error_class(f"LLM API returned HTTP {response.status}: {detail[:500]}")
+
+            if "text/event-stream" in response.getheader("Content-Type", ""):
+                for data in _sse_events(response):
+                    if data == "[DONE]":
+                        break
+                    text = _response_text(json.loads(data), config.api_format)
+                    if text:
+                        yield text
+                    if time.monotonic() > deadline:
+                        raise TimeoutError()
+            else:
+                yield _response_text(json.loads(response.read()), config.api_format)
+            reusable = True
+
+        except TimeoutError as e:
+            raise LLMTransientError(f"LLM call timed out after {config.timeout_seconds}s") from e
+        except ValueError as e:
+            raise LLMProviderError(f"Malformed response from LLM API: {e}") from e
+        except (OSError, http.client.HTTPException) as e:
+            raise LLMTransientError(f"Connection to LLM API failed: {e}") from e
+        finally:
+            if conn is not None:
+                self._release(target, conn, response, reusable)
+
+    def check_available(self, config: LLMProviderConfig) -> str | None:
+        if not config.api_base_url:
+            return f"No API base URL configured for {config.provider_name}"
+        target = urlsplit(config.api_base_url)
+        try:
+            conn, _ = self._acquire(target, timeout=5)
+            conn.connect()
+        except OSError as e:
+            return f"LLM API not reachable: {config.api_base_url} ({e})"
+        # The connection is ready for the first call
+        self._release(target, conn, None, reusable=True)
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            idle = [conn for conns in self._idle.values() for conn in conns]
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
+    def _send(self, target: SplitResult, body: bytes, headers: dict[str, str],
+              timeout: float) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """POST the body, retrying once on a fresh connection if a pooled one went stale."""
+        path = target.path + (f"?{target.query}" if target.query else "")
+        while True:
+            conn, reused = self._acquire(target, timeout)
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                return conn, conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                logger.debug("Pooled LLM API connection was closed by the server; reconnecting")
+            except BaseException:
+                conn.close()
+                raise
+
+    def _acquire(self, target: SplitResult,
+                 timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        """An idle pooled connection to the target's host, or a new one; and whether it was reused."""
+        key = _pool_key(target)
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+
+        scheme, host, port = key
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        with self._lock:
+            self.connections_opened += 1
+        return connection_class(host, port, timeout=timeout), False
+
+    def _release(self, target: SplitResult, conn: http.client.HTTPConnection,
+                 response: http.client.HTTPResponse | None, reusable: bool) -> None:
+        """Return a connection to the pool if its response was read completely, else close it."""
+        if reusable and response is not None:
+            try:
+                # Consume what follows the end of the stream so the connection can be reused
+                response.read()
+            except (OSError, http.client.HTTPException):
+                reusable = False
+            reusable = reusable and not response.will_close
+        if reusable:
+            with self._lock:
+                idle = self._idle.setdefault(_pool_key(target), [])
+                if len(idle) < self.max_idle_per_host:
+                    idle.append(conn)
+                    return
+        conn.close()
+
+
+def _pool_key(target: SplitResult) -> tuple[str, str, int]:
+    default_port = 443 if target.scheme == "https" else 80
+    return target.scheme, target.hostname or "", target.port or default_port
+
+
+def _sse_events(response: http.client.HTTPResponse) -> Iterator[str]:
+    """Data payloads of the server-sent events in a response."""
+    data_lines: list[str] = []
+    while True:
+        raw = response.readline()
+        if not raw:
+            break
+        line = raw.decode("utf-8").rstrip("\r\n")
+        if not line:
+            if data_lines:
+                yield "\n".join(data_lines)
+                data_lines = []
+        elif line.startswith("data:"):
+            data_lines.append(line[5:].removeprefix(" "))
+    if data_lines:
+        yield "\n".join(data_lines)
+
+
+def _response_text(payload: dict[str, Any], api_format: str) -> str:
+    """Text of one streamed chunk or complete response in either API format."""
+    if "error" in payload:
+        error = payload["error"]
+        code = error.get("code") if isinstance(error, dict) else None
+        message = error.get("message", error) if isinstance(error, dict) else error
+        transient = code in _TRANSIENT_STATUSES or any(
+            marker in str(error).lower() for marker in _TRANSIENT_ERROR_MARKERS
+        )
+        error_class = LLMTransientError if transient else LLMProviderError
+        raise error_class(f"LLM API error: {message}")
+
+    if api_format == "openai":
+        choices = payload.get("choices") or [{}]
+        message = choices[0].get("delta") or choices[0].get("message") or {}
+        return message.get("content") or ""
+
+    candidates = payload.get("candidates") or [{}]
+    parts = candidates[0].get("content", {}).get("parts", [])
+    return "".join(part.get("text", "") for part in parts)
@@ -0,0 +1,129 @@
+"""
+Rate limiting and retry policy for LLM provider calls.
+
+Batch report generation shares one TokenBucketLimiter between its workers
+so that the provider's requests-per-minute and tokens-per-minute quotas
+are respected, and retries transient failures with jittered exponential
+backoff (RetryPolicy).
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+
+
+class _Bucket:
+    """A token bucket refilled continuously at ``per_minute / 60`` per second."""
+
+    def __init__(self, per_minute: float, burst: float | None):
+        self.rate = per_minute / 60.0
+        self.capacity = burst if burst is not None else per_minute
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        # Requests larger than the bucket wait for a full bucket and go into debt
+        missing = min(amount, self.capacity) - self.level
+        return missing / self.rate if missing > 0 else 0.0
+
+
+class TokenBucketLimiter:
+    """
+    Thread-safe limiter for requests per minute and tokens per minute.
+
+    ``acquire`` blocks until both budgets allow a request of the given
+    size. Waiters take turns in arrival order and sleep without holding the
+    budgets, so ``charge`` never blocks behind them.
+    """
+
+    def __init__(self, requests_per_minute: float | None = None,
+                 tokens_per_minute: float | None = None,
+                 burst_requests: float | None = None,
+                 burst_tokens: float | None = None):
+        """
+        Initialize TokenBucketLimiter.
+
+        Args:
+            requests_per_minute: Allowed request rate (unlimited if None)
+            tokens_per_minute: Allowed token rate (unlimited if None)
+            burst_requests: Requests allowed at once (default: one minute's worth)
+            burst_tokens: Tokens allowed at once (default: one minute's worth)
+        """
+        for name, value in (("requests_per_minute", requests_per_minute),
+                            ("tokens_per_minute", tokens_per_minute)):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive")
+        self._requests = _Bucket(requests_per_minute, burst_requests) if requests_per_minute else None
+        self._tokens = _Bucket(tokens_per_minute, burst_tokens) if tokens_per_minute else None
+        self._lock = threading.Lock()
+        self._turn = threading.Lock()
+
+    def acquire(self, tokens: float = 0) -> float:
+        """
+        Wait until one request of ``tokens`` tokens fits the budgets and take it.
+
+        Args:
+            tokens: Estimated tokens of the request
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        with self._turn:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    wait = 0.0
+                    for bucket, amount in ((self._requests, 1), (self._tokens, tokens)):
+                        if bucket is not None:
+                            bucket.refill(now)
+                            wait = max(wait, bucket.wait_time(amount))
+                    if wait <= 0:
+                        self._consume(1, tokens)
+                        return waited
+                time.sleep(wait)
+                waited += wait
+
+    def charge(self, tokens: float) -> None:
+        """Account for tokens used beyond the estimate (e.g. the response) without waiting."""
+        with self._lock:
+            self._consume(0, tokens)
+
+    def _consume(self, requests: int, tokens: float) -> None:
+        if self._requests is not None:
+            self._requests.level -= requests
+        if self._tokens is not None:
+            self._tokens.refill(time.monotonic())
+            self._tokens.level -= tokens
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retries with full-jitter exponential backoff.
+
+    Attributes:
+        max_attempts: Calls made at most, the first one included
+        base_delay: Backoff ceiling before the first retry, in seconds
+        max_delay: Largest backoff ceiling, in seconds
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 2.0
+    max_delay: float = 60.0
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("delays must be non-negative")
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after failed attempt number ``attempt`` (1-based)."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
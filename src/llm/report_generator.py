@@ -7,12 +7,13 @@ template loading, prompt building, LLM calls, and report generation.
 
 import json
 import logging
-import subprocess
 import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
+from .errors import LLMProviderError, LLMTransientError, ReportGeneratorError
 from .models.generated_report import (
     GeneratedReport,
     InputMetadata,
@@ -22,19 +23,76 @@ from .models.generated_report import (
 from .models.llm_provider_config import LLMProviderConfig
 from .models.report_template import ReportTemplate
 from .prompt_builder import PromptBuilder
+from .providers import CLIBackend, HTTPBackend, LLMBackend
+from .rate_limiter import RetryPolicy, TokenBucketLimiter
+from .response_cache import LLMResponseCache
 from .template_loader import TemplateLoader, TemplateLoaderError
 
 logger = logging.getLogger(__name__)
 
 
-class ReportGeneratorError(Exception):
-    """Base exception for report generation errors."""
-    pass
+__all__ = ['LLMProviderError', 'LLMTransientError', 'ReportGenerator', 'ReportGeneratorError']
 
+# Appended to a kept partial report so it cannot be mistaken for a finished one
+INCOMPLETE_REPORT_MARKER = "<!-- INCOMPLETE REPORT: {reason} -->"
 
-class LLMProviderError(ReportGeneratorError):
-    """Exception raised when Gemini fails."""
-    pass
+
+class _PartialReport:
+    """
+    Response text of the current LLM call, mirrored to ``<output>.partial`` as it streams in.
+
+    Each attempt starts the file afresh. The file is removed once the final
+    report is saved, or kept with an INCOMPLETE_REPORT_MARKER when the call
+    or saving the report fails after some text arrived.
+    """
+
+    def __init__(self, output_path: str | None):
+        self.path = Path(f"{output_path}.partial") if output_path else None
+        self.first_byte_seconds: float | None = None
+        self._file: TextIO | None = None
+        self._started = 0.0
+        self._received = False
+
+    def begin(self) -> None:
+        """Start receiving a new response."""
+        self.close()
+        self._started = time.monotonic()
+        self.first_byte_seconds = None
+        self._received = False
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'w', encoding='utf-8')
+
+    def write(self, chunk: str) -> None:
+        """Record a chunk of response text."""
+        if self.first_byte_seconds is None:
+            self.first_byte_seconds = time.monotonic() - self._started
+        if chunk.strip():
+            self._received = True
+        if self._file is not None:
+            self._file.write(chunk)
+            self._file.flush()
+
+    def finish(self) -> None:
+        """Remove the partial file after the complete report was saved."""
+        self.close()
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+    def abandon(self, reason: str) -> Path | None:
+        """Keep received text with a marker; returns the kept file, if any."""
+        if self._file is not None and self._received:
+            self._file.write("\n\n" + INCOMPLETE_REPORT_MARKER.format(reason=reason) + "\n")
+            self.close()
+            return self.path
+        self.finish()
+        return None
+
+    def close(self) -> None:
+        """Stop writing to the partial file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
 
 class ReportGenerator:
@@ -46,17 +104,46 @@ class ReportGenerator:
     """
 
     def __init__(self, template_loader: TemplateLoader | None = None,
-                 prompt_builder: PromptBuilder | None = None):
+                 prompt_builder: PromptBuilder | None = None,
+                 response_cache: LLMResponseCache | None = None,
+                 rate_limiter: TokenBucketLimiter | None = None,
+                 retry_policy: RetryPolicy | None = None,
+                 show_progress: bool = True,
+                 backend: LLMBackend | None = None,
+                 api_base_url: str | None = None,
+                 api_format: str = 'gemini'):
         """
         Initialize ReportGenerator.
 
         Args:
             template_loader: TemplateLoader instance (creates new if None)
             prompt_builder: PromptBuilder instance (creates new if None)
+            response_cache: Reuse responses to identical prompts (disabled if None)
+            rate_limiter: Limiter every provider call waits for (unlimited if None)
+            retry_policy: Retry transient provider failures (no retries if None)
+            show_progress: Show a spinner on stderr during long provider calls
+            backend: Backend for every provider call (default: HTTP when the provider
+                has an API base URL, otherwise its CLI)
+            api_base_url: Call providers through this Gemini or OpenAI-compatible HTTP API
+            api_format: Request format of api_base_url ('gemini' or 'openai')
         """
         self.template_loader = template_loader or TemplateLoader()
         self.prompt_builder = prompt_builder or PromptBuilder(self.template_loader)
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=1)
+        self.show_progress = show_progress
         self._default_providers = LLMProviderConfig.get_default_configs()
+        if api_base_url:
+            self._default_providers = {
+                name: LLMProviderConfig.model_validate(
+                    {**config.model_dump(), 'api_base_url': api_base_url, 'api_format': api_format}
+                )
+                for name, config in self._default_providers.items()
+            }
+        self.backend = backend
+        self._cli_backend = CLIBackend()
+        self._http_backend = HTTPBackend()
 
     def generate_report(self, score_input_path: str,
                        output_path: str | None = None,
@@ -130,27 +217,57 @@ class ReportGenerator:
             logger.debug(f"Using provider: {provider_config.provider_name}")
 
             # Build prompt
-            prompt = self.prompt_builder.build_prompt(score_input_data, template_config)
+            prompt, budget_report = self.prompt_builder.build_prompt_with_budget(
+                score_input_data, template_config
+            )
             logger.info(f"Built prompt: {len(prompt)} characters")
 
-            # Generate report via LLM
+            # Generate report via LLM (or reuse the response to an identical prompt),
+            # streaming the text to <output>.partial as it arrives
+            partial = _PartialReport(output_path)
             generation_start = time.time()
-            llm_response = self._call_llm(prompt, provider_config)
+            try:
+                llm_response, cache_status, attempts = self._cached_call_llm(
+                    prompt, provider_config, partial.write, partial.begin
+                )
+            except LLMProviderError as e:
+                kept = partial.abandon(str(e))
+                if kept is None:
+                    raise
+                raise type(e)(f"{e} (partial report kept in {kept})") from e
+            except Exception as e:
+                partial.abandon(str(e))
+                raise
             generation_time = time.time() - generation_start
 
-            # Create generated report
-            generated_report = self._create_generated_report(
-                llm_response,
-                score_input_data,
-                template_config,
-                provider_config,
-                generation_time
-            )
+            # The streamed response stays in <output>.partial until the report is saved
+            try:
+                # Create generated report
+                generated_report = self._create_generated_report(
+                    llm_response,
+                    score_input_data,
+                    template_config,
+                    provider_config,
+                    generation_time,
+                    cache_status,
+                    partial.first_byte_seconds
+                )
 
-            # Save report if output path specified
-            if output_path:
-                self._save_report(generated_report, output_path)
-                logger.info(f"Report saved to: {output_path}")
+                # Say which evidence the model did not see
+                budget_summary = budget_report.summary()
+                if budget_summary:
+                    generated_report.add_warning(budget_summary)
+
+                # Save report if output path specified
+                if output_path:
+                    self._save_report(generated_report, output_path)
+                    logger.info(f"Report saved to: {output_path}")
+            except Exception as e:
+                kept = partial.abandon(f"report could not be saved: {e}")
+                if kept is None:
+                    raise
+                raise ReportGeneratorError(f"{e} (partial report kept in {kept})") from e
+            partial.finish()
 
             total_time = time.time() - start_time
             logger.info(f"Report generation completed in {total_time:.2f}s")
@@ -165,12 +282,14 @@ class ReportGenerator:
                     'warnings': generated_report.generation_warnings
                 },
                 'provider_metadata': generated_report.provider_used.dict(),
-                'template_metadata': generated_report.template_used.dict()
+                'template_metadata': generated_report.template_used.dict(),
+                'prompt_budget': budget_report.to_dict(),
+                'llm_attempts': attempts
             }
 
         except Exception as e:
             logger.error(f"Report generation failed: {e}")
-            raise ReportGeneratorError(f"Report generation failed: {e}")
+            raise ReportGeneratorError(f"Report generation failed: {e}") from e
 
     def _load_score_input(self, score_input_path: str) -> dict[str, Any]:
         """Load and validate score input data."""
@@ -206,7 +325,8 @@ class ReportGenerator:
         if provider not in self._default_providers:
             raise ReportGeneratorError(f"Unknown provider: {provider}")
 
-        config = self._default_providers[provider]
+        # Copied so concurrent generations with different timeouts don't interfere
+        config = self._default_providers[provider].model_copy(deep=True)
 
         # Override timeout if specified
         if timeout is not None:
@@ -219,94 +339,113 @@ class ReportGenerator:
 
         return config
 
-    def _call_llm(self, prompt: str, provider_config: LLMProviderConfig) -> str:
-        """Call external LLM service via subprocess with enhanced error recovery."""
-        import threading
+    def _cached_call_llm(self, prompt: str, provider_config: LLMProviderConfig,
+                         on_chunk: Callable[[str], None] | None = None,
+                         on_attempt: Callable[[], None] | None = None) -> tuple[str, str | None, int]:
+        """
+        Call the LLM unless the response cache has the answer.
 
-        try:
-            # Build CLI command
-            cmd = provider_config.build_cli_command(prompt)
-            logger.debug(f"Executing LLM command: {cmd[0]} [args hidden for security]")
-
-            # Progress indicator for long-running calls
-            progress_thread = None
-            if provider_config.timeout_seconds > 30:
-                stop_progress = threading.Event()
-                progress_thread = threading.Thread(
-                    target=self._show_progress_indicator,
-                    args=(stop_progress, provider_config.timeout_seconds)
-                )
-                progress_thread.daemon = True
-                progress_thread.start()
+        ``on_attempt`` is called before each provider call and ``on_chunk``
+        with the response text as it streams in.
+
+        Returns:
+            Tuple of (response, cache status, provider calls made)
+        """
+        if self.response_cache is None:
+            response, attempts = self._call_llm_with_retries(prompt, provider_config, on_chunk, on_attempt)
+            return response, None, attempts
+
+        key = LLMResponseCache.make_key(
+            prompt,
+            provider_config.provider_name,
+            provider_config.model_name,
+            provider_config.temperature,
+            provider_config.max_tokens
+        )
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            logger.info("Using cached LLM response")
+            return cached, "hit", 0
+
+        response, attempts = self._call_llm_with_retries(prompt, provider_config, on_chunk, on_attempt)
+        self.response_cache.put(key, response)
+        return response, "miss", attempts
+
+    def _call_llm_with_retries(self, prompt: str, provider_config: LLMProviderConfig,
+                               on_chunk: Callable[[str], None] | None = None,
+                               on_attempt: Callable[[], None] | None = None) -> tuple[str, int]:
+        """
+        Call the LLM within the rate limits, retrying transient failures.
 
+        Returns:
+            Tuple of (response, provider calls made)
+        """
+        prompt_tokens = self.prompt_builder.estimate_token_usage(prompt)['estimated_tokens']
+        max_attempts = self.retry_policy.max_attempts
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(prompt_tokens)
+            if on_attempt is not None:
+                on_attempt()
             try:
-                # Execute subprocess with timeout
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=provider_config.timeout_seconds,
-                    check=True
-                )
+                response = self._call_llm(prompt, provider_config, on_chunk)
+            except LLMTransientError as e:
+                if attempt >= max_attempts:
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                logger.warning(f"Transient LLM failure ({e}); retrying in {delay:.1f}s "
+                               f"(attempt {attempt + 1}/{max_attempts})")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.charge(self.prompt_builder.estimate_token_usage(response)['estimated_tokens'])
+            return response, attempt
+
+    def _call_llm(self, prompt: str, provider_config: LLMProviderConfig,
+                  on_chunk: Callable[[str], None] | None = None) -> str:
+        """Call the LLM through the provider's backend with enhanced error recovery."""
+        backend = self._backend_for(provider_config)
+
+        # Progress indicator for long-running calls
+        progress_thread = None
+        if self.show_progress and provider_config.timeout_seconds > 30:
+            stop_progress = threading.Event()
+            progress_thread = threading.Thread(
+                target=self._show_progress_indicator,
+                args=(stop_progress, provider_config.timeout_seconds)
+            )
+            progress_thread.daemon = True
+            progress_thread.start()
 
-                # Stop progress indicator
-                if progress_thread:
-                    stop_progress.set()
-                    progress_thread.join(timeout=1)
-
-                response = result.stdout.strip()
-                if not response:
-                    raise LLMProviderError("Empty response from Gemini")
-
-                logger.debug(f"LLM response: {len(response)} characters")
-                return response
-
-            except subprocess.TimeoutExpired as e:
-                # Stop progress indicator
-                if progress_thread:
-                    stop_progress.set()
-                    progress_thread.join(timeout=1)
-
-                # Attempt graceful termination first
-                if e.args and len(e.args) > 0:
-                    process = e.args[0] if hasattr(e.args[0], 'terminate') else None
-                    if process:
-                        try:
-                            process.terminate()
-                            process.wait(timeout=5)
-                        except:
-                            try:
-                                process.kill()
-                            except:
-                                pass
-
-                timeout_msg = f"LLM call timed out after {provider_config.timeout_seconds}s"
-                if provider_config.timeout_seconds < 60:
-                    timeout_msg += " (consider increasing timeout for complex prompts)"
-
-                raise LLMProviderError(timeout_msg)
-
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.strip() if e.stderr else "Unknown error"
-
-            # Enhanced error context based on return code
-            if e.returncode == 1:
-                error_msg += " (likely authentication or API issue)"
-            elif e.returncode == 2:
-                error_msg += " (likely invalid arguments or configuration)"
-            elif e.returncode in [124, 128, 130]:
-                error_msg += " (process interrupted or killed)"
-
-            raise LLMProviderError(f"LLM provider failed (exit {e.returncode}): {error_msg}")
+        try:
+            return backend.generate(prompt, provider_config, on_chunk)
 
-        except FileNotFoundError:
-            raise LLMProviderError(
-                f"LLM provider CLI not found: {provider_config.cli_command[0]}. "
-                f"Ensure {provider_config.provider_name} CLI is installed and in PATH."
-            )
+        except LLMProviderError:
+            raise
 
         except Exception as e:
-            raise LLMProviderError(f"Unexpected error calling LLM: {e}")
+            raise LLMProviderError(f"Unexpected error calling LLM: {e}") from e
+
+        finally:
+            # Stop progress indicator
+            if progress_thread:
+                stop_progress.set()
+                progress_thread.join(timeout=1)
+
+    def _backend_for(self, provider_config: LLMProviderConfig) -> LLMBackend:
+        """Backend that delivers prompts for a provider configuration."""
+        if self.backend is not None:
+            return self.backend
+        return self._http_backend if provider_config.api_base_url else self._cli_backend
+
+    def close(self) -> None:
+        """Close pooled provider connections."""
+        for backend in (self.backend, self._http_backend):
+            if backend is not None:
+                backend.close()
 
     def _show_progress_indicator(self, stop_event: threading.Event, timeout_seconds: int):
         """Show progress indicator for long-running LLM calls."""
@@ -336,7 +475,9 @@ class ReportGenerator:
                                score_input_data: dict[str, Any],
                                template_config: ReportTemplate,
                                provider_config: LLMProviderConfig,
-                               generation_time: float) -> GeneratedReport:
+                               generation_time: float,
+                               cache_status: str | None = None,
+                               first_byte_seconds: float | None = None) -> GeneratedReport:
         """Create GeneratedReport from LLM response and metadata."""
         # Extract input metadata
         repo_info = score_input_data['repository_info']
@@ -373,7 +514,9 @@ class ReportGenerator:
             model_name=provider_config.model_name,
             temperature=provider_config.temperature,
             max_tokens=provider_config.max_tokens,
-            response_time_seconds=generation_time
+            response_time_seconds=generation_time,
+            cache_status=cache_status,
+            time_to_first_byte_seconds=first_byte_seconds
         )
 
         # Create generated report
@@ -444,12 +587,10 @@ class ReportGenerator:
                 else:
                     results['issues'].append(f"Missing environment variables: {', '.join(missing_vars)}")
 
-                # Check CLI command availability
-                try:
-                    subprocess.run([provider_config.cli_command[0], '--version'],
-                                 capture_output=True, timeout=5, check=True)
-                except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-                    results['issues'].append(f"Provider CLI not available: {provider_config.cli_command[0]}")
+                # Check the provider's CLI or HTTP API can be reached
+                issue = self._backend_for(provider_config).check_available(provider_config)
+                if issue:
+                    results['issues'].append(issue)
 
             else:
                 results['issues'].append(f"Unknown provider: {provider}")
@@ -496,13 +637,8 @@ class ReportGenerator:
             provider_info['environment_ready'] = len(missing_vars) == 0
             provider_info['missing_variables'] = missing_vars
 
-            # Check CLI availability
-            try:
-                subprocess.run([config.cli_command[0], '--version'],
-                             capture_output=True, timeout=5, check=True)
-                provider_info['available'] = True
-            except:
-                provider_info['available'] = False
+            # Check CLI or HTTP API availability
+            provider_info['available'] = self._backend_for(config).check_available(config) is None
 
             providers.append(provider_info)
 
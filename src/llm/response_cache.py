@@ -0,0 +1,163 @@
+"""
+Persistent cache of LLM responses keyed by prompt and generation settings.
+
+Regenerating reports after output-only changes, or re-running a batch,
+renders byte-identical prompts. Their responses are stored on disk so the
+provider is only called once per distinct prompt and settings.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_ENV = "CODE_SCORE_LLM_CACHE"
+
+# Bump when the entry format changes so old entries are ignored
+_CACHE_FORMAT = 1
+
+
+class LLMResponseCache:
+    """
+    On-disk prompt -> response cache with TTL and size-based eviction.
+
+    Each response is one JSON file named by the hash of the prompt and the
+    generation settings, written atomically, so several processes can share
+    a cache directory. Entries older than ``ttl_seconds`` are treated as
+    misses and removed; when the directory grows beyond ``max_bytes`` the
+    least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir: str | Path, ttl_seconds: float = 7 * 24 * 3600,
+                 max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize LLMResponseCache.
+
+        Args:
+            cache_dir: Directory holding the cached responses
+            ttl_seconds: Age after which a response is regenerated
+            max_bytes: Total size of cached responses kept on disk
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(prompt: str, provider: str, model: str | None,
+                 temperature: float | None, max_tokens: int | None) -> str:
+        """Cache key of a prompt and the settings that affect the response."""
+        settings = json.dumps(
+            [_CACHE_FORMAT, provider, model, temperature, max_tokens], separators=(",", ":")
+        )
+        digest = hashlib.sha256(settings.encode("utf-8") + b"\0")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """
+        Cached response for a key, or None if missing or expired.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            The response text or None
+        """
+        path = self._path(key)
+        entry = self._read(path)
+        if entry is None or time.time() - entry["created_at"] > self.ttl_seconds:
+            if entry is not None:
+                self._remove(path)
+            self._count("misses")
+            return None
+
+        # Recency for LRU eviction is the file's modification time
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("hits")
+        response: str = entry["response"]
+        return response
+
+    def put(self, key: str, response: str) -> None:
+        """
+        Store a response and evict old entries if the cache is too large.
+
+        Failures to write are logged and otherwise ignored.
+
+        Args:
+            key: Key from make_key()
+            response: Response text to cache
+        """
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_path.write_text(
+                json.dumps({"created_at": time.time(), "response": response}), encoding="utf-8"
+            )
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write LLM response cache entry: {e}")
+            return
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        for path in self._entries():
+            self._remove(path)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _entries(self) -> list[Path]:
+        if not self.cache_dir.is_dir():
+            return []
+        return list(self.cache_dir.glob("*/*.json"))
+
+    def _read(self, path: Path) -> dict[str, Any] | None:
+        try:
+            entry: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+            if isinstance(entry.get("response"), str) and isinstance(entry.get("created_at"), (int, float)):
+                return entry
+        except (OSError, ValueError, AttributeError):
+            pass
+        return None
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            self._count("evictions")
+
+    def _remove(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
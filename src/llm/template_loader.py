@@ -3,19 +3,43 @@ Template loading and validation utilities.
 
 This module provides functionality for loading, validating, and compiling
 Jinja2 templates for LLM report generation with security sandboxing.
+
+Compiled template bytecode and security scan verdicts are cached on disk by
+the hash of the template content, so CLI processes and batch workers after
+the first load a template without compiling or scanning it again. Editing a
+template changes its hash, which invalidates both.
 """
 
+import hashlib
+import json
 import logging
+import os
+import re
+import stat
+import tempfile
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, Template, TemplateSyntaxError, meta
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    TemplateSyntaxError,
+    meta,
+)
 from jinja2.sandbox import SandboxedEnvironment
 
 from .models.report_template import ReportTemplate
 
 logger = logging.getLogger(__name__)
 
+TEMPLATE_CACHE_ENV = "CODE_SCORE_TEMPLATE_CACHE"
+DEFAULT_TEMPLATE_CACHE_DIR = "code_score_template_cache"
+
+# Bump when the security rules below change so cached verdicts are ignored
+_SECURITY_RULES_VERSION = 1
+
 
 class TemplateLoaderError(Exception):
     """Base exception for template loading errors."""
@@ -40,18 +64,41 @@ class TemplateLoader:
     validation, and compilation for use in report generation workflows.
     """
 
-    def __init__(self, use_sandbox: bool = True, cache_templates: bool = True):
+    def __init__(self, use_sandbox: bool = True, cache_templates: bool = True,
+                 cache_dir: str | Path | None = None):
         """
         Initialize TemplateLoader.
 
         Args:
             use_sandbox: Whether to use Jinja2 sandboxed environment for security
-            cache_templates: Whether to cache compiled templates in memory
+            cache_templates: Whether to cache compiled templates in memory and
+                their bytecode and security verdicts on disk
+            cache_dir: Directory shared by processes for the on-disk caches
+                (default: ``CODE_SCORE_TEMPLATE_CACHE`` or a per-user directory
+                under the system temp directory); it must belong to the current
+                user and not be writable by others, or the disk caches are off
         """
         self.use_sandbox = use_sandbox
         self.cache_templates = cache_templates
-        self._template_cache: dict[str, Template] = {}
+        self._template_cache: dict[str, tuple[str, Template]] = {}
+        self._security_verdicts: dict[str, str | None] = {}
+        self._template_fields: dict[str, list[str]] = {}
         self._environment: Environment | None = None
+        self.cache_dir: Path | None = None
+        self._bytecode_cache: FileSystemBytecodeCache | None = None
+        self.cache_stats = {'bytecode_hits': 0, 'bytecode_misses': 0,
+                            'security_hits': 0, 'security_misses': 0}
+
+        if cache_templates:
+            configured = cache_dir or os.environ.get(TEMPLATE_CACHE_ENV)
+            cache_dir = Path(configured) if configured else _default_cache_dir()
+            try:
+                cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+                _check_private_dir(cache_dir, tighten=not configured)
+                self.cache_dir = cache_dir
+                self._bytecode_cache = FileSystemBytecodeCache(str(self.cache_dir), "%s.jinja-bytecode")
+            except OSError as e:
+                logger.warning(f"Template cache directory {cache_dir} not usable, compiling in memory only: {e}")
 
     def _get_environment(self, template_dir: str | None = None) -> Environment:
         """
@@ -126,16 +173,24 @@ class TemplateLoader:
             raise TemplateNotFoundException(f"Template file not found: {path}")
 
         try:
+            # Syntax and variables only need checking once per distinct content
+            content_hash = self._file_hash(path)
+            known_fields = self._template_fields.get(content_hash) if content_hash else None
+
             # Create ReportTemplate with basic configuration
             template_config = ReportTemplate(
                 name=path.stem,
                 file_path=str(path),
                 description=f"Template loaded from {path.name}",
-                required_fields=self._extract_template_variables(str(path))
+                required_fields=(list(known_fields) if known_fields is not None
+                                 else self._extract_template_variables(str(path)))
             )
 
             # Validate template syntax
-            template_config.validate_template_syntax()
+            if known_fields is None:
+                template_config.validate_template_syntax()
+                if self.cache_templates and content_hash:
+                    self._template_fields[content_hash] = list(template_config.required_fields)
 
             logger.info(f"Successfully loaded template: {template_config.name}")
             return template_config
@@ -147,6 +202,10 @@ class TemplateLoader:
         """
         Compile Jinja2 template from configuration.
 
+        Templates are cached in memory by path and content hash, so an edited
+        file is recompiled. The compiled bytecode is also cached on disk, so
+        other processes skip the Jinja2 compilation of the same content.
+
         Args:
             template_config: ReportTemplate configuration
 
@@ -158,22 +217,24 @@ class TemplateLoader:
         """
         cache_key = template_config.file_path
 
-        # Check cache first
-        if self.cache_templates and cache_key in self._template_cache:
-            logger.debug(f"Using cached template: {template_config.name}")
-            return self._template_cache[cache_key]
-
         try:
             # Load template content
             template_content = template_config.load_template_content()
+            content_hash = _content_hash(template_content)
+
+            # Check cache first
+            cached = self._template_cache.get(cache_key) if self.cache_templates else None
+            if cached is not None and cached[0] == content_hash:
+                logger.debug(f"Using cached template: {template_config.name}")
+                return cached[1]
 
             # Get environment and compile
             env = self._get_environment()
-            compiled_template = env.from_string(template_content)
+            compiled_template = self._compile_cached(env, template_content, content_hash)
 
             # Cache if enabled
             if self.cache_templates:
-                self._template_cache[cache_key] = compiled_template
+                self._template_cache[cache_key] = (content_hash, compiled_template)
 
             logger.debug(f"Compiled template: {template_config.name}")
             return compiled_template
@@ -183,6 +244,46 @@ class TemplateLoader:
         except Exception as e:
             raise TemplateValidationError(f"Failed to compile template {template_config.name}: {e}")
 
+    @staticmethod
+    def _file_hash(path: Path) -> str | None:
+        """Content hash of a template file, or None if it cannot be read."""
+        try:
+            return _content_hash(path.read_text(encoding='utf-8'))
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _compile_cached(self, env: Environment, template_content: str, content_hash: str) -> Template:
+        """
+        Compile template content, reusing bytecode cached on disk.
+
+        Args:
+            env: Environment to compile in
+            template_content: Template source
+            content_hash: Hash of template_content
+
+        Returns:
+            Compiled Jinja2 Template
+        """
+        if self._bytecode_cache is None:
+            return env.from_string(template_content)
+
+        # Lexer settings change the generated code; the bucket itself checks the
+        # Python and Jinja2 versions and the source checksum
+        settings = f"{type(env).__name__}:{env.trim_blocks}:{env.lstrip_blocks}"
+        bucket = self._bytecode_cache.get_bucket(env, f"{settings}:{content_hash}", None, template_content)
+        code = bucket.code
+        if code is None:
+            self.cache_stats['bytecode_misses'] += 1
+            code = env.compile(template_content)
+            bucket.code = code
+            try:
+                self._bytecode_cache.set_bucket(bucket)
+            except OSError as e:
+                logger.warning(f"Could not write template bytecode cache: {e}")
+        else:
+            self.cache_stats['bytecode_hits'] += 1
+        return env.template_class.from_code(env, code, env.make_globals(None))
+
     def _extract_template_variables(self, template_path: str) -> list[str]:
         """
         Extract template variables from Jinja2 template.
@@ -304,9 +405,22 @@ class TemplateLoader:
         except Exception as e:
             raise TemplateValidationError(f"Failed to create template {name}: {e}")
 
-    def clear_cache(self) -> None:
-        """Clear template cache."""
+    def clear_cache(self, on_disk: bool = False) -> None:
+        """
+        Clear template cache.
+
+        Args:
+            on_disk: Also remove cached bytecode and security verdicts shared
+                with other processes
+        """
         self._template_cache.clear()
+        self._security_verdicts.clear()
+        self._template_fields.clear()
+        if on_disk and self.cache_dir is not None:
+            if self._bytecode_cache is not None:
+                self._bytecode_cache.clear()
+            for verdict in self.cache_dir.glob("*.security.json"):
+                verdict.unlink(missing_ok=True)
         logger.debug("Template cache cleared")
 
     def get_cache_stats(self) -> dict[str, Any]:
@@ -319,7 +433,9 @@ class TemplateLoader:
         return {
             'cache_enabled': self.cache_templates,
             'cached_templates': len(self._template_cache),
-            'template_paths': list(self._template_cache.keys())
+            'template_paths': list(self._template_cache.keys()),
+            'cache_dir': str(self.cache_dir) if self.cache_dir else None,
+            **self.cache_stats
         }
 
     def validate_template_syntax_only(self, template_path: str) -> bool:
@@ -357,6 +473,44 @@ class TemplateLoader:
         """
         Validate template content for security issues.
 
+        The verdict is cached by content hash, in memory and on disk, so the
+        scan runs once per distinct template content.
+
+        Args:
+            template_content: Template content to validate
+
+        Raises:
+            TemplateValidationError: If security issues are found
+        """
+        if not self.cache_templates:
+            self._scan_template_security(template_content)
+            return
+
+        key = _content_hash(f"{_SECURITY_RULES_VERSION}\0{template_content}")
+        if key not in self._security_verdicts:
+            verdict_path = self.cache_dir / f"{key}.security.json" if self.cache_dir else None
+            verdict = _read_verdict(verdict_path) if verdict_path else None
+            if verdict is not None:
+                self.cache_stats['security_hits'] += 1
+                self._security_verdicts[key] = verdict['error']
+            else:
+                self.cache_stats['security_misses'] += 1
+                try:
+                    self._scan_template_security(template_content)
+                    self._security_verdicts[key] = None
+                except TemplateValidationError as e:
+                    self._security_verdicts[key] = str(e)
+                if verdict_path:
+                    _write_verdict(verdict_path, self._security_verdicts[key])
+
+        error = self._security_verdicts[key]
+        if error is not None:
+            raise TemplateValidationError(error)
+
+    def _scan_template_security(self, template_content: str) -> None:
+        """
+        Scan template content for dangerous patterns, size and nesting.
+
         Args:
             template_content: Template content to validate
 
@@ -378,7 +532,6 @@ class TemplateLoader:
             r'urllib', r'requests', r'socket', r'http',
         ]
 
-        import re
         for pattern in dangerous_patterns:
             if re.search(pattern, template_content, re.IGNORECASE):
                 safe_pattern = pattern.replace('\\', '')
@@ -461,7 +614,6 @@ class TemplateLoader:
                 results['warnings'].append("Template output is very large (>1MB)")
 
             # Check for unrendered template syntax (indicates missing variables)
-            import re
             unrendered_patterns = [
                 r'\{\{[^}]+\}\}',  # Unrendered variables
                 r'\{%[^%]+%\}',    # Unrendered tags
@@ -522,3 +674,59 @@ class TemplateLoader:
 
         except Exception as e:
             return f"Preview failed: {e}"
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _default_cache_dir() -> Path:
+    """Per-user cache directory under the system temp directory."""
+    name = DEFAULT_TEMPLATE_CACHE_DIR
+    if hasattr(os, 'getuid'):
+        name = f"{name}-{os.getuid()}"
+    return Path(tempfile.gettempdir()) / name
+
+
+def _check_private_dir(path: Path, tighten: bool) -> None:
+    """
+    Refuse a cache directory other users could plant bytecode or verdicts in.
+
+    Args:
+        path: Existing cache directory
+        tighten: Reset the permissions of an own directory to 0700 instead of refusing it
+
+    Raises:
+        PermissionError: If the directory belongs to another user or others can write to it
+    """
+    if not hasattr(os, 'getuid'):
+        return
+    info = os.stat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise NotADirectoryError(f"{path} is not a directory")
+    if info.st_uid != os.getuid():
+        raise PermissionError(f"{path} belongs to another user")
+    if tighten and stat.S_IMODE(info.st_mode) != 0o700:
+        os.chmod(path, 0o700)
+    elif info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"{path} is writable by other users")
+
+
+def _read_verdict(path: Path) -> dict[str, Any] | None:
+    """Cached security verdict, or None if missing or unreadable."""
+    try:
+        verdict = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    return verdict if isinstance(verdict, dict) and 'error' in verdict else None
+
+
+def _write_verdict(path: Path, error: str | None) -> None:
+    """Write a security verdict atomically so concurrent readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps({'error': error}), encoding='utf-8')
+        os.replace(tmp_path, path)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.warning(f"Could not write template security verdict cache: {e}")
@@ -0,0 +1,507 @@
+"""Batch execution of the analysis pipeline over a durable job queue."""
+
+import logging
+import queue as queue_module
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+from .cleanup import RepositoryCleanup
+from .error_handling import ErrorHandler
+from .git_operations import GitOperationError, GitOperations
+from .jvm_daemons import JvmDaemonPool, set_jvm_daemon_pool
+from .language_detection import LanguageDetector
+from .models.batch_job import BatchJob, JobState
+from .models.repository import Repository
+from .output_generators import OutputManager
+from .package_cache import PackageCache
+from .runtime_history import RuntimeHistory
+from .sandbox import ToolSandbox, set_tool_sandbox
+from .tool_executor import ToolExecutor
+from .workspace_pool import WorkspacePool
+
+
+class BatchJobError(Exception):
+    """Raised when a pipeline stage of a batch job cannot produce its outputs."""
+    pass
+
+
+@dataclass
+class PipelineLimits:
+    """Concurrency and backpressure limits for the batch pipeline.
+
+    Attributes:
+        clone_workers: Concurrent ``git clone`` operations (network/disk bound)
+        analyze_workers: Concurrent analysis + evaluation jobs (CPU bound)
+        llm_workers: Concurrent LLM report generations
+        prefetch_depth: Cloned repositories allowed to wait for an analyze worker
+        max_checkouts: Checkouts allowed on disk at once (cloning, waiting or analyzing)
+        min_free_disk_mb: Free space required on the checkout filesystem before a
+            new clone starts while other checkouts still exist
+    """
+
+    clone_workers: int = 2
+    analyze_workers: int = 1
+    llm_workers: int = 1
+    prefetch_depth: int = 2
+    max_checkouts: int = 4
+    min_free_disk_mb: int = 1024
+
+    def __post_init__(self) -> None:
+        for name in ("clone_workers", "analyze_workers", "llm_workers", "prefetch_depth",
+                     "max_checkouts"):
+            if getattr(self, name) < 1:
+                raise ValueError(f"{name} must be at least 1")
+        if self.min_free_disk_mb < 0:
+            raise ValueError("min_free_disk_mb must be non-negative")
+
+
+@dataclass
+class _InFlight:
+    """A claimed job travelling between pipeline stages."""
+
+    job: BatchJob
+    error_handler: ErrorHandler
+    git_ops: GitOperations
+    repository: Repository | None = None
+    saved_files: list[str] | None = None
+    stage: JobState = JobState.CLONING
+
+
+class BatchQueue(Protocol):
+    """Job queue interface used by the batch pipeline.
+
+    Implemented by ``JobQueue`` (SQLite, one node) and ``SharedDirectoryQueue``
+    (lease files on a shared directory, many nodes).
+    """
+
+    def enqueue(self, repositories: list[tuple[str, str | None]], timeout_seconds: int = 300) -> int: ...
+
+    def claim(self, worker_id: str) -> BatchJob | None: ...
+
+    def advance(self, job_id: int, state: JobState, output_dir: str | None = None) -> None: ...
+
+    def complete(self, job_id: int) -> None: ...
+
+    def fail(self, job_id: int, error: str) -> None: ...
+
+    def requeue_interrupted(self) -> int: ...
+
+    def retry_failed(self, timeout_seconds: int | None = None) -> int: ...
+
+    def list_jobs(self, state: JobState | None = None) -> list[BatchJob]: ...
+
+    def get_counts(self) -> dict[str, int]: ...
+
+
+_STOP = object()
+
+
+class BatchRunner:
+    """Runs the clone → analyze → evaluate → report pipeline for queued jobs.
+
+    Stages run in separate worker pools connected by bounded queues, so the
+    next repositories are cloned (network/disk bound) while earlier ones are
+    analyzed (CPU bound) and reported (LLM bound). The number of checkouts on
+    disk is capped by ``max_checkouts`` and new clones also wait while the
+    checkout filesystem is low on space.
+
+    Every stage transition is recorded in the job queue. Because all progress
+    lives in the queue, a batch that dies midway can be restarted with the same
+    queue and only unfinished jobs are processed again.
+
+    Outputs for each job are written to ``<output_root>/<job.output_name>/``.
+    Toolchain validation is not performed per job; tool runners degrade
+    gracefully when a tool is missing.
+    """
+
+    def __init__(self, queue: BatchQueue, output_root: str | Path,
+                 enable_checklist: bool = True,
+                 checklist_config: str | None = None,
+                 generate_llm_report: bool = False,
+                 llm_template: str | None = None,
+                 output_format: str = "both",
+                 limits: PipelineLimits | None = None,
+                 workspace_pool: WorkspacePool | None = None,
+                 advisory_db: str | None = None,
+                 jvm_daemons: JvmDaemonPool | None = None,
+                 package_cache: PackageCache | None = None,
+                 tool_sandbox: ToolSandbox | None = None,
+                 tool_history: RuntimeHistory | None = None) -> None:
+        """Initialize the batch runner.
+
+        Args:
+            queue: JobQueue or SharedDirectoryQueue holding the jobs to process
+            output_root: Root directory for per-repository output directories
+            enable_checklist: Run checklist evaluation after analysis
+            checklist_config: Optional checklist configuration YAML
+            generate_llm_report: Generate a Gemini report after evaluation
+            llm_template: Optional custom LLM prompt template
+            output_format: Metrics output format ("json", "markdown" or "both")
+            limits: Pipeline concurrency and backpressure limits
+            workspace_pool: Optional pool of reusable checkout workspaces
+            advisory_db: Optional OSV advisory snapshot for offline dependency audits
+            jvm_daemons: Optional warm Maven/Gradle daemon pool for Java builds
+            package_cache: Optional shared npm/yarn/uv/pip/Go/Maven/Gradle caches for builds
+            tool_sandbox: Resource limits for tool subprocesses (default: built-in limits)
+            tool_history: Optional tool runtime history for predicted stage budgets
+        """
+        self.queue = queue
+        self.output_root = Path(output_root)
+        self.enable_checklist = enable_checklist
+        self.checklist_config = checklist_config
+        self.generate_llm_report = generate_llm_report
+        self.llm_template = llm_template
+        self.output_format = output_format
+        self.limits = limits or PipelineLimits()
+        self.workspace_pool = workspace_pool
+        self.advisory_db = advisory_db
+        self.jvm_daemons = jvm_daemons
+        self.package_cache = package_cache
+        self.tool_sandbox = tool_sandbox
+        self.tool_history = tool_history
+        self.checkout_root = workspace_pool.root if workspace_pool else Path(tempfile.gettempdir())
+        self.logger = logging.getLogger('code_score.batch')
+
+        self.cleanup_manager = RepositoryCleanup()
+        self._verbose = False
+        self._stop_event = threading.Event()
+        self._checkouts = 0
+        self._checkouts_changed = threading.Condition()
+        self._stats_lock = threading.Lock()
+        self.stats: dict[str, Any] = {}
+
+    def run(self, workers: int | None = None, verbose: bool = False) -> dict[str, int]:
+        """Process pending jobs until the queue is drained.
+
+        Jobs left in an in-progress state by a previous crashed run are
+        returned to pending first.
+
+        Args:
+            workers: Overrides ``limits.analyze_workers`` when given
+            verbose: Enable verbose error logging
+
+        Returns:
+            Final job counts by state
+        """
+        if workers is not None:
+            self.limits.analyze_workers = max(1, workers)
+        self._verbose = verbose
+        self._stop_event.clear()
+        self.stats = {"peak_checkouts": 0, "disk_waits": 0, "clone_seconds": 0.0,
+                      "analyze_seconds": 0.0, "report_seconds": 0.0}
+        self.queue.requeue_interrupted()
+        if self.jvm_daemons is not None:
+            set_jvm_daemon_pool(self.jvm_daemons)
+        if self.package_cache is not None:
+            self.package_cache.activate()
+        if self.tool_sandbox is not None:
+            set_tool_sandbox(self.tool_sandbox)
+
+        limits = self.limits
+        cloned: queue_module.Queue = queue_module.Queue(maxsize=limits.prefetch_depth)
+        to_report: queue_module.Queue = queue_module.Queue()
+
+        clone_threads = self._start_pool("clone", limits.clone_workers, self._clone_loop, cloned)
+        analyze_threads = self._start_pool("analyze", limits.analyze_workers,
+                                           self._analyze_loop, cloned, to_report)
+        llm_threads = self._start_pool("llm", limits.llm_workers, self._report_loop, to_report)
+
+        try:
+            self._join(clone_threads)
+            for _ in analyze_threads:
+                cloned.put(_STOP)
+            self._join(analyze_threads)
+            for _ in llm_threads:
+                to_report.put(_STOP)
+            self._join(llm_threads)
+        except KeyboardInterrupt:
+            # Unfinished jobs stay in-progress and are resumed by the next run
+            self._stop_event.set()
+            raise
+        finally:
+            self.cleanup_manager.cleanup_temporary_files()
+            if self.jvm_daemons is not None:
+                set_jvm_daemon_pool(None)
+                self.jvm_daemons.shutdown()
+                self.stats["jvm_daemons"] = self.jvm_daemons.report()
+            if self.tool_sandbox is not None:
+                set_tool_sandbox(None)
+                self.tool_sandbox.close()
+            if self.package_cache is not None:
+                self.package_cache.deactivate()
+                self.package_cache.evict(blocking=True)
+                self.stats["package_cache"] = self.package_cache.report()
+
+        return self.queue.get_counts()
+
+    def stop(self) -> None:
+        """Ask clone workers to stop claiming new jobs."""
+        self._stop_event.set()
+
+    def _start_pool(self, name: str, size: int, target: Any, *args: Any) -> list[threading.Thread]:
+        threads = [
+            threading.Thread(target=target, args=(f"{name}-{index}", *args),
+                             name=f"batch-{name}-{index}", daemon=True)
+            for index in range(size)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    @staticmethod
+    def _join(threads: list[threading.Thread]) -> None:
+        # Join with a timeout so KeyboardInterrupt reaches the main thread
+        for thread in threads:
+            while thread.is_alive():
+                thread.join(timeout=0.5)
+
+    # ------------------------------------------------------------------
+    # Backpressure
+    # ------------------------------------------------------------------
+
+    def _acquire_checkout(self) -> bool:
+        """Wait for a free checkout slot and enough disk space.
+
+        Returns:
+            False if the runner was stopped while waiting
+        """
+        required_bytes = self.limits.min_free_disk_mb * 1024 * 1024
+        with self._checkouts_changed:
+            while not self._stop_event.is_set():
+                if self._checkouts >= self.limits.max_checkouts:
+                    self._checkouts_changed.wait(timeout=1.0)
+                    continue
+                # Only hold back when releasing another checkout can free space
+                if self._checkouts > 0 and self._free_disk_bytes() < required_bytes:
+                    self.stats["disk_waits"] += 1
+                    self._checkouts_changed.wait(timeout=5.0)
+                    continue
+
+                self._checkouts += 1
+                self.stats["peak_checkouts"] = max(self.stats["peak_checkouts"], self._checkouts)
+                return True
+        return False
+
+    def _release_checkout(self) -> None:
+        with self._checkouts_changed:
+            self._checkouts -= 1
+            self._checkouts_changed.notify_all()
+
+    def _free_disk_bytes(self) -> int:
+        try:
+            return shutil.disk_usage(self.checkout_root).free
+        except OSError:
+            return 0
+
+    def _discard_checkout(self, item: _InFlight) -> None:
+        """Delete a job's checkout and free its slot."""
+        if item.repository is not None and item.repository.local_path:
+            try:
+                item.git_ops.cleanup_repository(item.repository)
+            except Exception as e:
+                item.error_handler.handle_error(e, "Cleanup")
+            item.repository = None
+            self._release_checkout()
+
+    # ------------------------------------------------------------------
+    # Stage workers
+    # ------------------------------------------------------------------
+
+    def _clone_loop(self, worker_id: str, cloned: queue_module.Queue) -> None:
+        """Claim jobs and clone them ahead of the analyze workers."""
+        while not self._stop_event.is_set():
+            if not self._acquire_checkout():
+                return
+            job = self.queue.claim(worker_id)
+            if job is None:
+                self._release_checkout()
+                return
+
+            item = _InFlight(job=job, error_handler=ErrorHandler(verbose=self._verbose),
+                             git_ops=GitOperations(timeout_seconds=job.timeout_seconds,
+                                                   workspace_pool=self.workspace_pool))
+            start_time = time.time()
+            try:
+                item.repository = item.git_ops.clone_repository(job.repository_url, job.commit_sha)
+            except GitOperationError as e:
+                item.error_handler.handle_repository_failure(job.repository_url, e)
+                self._release_checkout()
+                self.queue.fail(job.job_id, self._last_error(item.error_handler, e))
+                continue
+            except Exception as e:
+                self._release_checkout()
+                self._fail(item, e)
+                continue
+            self._add_stat("clone_seconds", time.time() - start_time)
+
+            if self.workspace_pool is None:
+                # Registered so an interrupted run still removes prefetched checkouts
+                self.cleanup_manager.register_for_cleanup(Path(item.repository.local_path).parent)
+            cloned.put(item)
+
+    def _analyze_loop(self, worker_id: str, cloned: queue_module.Queue,
+                      to_report: queue_module.Queue) -> None:
+        """Analyze cloned repositories, evaluate them and free their checkouts."""
+        while True:
+            item = cloned.get()
+            if item is _STOP:
+                return
+
+            job = item.job
+            start_time = time.time()
+            try:
+                item.stage = JobState.ANALYZING
+                self.queue.advance(job.job_id, item.stage,
+                                   output_dir=str(self.output_root / job.output_name))
+                item.saved_files = self._analyze(job, item.repository, item.git_ops)
+                # The checkout is not needed after analysis; free the slot early
+                self._discard_checkout(item)
+
+                if self.enable_checklist:
+                    item.stage = JobState.EVALUATING
+                    self.queue.advance(job.job_id, item.stage)
+                    item.saved_files = self._evaluate(self.output_root / job.output_name,
+                                                      item.saved_files)
+            except Exception as e:
+                self._discard_checkout(item)
+                self._fail(item, e)
+                continue
+            finally:
+                self._add_stat("analyze_seconds", time.time() - start_time)
+
+            if self.enable_checklist and self.generate_llm_report:
+                to_report.put(item)
+            else:
+                self._complete(item)
+
+    def _report_loop(self, worker_id: str, to_report: queue_module.Queue) -> None:
+        """Generate LLM reports for evaluated jobs."""
+        while True:
+            item = to_report.get()
+            if item is _STOP:
+                return
+
+            start_time = time.time()
+            try:
+                item.stage = JobState.REPORTING
+                self.queue.advance(item.job.job_id, item.stage)
+                self._report(item.job, self.output_root / item.job.output_name, item.saved_files)
+            except Exception as e:
+                self._fail(item, e)
+                continue
+            finally:
+                self._add_stat("report_seconds", time.time() - start_time)
+            self._complete(item)
+
+    def _complete(self, item: _InFlight) -> None:
+        self.queue.complete(item.job.job_id)
+        self.logger.info(f"Job {item.job.job_id} done: {item.job.repository_url}")
+
+    def _fail(self, item: _InFlight, error: Exception) -> None:
+        item.error_handler.handle_error(error, f"Batch job {item.job.job_id} ({item.stage.value})")
+        self.queue.fail(item.job.job_id, self._last_error(item.error_handler, error))
+
+    def _add_stat(self, key: str, value: float) -> None:
+        with self._stats_lock:
+            self.stats[key] += value
+
+    # ------------------------------------------------------------------
+    # Stage implementations
+    # ------------------------------------------------------------------
+
+    def _analyze(self, job: BatchJob, repository: Repository, git_ops: GitOperations) -> list[str]:
+        """Detect language, run tools and save metrics outputs."""
+        language_detector = LanguageDetector()
+        # Both lookups share one scan of the tree through the per-commit cache
+        repository.detected_language = language_detector.detect_primary_language(
+            repository.local_path, repository.commit_sha
+        )
+
+        tool_executor = ToolExecutor(timeout_seconds=job.timeout_seconds, advisory_db=self.advisory_db,
+                                     package_cache=self.package_cache, tool_history=self.tool_history)
+        metrics = tool_executor.execute_tools(
+            repository.detected_language, repository.local_path,
+            languages=language_detector.get_languages_above_threshold(
+                repository.local_path, commit_sha=repository.commit_sha
+            )
+        )
+        metrics.execution_metadata.workspace = git_ops.workspace_usage(repository)
+        if self.package_cache is not None:
+            # In the background and at most every few minutes; skipped while builds hold the cache
+            self.package_cache.maybe_evict()
+
+        output_manager = OutputManager(output_dir=str(self.output_root / job.output_name))
+        return output_manager.save_results(repository, metrics, self.output_format)
+
+    def _evaluate(self, job_output_dir: Path, saved_files: list[str]) -> list[str]:
+        """Run checklist evaluation on the job's submission.json."""
+        from .pipeline_output_manager import PipelineOutputManager
+
+        submission_file = _find_output(saved_files, 'submission.json')
+        if submission_file is None:
+            raise BatchJobError("No submission.json generated, cannot run checklist evaluation")
+
+        pipeline_manager = PipelineOutputManager(
+            output_dir=str(job_output_dir),
+            checklist_config_path=self.checklist_config,
+            enable_checklist_evaluation=True
+        )
+        all_files = pipeline_manager.integrate_with_existing_pipeline(saved_files, submission_file)
+
+        if _find_output(all_files, 'score_input.json') is None:
+            raise BatchJobError("Checklist evaluation did not produce score_input.json")
+        return all_files
+
+    def _report(self, job: BatchJob, job_output_dir: Path, saved_files: list[str]) -> None:
+        """Generate the LLM report for the job's score_input.json."""
+        from ..llm.report_generator import ReportGenerator
+
+        generator = ReportGenerator()
+        result = generator.generate_report(
+            score_input_path=_find_output(saved_files, 'score_input.json'),
+            output_path=str(job_output_dir / "final_report.md"),
+            template_path=self.llm_template,
+            provider='gemini',
+            timeout=job.timeout_seconds
+        )
+        if not result.get('success'):
+            raise BatchJobError("LLM report generation failed")
+
+    @staticmethod
+    def _last_error(error_handler: ErrorHandler, error: Exception) -> str:
+        """Get the message ErrorHandler recorded for the error that failed the job."""
+        errors = error_handler.get_errors()
+        return errors[-1] if errors else str(error)
+
+
+def _find_output(file_paths: list[str], filename: str) -> str | None:
+    """Find the first generated file with the given name."""
+    for file_path in file_paths:
+        if file_path.endswith(filename):
+            return file_path
+    return None
+
+
+def load_repository_list(list_path: str | Path) -> list[tuple[str, str | None]]:
+    """Load a batch repository list.
+
+    Each non-empty line holds a repository URL optionally followed by a commit
+    SHA, separated by whitespace. Lines starting with ``#`` are ignored.
+
+    Returns:
+        List of (repository_url, commit_sha) pairs in file order
+    """
+    repositories = []
+    with open(list_path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = line.split()
+            repositories.append((parts[0], parts[1] if len(parts) > 1 else None))
+    return repositories
@@ -5,8 +5,10 @@ Coordinates detection and parsing of CI configurations across multiple platforms
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from src.metrics.ci_parsers.circleci_parser import CircleCIParser
 from src.metrics.ci_parsers.github_actions_parser import GitHubActionsParser
@@ -20,6 +22,9 @@ from src.metrics.pattern_matchers.coverage_tool_matcher import CoverageToolMatch
 class CIConfigAnalyzer:
     """Analyzer for CI/CD configurations across multiple platforms."""
 
+    # Workers parsing CI configuration files concurrently
+    MAX_PARSE_WORKERS = 8
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.coverage_matcher = CoverageToolMatcher()
@@ -72,35 +77,22 @@ class CIConfigAnalyzer:
         platform_names = ', '.join(detected_platforms.keys())
         self.logger.info(f"Detected CI platforms: {platform_names}")
 
-        # Parse all detected platforms
-        platform_results = {}
-        for platform_name, config_path in detected_platforms.items():
-            self.logger.debug(f"Parsing workflow file: {config_path}")
-            parser = self.parsers[platform_name]
-            try:
-                test_steps = parser.parse(config_path)
-                if test_steps is not None:
-                    platform_results[platform_name] = {
-                        'config_path': config_path,
-                        'test_steps': test_steps
-                    }
-                    self.logger.debug(f"Successfully parsed {platform_name}: {len(test_steps)} test steps found")
-            except Exception as e:
-                # Parse error (minimal level - WARNING)
-                self.logger.warning(f"Parse error in {config_path}: {e}")
+        # Parse every configuration file of every detected platform
+        platform_results, parse_errors = self._parse_platforms(repo_path, detected_platforms)
 
         if not platform_results:
             # All parsers failed
+            first_platform, first_paths = next(iter(detected_platforms.items()))
             return CIConfigResult(
-                platform=list(detected_platforms.keys())[0],
-                config_file_path=str(list(detected_platforms.values())[0]),
+                platform=first_platform,
+                config_file_path=str(first_paths[0]),
                 has_test_steps=False,
                 test_commands=[],
                 has_coverage_upload=False,
                 coverage_tools=[],
                 test_job_count=0,
                 calculated_score=0,
-                parse_errors=["All CI parsers failed"]
+                parse_errors=["All CI parsers failed"] + parse_errors
             )
 
         # Use platform with highest score (per research.md)
@@ -162,7 +154,7 @@ class CIConfigAnalyzer:
             coverage_tools=coverage_tools,
             test_job_count=test_job_count,
             calculated_score=final_score,
-            parse_errors=[]
+            parse_errors=parse_errors
         )
 
         # Log final score (minimal level - always visible as INFO in standard mode)
@@ -170,39 +162,104 @@ class CIConfigAnalyzer:
 
         return result
 
-    def _detect_ci_platforms(self, repo_path: Path) -> Dict[str, Path]:
-        """Detect CI platforms by checking for config files."""
+    def _detect_ci_platforms(self, repo_path: Path) -> Dict[str, List[Path]]:
+        """Detect CI platforms by checking for config files.
+
+        Returns:
+            Configuration files per detected platform; GitHub Actions lists
+            every workflow file, sorted by name.
+        """
         detected = {}
 
         # GitHub Actions
         gh_workflows = repo_path / '.github' / 'workflows'
-        if gh_workflows.exists():
-            yml_files = list(gh_workflows.glob('*.yml')) + list(gh_workflows.glob('*.yaml'))
+        if gh_workflows.is_dir():
+            yml_files = sorted(
+                path for path in gh_workflows.iterdir()
+                if path.suffix in ('.yml', '.yaml') and path.is_file()
+            )
             if yml_files:
-                detected['github_actions'] = yml_files[0]
+                detected['github_actions'] = yml_files
 
         # GitLab CI
         gitlab_ci = repo_path / '.gitlab-ci.yml'
         if gitlab_ci.exists():
-            detected['gitlab_ci'] = gitlab_ci
+            detected['gitlab_ci'] = [gitlab_ci]
 
         # CircleCI
         circleci_config = repo_path / '.circleci' / 'config.yml'
         if circleci_config.exists():
-            detected['circleci'] = circleci_config
+            detected['circleci'] = [circleci_config]
 
         # Travis CI
         travis_yml = repo_path / '.travis.yml'
         if travis_yml.exists():
-            detected['travis_ci'] = travis_yml
+            detected['travis_ci'] = [travis_yml]
 
         # Jenkins
         jenkinsfile = repo_path / 'Jenkinsfile'
         if jenkinsfile.exists():
-            detected['jenkins'] = jenkinsfile
+            detected['jenkins'] = [jenkinsfile]
 
         return detected
 
+    def _parse_platforms(
+        self, repo_path: Path, detected_platforms: Dict[str, List[Path]]
+    ) -> Tuple[Dict[str, Dict], List[str]]:
+        """Parse all configuration files concurrently and merge them per platform.
+
+        Test steps of a platform's files are concatenated in file order. When
+        a platform has several files, job names are qualified with the file
+        name, so equally named jobs of different workflows count separately.
+
+        Returns:
+            Tuple of results per platform that parsed at least one file
+            ({'config_path', 'test_steps'}) and per-file parse errors.
+        """
+        files = [
+            (platform_name, config_path)
+            for platform_name, config_paths in detected_platforms.items()
+            for config_path in config_paths
+        ]
+        workers = min(self.MAX_PARSE_WORKERS, len(files))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(lambda item: self._parse_file(*item), files))
+
+        platform_results: Dict[str, Dict] = {}
+        parse_errors: List[str] = []
+        for (platform_name, config_path), (test_steps, error) in zip(files, outcomes, strict=True):
+            relative_path = config_path.relative_to(repo_path)
+            if test_steps is None:
+                parse_errors.append(f"Failed to parse {relative_path}: {error}")
+                continue
+
+            if len(detected_platforms[platform_name]) > 1:
+                test_steps = [
+                    replace(step, job_name=f"{config_path.stem}/{step.job_name}") for step in test_steps
+                ]
+            self.logger.debug(f"Parsed {relative_path}: {len(test_steps)} test steps found")
+
+            merged = platform_results.setdefault(
+                platform_name, {'config_path': config_path, 'test_steps': []}
+            )
+            if test_steps and not merged['test_steps']:
+                # Report the first file that contributes test steps
+                merged['config_path'] = config_path
+            merged['test_steps'].extend(test_steps)
+
+        return platform_results, parse_errors
+
+    def _parse_file(
+        self, platform_name: str, config_path: Path
+    ) -> Tuple[Optional[List[TestStepInfo]], Optional[str]]:
+        self.logger.debug(f"Parsing workflow file: {config_path}")
+        try:
+            return self.parsers[platform_name].parse_file(config_path)
+        except Exception as e:
+            # Parse error (minimal level - WARNING)
+            self.logger.warning(f"Parse error in {config_path}: {e}")
+            return None, f"{type(e).__name__}: {e}"
+
     def _calculate_platform_score(self, test_steps: List[TestStepInfo]) -> int:
         """Calculate score for a platform (for comparison)."""
         if not test_steps:
@@ -9,11 +9,25 @@ Constitutional Compliance:
 """
 
 import logging
+import threading
 from abc import ABC, abstractmethod
+from dataclasses import asdict
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, Any, List, Optional, Tuple, Union
+
+import yaml
 
 from src.metrics.models.ci_config import TestStepInfo
+from src.metrics.parse_cache import get_parse_cache
+from src.metrics.pattern_matchers.command_classifier import get_command_classifier
+
+# libyaml's C loader parses several times faster; same safe subset of YAML
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(stream: Union[str, bytes, IO]) -> Any:
+    """Load a YAML document like ``yaml.safe_load``, using libyaml when available."""
+    return yaml.load(stream, Loader=SafeLoader)
 
 
 class CIParser(ABC):
@@ -45,8 +59,53 @@ class CIParser(ABC):
     """
 
     def __init__(self):
-        """Initialize parser with logger."""
+        """Initialize parser with logger and command classifier."""
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.classifier = get_command_classifier()
+        # Last parse error per thread, so one parser can serve concurrent parses
+        self._last_error = threading.local()
+
+    def parse_file(self, config_path: Path) -> Tuple[Optional[List[TestStepInfo]], Optional[str]]:
+        """Parse a configuration file and report why it failed, if it did.
+
+        Results are cached by file content (see ``parse_cache``), so
+        identical workflow files of different repositories are parsed once.
+
+        Args:
+            config_path: Absolute path to CI configuration file.
+
+        Returns:
+            Tuple of parse() result and, when that is None, the error message.
+
+        Raises:
+            FileNotFoundError: If config_path does not exist.
+        """
+        if not config_path.exists():
+            raise FileNotFoundError(f"CI config not found: {config_path}")
+        # Results depend on the command patterns, which can be configured
+        return get_parse_cache().get(
+            f"ci.{type(self).__name__}.{self.classifier.fingerprint}", config_path, lambda _content: self._parse_reporting_error(config_path),
+            encode=_encode_parse_result, decode=_decode_parse_result
+        )
+
+    def _parse_reporting_error(self, config_path: Path) -> Tuple[Optional[List[TestStepInfo]], Optional[str]]:
+        self._last_error.message = None
+        test_steps = self.parse(config_path)
+        if test_steps is not None:
+            return test_steps, None
+        return None, self._last_error.message or "invalid configuration structure"
+
+    def _test_step(self, job_name: str, command: str) -> Optional[TestStepInfo]:
+        """TestStepInfo for a command if it runs tests, else None."""
+        verdict = self.classifier.classify(command)
+        if not verdict.is_test:
+            return None
+        return TestStepInfo(
+            job_name=job_name,
+            command=command,
+            framework=verdict.framework,
+            has_coverage_flag=verdict.has_coverage_flag
+        )
 
     @abstractmethod
     def parse(self, config_path: Path) -> Optional[List[TestStepInfo]]:
@@ -55,7 +114,7 @@ class CIParser(ABC):
         This method must be implemented by all subclasses. It should:
         1. Check if config_path exists (raise FileNotFoundError if not)
         2. Parse the configuration file (YAML, Groovy, etc.)
-        3. Extract test execution steps using TestCommandMatcher
+        3. Extract test execution steps using _test_step()
         4. Build List[TestStepInfo] with job names, commands, frameworks
         5. Return None on parse errors (after logging warning)
 
@@ -110,6 +169,7 @@ class CIParser(ABC):
             ... except yaml.YAMLError as e:
             ...     self._log_parse_error(e, config_path)
         """
+        self._last_error.message = f"{type(error).__name__}: {error}"
         if config_path:
             self.logger.warning(
                 f"Failed to parse CI config {config_path}: {type(error).__name__}: {error}"
@@ -118,3 +178,16 @@ class CIParser(ABC):
             self.logger.warning(
                 f"Parse error: {type(error).__name__}: {error}"
             )
+
+
+def _encode_parse_result(result: Tuple[Optional[List[TestStepInfo]], Optional[str]]) -> dict:
+    test_steps, error = result
+    return {
+        "test_steps": None if test_steps is None else [asdict(step) for step in test_steps],
+        "error": error,
+    }
+
+
+def _decode_parse_result(data: dict) -> Tuple[Optional[List[TestStepInfo]], Optional[str]]:
+    test_steps = data["test_steps"]
+    return (None if test_steps is None else [TestStepInfo(**step) for step in test_steps]), data["error"]
@@ -4,7 +4,7 @@ This module provides a parser for CircleCI configuration files (.circleci/config
 to extract test execution steps from job definitions.
 
 Constitutional Compliance:
-- Principle II (KISS): Simple YAML parsing with yaml.safe_load()
+- Principle II (KISS): Simple YAML parsing with load_yaml() (safe loader)
 - Principle III (Transparency): Clear error logging and step extraction
 """
 
@@ -13,9 +13,8 @@ from typing import Dict, List, Optional
 
 import yaml
 
-from src.metrics.ci_parsers.base import CIParser
+from src.metrics.ci_parsers.base import CIParser, load_yaml
 from src.metrics.models.ci_config import TestStepInfo
-from src.metrics.pattern_matchers.test_command_matcher import TestCommandMatcher
 
 
 class CircleCIParser(CIParser):
@@ -45,11 +44,6 @@ class CircleCIParser(CIParser):
         ...     print(f"Found {len(test_steps)} test steps")
     """
 
-    def __init__(self):
-        """Initialize parser with test command matcher."""
-        super().__init__()
-        self.test_matcher = TestCommandMatcher()
-
     def parse(self, config_path: Path) -> Optional[List[TestStepInfo]]:
         """Parse CircleCI configuration file to extract test steps.
 
@@ -80,7 +74,7 @@ class CircleCIParser(CIParser):
         try:
             # Parse YAML configuration file
             with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = load_yaml(f.read())
 
             # Validate config structure
             if not config or not isinstance(config, dict):
@@ -146,13 +140,8 @@ class CircleCIParser(CIParser):
                     continue
 
                 # Check if it's a test command
-                if command and self.test_matcher.is_test_command(command):
-                    test_step_info = TestStepInfo(
-                        job_name=job_name,
-                        command=command,
-                        framework=self.test_matcher.infer_framework(command),
-                        has_coverage_flag=self.test_matcher.has_coverage_flag(command)
-                    )
-                    test_steps.append(test_step_info)
+                test_step = self._test_step(job_name, command)
+                if test_step:
+                    test_steps.append(test_step)
 
         return test_steps
@@ -4,7 +4,7 @@ This module provides a parser for GitHub Actions workflow files (.yml/.yaml)
 to extract test execution steps and coverage upload actions.
 
 Constitutional Compliance:
-- Principle II (KISS): Simple YAML parsing with yaml.safe_load()
+- Principle II (KISS): Simple YAML parsing with load_yaml() (safe loader)
 - Principle III (Transparency): Clear error logging and step extraction
 """
 
@@ -13,9 +13,8 @@ from typing import Dict, List, Optional
 
 import yaml
 
-from src.metrics.ci_parsers.base import CIParser
+from src.metrics.ci_parsers.base import CIParser, load_yaml
 from src.metrics.models.ci_config import TestStepInfo
-from src.metrics.pattern_matchers.test_command_matcher import TestCommandMatcher
 
 
 class GitHubActionsParser(CIParser):
@@ -43,11 +42,6 @@ class GitHubActionsParser(CIParser):
         ...     print(f"Found {len(test_steps)} test steps")
     """
 
-    def __init__(self):
-        """Initialize parser with test command matcher."""
-        super().__init__()
-        self.test_matcher = TestCommandMatcher()
-
     def parse(self, config_path: Path) -> Optional[List[TestStepInfo]]:
         """Parse GitHub Actions workflow file to extract test steps.
 
@@ -79,7 +73,7 @@ class GitHubActionsParser(CIParser):
         try:
             # Parse YAML workflow file
             with open(config_path, 'r', encoding='utf-8') as f:
-                workflow = yaml.safe_load(f)
+                workflow = load_yaml(f.read())
 
             # Validate workflow structure
             if not workflow or not isinstance(workflow, dict):
@@ -140,13 +134,8 @@ class GitHubActionsParser(CIParser):
                 # Handle multi-line commands (split and check each line)
                 for line in run_command.split('\n'):
                     line = line.strip()
-                    if line and self.test_matcher.is_test_command(line):
-                        test_step_info = TestStepInfo(
-                            job_name=job_name,
-                            command=line,
-                            framework=self.test_matcher.infer_framework(line),
-                            has_coverage_flag=self.test_matcher.has_coverage_flag(line)
-                        )
-                        test_steps.append(test_step_info)
+                    test_step = self._test_step(job_name, line)
+                    if test_step:
+                        test_steps.append(test_step)
 
         return test_steps
@@ -4,7 +4,7 @@ This module provides a parser for GitLab CI configuration files (.gitlab-ci.yml)
 to extract test execution steps from script sections.
 
 Constitutional Compliance:
-- Principle II (KISS): Simple YAML parsing with yaml.safe_load()
+- Principle II (KISS): Simple YAML parsing with load_yaml() (safe loader)
 - Principle III (Transparency): Clear error logging and step extraction
 """
 
@@ -13,9 +13,8 @@ from typing import Dict, List, Optional, Union
 
 import yaml
 
-from src.metrics.ci_parsers.base import CIParser
+from src.metrics.ci_parsers.base import CIParser, load_yaml
 from src.metrics.models.ci_config import TestStepInfo
-from src.metrics.pattern_matchers.test_command_matcher import TestCommandMatcher
 
 
 class GitLabCIParser(CIParser):
@@ -51,11 +50,6 @@ class GitLabCIParser(CIParser):
         'include', 'extends', 'pages', 'workflow', 'default', 'inherit'
     }
 
-    def __init__(self):
-        """Initialize parser with test command matcher."""
-        super().__init__()
-        self.test_matcher = TestCommandMatcher()
-
     def parse(self, config_path: Path) -> Optional[List[TestStepInfo]]:
         """Parse GitLab CI configuration file to extract test steps.
 
@@ -86,7 +80,7 @@ class GitLabCIParser(CIParser):
         try:
             # Parse YAML configuration file
             with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = load_yaml(f.read())
 
             # Validate config structure
             if not config or not isinstance(config, dict):
@@ -137,28 +131,18 @@ class GitLabCIParser(CIParser):
         if script:
             commands = self._normalize_script_to_list(script)
             for command in commands:
-                if self.test_matcher.is_test_command(command):
-                    test_step_info = TestStepInfo(
-                        job_name=job_name,
-                        command=command,
-                        framework=self.test_matcher.infer_framework(command),
-                        has_coverage_flag=self.test_matcher.has_coverage_flag(command)
-                    )
-                    test_steps.append(test_step_info)
+                test_step = self._test_step(job_name, command)
+                if test_step:
+                    test_steps.append(test_step)
 
         # Also check after_script (sometimes contains test commands or coverage uploads)
         after_script = job_config.get('after_script')
         if after_script:
             commands = self._normalize_script_to_list(after_script)
             for command in commands:
-                if self.test_matcher.is_test_command(command):
-                    test_step_info = TestStepInfo(
-                        job_name=f"{job_name} (after_script)",
-                        command=command,
-                        framework=self.test_matcher.infer_framework(command),
-                        has_coverage_flag=self.test_matcher.has_coverage_flag(command)
-                    )
-                    test_steps.append(test_step_info)
+                test_step = self._test_step(f"{job_name} (after_script)", command)
+                if test_step:
+                    test_steps.append(test_step)
 
         return test_steps
 
@@ -1,19 +1,248 @@
 """Temporary directory management and cleanup for metrics collection."""
 
+import atexit
 import logging
 import os
+import queue
 import shutil
+import stat
+import sys
 import tempfile
+import threading
+import uuid
 from pathlib import Path
 
+# Directory (next to the discarded path) that doomed trees are renamed into;
+# one per user, since the system temp directory is shared
+TRASH_DIR_NAME = f".code-score-trash-{os.getuid()}" if hasattr(os, "getuid") else ".code-score-trash"
+
+
+def _force_rmtree(path: Path) -> None:
+    """Remove a directory tree, fixing permissions and tolerating concurrent removal."""
+    def on_exc(func, failed_path, error):
+        if isinstance(error, FileNotFoundError):
+            return
+        if isinstance(error, PermissionError):
+            os.chmod(os.path.dirname(failed_path), 0o755)
+            if os.path.isdir(failed_path) and not os.path.islink(failed_path):
+                os.chmod(failed_path, 0o755)
+            try:
+                func(failed_path)
+                return
+            except FileNotFoundError:
+                return
+        raise error
+
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=on_exc)
+    else:
+        shutil.rmtree(path, onerror=lambda func, failed_path, exc_info: on_exc(func, failed_path, exc_info[1]))
+
+
+def _make_private_trash_dir(trash_dir: Path) -> None:
+    """Create the trash directory, or make sure an existing one is ours alone.
+
+    Checkouts renamed into it must not be readable by other users, and a
+    directory someone else created must never receive them.
+
+    Raises:
+        OSError: If the directory cannot be created or belongs to another user
+    """
+    trash_dir.mkdir(mode=0o700, exist_ok=True)
+    if not hasattr(os, "getuid"):
+        return
+    info = os.lstat(trash_dir)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"{trash_dir} is not a directory owned by the current user")
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        os.chmod(trash_dir, 0o700)
+
+
+def _owned_by_current_user(path: Path) -> bool:
+    if not hasattr(os, "getuid"):
+        return True
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(info.st_mode) and info.st_uid == os.getuid()
+
+
+class TrashReaper:
+    """Deletes discarded directory trees in the background.
+
+    A directory is first renamed into a trash directory on the same
+    filesystem, which is atomic and instant, and then deleted by a small pool
+    of daemon threads. Callers therefore never wait for large checkouts
+    (``node_modules``, Maven ``target``) to be removed.
+
+    Trash directories are per user and private (mode 0700); a trash
+    directory owned by someone else is never used or swept. Trash left
+    behind by a crashed process is swept the next time a reaper starts or
+    uses that trash directory. Pending deletions are drained when the
+    interpreter exits.
+    """
+
+    def __init__(self, max_workers: int = 2, trash_roots: list[Path] | None = None):
+        """Initialize the reaper and sweep leftover trash.
+
+        Args:
+            max_workers: Maximum concurrent deletions
+            trash_roots: Directories whose trash is swept on startup
+                (default: the system temp directory)
+        """
+        self.max_workers = max(1, max_workers)
+        self.logger = logging.getLogger('code_score.cleanup')
+        self.stats = {"queued": 0, "deleted": 0, "failed": 0, "fallback_sync": 0}
+
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._threads: list[threading.Thread] = []
+        self._swept: set[Path] = set()
+
+        for root in trash_roots if trash_roots is not None else [Path(tempfile.gettempdir())]:
+            trash_dir = Path(root) / TRASH_DIR_NAME
+            if _owned_by_current_user(trash_dir):
+                self._sweep(trash_dir)
+
+    def discard(self, path: str | Path) -> None:
+        """Move a directory out of the way and delete it in the background.
+
+        The path no longer exists when this returns. Falls back to a
+        synchronous delete when the rename is not possible (e.g. the trash
+        directory cannot be created).
+        """
+        path = Path(path)
+        if not path.exists() and not path.is_symlink():
+            return
+        if path.is_symlink() or not path.is_dir():
+            path.unlink()
+            return
+
+        trash_dir = path.parent / TRASH_DIR_NAME
+        target = trash_dir / f"{path.name}-{uuid.uuid4().hex[:12]}"
+        for attempt in range(2):
+            try:
+                _make_private_trash_dir(trash_dir)
+                self._sweep_once(trash_dir)
+                os.rename(path, target)
+                break
+            except FileNotFoundError:
+                # A worker removed the empty trash directory in between; recreate it
+                if attempt == 0 and path.exists():
+                    continue
+                raise
+            except OSError as e:
+                self.logger.debug(f"Cannot move {path} to trash ({e}); deleting synchronously")
+                self._record("fallback_sync")
+                _force_rmtree(path)
+                return
+
+        self._schedule(target)
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until all scheduled deletions have finished.
+
+        Returns:
+            True if nothing is pending anymore
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def pending(self) -> int:
+        """Number of scheduled deletions that have not finished yet."""
+        with self._lock:
+            return self._pending
+
+    def _sweep_once(self, trash_dir: Path) -> None:
+        with self._lock:
+            if trash_dir in self._swept:
+                return
+        self._sweep(trash_dir)
+
+    def _sweep(self, trash_dir: Path) -> int:
+        """Schedule deletion of everything left in a trash directory."""
+        with self._lock:
+            self._swept.add(trash_dir)
+        count = 0
+        try:
+            entries = list(trash_dir.iterdir())
+        except OSError:
+            return 0
+        for entry in entries:
+            self._schedule(entry)
+            count += 1
+        if count:
+            self.logger.info(f"Sweeping {count} leftover trash entr{'y' if count == 1 else 'ies'} in {trash_dir}")
+        return count
+
+    def _schedule(self, target: Path) -> None:
+        with self._lock:
+            self._pending += 1
+            self.stats["queued"] += 1
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(target=self._worker, name=f"trash-reaper-{len(self._threads)}",
+                                          daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        self._queue.put(target)
+
+    def _worker(self) -> None:
+        while True:
+            target = self._queue.get()
+            try:
+                if target.is_dir() and not target.is_symlink():
+                    _force_rmtree(target)
+                elif target.exists() or target.is_symlink():
+                    target.unlink()
+                self._record("deleted")
+            except Exception as e:
+                self.logger.warning(f"Background cleanup of {target} failed: {e}")
+                self._record("failed")
+            finally:
+                self._remove_empty_trash_dir(target.parent)
+                with self._idle:
+                    self._pending -= 1
+                    self._idle.notify_all()
+
+    def _record(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    @staticmethod
+    def _remove_empty_trash_dir(trash_dir: Path) -> None:
+        # Another deletion may still be using it; rmdir then fails harmlessly
+        try:
+            trash_dir.rmdir()
+        except OSError:
+            pass
+
 
 class RepositoryCleanup:
-    """Manages cleanup of temporary files and directories."""
+    """Manages cleanup of temporary files and directories.
+
+    Directories are handed to a TrashReaper, so they disappear immediately
+    but are deleted in the background.
+    """
 
-    def __init__(self):
-        """Initialize cleanup manager."""
+    def __init__(self, reaper: TrashReaper | None = None):
+        """Initialize cleanup manager.
+
+        Args:
+            reaper: Background deleter for directories (default: the global reaper)
+        """
         self.cleanup_paths: list[Path] = []
         self.logger = logging.getLogger('code_score.cleanup')
+        self._reaper = reaper
+
+    @property
+    def reaper(self) -> TrashReaper:
+        """Background deleter used for directories."""
+        if self._reaper is None:
+            self._reaper = get_trash_reaper()
+        return self._reaper
 
     def register_for_cleanup(self, path: Path) -> None:
         """Register a path for cleanup."""
@@ -52,8 +281,8 @@ class RepositoryCleanup:
                 path.unlink()
                 self.logger.debug(f"Removed file: {path}")
             elif path.is_dir():
-                shutil.rmtree(path)
-                self.logger.debug(f"Removed directory: {path}")
+                self.reaper.discard(path)
+                self.logger.debug(f"Moved directory to background cleanup: {path}")
         except PermissionError as e:
             self.logger.warning(f"Permission denied cleaning up {path}: {e}")
             # Try to change permissions and retry
@@ -131,6 +360,20 @@ class RepositoryCleanup:
 # Global cleanup instance for module-level operations
 _global_cleanup = RepositoryCleanup()
 
+# Global reaper, created on first use so importing this module does not sweep
+_global_reaper: TrashReaper | None = None
+_global_reaper_lock = threading.Lock()
+
+
+def get_trash_reaper() -> TrashReaper:
+    """Get the global background reaper, draining it at interpreter exit."""
+    global _global_reaper
+    with _global_reaper_lock:
+        if _global_reaper is None:
+            _global_reaper = TrashReaper()
+            atexit.register(_global_reaper.drain)
+        return _global_reaper
+
 
 def get_cleanup_manager() -> RepositoryCleanup:
     """Get the global cleanup manager instance."""
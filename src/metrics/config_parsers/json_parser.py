@@ -11,12 +11,15 @@ Constitutional Compliance:
 import json
 from pathlib import Path
 
+from src.metrics.manifest_store import ManifestStore
 
-def verify_test_script(file_path: Path) -> tuple[bool, str]:
+
+def verify_test_script(file_path: Path, store: ManifestStore | None = None) -> tuple[bool, str]:
     """Verify that package.json contains scripts.test key (FR-005).
 
     Args:
         file_path: Path to package.json file
+        store: Manifests of the analysis, shared with the other checks
 
     Returns:
         Tuple of (verified: bool, message: str)
@@ -32,7 +35,8 @@ def verify_test_script(file_path: Path) -> tuple[bool, str]:
         - jest.config.js files are accepted if they exist (FR-005)
         - Malformed JSON returns (False, "parse error message")
     """
-    if not file_path.exists():
+    store = store or ManifestStore(file_path.parent)
+    if not store.exists(file_path):
         return False, f"File not found: {file_path}"
 
     # jest.config.js files are valid if they exist (any content per FR-005)
@@ -42,29 +46,19 @@ def verify_test_script(file_path: Path) -> tuple[bool, str]:
     # For package.json, must verify scripts.test key
     if file_path.name == "package.json":
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Check for scripts.test key
-            if "scripts" in data and "test" in data["scripts"]:
-                return True, "Found scripts.test in package.json"
-            else:
-                return False, "Missing scripts.test key in package.json"
-
-        except json.JSONDecodeError as e:
-            # Fail-fast on parsing errors (KISS principle)
-            return False, f"JSON parse error: {str(e)}"
+            return store.verdict("json.test_script", file_path, lambda: _test_script_verdict(store, file_path))
         except Exception as e:
             return False, f"Error reading file: {str(e)}"
 
     return False, f"Unexpected file type: {file_path.name}"
 
 
-def verify_coverage_threshold(file_path: Path) -> tuple[bool, str]:
+def verify_coverage_threshold(file_path: Path, store: ManifestStore | None = None) -> tuple[bool, str]:
     """Verify that jest config contains coverageThreshold key (FR-006).
 
     Args:
         file_path: Path to jest.config.json or jest.config.js file
+        store: Manifests of the analysis, shared with the other checks
 
     Returns:
         Tuple of (verified: bool, message: str)
@@ -80,7 +74,8 @@ def verify_coverage_threshold(file_path: Path) -> tuple[bool, str]:
         - Only works with .json files (not .js files with exports)
         - Malformed JSON returns (False, "parse error message")
     """
-    if not file_path.exists():
+    store = store or ManifestStore(file_path.parent)
+    if not store.exists(file_path):
         return False, f"File not found: {file_path}"
 
     # Only parse .json files (not .js files with module.exports)
@@ -89,15 +84,38 @@ def verify_coverage_threshold(file_path: Path) -> tuple[bool, str]:
         # This prevents false positives (FR-006/FR-006a compliance)
         return False, f"Cannot parse {file_path.name} (JavaScript file requires AST parsing)"
 
+    def verdict() -> tuple[bool, str]:
+        try:
+            data = store.json(file_path)
+
+            # Check for coverageThreshold key
+            if "coverageThreshold" in data:
+                return True, f"Found coverageThreshold in {file_path.name}"
+            else:
+                return False, f"Missing coverageThreshold key in {file_path.name}"
+
+        except json.JSONDecodeError as e:
+            # Fail-fast on parsing errors (KISS principle)
+            return False, f"JSON parse error: {str(e)}"
+        except Exception as e:
+            return False, f"Error reading file: {str(e)}"
+
+    try:
+        # The cache key includes the file name the messages mention
+        return store.verdict("json.coverage_threshold", file_path, verdict)
+    except Exception as e:
+        return False, f"Error reading file: {str(e)}"
+
+
+def _test_script_verdict(store: ManifestStore, file_path: Path) -> tuple[bool, str]:
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = store.json(file_path)
 
-        # Check for coverageThreshold key
-        if "coverageThreshold" in data:
-            return True, f"Found coverageThreshold in {file_path.name}"
+        # Check for scripts.test key
+        if "scripts" in data and "test" in data["scripts"]:
+            return True, "Found scripts.test in package.json"
         else:
-            return False, f"Missing coverageThreshold key in {file_path.name}"
+            return False, "Missing scripts.test key in package.json"
 
     except json.JSONDecodeError as e:
         # Fail-fast on parsing errors (KISS principle)
@@ -10,12 +10,15 @@ Constitutional Compliance:
 
 from pathlib import Path
 
+from src.metrics.manifest_store import ManifestStore
 
-def verify_coverage_flags(file_path: Path) -> tuple[bool, str]:
+
+def verify_coverage_flags(file_path: Path, store: ManifestStore | None = None) -> tuple[bool, str]:
     """Verify that Makefile contains coverage-related flags (FR-006).
 
     Args:
         file_path: Path to Makefile
+        store: Manifests of the analysis, shared with the other checks
 
     Returns:
         Tuple of (verified: bool, message: str)
@@ -31,12 +34,20 @@ def verify_coverage_flags(file_path: Path) -> tuple[bool, str]:
         - Simple text search, no make syntax parsing
         - Case-sensitive search
     """
-    if not file_path.exists():
+    store = store or ManifestStore(file_path.parent)
+    if not store.exists(file_path):
         return False, f"File not found: {file_path}"
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        return store.verdict("makefile.coverage_flags", file_path,
+                             lambda: _coverage_flags_verdict(store.content(file_path)))
+    except Exception as e:
+        return False, f"Error reading file: {str(e)}"
+
+
+def _coverage_flags_verdict(data: bytes) -> tuple[bool, str]:
+    try:
+        content = data.decode("utf-8")
 
         # Check for coverage-related flags and keywords
         coverage_indicators = [
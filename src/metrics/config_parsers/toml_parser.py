@@ -12,12 +12,15 @@ from pathlib import Path
 
 import tomli
 
+from src.metrics.manifest_store import ManifestStore
 
-def verify_pytest_section(file_path: Path) -> tuple[bool, str]:
+
+def verify_pytest_section(file_path: Path, store: ManifestStore | None = None) -> tuple[bool, str]:
     """Verify that pyproject.toml contains [tool.pytest] section (FR-005).
 
     Args:
         file_path: Path to pyproject.toml or pytest.ini file
+        store: Manifests of the analysis, shared with the other checks
 
     Returns:
         Tuple of (verified: bool, message: str)
@@ -33,7 +36,8 @@ def verify_pytest_section(file_path: Path) -> tuple[bool, str]:
         - pyproject.toml requires [tool.pytest] section presence
         - Malformed TOML returns (False, "parse error message")
     """
-    if not file_path.exists():
+    store = store or ManifestStore(file_path.parent)
+    if not store.exists(file_path):
         return False, f"File not found: {file_path}"
 
     # pytest.ini files are valid if they exist (any content per FR-005)
@@ -43,18 +47,8 @@ def verify_pytest_section(file_path: Path) -> tuple[bool, str]:
     # For pyproject.toml, must verify [tool.pytest] section
     if file_path.name == "pyproject.toml":
         try:
-            with open(file_path, "rb") as f:
-                data = tomli.load(f)
-
-            # Check for [tool.pytest] or [tool.pytest.ini_options]
-            if "tool" in data and "pytest" in data["tool"]:
-                return True, "Found [tool.pytest] section in pyproject.toml"
-            else:
-                return False, "Missing [tool.pytest] section in pyproject.toml"
-
-        except tomli.TOMLDecodeError as e:
-            # Fail-fast on parsing errors (KISS principle)
-            return False, f"TOML parse error: {str(e)}"
+            return store.verdict("toml.pytest_section", file_path,
+                                 lambda: _pytest_section_verdict(store, file_path))
         except Exception as e:
             return False, f"Error reading file: {str(e)}"
 
@@ -65,11 +59,12 @@ def verify_pytest_section(file_path: Path) -> tuple[bool, str]:
     return False, f"Unexpected file type: {file_path.name}"
 
 
-def verify_coverage_section(file_path: Path) -> tuple[bool, str]:
+def verify_coverage_section(file_path: Path, store: ManifestStore | None = None) -> tuple[bool, str]:
     """Verify that pyproject.toml or .coveragerc contains coverage config (FR-006).
 
     Args:
         file_path: Path to pyproject.toml or .coveragerc file
+        store: Manifests of the analysis, shared with the other checks
 
     Returns:
         Tuple of (verified: bool, message: str)
@@ -85,7 +80,8 @@ def verify_coverage_section(file_path: Path) -> tuple[bool, str]:
         - pyproject.toml requires [tool.coverage] section presence
         - Malformed TOML returns (False, "parse error message")
     """
-    if not file_path.exists():
+    store = store or ManifestStore(file_path.parent)
+    if not store.exists(file_path):
         return False, f"File not found: {file_path}"
 
     # .coveragerc files are valid if they exist (any content per FR-006)
@@ -95,19 +91,43 @@ def verify_coverage_section(file_path: Path) -> tuple[bool, str]:
     # For pyproject.toml, must verify [tool.coverage] section
     if file_path.name == "pyproject.toml":
         try:
-            with open(file_path, "rb") as f:
-                data = tomli.load(f)
-
-            # Check for [tool.coverage]
-            if "tool" in data and "coverage" in data["tool"]:
-                return True, "Found [tool.coverage] section in pyproject.toml"
-            else:
-                return False, "Missing [tool.coverage] section in pyproject.toml"
-
-        except tomli.TOMLDecodeError as e:
-            # Fail-fast on parsing errors (KISS principle)
-            return False, f"TOML parse error: {str(e)}"
+            return store.verdict("toml.coverage_section", file_path,
+                                 lambda: _coverage_section_verdict(store, file_path))
         except Exception as e:
             return False, f"Error reading file: {str(e)}"
 
     return False, f"Unexpected file type: {file_path.name}"
+
+
+def _pytest_section_verdict(store: ManifestStore, file_path: Path) -> tuple[bool, str]:
+    try:
+        data = store.toml(file_path)
+
+        # Check for [tool.pytest] or [tool.pytest.ini_options]
+        if "tool" in data and "pytest" in data["tool"]:
+            return True, "Found [tool.pytest] section in pyproject.toml"
+        else:
+            return False, "Missing [tool.pytest] section in pyproject.toml"
+
+    except tomli.TOMLDecodeError as e:
+        # Fail-fast on parsing errors (KISS principle)
+        return False, f"TOML parse error: {str(e)}"
+    except Exception as e:
+        return False, f"Error reading file: {str(e)}"
+
+
+def _coverage_section_verdict(store: ManifestStore, file_path: Path) -> tuple[bool, str]:
+    try:
+        data = store.toml(file_path)
+
+        # Check for [tool.coverage]
+        if "tool" in data and "coverage" in data["tool"]:
+            return True, "Found [tool.coverage] section in pyproject.toml"
+        else:
+            return False, "Missing [tool.coverage] section in pyproject.toml"
+
+    except tomli.TOMLDecodeError as e:
+        # Fail-fast on parsing errors (KISS principle)
+        return False, f"TOML parse error: {str(e)}"
+    except Exception as e:
+        return False, f"Error reading file: {str(e)}"
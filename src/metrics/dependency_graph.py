@@ -0,0 +1,655 @@
+"""Dependency graph extraction from lockfiles and manifests.
+
+Lockfiles are parsed directly (no package manager is invoked) into a
+compact graph: interned ``(ecosystem, name, version)`` packages, edges as
+index pairs and the set of direct dependencies. Each lockfile's parse is
+cached by the hash of its content (and of the manifest it is read with),
+so identical lockfiles across jobs, forks and subprojects are parsed once.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import tomllib
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, NamedTuple
+
+DEPENDENCY_CACHE_ENV = "CODE_SCORE_DEPENDENCY_CACHE"
+# Bump when parsers change so stale on-disk entries are ignored
+_CACHE_FORMAT = 1
+
+_SKIP_DIRS = {".git", "node_modules", "vendor", "target", "build", "dist", ".venv", "venv", "__pycache__"}
+_MAX_MANIFEST_DEPTH = 4
+
+logger = logging.getLogger('code_score.dependency_graph')
+
+
+class Package(NamedTuple):
+    """A resolved package version; strings are interned."""
+
+    ecosystem: str
+    name: str
+    version: str
+
+
+def normalize_package_name(ecosystem: str, name: str) -> str:
+    """Name used to identify a package (PEP 503 for PyPI, exact otherwise)."""
+    if ecosystem == "PyPI":
+        return re.sub(r"[-_.]+", "-", name).lower()
+    return name
+
+
+@dataclass
+class LockfileGraph:
+    """Parse result of one lockfile, the unit that is cached.
+
+    Attributes:
+        ecosystem: OSV ecosystem name (PyPI, npm, Go, Maven)
+        packages: ``(name, version)`` pairs
+        edges: ``(dependent, dependency)`` indices into ``packages``
+        direct: Indices of packages the project depends on directly
+    """
+
+    ecosystem: str
+    packages: list[tuple[str, str]] = field(default_factory=list)
+    edges: list[tuple[int, int]] = field(default_factory=list)
+    direct: list[int] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"ecosystem": self.ecosystem, "packages": self.packages,
+                "edges": self.edges, "direct": self.direct}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LockfileGraph":
+        return cls(
+            ecosystem=data["ecosystem"],
+            packages=[tuple(package) for package in data["packages"]],
+            edges=[tuple(edge) for edge in data["edges"]],
+            direct=list(data["direct"]),
+        )
+
+
+class _Builder:
+    """Accumulates one lockfile's packages without duplicates."""
+
+    def __init__(self, ecosystem: str) -> None:
+        self.graph = LockfileGraph(ecosystem)
+        self._index: dict[tuple[str, str], int] = {}
+        self._edges: set[tuple[int, int]] = set()
+        self._direct: set[int] = set()
+
+    def add(self, name: str, version: str) -> int:
+        key = (normalize_package_name(self.graph.ecosystem, name), version)
+        index = self._index.get(key)
+        if index is None:
+            index = self._index[key] = len(self.graph.packages)
+            self.graph.packages.append((name, version))
+        return index
+
+    def edge(self, dependent: int | None, dependency: int | None) -> None:
+        if dependent is not None and dependency is not None and dependent != dependency:
+            self._edges.add((dependent, dependency))
+
+    def mark_direct(self, index: int | None) -> None:
+        if index is not None:
+            self._direct.add(index)
+
+    def build(self) -> LockfileGraph:
+        self.graph.edges = sorted(self._edges)
+        self.graph.direct = sorted(self._direct)
+        return self.graph
+
+
+# ----------------------------------------------------------------------
+# Parsers: (content, companion manifest content or None) -> LockfileGraph
+# ----------------------------------------------------------------------
+
+_REQUIREMENT_PIN = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*===?\s*([^\s;#,]+)")
+_REQUIREMENT_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+_YARN_DEPENDENCY = re.compile(r'^\s+"?((?:@[^/\s"]+/)?[^\s":]+)"?:?\s+"?([^"]+?)"?\s*$')
+_GO_REQUIRE = re.compile(r"^(?:require\s+)?(\S+)\s+(v\S+)(\s*//\s*indirect)?")
+
+
+def _text(content: bytes) -> str:
+    return content.decode("utf-8", errors="replace")
+
+
+def _package_json_dependencies(companion: bytes | None) -> dict[str, str]:
+    if not companion:
+        return {}
+    try:
+        manifest = json.loads(companion)
+    except ValueError:
+        return {}
+    dependencies = {}
+    for section in ("dependencies", "devDependencies", "optionalDependencies", "peerDependencies"):
+        if isinstance(manifest.get(section), dict):
+            dependencies.update(manifest[section])
+    return dependencies
+
+
+def _parse_requirements(content: bytes, companion: bytes | None) -> LockfileGraph:
+    builder = _Builder("PyPI")
+    for line in _text(content).splitlines():
+        match = _REQUIREMENT_PIN.match(line)
+        if match:
+            builder.mark_direct(builder.add(match.group(1), match.group(2)))
+    return builder.build()
+
+
+def _pyproject_direct_names(companion: bytes | None) -> set[str]:
+    if not companion:
+        return set()
+    try:
+        pyproject = tomllib.loads(_text(companion))
+    except tomllib.TOMLDecodeError:
+        return set()
+    names = set()
+    poetry = pyproject.get("tool", {}).get("poetry", {})
+    names.update(poetry.get("dependencies", {}))
+    for group in poetry.get("group", {}).values():
+        names.update(group.get("dependencies", {}))
+    requirements = list(pyproject.get("project", {}).get("dependencies", []))
+    for extra in pyproject.get("project", {}).get("optional-dependencies", {}).values():
+        requirements.extend(extra)
+    for requirement in requirements:
+        match = _REQUIREMENT_NAME.match(requirement)
+        if match:
+            names.add(match.group(1))
+    names.discard("python")
+    return {normalize_package_name("PyPI", name) for name in names}
+
+
+def _parse_toml_lock(content: bytes, companion: bytes | None) -> LockfileGraph:
+    """``poetry.lock`` and ``uv.lock``: ``[[package]]`` tables.
+
+    Poetry lists dependencies as a name -> constraint table and direct
+    dependencies come from ``pyproject.toml``; uv lists them as
+    ``{name = ...}`` entries and the project itself is the package with an
+    editable/virtual source.
+    """
+    builder = _Builder("PyPI")
+    data = tomllib.loads(_text(content))
+    by_name: dict[str, int] = {}
+    project_dependencies: list[str] = []
+    entries = []
+    for package in data.get("package", []):
+        name = package.get("name")
+        source = package.get("source") or {}
+        if name and ("editable" in source or "virtual" in source):
+            project_dependencies.extend(_toml_dependency_names(package))
+            continue
+        if not name or not package.get("version"):
+            continue
+        index = builder.add(name, str(package["version"]))
+        by_name.setdefault(normalize_package_name("PyPI", name), index)
+        entries.append((index, package))
+
+    for index, package in entries:
+        for dependency in _toml_dependency_names(package):
+            builder.edge(index, by_name.get(normalize_package_name("PyPI", dependency)))
+
+    direct = {normalize_package_name("PyPI", name) for name in project_dependencies}
+    direct |= _pyproject_direct_names(companion)
+    for name in direct:
+        builder.mark_direct(by_name.get(name))
+    return builder.build()
+
+
+def _toml_dependency_names(package: dict[str, Any]) -> list[str]:
+    names: list[str] = []
+    for key in ("dependencies", "dev-dependencies", "optional-dependencies"):
+        value = package.get(key)
+        if isinstance(value, dict):
+            for name, entries in value.items():
+                if isinstance(entries, list) and entries and isinstance(entries[0], dict):
+                    names.extend(entry["name"] for entry in entries if entry.get("name"))  # uv groups/extras
+                else:
+                    names.append(name)  # poetry constraint table
+        elif isinstance(value, list):
+            names.extend(entry["name"] for entry in value if isinstance(entry, dict) and entry.get("name"))
+    return names
+
+
+def _parse_package_lock(content: bytes, companion: bytes | None) -> LockfileGraph:
+    builder = _Builder("npm")
+    data = json.loads(content)
+
+    if "packages" in data:  # lockfileVersion 2 and 3: flat map of install locations
+        packages = data["packages"]
+        locations: dict[str, int] = {}
+        for location, package in packages.items():
+            if not location or package.get("link") or not package.get("version"):
+                continue
+            name = package.get("name") or location.rsplit("node_modules/", 1)[-1]
+            locations[location] = builder.add(name, package["version"])
+
+        def resolve(location: str, name: str) -> int | None:
+            # Node resolution: nearest node_modules directory walking upwards
+            base = location
+            while True:
+                candidate = f"{base}/node_modules/{name}" if base else f"node_modules/{name}"
+                if candidate in locations:
+                    return locations[candidate]
+                if not base:
+                    return None
+                cut = base.rfind("node_modules/")
+                base = base[:cut].rstrip("/") if cut > 0 else ""
+
+        for location, package in packages.items():
+            if package.get("link"):
+                continue
+            names = set(package.get("dependencies", {})) | set(package.get("optionalDependencies", {}))
+            if not location:
+                names |= set(package.get("devDependencies", {}))
+            for name in names:
+                target = resolve(location, name)
+                if not location:
+                    builder.mark_direct(target)
+                else:
+                    builder.edge(locations.get(location), target)
+        return builder.build()
+
+    # lockfileVersion 1: nested "dependencies" with "requires" by name
+    def walk(dependencies: dict[str, Any], scopes: list[dict[str, int]]) -> dict[str, int]:
+        scope = {
+            name: builder.add(name, package["version"])
+            for name, package in dependencies.items() if package.get("version")
+        }
+        chain = [scope] + scopes
+        for name, package in dependencies.items():
+            if name not in scope:
+                continue
+            nested_scope = walk(package.get("dependencies", {}), chain)
+            for required in package.get("requires", {}):
+                target = nested_scope.get(required)
+                if target is None:
+                    target = next((s[required] for s in chain if required in s), None)
+                builder.edge(scope[name], target)
+        return scope
+
+    top_level = walk(data.get("dependencies", {}), [])
+    for name in _package_json_dependencies(companion):
+        builder.mark_direct(top_level.get(name))
+    return builder.build()
+
+
+def _yarn_spec_name(spec: str) -> str:
+    at = spec.find("@", 1)
+    return spec[:at] if at > 0 else spec
+
+
+def _parse_yarn_lock(content: bytes, companion: bytes | None) -> LockfileGraph:
+    """Yarn classic (v1) and berry lockfiles."""
+    builder = _Builder("npm")
+    entries: list[tuple[list[str], str | None, list[tuple[str, str]]]] = []
+    specs: list[str] = []
+    version = None
+    dependencies: list[tuple[str, str]] = []
+    in_dependencies = False
+
+    def flush() -> None:
+        if specs:
+            entries.append((specs, version, dependencies))
+
+    for line in _text(content).splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        indent = len(line) - len(line.lstrip())
+        if indent == 0:
+            flush()
+            specs = [spec.strip().strip('"') for spec in line.rstrip(":").split(",")]
+            specs = [spec for spec in specs if "@" in spec]
+            version, dependencies, in_dependencies = None, [], False
+        elif indent == 2:
+            stripped = line.strip()
+            in_dependencies = stripped.rstrip(":") in ("dependencies", "optionalDependencies")
+            if stripped.startswith("version"):
+                version = stripped.split(None, 1)[1].strip('"') if " " in stripped else None
+        elif in_dependencies:
+            match = _YARN_DEPENDENCY.match(line)
+            if match:
+                dependencies.append((match.group(1), match.group(2)))
+    flush()
+
+    by_spec: dict[str, int] = {}
+    indexed: list[tuple[int | None, list[tuple[str, str]]]] = []
+    for entry_specs, entry_version, entry_dependencies in entries:
+        if not entry_version:
+            continue
+        if any("@workspace:" in spec for spec in entry_specs):
+            # Berry workspace entry: the project itself, its dependencies are direct
+            indexed.append((None, entry_dependencies))
+            continue
+        index = builder.add(_yarn_spec_name(entry_specs[0]), entry_version)
+        for spec in entry_specs:
+            by_spec[spec] = index
+        indexed.append((index, entry_dependencies))
+
+    def lookup(name: str, spec_range: str) -> int | None:
+        for key in (f"{name}@{spec_range}", f"{name}@npm:{spec_range}"):
+            if key in by_spec:
+                return by_spec[key]
+        return None
+
+    for dependent, entry_dependencies in indexed:
+        for name, spec_range in entry_dependencies:
+            if dependent is None:
+                builder.mark_direct(lookup(name, spec_range))
+            else:
+                builder.edge(dependent, lookup(name, spec_range))
+    for name, spec_range in _package_json_dependencies(companion).items():
+        builder.mark_direct(lookup(name, spec_range))
+    return builder.build()
+
+
+def _parse_go_mod(content: bytes, companion: bytes | None) -> LockfileGraph:
+    """``go.mod`` require directives (the full selected module set since Go 1.17)."""
+    builder = _Builder("Go")
+    in_block = False
+    for line in _text(content).splitlines():
+        stripped = line.strip()
+        if stripped.startswith("require ("):
+            in_block = True
+            continue
+        if in_block and stripped == ")":
+            in_block = False
+            continue
+        if in_block or stripped.startswith("require "):
+            match = _GO_REQUIRE.match(stripped)
+            if match:
+                index = builder.add(match.group(1), match.group(2).split("+incompatible")[0])
+                if not match.group(3):
+                    builder.mark_direct(index)
+    return builder.build()
+
+
+def _parse_go_sum(content: bytes, companion: bytes | None) -> LockfileGraph:
+    """``go.sum`` without a ``go.mod``: every checksummed module version."""
+    builder = _Builder("Go")
+    for line in _text(content).splitlines():
+        parts = line.split()
+        if len(parts) >= 2:
+            builder.add(parts[0], parts[1].removesuffix("/go.mod").split("+incompatible")[0])
+    return builder.build()
+
+
+def _parse_pom(content: bytes, companion: bytes | None) -> LockfileGraph:
+    """Dependencies with literal or ``${property}`` versions declared in a pom."""
+    builder = _Builder("Maven")
+    root = ET.fromstring(content)
+    for element in root.iter():
+        if isinstance(element.tag, str) and "}" in element.tag:
+            element.tag = element.tag.split("}", 1)[1]
+
+    properties = {}
+    properties_element = root.find("properties")
+    if properties_element is not None:
+        for prop in properties_element:
+            properties[prop.tag] = (prop.text or "").strip()
+    project_version = (root.findtext("version") or root.findtext("parent/version") or "").strip()
+    properties.setdefault("project.version", project_version)
+
+    for dependency in root.iter("dependency"):
+        group = (dependency.findtext("groupId") or "").strip()
+        artifact = (dependency.findtext("artifactId") or "").strip()
+        version = (dependency.findtext("version") or "").strip()
+        version = re.sub(r"\$\{([^}]+)\}", lambda m: properties.get(m.group(1), m.group(0)), version)
+        if group and artifact and version and "${" not in version:
+            builder.mark_direct(builder.add(f"{group}:{artifact}", version))
+    return builder.build()
+
+
+# File name -> (ecosystem, parser, companion manifest read alongside it);
+# requirements*.txt is matched separately
+_Parser = tuple[str, Callable[[bytes, bytes | None], LockfileGraph], str | None]
+
+LOCKFILE_PARSERS: dict[str, _Parser] = {
+    "uv.lock": ("PyPI", _parse_toml_lock, "pyproject.toml"),
+    "poetry.lock": ("PyPI", _parse_toml_lock, "pyproject.toml"),
+    "package-lock.json": ("npm", _parse_package_lock, "package.json"),
+    "yarn.lock": ("npm", _parse_yarn_lock, "package.json"),
+    "go.mod": ("Go", _parse_go_mod, None),
+    "go.sum": ("Go", _parse_go_sum, None),
+    "pom.xml": ("Maven", _parse_pom, None),
+}
+
+
+def _parser_for(filename: str, siblings: set[str]) -> _Parser | None:
+    if filename == "go.sum" and "go.mod" in siblings:
+        return None  # go.mod already lists the selected versions
+    if filename in LOCKFILE_PARSERS:
+        return LOCKFILE_PARSERS[filename]
+    if filename.startswith("requirements") and filename.endswith(".txt"):
+        return ("PyPI", _parse_requirements, None)
+    return None
+
+
+# ----------------------------------------------------------------------
+# Content-hash cache
+# ----------------------------------------------------------------------
+
+class LockfileCache:
+    """Parsed lockfiles keyed by content hash, in memory and optionally on disk."""
+
+    def __init__(self, cache_dir: str | Path | None = None, max_entries: int = 512) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persistent entries shared across processes
+            max_entries: In-memory entries kept (least recently used are dropped)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, LockfileGraph] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+    def get(self, key: str) -> LockfileGraph | None:
+        with self._lock:
+            graph = self._entries.get(key)
+            if graph is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return graph
+
+        graph = self._read_disk(key)
+        with self._lock:
+            if graph is not None:
+                self.stats["disk_hits"] += 1
+                self._remember(key, graph)
+            else:
+                self.stats["misses"] += 1
+        return graph
+
+    def put(self, key: str, graph: LockfileGraph) -> None:
+        with self._lock:
+            self._remember(key, graph)
+        if self.cache_dir is not None:
+            path = self._disk_path(key)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                temp_path.write_text(json.dumps(graph.to_dict()))
+                os.replace(temp_path, path)
+            except OSError as e:
+                logger.debug(f"Could not persist dependency cache entry {key}: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: str, graph: LockfileGraph) -> None:
+        self._entries[key] = graph
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> LockfileGraph | None:
+        if self.cache_dir is None:
+            return None
+        try:
+            return LockfileGraph.from_dict(json.loads(self._disk_path(key).read_text()))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+_default_cache: LockfileCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_lockfile_cache() -> LockfileCache:
+    """Process-wide cache; persisted under ``CODE_SCORE_DEPENDENCY_CACHE`` when set."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = LockfileCache(os.environ.get(DEPENDENCY_CACHE_ENV) or None)
+        return _default_cache
+
+
+def content_hash(filename: str, content: bytes, companion: bytes | None) -> str:
+    digest = hashlib.sha256(f"{_CACHE_FORMAT}:{filename}\0".encode())
+    digest.update(content)
+    digest.update(b"\0")
+    digest.update(companion or b"")
+    return digest.hexdigest()
+
+
+# ----------------------------------------------------------------------
+# Repository graph
+# ----------------------------------------------------------------------
+
+class DependencyGraph:
+    """Packages, edges and direct dependencies merged over a repository's lockfiles."""
+
+    def __init__(self) -> None:
+        self.packages: list[Package] = []
+        self.sources: list[str] = []  # lockfile that first declared each package
+        self.edges: set[tuple[int, int]] = set()
+        self.direct: set[int] = set()
+        self.lockfiles: list[dict[str, Any]] = []
+        self._index: dict[tuple[str, str, str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.packages)
+
+    def add_lockfile(self, path: str, digest: str, lockfile: LockfileGraph, cached: bool) -> None:
+        """Merge one lockfile's graph (``path`` is relative to the repository)."""
+        ecosystem = sys.intern(lockfile.ecosystem)
+        mapping = [self._intern(ecosystem, name, version, path) for name, version in lockfile.packages]
+        self.edges.update((mapping[a], mapping[b]) for a, b in lockfile.edges)
+        self.direct.update(mapping[index] for index in lockfile.direct)
+        self.lockfiles.append({
+            "path": path,
+            "ecosystem": ecosystem,
+            "sha256": digest,
+            "packages": len(lockfile.packages),
+            "cached": cached,
+        })
+
+    def _intern(self, ecosystem: str, name: str, version: str, source: str) -> int:
+        key = (ecosystem, normalize_package_name(ecosystem, name), version)
+        index = self._index.get(key)
+        if index is None:
+            index = self._index[key] = len(self.packages)
+            self.packages.append(Package(ecosystem, sys.intern(name), sys.intern(version)))
+            self.sources.append(source)
+        return index
+
+    def dependencies_of(self, index: int) -> list[Package]:
+        return [self.packages[b] for a, b in sorted(self.edges) if a == index]
+
+    def ecosystem_counts(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for package in self.packages:
+            counts[package.ecosystem] = counts.get(package.ecosystem, 0) + 1
+        return counts
+
+    def to_dict(self) -> dict[str, Any]:
+        """Full serializable form, including every package and edge."""
+        return {
+            **self.summary(),
+            "packages": [
+                {
+                    "ecosystem": package.ecosystem,
+                    "name": package.name,
+                    "version": package.version,
+                    "direct": index in self.direct,
+                    "source": self.sources[index],
+                }
+                for index, package in enumerate(self.packages)
+            ],
+            "edges": [list(edge) for edge in sorted(self.edges)],
+        }
+
+    def summary(self) -> dict[str, Any]:
+        """Counts and lockfiles only; this is what ``submission.json`` carries."""
+        return {
+            "package_count": len(self.packages),
+            "direct_count": len(self.direct),
+            "edge_count": len(self.edges),
+            "ecosystems": self.ecosystem_counts(),
+            "lockfiles": self.lockfiles,
+        }
+
+
+def summarize_dependency_graph(graph: dict[str, Any]) -> dict[str, Any]:
+    """Drop the package and edge lists from a serialized graph."""
+    return {key: value for key, value in graph.items() if key not in ("packages", "edges")}
+
+
+def build_dependency_graph(repo_path: str | Path, ecosystems: tuple[str, ...] | None = None,
+                           cache: LockfileCache | None = None) -> DependencyGraph:
+    """Parse the lockfiles/manifests of a checkout into one graph.
+
+    Args:
+        repo_path: Repository (or subproject) directory
+        ecosystems: Only parse files of these ecosystems (default: all)
+        cache: Parse cache (default: ``get_lockfile_cache()``)
+
+    Returns:
+        DependencyGraph; unparseable files are logged and skipped
+    """
+    cache = cache if cache is not None else get_lockfile_cache()
+    root = Path(repo_path)
+    graph = DependencyGraph()
+    for dirpath, dirnames, filenames in os.walk(root):
+        relative = Path(dirpath).relative_to(root)
+        dirnames[:] = sorted(d for d in dirnames if d not in _SKIP_DIRS and not d.startswith(".")) \
+            if len(relative.parts) < _MAX_MANIFEST_DEPTH else []
+        siblings = set(filenames)
+        for filename in sorted(filenames):
+            parser = _parser_for(filename, siblings)
+            if parser is None or (ecosystems and parser[0] not in ecosystems):
+                continue
+            _, parse, companion_name = parser
+            file_path = Path(dirpath) / filename
+            try:
+                content = file_path.read_bytes()
+                companion = None
+                if companion_name and companion_name in siblings:
+                    companion = (Path(dirpath) / companion_name).read_bytes()
+                digest = content_hash(filename, content, companion)
+                lockfile = cache.get(digest)
+                cached = lockfile is not None
+                if lockfile is None:
+                    lockfile = parse(content, companion)
+                    cache.put(digest, lockfile)
+            except (OSError, ValueError, KeyError, TypeError, AttributeError, IndexError,
+                    ET.ParseError, tomllib.TOMLDecodeError) as e:
+                logger.warning(f"Could not parse {file_path}: {e}")
+                continue
+            graph.add_lockfile((relative / filename).as_posix(), digest, lockfile, cached)
+    return graph
@@ -5,6 +5,8 @@ import sys
 from enum import Enum
 from typing import Any
 
+_HANDLER_NAME = "code_score_error_handler"
+
 
 class ErrorSeverity(Enum):
     """Error severity levels."""
@@ -99,19 +101,22 @@ class ErrorHandler:
         """Setup logging configuration."""
         log_level = logging.DEBUG if self.verbose else logging.INFO
 
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-
-        # Setup stderr handler
-        handler = logging.StreamHandler(sys.stderr)
-        handler.setFormatter(formatter)
-
         # Configure logger
         logger = logging.getLogger('code_score')
         logger.setLevel(log_level)
-        logger.addHandler(handler)
+
+        # Setup stderr handler once; batch runs create one ErrorHandler per job
+        existing = [h for h in logger.handlers if h.get_name() == _HANDLER_NAME]
+        if existing:
+            existing[0].stream = sys.stderr
+        else:
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            handler = logging.StreamHandler(sys.stderr)
+            handler.setFormatter(formatter)
+            handler.set_name(_HANDLER_NAME)
+            logger.addHandler(handler)
 
         # Prevent duplicate logs
         logger.propagate = False
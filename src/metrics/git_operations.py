@@ -4,11 +4,14 @@ import os
 import shutil
 import subprocess
 import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from .cleanup import get_trash_reaper
 from .models.repository import Repository
+from .workspace_pool import Workspace, WorkspacePool
 
 
 class GitOperationError(Exception):
@@ -29,40 +32,30 @@ class NetworkTimeoutError(GitOperationError):
 class GitOperations:
     """Handles Git repository operations using command-line git."""
 
-    def __init__(self, timeout_seconds: int = 300) -> None:
-        """Initialize git operations with timeout."""
+    def __init__(self, timeout_seconds: int = 300,
+                 workspace_pool: WorkspacePool | None = None) -> None:
+        """Initialize git operations with timeout.
+
+        Args:
+            timeout_seconds: Timeout for clone and fetch operations
+            workspace_pool: Optional pool of reusable workspaces; without it
+                every clone goes to a fresh temporary directory
+        """
         self.timeout_seconds = timeout_seconds
+        self.workspace_pool = workspace_pool
+        self._workspaces: dict[str, Workspace] = {}
 
     def clone_repository(self, url: str, commit_sha: str | None = None) -> Repository:
         """Clone repository to temporary directory and optionally checkout specific commit."""
+        if self.workspace_pool is not None:
+            return self._prepare_workspace(url, commit_sha)
+
         try:
             # Create temporary directory
             temp_dir = tempfile.mkdtemp(prefix="code-score-")
             local_path = str(Path(temp_dir) / "repo")
 
-            # Clone repository
-            clone_cmd = ["git", "clone", "--depth", "1", url, local_path]
-            if commit_sha:
-                # For specific commit, we need full clone
-                clone_cmd = ["git", "clone", url, local_path]
-
-            result = subprocess.run(
-                clone_cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout_seconds
-            )
-
-            if result.returncode != 0:
-                shutil.rmtree(temp_dir, ignore_errors=True)
-                if "fatal: repository" in result.stderr.lower():
-                    raise InvalidRepositoryError(f"Invalid repository URL: {url}")
-                else:
-                    raise GitOperationError(f"Git clone failed: {result.stderr}")
-
-            # Checkout specific commit if provided
-            if commit_sha:
-                self.checkout_commit(local_path, commit_sha)
+            self._clone_into(url, commit_sha, local_path)
 
             # Get actual commit SHA
             actual_commit = self._get_current_commit(local_path)
@@ -83,16 +76,124 @@ class GitOperations:
 
         except subprocess.TimeoutExpired:
             if 'temp_dir' in locals():
-                shutil.rmtree(temp_dir, ignore_errors=True)
+                # A timed-out clone may be large; delete it in the background
+                self._discard_temp_dir(temp_dir)
             raise NetworkTimeoutError(f"Git clone timed out after {self.timeout_seconds} seconds")
 
         except Exception as e:
             if 'temp_dir' in locals():
-                shutil.rmtree(temp_dir, ignore_errors=True)
+                self._discard_temp_dir(temp_dir)
             if isinstance(e, (GitOperationError, InvalidRepositoryError, NetworkTimeoutError)):
                 raise
             raise GitOperationError(f"Unexpected error during clone: {str(e)}")
 
+    def _clone_into(self, url: str, commit_sha: str | None, local_path: str) -> None:
+        """Clone ``url`` into ``local_path`` and check out ``commit_sha`` if given."""
+        clone_cmd = ["git", "clone", "--depth", "1", url, local_path]
+        if commit_sha:
+            # For specific commit, we need full clone
+            clone_cmd = ["git", "clone", url, local_path]
+
+        result = subprocess.run(
+            clone_cmd,
+            capture_output=True,
+            text=True,
+            timeout=self.timeout_seconds
+        )
+
+        if result.returncode != 0:
+            if "fatal: repository" in result.stderr.lower():
+                raise InvalidRepositoryError(f"Invalid repository URL: {url}")
+            else:
+                raise GitOperationError(f"Git clone failed: {result.stderr}")
+
+        if commit_sha:
+            self.checkout_commit(local_path, commit_sha)
+
+    def _prepare_workspace(self, url: str, commit_sha: str | None) -> Repository:
+        """Check out a repository in a pooled workspace, recycling it when possible."""
+        pool = self.workspace_pool
+        try:
+            workspace = pool.acquire(url)
+        except TimeoutError as e:
+            raise GitOperationError(str(e))
+
+        start_time = time.time()
+        local_path = str(workspace.repo_path)
+        try:
+            reused = workspace.has_checkout_of(url) and self._recycle_checkout(local_path, commit_sha)
+            if not reused:
+                pool.wipe(workspace)
+                self._clone_into(url, commit_sha, local_path)
+
+            size_mb = self._calculate_repo_size(local_path)
+            if pool.exceeds_quota(size_mb):
+                raise GitOperationError(
+                    f"Checkout of {url} is {size_mb} MB, over the workspace quota of {pool.quota_mb} MB"
+                )
+
+            repository = Repository(
+                url=url,
+                commit_sha=self._get_current_commit(local_path),
+                local_path=local_path,
+                clone_timestamp=datetime.utcnow(),
+                size_mb=size_mb
+            )
+        except subprocess.TimeoutExpired:
+            pool.release(workspace, keep=False)
+            raise NetworkTimeoutError(f"Git clone timed out after {self.timeout_seconds} seconds")
+        except Exception as e:
+            pool.release(workspace, keep=False)
+            if isinstance(e, GitOperationError):
+                raise
+            raise GitOperationError(f"Unexpected error during clone: {str(e)}")
+
+        pool.record(workspace, url, commit_sha, reused, size_mb, time.time() - start_time)
+        self._workspaces[local_path] = workspace
+        return repository
+
+    def _recycle_checkout(self, local_path: str, commit_sha: str | None) -> bool:
+        """Reset an existing checkout of the same repository to the requested commit.
+
+        Returns:
+            False if the checkout could not be recycled and must be cloned again
+        """
+        def git(*args: str) -> bool:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=local_path,
+                capture_output=True,
+                text=True,
+                timeout=self.timeout_seconds
+            )
+            return result.returncode == 0
+
+        if not (git("clean", "-ffdx") and git("reset", "--hard", "--quiet")):
+            return False
+
+        if commit_sha:
+            if not git("cat-file", "-e", f"{commit_sha}^{{commit}}"):
+                fetch = ["fetch", "--quiet", "origin"]
+                if (Path(local_path) / ".git" / "shallow").exists():
+                    fetch.append("--unshallow")
+                if not git(*fetch):
+                    return False
+            target = commit_sha
+        else:
+            # Same as a fresh shallow clone: the remote's current HEAD
+            if not git("fetch", "--quiet", "--depth", "1", "origin", "HEAD"):
+                return False
+            target = "FETCH_HEAD"
+
+        return git("checkout", "--quiet", "--force", "--detach", target) and git("clean", "-ffdx")
+
+    def workspace_usage(self, repository: Repository) -> dict[str, Any] | None:
+        """Workspace usage for a pooled checkout, None for plain temporary clones."""
+        workspace = self._workspaces.get(repository.local_path or "")
+        if workspace is None:
+            return None
+        return self.workspace_pool.usage(workspace)
+
     def checkout_commit(self, local_path: str, commit_sha: str) -> None:
         """Checkout specific commit in cloned repository."""
         try:
@@ -150,14 +251,23 @@ class GitOperations:
 
     def cleanup_repository(self, repository: Repository) -> None:
         """Clean up cloned repository and temporary files."""
+        workspace = self._workspaces.pop(repository.local_path or "", None)
+        if workspace is not None:
+            # Pooled checkouts are kept for recycling by the next job
+            self.workspace_pool.release(workspace, keep=True)
+            return
+
         if repository.local_path and Path(repository.local_path).exists():
-            # Get parent temp directory
+            # Get parent temp directory; it is deleted in the background
             temp_dir = Path(repository.local_path).parent
-            try:
-                shutil.rmtree(temp_dir, ignore_errors=True)
-            except Exception:
-                # Log warning but don't fail - cleanup is best effort
-                pass
+            self._discard_temp_dir(temp_dir)
+
+    def _discard_temp_dir(self, temp_dir: str | Path) -> None:
+        """Hand a clone directory to the background reaper (best effort)."""
+        try:
+            get_trash_reaper().discard(temp_dir)
+        except Exception:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
     def _get_current_commit(self, local_path: str) -> str:
         """Get current commit SHA from repository."""
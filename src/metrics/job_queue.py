@@ -0,0 +1,247 @@
+"""Durable SQLite-backed job queue for batch repository analysis."""
+
+import json
+import logging
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from .models.batch_job import BatchJob, JobState
+
+
+class JobQueueError(Exception):
+    """Raised when a queue operation cannot be completed."""
+    pass
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    repository_url TEXT NOT NULL,
+    commit_sha TEXT NOT NULL DEFAULT '',
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    timeout_seconds INTEGER NOT NULL DEFAULT 300,
+    worker_id TEXT,
+    output_dir TEXT,
+    error TEXT,
+    stage_timestamps TEXT NOT NULL DEFAULT '{}',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    UNIQUE (repository_url, commit_sha)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs (state, id);
+"""
+
+
+class JobQueue:
+    """Persistent queue of repository analysis jobs stored in a local SQLite file.
+
+    Every operation opens its own short-lived connection, so a single JobQueue
+    instance may be shared between worker threads and several processes may
+    use the same database file. Claims run inside ``BEGIN IMMEDIATE``
+    transactions, which makes them atomic: a pending job is handed to exactly
+    one worker.
+
+    Examples:
+        >>> queue = JobQueue("output/batch_queue.db")
+        >>> queue.enqueue([("https://github.com/user/repo.git", None)])
+        1
+        >>> job = queue.claim("worker-1")
+        >>> queue.advance(job.job_id, JobState.ANALYZING)
+        >>> queue.complete(job.job_id)
+    """
+
+    def __init__(self, db_path: str | Path, busy_timeout_seconds: float = 30.0) -> None:
+        """Open (creating if needed) the queue database at db_path."""
+        self.db_path = Path(db_path)
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self.logger = logging.getLogger('code_score.job_queue')
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield an autocommit connection that is closed afterwards."""
+        try:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=self.busy_timeout_seconds,
+                isolation_level=None
+            )
+        except sqlite3.Error as e:
+            raise JobQueueError(f"Failed to open job queue {self.db_path}: {e}") from e
+
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection inside a write-locked transaction."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.utcnow().isoformat()
+
+    def enqueue(self, repositories: list[tuple[str, str | None]], timeout_seconds: int = 300) -> int:
+        """Add repositories to the queue, ignoring ones that are already queued.
+
+        Args:
+            repositories: List of (repository_url, commit_sha) pairs
+            timeout_seconds: Analysis timeout recorded for new jobs
+
+        Returns:
+            Number of newly added jobs
+        """
+        now = self._now()
+        added = 0
+        with self._transaction() as conn:
+            for url, commit_sha in repositories:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO jobs "
+                    "(repository_url, commit_sha, timeout_seconds, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (url, commit_sha or "", timeout_seconds, now, now)
+                )
+                added += cursor.rowcount
+        self.logger.debug(f"Enqueued {added} new job(s) of {len(repositories)} requested")
+        return added
+
+    def claim(self, worker_id: str) -> BatchJob | None:
+        """Atomically claim the oldest pending job and move it to cloning.
+
+        Returns:
+            The claimed BatchJob, or None when no pending job is left
+        """
+        now = self._now()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE state = ? ORDER BY id LIMIT 1",
+                (JobState.PENDING.value,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            conn.execute(
+                "UPDATE jobs SET state = ?, attempts = attempts + 1, worker_id = ?, "
+                "error = NULL, stage_timestamps = ?, updated_at = ? WHERE id = ?",
+                (JobState.CLONING.value, worker_id,
+                 json.dumps({JobState.CLONING.value: now}), now, row["id"])
+            )
+            claimed = conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+
+        job = BatchJob.from_row(claimed)
+        self.logger.debug(f"Worker {worker_id} claimed job {job.job_id} ({job.repository_url})")
+        return job
+
+    def advance(self, job_id: int, state: JobState, output_dir: str | None = None) -> None:
+        """Move a claimed job to the next processing stage and timestamp it."""
+        if state in (JobState.PENDING, JobState.FAILED):
+            raise JobQueueError(f"Use requeue/fail to move job {job_id} to {state.value}")
+        self._set_state(job_id, state, output_dir=output_dir)
+
+    def complete(self, job_id: int) -> None:
+        """Mark a job as done."""
+        self._set_state(job_id, JobState.DONE)
+
+    def fail(self, job_id: int, error: str) -> None:
+        """Mark a job as failed and record the error that caused it."""
+        self._set_state(job_id, JobState.FAILED, error=error)
+
+    def _set_state(self, job_id: int, state: JobState, output_dir: str | None = None,
+                   error: str | None = None) -> None:
+        now = self._now()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT stage_timestamps FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                raise JobQueueError(f"Unknown job id: {job_id}")
+
+            timestamps = json.loads(row["stage_timestamps"] or "{}")
+            timestamps[state.value] = now
+            conn.execute(
+                "UPDATE jobs SET state = ?, stage_timestamps = ?, updated_at = ?, "
+                "output_dir = COALESCE(?, output_dir), error = COALESCE(?, error) WHERE id = ?",
+                (state.value, json.dumps(timestamps), now, output_dir, error, job_id)
+            )
+
+    def requeue_interrupted(self) -> int:
+        """Return jobs left in an in-progress state by a crashed run to pending.
+
+        Call this before starting workers for a batch that is being resumed.
+        It assumes no other worker is currently processing jobs from this queue.
+
+        Returns:
+            Number of jobs returned to pending
+        """
+        states = [state.value for state in JobState.in_progress_states()]
+        placeholders = ", ".join("?" for _ in states)
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE jobs SET state = ?, worker_id = NULL, updated_at = ? "
+                f"WHERE state IN ({placeholders})",
+                (JobState.PENDING.value, self._now(), *states)
+            )
+            count = cursor.rowcount
+        if count:
+            self.logger.info(f"Resuming {count} interrupted job(s)")
+        return count
+
+    def retry_failed(self, timeout_seconds: int | None = None) -> int:
+        """Return failed jobs to pending, optionally with a new timeout.
+
+        Args:
+            timeout_seconds: New timeout for the retried jobs (None keeps the old one)
+
+        Returns:
+            Number of jobs returned to pending
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET state = ?, timeout_seconds = COALESCE(?, timeout_seconds), "
+                "updated_at = ? WHERE state = ?",
+                (JobState.PENDING.value, timeout_seconds, self._now(), JobState.FAILED.value)
+            )
+            return cursor.rowcount
+
+    def get_job(self, job_id: int) -> BatchJob | None:
+        """Get a job by id."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return BatchJob.from_row(row) if row else None
+
+    def list_jobs(self, state: JobState | None = None) -> list[BatchJob]:
+        """List jobs in queue order, optionally filtered by state."""
+        with self._connect() as conn:
+            if state is None:
+                rows = conn.execute("SELECT * FROM jobs ORDER BY id").fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM jobs WHERE state = ? ORDER BY id", (state.value,)
+                ).fetchall()
+        return [BatchJob.from_row(row) for row in rows]
+
+    def get_counts(self) -> dict[str, int]:
+        """Get the number of jobs in each state (all states present, zero-filled)."""
+        counts = {state.value: 0 for state in JobState}
+        with self._connect() as conn:
+            for row in conn.execute("SELECT state, COUNT(*) AS n FROM jobs GROUP BY state"):
+                counts[row["state"]] = row["n"]
+        return counts
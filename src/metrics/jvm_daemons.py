@@ -0,0 +1,242 @@
+"""Long-lived Gradle/Maven daemons and shared dependency caches for batch runs."""
+
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from .sandbox import SandboxedProcess, run_tool
+
+DEFAULT_JVM_CACHE_DIR = "code_score_jvm_cache"
+
+
+def default_jvm_cache_root() -> Path:
+    return Path(tempfile.gettempdir()) / DEFAULT_JVM_CACHE_DIR
+
+
+class JvmDaemonPool:
+    """Runs Maven and Gradle through warm daemons with shared caches.
+
+    - Gradle runs with ``--daemon`` and one shared Gradle user home, so
+      daemons started by one job are reused by the next. At most
+      ``pool_size`` Gradle builds run at once, which pins the number of
+      daemons Gradle keeps alive to the pool size.
+    - Maven goes through the Maven Daemon (``mvnd``) when it is installed,
+      otherwise through plain ``mvn``; both use one shared local repository
+      so plugins and dependencies are resolved once per batch.
+    - Build outputs (``target/``, ``build/``, ``.gradle/``) stay in each
+      job's checkout, so jobs never share project output directories.
+
+    A build counts as warm only when the daemon's ``--status`` listed an
+    idle daemon, not claimed by a concurrent build, before it started.
+    """
+
+    def __init__(self, cache_root: str | Path | None = None, pool_size: int = 2,
+                 use_mvnd: bool | None = None, idle_timeout_seconds: int = 1800,
+                 offline: bool = False) -> None:
+        """Initialize the pool; daemons start lazily on the first build.
+
+        Args:
+            cache_root: Directory for the shared Maven repository and Gradle user home
+            pool_size: Concurrent builds per tool (and so warm daemons per tool)
+            use_mvnd: Force Maven Daemon on/off; default: use it when on PATH
+            idle_timeout_seconds: Gradle daemons exit after this much idle time
+            offline: Resolve only from the shared caches (``--offline``)
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
+        self.cache_root = Path(cache_root) if cache_root is not None else default_jvm_cache_root()
+        self.maven_repository = self.cache_root / "m2" / "repository"
+        self.gradle_user_home = self.cache_root / "gradle"
+        self.pool_size = pool_size
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.offline = offline
+        self.mvnd = shutil.which("mvnd") if use_mvnd is not False else None
+        if use_mvnd and self.mvnd is None:
+            raise ValueError("mvnd was requested but is not on PATH")
+        self.logger = logging.getLogger('code_score.jvm_daemons')
+
+        self.maven_repository.mkdir(parents=True, exist_ok=True)
+        self.gradle_user_home.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._slots = {tool: threading.BoundedSemaphore(pool_size) for tool in ("maven", "gradle")}
+        # Builds in flight that were counted as served by an idle daemon
+        self._claimed = {"maven": 0, "gradle": 0}
+        self.stats = {
+            tool: {"builds": 0, "warm": 0, "cold_seconds": 0.0, "warm_seconds": 0.0}
+            for tool in ("maven", "gradle")
+        }
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+
+    def maven_available(self) -> bool:
+        return self.mvnd is not None or shutil.which("mvn") is not None
+
+    def maven_command(self, args: list[str]) -> list[str]:
+        executable = "mvnd" if self.mvnd else "mvn"
+        offline = ["--offline"] if self.offline else []
+        return [executable, f"-Dmaven.repo.local={self.maven_repository}", *offline, *args]
+
+    def gradle_command(self, args: list[str]) -> list[str]:
+        offline = ["--offline"] if self.offline else []
+        return ["gradle", "--daemon", "--gradle-user-home", str(self.gradle_user_home), *offline, *args]
+
+    def environment(self) -> dict[str, str]:
+        env = dict(os.environ)
+        env["GRADLE_USER_HOME"] = str(self.gradle_user_home)
+        # Keep daemons alive across jobs but not forever once the batch is gone
+        env["GRADLE_OPTS"] = (
+            f"{env.get('GRADLE_OPTS', '')} -Dorg.gradle.daemon.idletimeout={self.idle_timeout_seconds * 1000}"
+        ).strip()
+        return env
+
+    def run(self, tool: str, args: list[str], cwd: str, timeout: float) -> SandboxedProcess:
+        """Run ``mvn``/``gradle`` arguments through the pool.
+
+        Args:
+            tool: "maven" or "gradle"
+            args: Goals/tasks and flags, without the executable
+            cwd: Project directory (the job's checkout)
+            timeout: Seconds before ``subprocess.TimeoutExpired`` is raised
+
+        Returns:
+            The completed process, run under the "jvm" tool limits
+        """
+        command = self.maven_command(args) if tool == "maven" else self.gradle_command(args)
+        with self._slot(tool) as warm:
+            start = time.monotonic()
+            try:
+                return run_tool("jvm", command, timeout=timeout, cwd=cwd, env=self.environment())
+            finally:
+                self._record(tool, warm, time.monotonic() - start)
+
+    @contextmanager
+    def _slot(self, tool: str) -> Iterator[bool]:
+        """Hold one of the tool's daemon slots; yields whether a warm daemon serves it."""
+        self._slots[tool].acquire()
+        warm = False
+        try:
+            idle = self.idle_daemons(tool)
+            with self._lock:
+                # Daemons claimed by builds in flight may still be listed as idle
+                warm = idle > self._claimed[tool]
+                if warm:
+                    self._claimed[tool] += 1
+            yield warm
+        finally:
+            if warm:
+                with self._lock:
+                    self._claimed[tool] -= 1
+            self._slots[tool].release()
+
+    def idle_daemons(self, tool: str) -> int:
+        """Live idle daemons that can serve the next build, from the tool's ``--status``."""
+        if tool == "gradle":
+            if shutil.which("gradle") is None:
+                return 0
+            command = ["gradle", "--status", "--gradle-user-home", str(self.gradle_user_home)]
+        elif self.mvnd is not None:
+            command = [self.mvnd, "--status"]
+        else:
+            return 0
+        try:
+            completed = subprocess.run(command, capture_output=True, text=True, timeout=60,
+                                       env=self.environment())
+        except (OSError, subprocess.SubprocessError) as e:
+            self.logger.debug(f"{command[0]} --status failed: {e}")
+            return 0
+        return count_idle_daemons(completed.stdout)
+
+    def _record(self, tool: str, warm: bool, seconds: float) -> None:
+        with self._lock:
+            stats = self.stats[tool]
+            stats["builds"] += 1
+            if warm:
+                stats["warm"] += 1
+                stats["warm_seconds"] += seconds
+            else:
+                stats["cold_seconds"] += seconds
+
+    # ------------------------------------------------------------------
+    # Reporting and shutdown
+    # ------------------------------------------------------------------
+
+    def report(self) -> dict[str, Any]:
+        """Daemon reuse rate and estimated startup time saved.
+
+        The saving is estimated per tool as the number of warm builds times
+        the difference between the mean cold and mean warm build time.
+        """
+        with self._lock:
+            report: dict[str, Any] = {"mvnd": self.mvnd is not None, "cache_root": str(self.cache_root)}
+            total_builds = total_warm = 0
+            saved = 0.0
+            for tool, stats in self.stats.items():
+                cold = stats["builds"] - stats["warm"]
+                mean_cold = stats["cold_seconds"] / cold if cold else 0.0
+                mean_warm = stats["warm_seconds"] / stats["warm"] if stats["warm"] else 0.0
+                tool_saved = stats["warm"] * max(0.0, mean_cold - mean_warm) if cold else 0.0
+                report[tool] = {
+                    "builds": stats["builds"],
+                    "warm_builds": stats["warm"],
+                    "reuse_rate": round(stats["warm"] / stats["builds"], 3) if stats["builds"] else 0.0,
+                    "mean_cold_seconds": round(mean_cold, 2),
+                    "mean_warm_seconds": round(mean_warm, 2),
+                    "estimated_seconds_saved": round(tool_saved, 1),
+                }
+                total_builds += int(stats["builds"])
+                total_warm += int(stats["warm"])
+                saved += tool_saved
+            report["builds"] = total_builds
+            report["reuse_rate"] = round(total_warm / total_builds, 3) if total_builds else 0.0
+            report["estimated_seconds_saved"] = round(saved, 1)
+            return report
+
+    def shutdown(self, timeout: float = 60.0) -> None:
+        """Stop the daemons this pool started (no-op for tools never used)."""
+        commands = []
+        if self.stats["gradle"]["builds"] and shutil.which("gradle"):
+            commands.append(["gradle", "--stop", "--gradle-user-home", str(self.gradle_user_home)])
+        if self.stats["maven"]["builds"] and self.mvnd:
+            commands.append(["mvnd", "--stop"])
+        for command in commands:
+            try:
+                subprocess.run(command, capture_output=True, timeout=timeout, env=self.environment())
+            except (OSError, subprocess.SubprocessError) as e:
+                self.logger.warning(f"Failed to stop {command[0]} daemons: {e}")
+
+
+def count_idle_daemons(status_output: str) -> int:
+    """Idle daemons in ``gradle --status`` or ``mvnd --status`` output.
+
+    Both list one daemon per row with its state as a column (``IDLE`` for
+    Gradle, ``Idle`` for mvnd); other rows are headers and notes.
+    """
+    return sum(1 for line in status_output.splitlines() if "idle" in line.lower().split())
+
+
+_active_pool: JvmDaemonPool | None = None
+_active_pool_lock = threading.Lock()
+
+
+def get_jvm_daemon_pool() -> JvmDaemonPool | None:
+    """The pool Java builds should use, or None to run ``mvn``/``gradle`` cold."""
+    return _active_pool
+
+
+def set_jvm_daemon_pool(pool: JvmDaemonPool | None) -> None:
+    """Activate (or with None, deactivate) a pool for this process's Java builds."""
+    global _active_pool
+    with _active_pool_lock:
+        _active_pool = pool
@@ -1,8 +1,20 @@
 """Language detection for Git repositories using file extension analysis."""
 
+import math
 import os
-from collections import defaultdict
-from pathlib import Path
+import random
+import threading
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterator
+
+from .manifest_store import ManifestStore
+
+SKIPPED_DIRECTORIES = frozenset({"node_modules", "__pycache__", "target", "build"})
+
+# Detection results per commit, shared by all detectors of the process
+_STATS_CACHE_SIZE = 256
+_stats_cache: OrderedDict[tuple, dict] = OrderedDict()
+_stats_cache_lock = threading.Lock()
 
 
 class LanguageDetector:
@@ -34,10 +46,17 @@ class LanguageDetector:
         self.detection_strategy = "file_extension_analysis"
         self.confidence_threshold = 0.6
 
-    def detect_primary_language(self, repository_path: str) -> str:
+        # Count source bytes instead of files (like GitHub Linguist)
+        self.weight_by_bytes = False
+        # Stop scanning once the primary language share is known to +/- this
+        # margin (95% confidence); None scans every file
+        self.sample_margin: float | None = None
+        self.min_sample_files = 2000
+
+    def detect_primary_language(self, repository_path: str, commit_sha: str | None = None) -> str:
         """Detect the primary programming language of a repository."""
         try:
-            language_stats = self.get_language_statistics(repository_path)
+            language_stats = self.get_language_statistics(repository_path, commit_sha)
 
             if not language_stats["detected_languages"]:
                 return "unknown"
@@ -54,57 +73,93 @@ class LanguageDetector:
             # Fail gracefully - return unknown if detection fails
             return "unknown"
 
-    def get_language_statistics(self, repository_path: str) -> dict:
-        """Get detailed language statistics for a repository."""
-        language_counts = defaultdict(int)
-        total_files = 0
+    def get_language_statistics(self, repository_path: str, commit_sha: str | None = None) -> dict:
+        """Get detailed language statistics for a repository.
 
-        # Analyze file extensions
-        for _root, dirs, files in os.walk(repository_path):
-            # Skip common non-source directories
-            dirs[:] = [
-                d
-                for d in dirs
-                if not d.startswith(".")
-                and d not in ["node_modules", "__pycache__", "target", "build"]
-            ]
-
-            for file in files:
-                if file.startswith("."):
-                    continue
-
-                file_path = Path(file)
-                extension = file_path.suffix.lower()
-
-                # Count files by language
-                for language, extensions in self.language_extensions.items():
-                    if extension in extensions:
-                        language_counts[language] += 1
-                        total_files += 1
-                        break
+        Args:
+            repository_path: Path to repository root
+            commit_sha: Commit checked out at repository_path; results are
+                cached per commit (and detector settings) when given
+
+        Returns:
+            Statistics with per-language file counts (and byte counts when
+            ``weight_by_bytes`` is set); percentages and confidence follow the
+            selected weight. ``sampled`` is True when the scan stopped early.
+        """
+        cache_key = self._cache_key(commit_sha)
+        if cache_key is not None:
+            with _stats_cache_lock:
+                cached = _stats_cache.get(cache_key)
+                if cached is not None:
+                    _stats_cache.move_to_end(cache_key)
+                    return _copy_stats(cached)
+
+        stats = self._compute_statistics(repository_path)
+
+        if cache_key is not None:
+            with _stats_cache_lock:
+                _stats_cache[cache_key] = _copy_stats(stats)
+                while len(_stats_cache) > _STATS_CACHE_SIZE:
+                    _stats_cache.popitem(last=False)
+        return stats
+
+    def _compute_statistics(self, repository_path: str) -> dict:
+        extension_languages = self._extension_languages()
+        file_counts: dict[str, int] = defaultdict(int)
+        byte_counts: dict[str, int] = defaultdict(int)
+        total_files = 0
+        sampled = False
+        next_check = self.min_sample_files
+
+        for entry in self._iter_files(repository_path):
+            name = entry.name
+            dot = name.rfind(".")
+            if dot <= 0:
+                continue
+            language = extension_languages.get(name[dot:].lower())
+            if language is None:
+                continue
+
+            file_counts[language] += 1
+            total_files += 1
+            if self.weight_by_bytes:
+                try:
+                    byte_counts[language] += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+
+            if total_files >= next_check:
+                if self._sample_is_sufficient(file_counts, total_files):
+                    sampled = True
+                    break
+                next_check += self.min_sample_files
 
         # Boost confidence based on config files
         config_bonuses = self._calculate_config_bonuses(repository_path)
 
+        weights = byte_counts if self.weight_by_bytes else file_counts
+        total_weight = sum(weights.values())
+
         # Calculate percentages and confidence
         detected_languages = {}
-        for language, count in language_counts.items():
-            percentage = (count / total_files * 100) if total_files > 0 else 0
+        for language, count in file_counts.items():
+            percentage = (weights[language] / total_weight * 100) if total_weight > 0 else 0
             detected_languages[language] = {"file_count": count, "percentage": percentage}
+            if self.weight_by_bytes:
+                detected_languages[language]["byte_count"] = byte_counts[language]
 
         # Determine primary language
         primary_language = "unknown"
         confidence_score = 0.0
 
         if detected_languages:
-            # Find language with highest file count
+            # Find language with the highest share (file or byte count)
             primary_language = max(
-                detected_languages.keys(), key=lambda lang: detected_languages[lang]["file_count"]
+                detected_languages.keys(), key=lambda lang: (weights[lang], file_counts[lang])
             )
 
             # Calculate confidence score
-            primary_count = detected_languages[primary_language]["file_count"]
-            base_confidence = primary_count / total_files if total_files > 0 else 0
+            base_confidence = weights[primary_language] / total_weight if total_weight > 0 else 0
 
             # Apply config file bonus
             config_bonus = config_bonuses.get(primary_language, 0)
@@ -115,10 +170,78 @@ class LanguageDetector:
             "primary_language": primary_language,
             "confidence_score": confidence_score,
             "total_files_analyzed": total_files,
+            "sampled": sampled,
         }
 
+    def _extension_languages(self) -> dict[str, str]:
+        """Extension to language map, rebuilt only when ``language_extensions`` changes."""
+        signature = tuple((language, tuple(extensions)) for language, extensions in self.language_extensions.items())
+        if getattr(self, "_extension_signature", None) != signature:
+            mapping: dict[str, str] = {}
+            for language, extensions in self.language_extensions.items():
+                for extension in extensions:
+                    # First language listing an extension wins, as in the old nested loop
+                    mapping.setdefault(extension.lower(), language)
+            self._extension_map = mapping
+            self._extension_signature = signature
+        return self._extension_map
+
+    def _iter_files(self, repository_path: str) -> Iterator[os.DirEntry]:
+        """Yield ``os.DirEntry`` objects of non-hidden files outside skipped directories.
+
+        When sampling, directories are visited in random order so that an
+        early stop sees files from across the tree rather than its first
+        subdirectories.
+        """
+        pending = [repository_path]
+        shuffle = random.Random(0) if self.sample_margin is not None else None
+        while pending:
+            if shuffle is not None:
+                index = shuffle.randrange(len(pending))
+                pending[index], pending[-1] = pending[-1], pending[index]
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("."):
+                            continue
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if not is_dir:
+                            yield entry
+                        elif entry.name not in SKIPPED_DIRECTORIES and not entry.is_symlink():
+                            pending.append(entry.path)
+            except OSError:
+                continue
+
+    def _sample_is_sufficient(self, file_counts: dict[str, int], total_files: int) -> bool:
+        """Whether the primary language share is known to within ``sample_margin``.
+
+        Uses the normal approximation of the binomial 95% interval on file
+        counts, which also bounds byte shares well enough to stop scanning.
+        """
+        if self.sample_margin is None:
+            return False
+        share = max(file_counts.values()) / total_files
+        half_width = 1.96 * math.sqrt(share * (1 - share) / total_files)
+        return half_width <= self.sample_margin
+
+    def _cache_key(self, commit_sha: str | None) -> tuple | None:
+        if not commit_sha:
+            return None
+        return (
+            commit_sha,
+            tuple((language, tuple(extensions)) for language, extensions in self.language_extensions.items()),
+            tuple((language, tuple(files)) for language, files in self.config_files.items()),
+            self.weight_by_bytes,
+            self.sample_margin,
+            self.min_sample_files,
+        )
+
     def get_languages_above_threshold(
-        self, repository_path: str, threshold: float = 0.20
+        self, repository_path: str, threshold: float = 0.20, commit_sha: str | None = None
     ) -> dict[str, float]:
         """Get all languages with file count percentage above threshold.
 
@@ -130,6 +253,7 @@ class LanguageDetector:
             repository_path: Path to repository root
             threshold: Minimum percentage (0.0-1.0) for language to be included
                       Default is 0.20 (20%) per FR-004a
+            commit_sha: Checked out commit, reusing cached statistics
 
         Returns:
             Dictionary mapping language names to their percentages (0.0-1.0)
@@ -141,7 +265,7 @@ class LanguageDetector:
             >>> languages
             {"python": 0.65, "javascript": 0.25}
         """
-        stats = self.get_language_statistics(repository_path)
+        stats = self.get_language_statistics(repository_path, commit_sha)
         detected = stats["detected_languages"]
 
         # Filter languages above threshold and convert percentage to 0.0-1.0 range
@@ -154,14 +278,23 @@ class LanguageDetector:
     def _calculate_config_bonuses(self, repository_path: str) -> dict[str, float]:
         """Calculate confidence bonuses based on config files."""
         bonuses = {}
-        repo_path = Path(repository_path)
+        # One directory listing instead of a stat per candidate file
+        manifests = ManifestStore(repository_path)
 
         for language, config_files in self.config_files.items():
             bonus = 0.0
             for config_file in config_files:
-                if (repo_path / config_file).exists():
+                if manifests.exists(config_file):
                     bonus += 0.1  # 10% bonus per config file
 
             bonuses[language] = min(0.3, bonus)  # Cap at 30% bonus
 
         return bonuses
+
+
+def _copy_stats(stats: dict) -> dict:
+    """Copy of statistics deep enough that callers cannot alter cached results."""
+    return {
+        **stats,
+        "detected_languages": {language: dict(info) for language, info in stats["detected_languages"].items()},
+    }
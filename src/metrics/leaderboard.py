@@ -0,0 +1,144 @@
+"""Shard summaries and merged leaderboards for batch runs."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .models.batch_job import BatchJob
+
+
+def build_summary_entry(job: BatchJob) -> dict[str, Any]:
+    """Summarize a finished job, including its score when score_input.json exists."""
+    entry: dict[str, Any] = {
+        "repository_url": job.repository_url,
+        "commit_sha": job.commit_sha,
+        "state": job.state.value,
+        "worker_id": job.worker_id,
+        "output_dir": job.output_dir,
+        "attempts": job.attempts,
+        "completed_at": job.stage_timestamps.get(job.state.value),
+        "total_score": None,
+        "max_possible_score": None,
+        "score_percentage": None,
+        "error": job.error,
+    }
+
+    if job.output_dir:
+        score_input_path = Path(job.output_dir) / "score_input.json"
+        if score_input_path.exists():
+            try:
+                with open(score_input_path, encoding='utf-8') as f:
+                    result = json.load(f).get("evaluation_result", {})
+                entry["total_score"] = result.get("total_score")
+                entry["max_possible_score"] = result.get("max_possible_score")
+                entry["score_percentage"] = result.get("score_percentage")
+            except (OSError, json.JSONDecodeError):
+                pass
+
+    return entry
+
+
+def write_shard_summary(jobs: list[BatchJob], summary_path: str | Path, shard_name: str) -> str:
+    """Write the summary of the given jobs for one shard or node.
+
+    Returns:
+        Path of the written summary file
+    """
+    summary_path = Path(summary_path)
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+
+    summary = {
+        "shard": shard_name,
+        "generated_at": datetime.utcnow().isoformat(),
+        "entries": [build_summary_entry(job) for job in jobs],
+    }
+    tmp_path = summary_path.with_name(f".{summary_path.name}.tmp")
+    tmp_path.write_text(json.dumps(summary, indent=2), encoding='utf-8')
+    tmp_path.replace(summary_path)
+    return str(summary_path)
+
+
+def load_shard_summaries(paths: list[str | Path]) -> list[dict[str, Any]]:
+    """Load shard summaries from files or directories of ``*.json`` summaries."""
+    summaries = []
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.glob("*.json")) if path.is_dir() else [path]
+        for file_path in files:
+            with open(file_path, encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict) and isinstance(data.get("entries"), list):
+                summaries.append(data)
+    return summaries
+
+
+def merge_summaries(summaries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Combine shard summaries into one ranked leaderboard.
+
+    When the same repository appears in several summaries (e.g. it was retried
+    on another node), the most recently completed entry wins, and a done entry
+    always wins over a failed one. Scored entries are ranked by score
+    percentage; unscored entries follow without a rank.
+    """
+    merged: dict[tuple[str, str | None], dict[str, Any]] = {}
+    for summary in summaries:
+        for entry in summary["entries"]:
+            entry = {**entry, "shard": summary.get("shard")}
+            key = (entry["repository_url"], entry.get("commit_sha"))
+            current = merged.get(key)
+            if current is None or _sort_key_for_duplicates(entry) > _sort_key_for_duplicates(current):
+                merged[key] = entry
+
+    ranked = sorted(
+        merged.values(),
+        key=lambda e: (e.get("score_percentage") is None, -(e.get("score_percentage") or 0.0),
+                       e["repository_url"])
+    )
+    rank = 0
+    for entry in ranked:
+        if entry.get("score_percentage") is not None:
+            rank += 1
+            entry["rank"] = rank
+        else:
+            entry["rank"] = None
+    return ranked
+
+
+def _sort_key_for_duplicates(entry: dict[str, Any]) -> tuple[bool, str]:
+    return entry.get("state") == "done", entry.get("completed_at") or ""
+
+
+def write_leaderboard(entries: list[dict[str, Any]], output_dir: str | Path) -> list[str]:
+    """Write leaderboard.json and leaderboard.md.
+
+    Returns:
+        Paths of the generated files
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    json_path = output_dir / "leaderboard.json"
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump({"generated_at": datetime.utcnow().isoformat(), "entries": entries}, f, indent=2)
+
+    lines = [
+        "# Leaderboard",
+        "",
+        "| Rank | Repository | Score | State | Shard |",
+        "|------|------------|-------|-------|-------|",
+    ]
+    for entry in entries:
+        if entry.get("score_percentage") is not None:
+            score = (f"{entry['total_score']:.1f}/{entry['max_possible_score']} "
+                     f"({entry['score_percentage']:.1f}%)")
+        else:
+            score = "n/a"
+        lines.append(
+            f"| {entry.get('rank') or '-'} | {entry['repository_url']} | {score} "
+            f"| {entry.get('state')} | {entry.get('shard') or '-'} |"
+        )
+
+    md_path = output_dir / "leaderboard.md"
+    md_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return [str(json_path), str(md_path)]
@@ -0,0 +1,151 @@
+"""Per-analysis access to a repository's manifest and configuration files.
+
+Test and coverage checks look at the same few files (``pyproject.toml``,
+``package.json``, ``pom.xml``, ...) once per language and per check. A
+``ManifestStore`` lists each directory, reads each file and parses each
+document at most once for the analysis, and hands every consumer the same
+structured result.
+"""
+
+import io
+import json
+import threading
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import tomli
+
+from src.metrics.parse_cache import get_parse_cache
+
+# Plugins looked for in pom.xml: (tags whose text is matched, substring, case sensitive)
+POM_PLUGINS = {
+    "surefire": (("artifactId",), "surefire", True),
+    "jacoco": (("artifactId", "groupId"), "jacoco", False),
+}
+
+
+class ManifestStore:
+    """Manifests of one repository, each read and parsed at most once.
+
+    Documents (and parse errors, which are raised again on every access)
+    are shared by all callers, which must not modify them. Create one
+    store per analysis; it does not notice files changing afterwards.
+    """
+
+    def __init__(self, repo_path: str | Path) -> None:
+        """Initialize the store.
+
+        Args:
+            repo_path: Repository root that relative paths are resolved against
+        """
+        self.repo_path = Path(repo_path)
+        self._listings: dict[Path, frozenset[str]] = {}
+        self._contents: dict[Path, bytes] = {}
+        self._documents: dict[tuple[Path, str], tuple[bool, Any]] = {}
+        self._pom_plugins: dict[Path, dict[str, bool]] = {}
+        self._lock = threading.RLock()
+
+    def path(self, name: str | Path) -> Path:
+        """Path of a file given relative to the repository, or already joined with ``repo_path``."""
+        name = Path(name)
+        prefix = self.repo_path.parts
+        if name.is_absolute() or (prefix and name.parts[:len(prefix)] == prefix):
+            return name
+        return self.repo_path / name
+
+    def exists(self, path: str | Path) -> bool:
+        """Whether a file exists, from one listing per directory."""
+        path = self.path(path)
+        with self._lock:
+            listing = self._listings.get(path.parent)
+            if listing is None:
+                try:
+                    listing = frozenset(entry.name for entry in path.parent.iterdir())
+                except OSError:
+                    listing = frozenset()
+                self._listings[path.parent] = listing
+        return path.name in listing
+
+    def content(self, path: str | Path) -> bytes:
+        """File content.
+
+        Raises:
+            OSError: If the file cannot be read (not remembered)
+        """
+        path = self.path(path)
+        with self._lock:
+            content = self._contents.get(path)
+            if content is None:
+                content = path.read_bytes()
+                self._contents[path] = content
+            return content
+
+    def toml(self, path: str | Path) -> dict[str, Any]:
+        """Parsed TOML document (raises ``tomli.TOMLDecodeError`` if malformed)."""
+        return self._document(path, "toml", lambda content: tomli.loads(content.decode("utf-8")))
+
+    def json(self, path: str | Path) -> Any:
+        """Parsed JSON document (raises ``json.JSONDecodeError`` if malformed)."""
+        return self._document(path, "json", json.loads)
+
+    def pom_plugins(self, path: str | Path) -> dict[str, bool]:
+        """Which of ``POM_PLUGINS`` a pom.xml references.
+
+        The pom is streamed with ``iterparse`` and the scan stops as soon as
+        every plugin was found, so large multi-module poms are rarely read to
+        the end (and a syntax error after that point goes unnoticed).
+
+        Raises:
+            ET.ParseError: If the XML is malformed before the scan stopped
+        """
+        path = self.path(path)
+        with self._lock:
+            if path not in self._pom_plugins:
+                self._pom_plugins[path] = _scan_pom(self.content(path))
+            return self._pom_plugins[path]
+
+    def verdict(self, kind: str, path: str | Path,
+                compute: Callable[[], tuple[bool, str]]) -> tuple[bool, str]:
+        """Verdict derived from a file, shared across repositories by content.
+
+        Args:
+            kind: Name of the check, part of the cache key
+            path: File the verdict depends on (only its content and name)
+            compute: Computes the verdict from this store's documents
+        """
+        path = self.path(path)
+        return get_parse_cache().verdict(kind, path, lambda _content: compute(), content=self.content(path))
+
+    def _document(self, path: str | Path, kind: str, loader: Callable[[bytes], Any]) -> Any:
+        path = self.path(path)
+        with self._lock:
+            entry = self._documents.get((path, kind))
+            if entry is None:
+                try:
+                    entry = (True, loader(self.content(path)))
+                except (ValueError, UnicodeDecodeError) as e:
+                    # TOMLDecodeError and JSONDecodeError are ValueErrors
+                    entry = (False, e)
+                self._documents[(path, kind)] = entry
+        ok, document = entry
+        if not ok:
+            raise document
+        return document
+
+
+def _scan_pom(content: bytes) -> dict[str, bool]:
+    found = dict.fromkeys(POM_PLUGINS, False)
+    for _event, element in ET.iterparse(io.BytesIO(content), events=("end",)):
+        tag = element.tag.rsplit("}", 1)[-1]
+        text = element.text
+        if text:
+            for name, (tags, needle, case_sensitive) in POM_PLUGINS.items():
+                if not found[name] and tag in tags and needle in (text if case_sensitive else text.lower()):
+                    found[name] = True
+            if all(found.values()):
+                break
+        # Keep memory flat on large poms; only end tags are inspected
+        element.clear()
+    return found
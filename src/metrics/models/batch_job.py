@@ -0,0 +1,129 @@
+"""Batch job dataclass for the durable batch analysis queue.
+
+This module defines the BatchJob record stored in the SQLite-backed JobQueue
+and the JobState lifecycle a job moves through during a batch run.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+
+class JobState(str, Enum):
+    """Lifecycle states of a batch job.
+
+    A job moves pending → cloning → analyzing → evaluating → reporting → done.
+    Any in-progress state may transition to failed. Jobs found in an
+    in-progress state when a batch starts were interrupted by a crash and
+    are returned to pending.
+    """
+
+    PENDING = "pending"
+    CLONING = "cloning"
+    ANALYZING = "analyzing"
+    EVALUATING = "evaluating"
+    REPORTING = "reporting"
+    DONE = "done"
+    FAILED = "failed"
+
+    @classmethod
+    def in_progress_states(cls) -> list["JobState"]:
+        """States a job can only be in while a worker is processing it."""
+        return [cls.CLONING, cls.ANALYZING, cls.EVALUATING, cls.REPORTING]
+
+
+@dataclass
+class BatchJob:
+    """One repository analysis job in a batch run.
+
+    Attributes:
+        job_id: Queue-assigned primary key
+        repository_url: Git repository URL to analyze
+        commit_sha: Optional commit to analyze (None analyzes the default branch)
+        state: Current JobState
+        attempts: Number of times a worker has claimed this job
+        timeout_seconds: Analysis timeout applied to clone, tools and LLM calls
+        worker_id: Identifier of the worker that last claimed the job
+        output_dir: Per-repository output directory once processing started
+        error: Last error recorded by ErrorHandler when the job failed
+        stage_timestamps: Mapping of state name → ISO timestamp for the current attempt
+        created_at: ISO timestamp of enqueue
+        updated_at: ISO timestamp of the last state change
+
+    Examples:
+        >>> job = BatchJob(job_id=1, repository_url="https://github.com/user/repo.git")
+        >>> job.output_name
+        'repo-3c7bb079'
+    """
+
+    job_id: int
+    repository_url: str
+    commit_sha: str | None = None
+    state: JobState = JobState.PENDING
+    attempts: int = 0
+    timeout_seconds: int = 300
+    worker_id: str | None = None
+    output_dir: str | None = None
+    error: str | None = None
+    stage_timestamps: dict[str, str] = field(default_factory=dict)
+    created_at: str | None = None
+    updated_at: str | None = None
+
+    @property
+    def output_name(self) -> str:
+        """Stable, filesystem-safe directory name for this job's outputs.
+
+        Combines the repository name with a short hash of the URL and commit so
+        that forks sharing a name do not overwrite each other.
+        """
+        return repository_output_name(self.repository_url, self.commit_sha)
+
+    @classmethod
+    def from_row(cls, row: Any) -> "BatchJob":
+        """Build a BatchJob from a sqlite3.Row of the jobs table."""
+        return cls(
+            job_id=row["id"],
+            repository_url=row["repository_url"],
+            commit_sha=row["commit_sha"] or None,
+            state=JobState(row["state"]),
+            attempts=row["attempts"],
+            timeout_seconds=row["timeout_seconds"],
+            worker_id=row["worker_id"],
+            output_dir=row["output_dir"],
+            error=row["error"],
+            stage_timestamps=json.loads(row["stage_timestamps"] or "{}"),
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "job_id": self.job_id,
+            "repository_url": self.repository_url,
+            "commit_sha": self.commit_sha,
+            "state": self.state.value,
+            "attempts": self.attempts,
+            "timeout_seconds": self.timeout_seconds,
+            "worker_id": self.worker_id,
+            "output_dir": self.output_dir,
+            "error": self.error,
+            "stage_timestamps": dict(self.stage_timestamps),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+def repository_output_name(repository_url: str, commit_sha: str | None = None) -> str:
+    """Derive the per-repository output directory name for a URL and commit."""
+    url = repository_url.rstrip("/")
+    if url.endswith(".git"):
+        url = url[:-4]
+    name = url.replace(":", "/").split("/")[-1] or "repo"
+    name = re.sub(r"[^A-Za-z0-9._-]", "_", name)
+
+    digest = hashlib.sha256(f"{repository_url}@{commit_sha or ''}".encode()).hexdigest()[:8]
+    return f"{name}-{digest}"
@@ -18,6 +18,8 @@ class BuildValidationResult(BaseModel):
         execution_time_seconds: Duration of build execution in seconds
         error_message: Error details if build failed (truncated to 1000 chars per NFR-002)
         exit_code: Process exit code from build tool
+        limit_exceeded: Resource limit that stopped the build ("cpu", "memory",
+            "processes"); None for ordinary failures (see ``metrics.sandbox``)
 
     Examples:
         >>> # Successful build
@@ -53,6 +55,7 @@ class BuildValidationResult(BaseModel):
     execution_time_seconds: float
     error_message: Optional[str] = None
     exit_code: Optional[int] = None
+    limit_exceeded: Optional[str] = None
 
     @field_validator("error_message")
     @classmethod
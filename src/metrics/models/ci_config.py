@@ -107,6 +107,10 @@ class ScoreBreakdown:
         }
 
 
+# Frameworks a CI test step can be attributed to
+TEST_FRAMEWORKS = frozenset({"pytest", "jest", "vitest", "junit", "go_test", "cargo_test"})
+
+
 @dataclass
 class TestStepInfo:
     """Represents a single test execution step found in CI configuration.
@@ -117,7 +121,7 @@ class TestStepInfo:
     Attributes:
         job_name: CI job or step name (non-empty).
         command: Full command text (non-empty).
-        framework: Inferred test framework ("pytest", "jest", "junit", "go_test", or None).
+        framework: Inferred test framework (one of TEST_FRAMEWORKS, or None).
         has_coverage_flag: True if command includes coverage flags (--cov, --coverage).
 
     Example:
@@ -148,10 +152,9 @@ class TestStepInfo:
         if not self.command:
             raise ValueError("command must be non-empty")
 
-        valid_frameworks = {"pytest", "jest", "junit", "go_test"}
-        if self.framework is not None and self.framework not in valid_frameworks:
+        if self.framework is not None and self.framework not in TEST_FRAMEWORKS:
             raise ValueError(
-                f"framework must be None or one of {valid_frameworks}, "
+                f"framework must be None or one of {sorted(TEST_FRAMEWORKS)}, "
                 f"got {self.framework}"
             )
 
@@ -57,6 +57,31 @@ class ExecutionMetadata(BaseModel):
     warnings: list[str] = Field(default_factory=list, description="Warnings generated")
     duration_seconds: float = Field(0.0, description="Total execution time")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Execution timestamp")
+    workspace: dict[str, Any] | None = Field(None, description="Pooled workspace usage (slot, reuse, size)")
+    package_cache: dict[str, Any] | None = Field(None, description="Shared package cache hits and bytes downloaded by builds")
+
+
+class LanguageMetrics(BaseModel):
+    """Tool results for one language of a multi-language repository."""
+    language: str = Field(..., description="Language the tools ran for")
+    share: float | None = Field(None, description="Fraction of source files in this language (0-1)")
+    code_quality: CodeQualityMetrics = Field(default_factory=CodeQualityMetrics, description="Lint, build and audit results")
+    testing_metrics: TestingMetrics = Field(default_factory=TestingMetrics, description="Testing results")
+    tools_used: list[str] = Field(default_factory=list, description="Analysis tools executed for this language")
+    errors: list[str] = Field(default_factory=list, description="Errors for this language")
+
+
+class SubprojectMetrics(BaseModel):
+    """Tool results for one package/module of a monorepo."""
+    path: str = Field(..., description="Subproject path relative to the repository root")
+    language: str = Field(..., description="Language whose tools ran in the subproject")
+    manifest: str | None = Field(None, description="Manifest file defining the subproject")
+    modules: list[str] = Field(default_factory=list, description="Nested build modules covered by the subproject")
+    lint_results: dict[str, Any] | None = Field(None, description="Linting tool results")
+    build_success: bool | None = Field(None, description="Build success status")
+    build_details: dict[str, Any] | None = Field(None, description="Build validation result")
+    dependency_audit: dict[str, Any] | None = Field(None, description="Dependency audit results")
+    errors: list[str] = Field(default_factory=list, description="Tool errors for this subproject")
 
 
 class MetricsCollection(BaseModel):
@@ -68,3 +93,12 @@ class MetricsCollection(BaseModel):
     testing_metrics: TestingMetrics = Field(default_factory=TestingMetrics, description="Testing metrics")
     documentation_metrics: DocumentationMetrics = Field(default_factory=DocumentationMetrics, description="Documentation metrics")
     execution_metadata: ExecutionMetadata = Field(default_factory=ExecutionMetadata, description="Execution metadata")
+    language_metrics: dict[str, LanguageMetrics] = Field(
+        default_factory=dict, description="Per-language results when several languages were analyzed"
+    )
+    dependency_graph: dict[str, Any] | None = Field(
+        None, description="Packages, direct dependencies and edges parsed from lockfiles; submission.json carries only the counts"
+    )
+    subprojects: list[SubprojectMetrics] = Field(
+        default_factory=list, description="Per-subproject results for monorepos"
+    )
@@ -0,0 +1,328 @@
+"""Offline dependency audit against a local OSV advisory snapshot.
+
+Dependencies are read from lockfiles and manifests in the checkout (see
+``dependency_graph``) and matched against an OSV JSON export (https://osv.dev/docs/#section/Data-Dumps)
+stored on disk, so audits need no network access. The snapshot may be a
+directory of advisory ``.json`` files (searched recursively), an
+ecosystem's ``all.zip`` export, a directory of such zips, or one JSON file
+holding a list of advisories.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import zipfile
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .dependency_graph import build_dependency_graph, normalize_package_name
+
+ADVISORY_DB_ENV = "CODE_SCORE_ADVISORY_DB"
+
+# OSV ecosystems audited for each analyzed language
+LANGUAGE_ECOSYSTEMS = {
+    "python": ("PyPI",),
+    "javascript": ("npm",),
+    "typescript": ("npm",),
+    "go": ("Go",),
+    "java": ("Maven",),
+}
+
+HIGH_SEVERITIES = {"high", "critical"}
+
+logger = logging.getLogger('code_score.offline_audit')
+
+
+@dataclass(frozen=True)
+class Dependency:
+    """A resolved dependency version found in a lockfile or manifest."""
+
+    ecosystem: str
+    name: str
+    version: str
+    source: str
+
+
+# ----------------------------------------------------------------------
+# Version comparison
+# ----------------------------------------------------------------------
+
+_VERSION_TOKEN = re.compile(r"\d+|[a-zA-Z]+")
+# Tuple tags: numbers > post-release labels > end of version > pre-release
+# labels, so that 1.0rc1 < 1.0 < 1.0.post1 < 1.0.1
+_NUMBER, _POST, _END, _LABEL = 3, 2, 1, 0
+# Pre-release labels (PEP 440 and Maven spellings) by rank; unknown labels
+# (semver pre-releases such as "-foo") rank with release candidates
+_PRE_RELEASE_LABELS = {
+    "dev": (0, "dev"),
+    "alpha": (1, "alpha"), "a": (1, "alpha"),
+    "beta": (2, "beta"), "b": (2, "beta"),
+    "milestone": (3, "milestone"), "m": (3, "milestone"),
+    "rc": (4, "rc"), "cr": (4, "rc"), "c": (4, "rc"), "pre": (4, "rc"), "preview": (4, "rc"),
+    "snapshot": (5, "snapshot"),
+}
+_UNKNOWN_LABEL_RANK = 4
+# Labels naming the release itself (Maven qualifiers): 5.3.0.Final == 5.3.0
+_RELEASE_LABELS = {"final", "release", "ga"}
+# Labels of releases after the one they follow: 1.0.post1, Maven -sp1, -r2
+_POST_RELEASE_LABELS = {"post", "rev", "r", "sp", "patch", "pl"}
+
+
+def version_key(version: str) -> tuple:
+    """Sort key comparing PEP 440, semver, Go and most Maven versions.
+
+    Build metadata (``+...``) and a leading ``v`` are ignored. Pre-release
+    labels (``dev`` < ``alpha`` < ``beta`` < ``milestone`` < ``rc`` <
+    ``snapshot``) sort below the release they precede, ``final``/``release``/
+    ``ga`` equal it and post-release labels (``post``, ``rev``, ``r``,
+    ``sp``) sort above it.
+    """
+    version = version.strip().split("+", 1)[0]
+    if version[:1] in ("v", "V"):
+        version = version[1:]
+    tokens = [token for token in _VERSION_TOKEN.findall(version) if token.lower() not in _RELEASE_LABELS]
+    release_length = next((i for i, token in enumerate(tokens) if not token.isdigit()), len(tokens))
+    release = [int(token) for token in tokens[:release_length]]
+    # Trailing zeros of the release do not change the version: 1.0 == 1.0.0
+    while release and release[-1] == 0:
+        release.pop()
+    parts = [(_NUMBER, number, "") for number in release]
+    for token in tokens[release_length:]:
+        label = token.lower()
+        if token.isdigit():
+            parts.append((_NUMBER, int(token), ""))
+        elif label in _POST_RELEASE_LABELS:
+            parts.append((_POST, 0, "post"))
+        else:
+            rank, name = _PRE_RELEASE_LABELS.get(label, (_UNKNOWN_LABEL_RANK, label))
+            parts.append((_LABEL, rank, name))
+    parts.append((_END, 0, ""))
+    return tuple(parts)
+
+
+def _event_key(event: dict[str, str]) -> tuple:
+    value = next(iter(event.values()), "0")
+    return () if value == "0" else version_key(value)
+
+
+def _in_ranges(version: tuple, ranges: list[dict[str, Any]]) -> bool:
+    for affected_range in ranges:
+        if affected_range.get("type") == "GIT":
+            continue
+        events = sorted(affected_range.get("events", []), key=_event_key)
+        affected = False
+        for event in events:
+            if "introduced" in event:
+                if event["introduced"] == "0" or version >= version_key(event["introduced"]):
+                    affected = True
+            elif "fixed" in event:
+                if version >= version_key(event["fixed"]):
+                    affected = False
+            elif "last_affected" in event:
+                if version > version_key(event["last_affected"]):
+                    affected = False
+            elif "limit" in event:
+                if version >= version_key(event["limit"]):
+                    affected = False
+        if affected:
+            return True
+    return False
+
+
+def _fixed_versions(ranges: list[dict[str, Any]]) -> list[str]:
+    return [event["fixed"] for affected_range in ranges
+            for event in affected_range.get("events", []) if "fixed" in event]
+
+
+def advisory_severity(advisory: dict[str, Any], affected: dict[str, Any] | None = None) -> str | None:
+    """Severity label (low/moderate/high/critical) recorded in an advisory.
+
+    GitHub and most ecosystem databases store it in ``database_specific``;
+    some only in ``ecosystem_specific`` of the affected package. CVSS
+    vectors alone are not scored.
+    """
+    for source in (advisory.get("database_specific"), (affected or {}).get("ecosystem_specific"),
+                   (affected or {}).get("database_specific")):
+        if isinstance(source, dict) and isinstance(source.get("severity"), str):
+            return source["severity"].lower()
+    return None
+
+
+# ----------------------------------------------------------------------
+# Advisory database
+# ----------------------------------------------------------------------
+
+class AdvisoryDatabase:
+    """OSV advisories indexed by ecosystem and package name."""
+
+    def __init__(self, advisories: list[dict[str, Any]] | None = None, source: str = "") -> None:
+        self.source = source
+        self._index: dict[tuple[str, str], list[tuple[dict[str, Any], dict[str, Any]]]] = defaultdict(list)
+        self.advisory_count = 0
+        for advisory in advisories or []:
+            self.add(advisory)
+
+    def add(self, advisory: dict[str, Any]) -> None:
+        """Index an advisory under every package it affects."""
+        if advisory.get("withdrawn"):
+            return
+        indexed = False
+        for affected in advisory.get("affected", []):
+            package = affected.get("package") or {}
+            ecosystem = (package.get("ecosystem") or "").split(":", 1)[0]
+            if not ecosystem or not package.get("name"):
+                continue
+            key = (ecosystem, normalize_package_name(ecosystem, package["name"]))
+            self._index[key].append((advisory, affected))
+            indexed = True
+        if indexed:
+            self.advisory_count += 1
+
+    def lookup(self, dependency: Dependency) -> list[dict[str, Any]]:
+        """Advisories affecting the dependency's exact version."""
+        entries = self._index.get(
+            (dependency.ecosystem, normalize_package_name(dependency.ecosystem, dependency.name)), []
+        )
+        if not entries:
+            return []
+
+        version = version_key(dependency.version)
+        matches = []
+        seen = set()
+        for advisory, affected in entries:
+            if advisory["id"] in seen:
+                continue
+            if dependency.version in affected.get("versions", []) or _in_ranges(version, affected.get("ranges", [])):
+                seen.add(advisory["id"])
+                matches.append({
+                    "id": advisory["id"],
+                    "aliases": advisory.get("aliases", []),
+                    "package": dependency.name,
+                    "version": dependency.version,
+                    "ecosystem": dependency.ecosystem,
+                    "severity": advisory_severity(advisory, affected),
+                    "fixed_versions": _fixed_versions(affected.get("ranges", [])),
+                    "source": dependency.source,
+                })
+        return matches
+
+    @classmethod
+    def load(cls, path: str | Path) -> "AdvisoryDatabase":
+        """Load a snapshot from a directory, ``.zip`` export or JSON list file."""
+        path = Path(path)
+        database = cls(source=str(path))
+        if path.is_dir():
+            for root, _, filenames in os.walk(path):
+                for filename in sorted(filenames):
+                    file_path = Path(root) / filename
+                    if filename.endswith(".zip"):
+                        database._load_zip(file_path)
+                    elif filename.endswith(".json"):
+                        database._add_document(file_path.read_bytes(), file_path)
+        elif path.suffix == ".zip":
+            database._load_zip(path)
+        elif path.is_file():
+            database._add_document(path.read_bytes(), path)
+        else:
+            raise FileNotFoundError(f"Advisory database not found: {path}")
+        logger.info(f"Loaded {database.advisory_count} advisories from {path}")
+        return database
+
+    def _load_zip(self, path: Path) -> None:
+        with zipfile.ZipFile(path) as archive:
+            for name in archive.namelist():
+                if name.endswith(".json"):
+                    self._add_document(archive.read(name), f"{path}:{name}")
+
+    def _add_document(self, content: bytes, origin: Any) -> None:
+        try:
+            document = json.loads(content)
+        except ValueError:
+            logger.warning(f"Skipping invalid advisory file {origin}")
+            return
+        for advisory in document if isinstance(document, list) else [document]:
+            if isinstance(advisory, dict) and advisory.get("id"):
+                self.add(advisory)
+
+
+_databases: dict[tuple[str, float], AdvisoryDatabase] = {}
+_databases_lock = threading.Lock()
+
+
+def load_advisory_database(path: str | Path) -> AdvisoryDatabase:
+    """Load a snapshot once per process; reloaded when its mtime changes."""
+    resolved = Path(path).resolve()
+    key = (str(resolved), resolved.stat().st_mtime)
+    with _databases_lock:
+        database = _databases.get(key)
+        if database is None:
+            database = AdvisoryDatabase.load(resolved)
+            _databases.clear()
+            _databases[key] = database
+        return database
+
+
+def collect_dependencies(repo_path: str | Path, ecosystems: tuple[str, ...] | None = None) -> list[Dependency]:
+    """Resolved dependencies declared in the repository's lockfiles/manifests.
+
+    Args:
+        repo_path: Repository (or subproject) directory
+        ecosystems: Only parse files of these OSV ecosystems (default: all)
+
+    Returns:
+        Unique dependencies with the lockfile that first declared them
+    """
+    graph = build_dependency_graph(repo_path, ecosystems)
+    return [
+        Dependency(package.ecosystem, package.name, package.version, source)
+        for package, source in zip(graph.packages, graph.sources, strict=True)
+    ]
+
+
+# ----------------------------------------------------------------------
+# Audit
+# ----------------------------------------------------------------------
+
+class OfflineAuditor:
+    """Fills ``dependency_audit`` from lockfiles and a local advisory snapshot."""
+
+    TOOL_NAME = "osv-offline"
+
+    def __init__(self, database: AdvisoryDatabase) -> None:
+        self.database = database
+
+    @classmethod
+    def from_path(cls, path: str | Path) -> "OfflineAuditor":
+        return cls(load_advisory_database(path))
+
+    def audit(self, repo_path: str | Path, language: str | None = None) -> dict[str, Any]:
+        """Audit the dependencies of a checkout.
+
+        Args:
+            repo_path: Repository (or subproject) directory
+            language: Restrict to the language's ecosystems (``LANGUAGE_ECOSYSTEMS``)
+
+        Returns:
+            ``vulnerabilities_found``, ``high_severity_count`` and ``tool_used``
+            like the online audits, plus the matched advisories
+        """
+        ecosystems = LANGUAGE_ECOSYSTEMS.get(language) if language else None
+        dependencies = collect_dependencies(repo_path, ecosystems)
+
+        vulnerabilities = []
+        for dependency in dependencies:
+            vulnerabilities.extend(self.database.lookup(dependency))
+
+        return {
+            "vulnerabilities_found": len(vulnerabilities),
+            "high_severity_count": sum(
+                1 for vulnerability in vulnerabilities if vulnerability["severity"] in HIGH_SEVERITIES
+            ),
+            "tool_used": self.TOOL_NAME,
+            "dependencies_scanned": len(dependencies),
+            "vulnerabilities": vulnerabilities,
+        }
@@ -7,6 +7,7 @@ from typing import Any
 
 import jsonschema
 
+from .dependency_graph import summarize_dependency_graph
 from .models.metrics_collection import MetricsCollection
 from .models.repository import Repository
 
@@ -66,13 +67,25 @@ class OutputFormat:
         if code_quality.get('lint_results'):
             lint = code_quality['lint_results']
             status = "✅ Passed" if lint.get('passed') else "❌ Failed"
+            if lint.get('limit_exceeded'):
+                status = f"⛔ Stopped ({lint['limit_exceeded']} limit exceeded)"
             md_content.append(f"- **Linting ({lint.get('tool_used', 'Unknown')})**: {status}")
             md_content.append(f"  - Issues found: {lint.get('issues_count', 0)}")
 
         if code_quality.get('build_success') is not None:
             status = "✅ Success" if code_quality['build_success'] else "❌ Failed"
+            limit = (code_quality.get('build_details') or {}).get('limit_exceeded')
+            if limit:
+                status = f"⛔ Stopped ({limit} limit exceeded)"
             md_content.append(f"- **Build**: {status}")
 
+        dependencies = output_data['metrics'].get('dependencies')
+        if dependencies and dependencies.get('package_count'):
+            md_content.append(
+                f"- **Dependencies**: {dependencies['package_count']} packages "
+                f"({dependencies.get('direct_count', 0)} direct) from {len(dependencies.get('lockfiles', []))} lockfile(s)"
+            )
+
         if code_quality.get('security_issues') is not None:
             issues_count = len(code_quality['security_issues'])
             md_content.append(f"- **Security Issues**: {issues_count}")
@@ -115,12 +128,58 @@ class OutputFormat:
 
         md_content.append("")
 
+        # Per-language results for polyglot repositories
+        languages = output_data['metrics'].get('languages')
+        if languages:
+            md_content.append("## Languages")
+            md_content.append("| Language | Share | Lint | Build | Tools |")
+            md_content.append("|----------|-------|------|-------|-------|")
+            for language, section in languages.items():
+                share = f"{section['share'] * 100:.0f}%" if section.get('share') is not None else "-"
+                lint = section.get('lint_results') or {}
+                lint_status = "-" if not lint else ("✅" if lint.get('passed') else f"❌ {lint.get('issues_count', 0)}")
+                build = section.get('build_success')
+                build_status = "-" if build is None else ("✅" if build else "❌")
+                md_content.append(
+                    f"| {language} | {share} | {lint_status} | {build_status} | {', '.join(section.get('tools_used', [])) or '-'} |"
+                )
+            md_content.append("")
+
+        # Per-subproject results for monorepos
+        subprojects = output_data['metrics'].get('subprojects')
+        if subprojects:
+            md_content.append("## Subprojects")
+            md_content.append("| Path | Language | Lint Issues | Vulnerabilities | Build |")
+            md_content.append("|------|----------|-------------|-----------------|-------|")
+            for subproject in subprojects:
+                lint = subproject.get('lint_results') or {}
+                audit = subproject.get('dependency_audit') or {}
+                build = subproject.get('build_success')
+                build_status = "-" if build is None else ("✅" if build else "❌")
+                md_content.append(
+                    f"| {subproject['path']} | {subproject['language']} | {lint.get('issues_count', '-')} | "
+                    f"{audit.get('vulnerabilities_found', '-')} | {build_status} |"
+                )
+            md_content.append("")
+
         # Execution Summary
         md_content.append("## Execution Summary")
         execution = output_data['execution']
         md_content.append(f"- **Tools Used**: {', '.join(execution.get('tools_used', []))}")
         md_content.append(f"- **Duration**: {execution.get('duration_seconds', 0):.1f} seconds")
 
+        workspace = execution.get('workspace')
+        if workspace:
+            reuse = "recycled" if workspace.get('reused') else "fresh clone"
+            md_content.append(f"- **Workspace**: {workspace.get('slot')} ({reuse}, {workspace.get('size_mb', 0)} MB)")
+
+        package_cache = execution.get('package_cache')
+        if package_cache:
+            md_content.append(
+                f"- **Package Cache**: {package_cache.get('hits', 0)}/{package_cache.get('builds', 0)} builds "
+                f"served from cache, {package_cache.get('bytes_downloaded', 0) / (1024 * 1024):.1f} MB downloaded"
+            )
+
         if execution.get('errors'):
             md_content.append(f"- **Errors**: {len(execution['errors'])}")
             for error in execution['errors'][:3]:  # Show first 3 errors
@@ -137,7 +196,7 @@ class OutputFormat:
 
     def _create_output_structure(self, repository: Repository, metrics: MetricsCollection) -> dict[str, Any]:
         """Create standardized output structure."""
-        return {
+        output = {
             "schema_version": "1.0.0",
             "repository": {
                 "url": repository.url,
@@ -183,6 +242,32 @@ class OutputFormat:
                 "timestamp": metrics.execution_metadata.timestamp.isoformat()
             }
         }
+        if metrics.language_metrics:
+            output["metrics"]["languages"] = {
+                language: {
+                    "share": section.share,
+                    "lint_results": section.code_quality.lint_results,
+                    "build_success": section.code_quality.build_success,
+                    "build_details": section.code_quality.build_details.model_dump() if section.code_quality.build_details else None,
+                    "dependency_audit": section.code_quality.dependency_audit,
+                    "test_execution": section.testing_metrics.test_execution,
+                    "tools_used": section.tools_used,
+                    "errors": section.errors
+                }
+                for language, section in metrics.language_metrics.items()
+            }
+        if metrics.dependency_graph is not None:
+            # Full package/edge lists go to a separate file (OutputManager)
+            output["metrics"]["dependencies"] = summarize_dependency_graph(metrics.dependency_graph)
+        if metrics.subprojects:
+            output["metrics"]["subprojects"] = [
+                subproject.model_dump() for subproject in metrics.subprojects
+            ]
+        if metrics.execution_metadata.workspace is not None:
+            output["execution"]["workspace"] = metrics.execution_metadata.workspace
+        if metrics.execution_metadata.package_cache is not None:
+            output["execution"]["package_cache"] = metrics.execution_metadata.package_cache
+        return output
 
     def _json_serializer(self, obj):
         """JSON serializer for non-standard types."""
@@ -231,6 +316,12 @@ class OutputManager:
                 f.write(json_content)
             saved_files.append(str(submission_file))
 
+            if metrics.dependency_graph is not None:
+                graph_file = self.metrics_dir / f"{base_filename}_dependencies.json"
+                with open(graph_file, 'w') as f:
+                    json.dump(metrics.dependency_graph, f, indent=2)
+                saved_files.append(str(graph_file))
+
         if format_type in ["markdown", "both"]:
             # Save markdown summary
             md_content = formatter.export_markdown(repository, metrics)
@@ -0,0 +1,328 @@
+"""Shared package manager caches for builds in batch mode."""
+
+import fcntl
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from .cleanup import _force_rmtree
+
+# Cache directory (under the root) -> environment variables pointing at it
+CACHE_DIRS = {
+    "npm": ("npm_config_cache",),
+    "yarn": ("YARN_CACHE_FOLDER",),
+    "uv": ("UV_CACHE_DIR",),
+    "pip": ("PIP_CACHE_DIR",),
+    "go-mod": ("GOMODCACHE",),
+    "go-build": ("GOCACHE",),
+    "m2/repository": (),  # passed as -Dmaven.repo.local (see jvm_daemons)
+    "gradle": ("GRADLE_USER_HOME",),
+}
+
+# Environment that makes the package managers use only what is cached
+OFFLINE_ENVIRONMENT = {
+    "npm_config_offline": "true",
+    "YARN_OFFLINE": "true",
+    "YARN_ENABLE_OFFLINE_MODE": "1",
+    "UV_OFFLINE": "1",
+    "PIP_NO_INDEX": "1",
+    # No GOFLAGS: Go's default (-mod=readonly, or vendor/ when present) never
+    # rewrites go.mod/go.sum, and GOPROXY=off rules out module downloads
+    "GOPROXY": "off",
+}
+
+# Caches a language's builds read and fill
+LANGUAGE_CACHES = {
+    "python": ("uv", "pip"),
+    "javascript": ("npm", "yarn"),
+    "typescript": ("npm", "yarn"),
+    "go": ("go-mod", "go-build"),
+    "java": ("m2/repository", "gradle"),
+}
+
+_LOCK_FILE = ".lock"
+_BUILD_MARKER = ".build"
+
+
+def _tree_size(path: Path) -> int:
+    """Bytes used by regular files below ``path`` (symlinks are not followed)."""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(Path(entry.path))
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+def _bytes_added_since(path: Path, since: float) -> int:
+    """Bytes of regular files below ``path`` created at or after ``since``.
+
+    Adding a file changes its directory's mtime, so only directories are
+    stat'ed, plus the files of directories changed since then.
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        directory = stack.pop()
+        try:
+            changed = os.stat(directory).st_mtime >= since
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(Path(entry.path))
+                        elif changed and entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            # ctime: unpacked files may keep the archive's old mtime
+                            if max(stat.st_mtime, stat.st_ctime) >= since:
+                                total += stat.st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+class PackageCache:
+    """Shared npm/yarn/uv/pip/Go/Maven/Gradle caches under one managed root.
+
+    ``activate()`` points the package managers at ``<root>/<tool>`` through
+    their environment variables, so every job in the process downloads a
+    given package version once. Builds hold a shared ``flock`` on the root
+    while they run and eviction takes it exclusively, so entries are never
+    removed under a running build - also across processes sharing the root.
+    The tools' own cache formats are safe for concurrent use.
+    """
+
+    def __init__(self, root: str | Path, max_size_mb: float | None = None, offline: bool = False,
+                 evict_interval_seconds: float = 300.0) -> None:
+        """Initialize the cache root.
+
+        Args:
+            root: Directory holding one subdirectory per package manager
+            max_size_mb: Evict least recently used entries above this size
+            offline: Build only from cached packages (no downloads)
+            evict_interval_seconds: Minimum time between background evictions
+                started by ``maybe_evict()``
+        """
+        if max_size_mb is not None and max_size_mb <= 0:
+            raise ValueError("max_size_mb must be positive")
+
+        self.root = Path(root)
+        self.max_size_mb = max_size_mb
+        self.offline = offline
+        self.evict_interval_seconds = evict_interval_seconds
+        self.logger = logging.getLogger('code_score.package_cache')
+        self._lock = threading.Lock()
+        self._eviction_thread: threading.Thread | None = None
+        self._last_eviction = 0.0
+        self._saved_environment: dict[str, str | None] | None = None
+        self.stats = {"builds": 0, "hits": 0, "bytes_downloaded": 0, "evictions": 0, "bytes_evicted": 0}
+
+        for name in CACHE_DIRS:
+            (self.root / name).mkdir(parents=True, exist_ok=True)
+
+    def environment(self) -> dict[str, str]:
+        """Variables directing the package managers at the shared caches."""
+        env = {
+            variable: str(self.root / name)
+            for name, variables in CACHE_DIRS.items() for variable in variables
+        }
+        env["MAVEN_OPTS"] = f"{os.environ.get('MAVEN_OPTS', '')} -Dmaven.repo.local={self.root / 'm2' / 'repository'}".strip()
+        if self.offline:
+            env.update(OFFLINE_ENVIRONMENT)
+            # Maven 3.9+; Gradle gets --offline from JvmDaemonPool
+            env["MAVEN_ARGS"] = f"{os.environ.get('MAVEN_ARGS', '')} --offline".strip()
+        return env
+
+    def activate(self) -> None:
+        """Apply ``environment()`` to this process, inherited by every tool it runs."""
+        if self._saved_environment is not None:
+            return
+        env = self.environment()
+        self._saved_environment = {variable: os.environ.get(variable) for variable in env}
+        os.environ.update(env)
+
+    def deactivate(self) -> None:
+        """Restore the environment from before ``activate()``."""
+        if self._saved_environment is None:
+            return
+        for variable, value in self._saved_environment.items():
+            if value is None:
+                os.environ.pop(variable, None)
+            else:
+                os.environ[variable] = value
+        self._saved_environment = None
+
+    @contextmanager
+    def track(self, language: str) -> Iterator[dict[str, Any]]:
+        """Hold the cache for a build and measure what it downloaded.
+
+        Yields a dict that is filled on exit with ``hit`` (nothing new was
+        added to the language's caches) and ``bytes_downloaded``: the size of
+        the files created during the build. Existing entries are not measured,
+        so the cost does not grow with the size of the cache files. With
+        several concurrent builds of the same language the attribution of
+        new entries is approximate.
+        """
+        caches = [self.root / name for name in LANGUAGE_CACHES.get(language, ())]
+        usage: dict[str, Any] = {"root": str(self.root), "offline": self.offline,
+                                 "caches": [path.name for path in caches]}
+        with self._shared_lock():
+            since = self._build_start()
+            try:
+                yield usage
+            finally:
+                downloaded = sum(_bytes_added_since(path, since) for path in caches)
+                usage["bytes_downloaded"] = downloaded
+                usage["hit"] = downloaded == 0
+                with self._lock:
+                    self.stats["builds"] += 1
+                    self.stats["hits"] += int(downloaded == 0)
+                    self.stats["bytes_downloaded"] += downloaded
+
+    def _build_start(self) -> float:
+        """Start time of a build on the filesystem's clock (file times use a coarser clock)."""
+        marker = self.root / f"{_BUILD_MARKER}.{os.getpid()}.{threading.get_ident()}"
+        try:
+            marker.touch()
+            started = marker.stat().st_mtime
+            marker.unlink()
+            return started
+        except OSError:
+            return time.time()
+
+    def maybe_evict(self) -> bool:
+        """Start ``evict()`` in a background thread unless one ran recently.
+
+        Eviction walks the whole cache, so jobs call this instead of
+        ``evict()``: at most one eviction runs at a time, and at most once
+        per ``evict_interval_seconds``.
+
+        Returns:
+            Whether an eviction was started
+        """
+        if self.max_size_mb is None:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            running = self._eviction_thread is not None and self._eviction_thread.is_alive()
+            if running or (self._last_eviction and now - self._last_eviction < self.evict_interval_seconds):
+                return False
+            self._last_eviction = now
+            self._eviction_thread = threading.Thread(target=self.evict, name="package-cache-evict", daemon=True)
+            self._eviction_thread.start()
+        return True
+
+    def evict(self, blocking: bool = False) -> int:
+        """Remove least recently used entries until the root fits ``max_size_mb``.
+
+        Entries are the second-level directories/files of each tool's cache
+        (e.g. ``go-mod/github.com/gin-gonic``, ``uv/archive-v0/<hash>``),
+        ordered by modification/access time.
+
+        Args:
+            blocking: Wait for running builds instead of skipping eviction
+
+        Returns:
+            Bytes removed (0 when under the limit or builds are running)
+        """
+        if self.max_size_mb is None:
+            return 0
+        limit = int(self.max_size_mb * 1024 * 1024)
+        if blocking:
+            eviction_thread = self._eviction_thread
+            if eviction_thread is not None and eviction_thread is not threading.current_thread():
+                eviction_thread.join()
+
+        lock_file = open(self.root / _LOCK_FILE, "a+")
+        try:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                return 0
+
+            entries = []
+            total = 0
+            for name in CACHE_DIRS:
+                for entry in self._eviction_units(self.root / name):
+                    size = _tree_size(entry) if entry.is_dir() else entry.stat().st_size
+                    stat = entry.stat()
+                    entries.append((max(stat.st_mtime, stat.st_atime), size, entry))
+                    total += size
+            if total <= limit:
+                return 0
+
+            removed = 0
+            for _, size, entry in sorted(entries, key=lambda item: item[0]):
+                if total - removed <= limit:
+                    break
+                try:
+                    if entry.is_dir():
+                        _force_rmtree(entry)
+                    else:
+                        entry.unlink()
+                except OSError as e:
+                    self.logger.warning(f"Failed to evict {entry}: {e}")
+                    continue
+                removed += size
+                with self._lock:
+                    self.stats["evictions"] += 1
+            with self._lock:
+                self.stats["bytes_evicted"] += removed
+            self.logger.info(f"Evicted {removed / (1024 * 1024):.1f} MB from {self.root}")
+            return removed
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+    def report(self) -> dict[str, Any]:
+        """Hit statistics for the run."""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["hit_rate"] = round(stats["hits"] / stats["builds"], 3) if stats["builds"] else 0.0
+        stats["root"] = str(self.root)
+        stats["size_mb"] = round(_tree_size(self.root) / (1024 * 1024), 2)
+        stats["offline"] = self.offline
+        return stats
+
+    @staticmethod
+    def _eviction_units(cache_dir: Path) -> Iterator[Path]:
+        try:
+            children = list(cache_dir.iterdir())
+        except OSError:
+            return
+        for child in children:
+            if child.is_dir() and not child.is_symlink():
+                try:
+                    yield from child.iterdir()
+                except OSError:
+                    continue
+            else:
+                yield child
+
+    @contextmanager
+    def _shared_lock(self) -> Iterator[None]:
+        lock_file = open(self.root / _LOCK_FILE, "a+")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_SH)
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
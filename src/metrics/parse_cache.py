@@ -0,0 +1,159 @@
+"""Content-hash cache for parsed CI and build configuration files.
+
+Submissions generated from the same templates share byte-identical
+workflow files, ``pyproject.toml``, ``package.json`` and ``pom.xml``. The
+results derived from them (verdicts, extracted test steps) are cached by
+the hash of the file content (and name), so each distinct file is parsed
+once per process, or once overall with the on-disk cache. Parsed documents
+are shared within one analysis by ``ManifestStore``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+PARSE_CACHE_ENV = "CODE_SCORE_PARSE_CACHE"
+# Bump when parsers or verdict messages change so stale on-disk entries are ignored
+_CACHE_FORMAT = 2
+
+logger = logging.getLogger('code_score.parse_cache')
+
+T = TypeVar("T")
+_MISSING = object()
+
+
+class ParseCache:
+    """Parse results keyed by content hash, in memory and optionally on disk.
+
+    Results must be JSON serializable, or come with ``encode``/``decode``
+    functions, to be persisted.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None, max_entries: int = 4096) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persistent results shared across processes
+            max_entries: In-memory results kept (least recently used are dropped)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+    def get(self, kind: str, file_path: Path, compute: Callable[[bytes], T],
+            encode: Callable[[T], Any] | None = None, decode: Callable[[Any], T] | None = None,
+            content: bytes | None = None) -> T:
+        """Result of ``compute(content)`` for the file, computed once per content.
+
+        Args:
+            kind: What is computed (e.g. "toml.pytest_section"); part of the key
+            file_path: File whose bytes are hashed and passed to ``compute``
+            compute: Derives the result from the file content; must not
+                depend on anything but the content and file name
+            encode: Converts the result to JSON for the disk cache
+            decode: Converts it back (also applied to results read from disk)
+            content: The file's content when already read
+
+        Raises:
+            OSError: If the file cannot be read (not cached)
+        """
+        if content is None:
+            content = file_path.read_bytes()
+        key = content_key(kind, file_path.name, content)
+
+        value = self._lookup(key, decode)
+        if value is _MISSING:
+            value = compute(content)
+            self._store(key, value, encode)
+        return value
+
+    def verdict(self, kind: str, file_path: Path, compute: Callable[[bytes], tuple[bool, str]],
+                content: bytes | None = None) -> tuple[bool, str]:
+        """Cached ``(verified, message)`` verdict of a config parser."""
+        return self.get(kind, file_path, compute, decode=tuple, content=content)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, key: str, decode: Callable[[Any], Any] | None) -> Any:
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is not _MISSING:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return value
+
+        value = self._read_disk(key, decode)
+        with self._lock:
+            if value is not _MISSING:
+                self.stats["disk_hits"] += 1
+                self._remember(key, value)
+            else:
+                self.stats["misses"] += 1
+        return value
+
+    def _store(self, key: str, value: Any, encode: Callable[[Any], Any] | None) -> None:
+        with self._lock:
+            self._remember(key, value)
+        if self.cache_dir is not None:
+            path = self._disk_path(key)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                temp_path.write_text(json.dumps(encode(value) if encode else value))
+                os.replace(temp_path, path)
+            except (OSError, TypeError, ValueError) as e:
+                logger.debug(f"Could not persist parse cache entry {key}: {e}")
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str, decode: Callable[[Any], Any] | None) -> Any:
+        if self.cache_dir is None:
+            return _MISSING
+        try:
+            value = json.loads(self._disk_path(key).read_text())
+            return decode(value) if decode else value
+        except (OSError, ValueError, KeyError, TypeError):
+            return _MISSING
+
+
+def content_key(kind: str, filename: str, content: bytes) -> str:
+    digest = hashlib.sha256(f"{_CACHE_FORMAT}:{kind}:{filename}\0".encode())
+    digest.update(content)
+    return digest.hexdigest()
+
+
+_default_cache: ParseCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParseCache:
+    """Process-wide cache; persisted under ``CODE_SCORE_PARSE_CACHE`` when set."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ParseCache(os.environ.get(PARSE_CACHE_ENV) or None)
+        return _default_cache
+
+
+def set_parse_cache(cache: ParseCache | None) -> None:
+    """Replace the process's cache (None creates a new default on next use)."""
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
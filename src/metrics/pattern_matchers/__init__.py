@@ -4,11 +4,24 @@ This package provides pattern matchers for detecting test commands and
 coverage tools in CI configuration files.
 
 Constitutional Compliance:
-- Principle II (KISS): Simple substring matching, no regex overhead
+- Principle II (KISS): One compiled pattern set, one scan per command
 - Principle III (Transparency): Clear pattern lists and matching logic
 """
 
+from src.metrics.pattern_matchers.command_classifier import (
+    CommandClassifier,
+    CommandPattern,
+    CommandVerdict,
+    get_command_classifier,
+)
 from src.metrics.pattern_matchers.coverage_tool_matcher import CoverageToolMatcher
 from src.metrics.pattern_matchers.test_command_matcher import TestCommandMatcher
 
-__all__ = ["TestCommandMatcher", "CoverageToolMatcher"]
+__all__ = [
+    "TestCommandMatcher",
+    "CoverageToolMatcher",
+    "CommandClassifier",
+    "CommandPattern",
+    "CommandVerdict",
+    "get_command_classifier",
+]
@@ -0,0 +1,296 @@
+"""Single-pass classification of CI commands.
+
+A ``CommandClassifier`` compiles every test command, coverage flag and
+coverage tool pattern into one regular expression (a trie of the
+lowercased literals, so the regex engine never backtracks over
+alternatives sharing a prefix). Classifying a command scans it once and
+yields all verdicts together; classifications are memoized because CI
+pipelines repeat the same few commands across jobs and repositories.
+
+The default patterns can be extended with a YAML or JSON file named by
+``CODE_SCORE_COMMAND_PATTERNS``::
+
+    patterns:
+      - kind: test
+        pattern: pnpm test
+        label: jest
+      - kind: coverage_tool
+        pattern: codeclimate
+        label: codeclimate
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import yaml
+
+from src.metrics.models.ci_config import TEST_FRAMEWORKS
+
+COMMAND_PATTERNS_ENV = "CODE_SCORE_COMMAND_PATTERNS"
+
+PATTERN_KINDS = ("test", "coverage_flag", "coverage_tool")
+
+# Characters that may precede a command anchored at the start of a shell command
+_COMMAND_START = re.compile(r"(?:^|[;&|(])\s*$")
+_COMMAND_END = frozenset(" \t;&|)")
+
+
+@dataclass(frozen=True)
+class CommandPattern:
+    """A literal looked for in CI commands.
+
+    Attributes:
+        kind: "test", "coverage_flag" or "coverage_tool"
+        literal: Substring that identifies the command, flag or tool
+        label: Framework of a test command (or None), name of a coverage tool
+        case_sensitive: Match the literal's case exactly
+        command_start: Only match a whole word starting a shell command
+            (for short names like ``tox`` that occur inside other words)
+    """
+    kind: str
+    literal: str
+    label: str | None = None
+    case_sensitive: bool = False
+    command_start: bool = False
+
+    def __post_init__(self) -> None:
+        if self.kind not in PATTERN_KINDS:
+            raise ValueError(f"kind must be one of {PATTERN_KINDS}, got {self.kind!r}")
+        if not self.literal:
+            raise ValueError("literal must be non-empty")
+        if self.kind == "test" and self.label is not None and self.label not in TEST_FRAMEWORKS:
+            raise ValueError(f"test framework must be None or one of {sorted(TEST_FRAMEWORKS)}, "
+                             f"got {self.label!r}")
+        if self.kind == "coverage_tool" and not self.label:
+            raise ValueError(f"coverage tool pattern {self.literal!r} needs a label")
+
+
+@dataclass(frozen=True)
+class CommandVerdict:
+    """Everything the CI parsers want to know about one command."""
+    is_test: bool
+    framework: str | None
+    has_coverage_flag: bool
+    coverage_tools: tuple[str, ...]
+
+
+# Order matters: the first matching test pattern with a framework names it
+DEFAULT_PATTERNS = (
+    # Python
+    CommandPattern("test", "pytest", "pytest"),
+    CommandPattern("test", "python -m pytest", "pytest"),
+    # JavaScript/TypeScript
+    CommandPattern("test", "npm test", "jest"),
+    CommandPattern("test", "npm run test", "jest"),
+    CommandPattern("test", "vitest", "vitest"),
+    # Rust (before "go test", which it contains)
+    CommandPattern("test", "cargo test", "cargo_test"),
+    # Go
+    CommandPattern("test", "go test", "go_test"),
+    # Java
+    CommandPattern("test", "mvn test", "junit"),
+    CommandPattern("test", "gradle test", "junit"),
+    CommandPattern("test", "./gradlew test", "junit"),
+    CommandPattern("test", "gradlew test", "junit"),
+    # Build and environment runners (framework unknown)
+    CommandPattern("test", "bazel test"),
+    CommandPattern("test", "bazelisk test"),
+    CommandPattern("test", "tox", command_start=True),
+    CommandPattern("test", "nox", command_start=True),
+    CommandPattern("coverage_flag", "--cov", case_sensitive=True),
+    CommandPattern("coverage_flag", "--coverage", case_sensitive=True),
+    CommandPattern("coverage_flag", "-cover", case_sensitive=True),
+    CommandPattern("coverage_flag", "-coverprofile", case_sensitive=True),
+    CommandPattern("coverage_tool", "codecov", "codecov"),
+    CommandPattern("coverage_tool", "coveralls", "coveralls"),
+    CommandPattern("coverage_tool", "sonar-scanner", "sonarqube"),
+    CommandPattern("coverage_tool", "sonarqube", "sonarqube"),
+)
+
+_NO_MATCH = CommandVerdict(is_test=False, framework=None, has_coverage_flag=False, coverage_tools=())
+
+
+class CommandClassifier:
+    """Classifies CI commands against a pattern set in one scan per command.
+
+    Example:
+        >>> classifier = CommandClassifier()
+        >>> classifier.classify("python -m pytest --cov=src && codecov")
+        CommandVerdict(is_test=True, framework='pytest', has_coverage_flag=True, coverage_tools=('codecov',))
+    """
+
+    def __init__(self, patterns: Iterable[CommandPattern] = DEFAULT_PATTERNS, cache_size: int = 4096) -> None:
+        """Compile the patterns.
+
+        Args:
+            patterns: Patterns in priority order (see ``DEFAULT_PATTERNS``)
+            cache_size: Distinct commands whose verdicts are memoized
+        """
+        self.patterns = tuple(patterns)
+        if not self.patterns:
+            raise ValueError("at least one pattern is required")
+
+        keys = {pattern.literal.lower() for pattern in self.patterns}
+        self._regex = re.compile(_trie_regex(keys))
+        # The regex reports the longest literal at a position. The shorter
+        # literals it starts with matched there as well: unconditionally
+        # (a bit mask) or subject to case and command start checks. Scanning
+        # resumes at the first offset where another literal could begin.
+        self._matches: dict[str, tuple[int, tuple[tuple[int, CommandPattern], ...], int]] = {}
+        for key in keys:
+            mask, checked = 0, []
+            for index, pattern in enumerate(self.patterns):
+                if key.startswith(pattern.literal.lower()):
+                    if pattern.case_sensitive or pattern.command_start:
+                        checked.append((1 << index, pattern))
+                    else:
+                        mask |= 1 << index
+            self._matches[key] = (mask, tuple(checked), _resume_offset(key, keys))
+        self._verdicts: dict[int, CommandVerdict] = {0: _NO_MATCH}
+        self.fingerprint = hashlib.sha256(repr(self.patterns).encode()).hexdigest()[:16]
+        self.classify = lru_cache(maxsize=cache_size)(self._classify)
+
+    def _classify(self, command: str) -> CommandVerdict:
+        """Verdict for one command (memoized as ``classify``)."""
+        if not command:
+            return _NO_MATCH
+        lowered = command.lower()
+        # Lowercasing a few non-ASCII characters changes the length
+        aligned = len(lowered) == len(command)
+
+        matched = 0
+        search = self._regex.search
+        match = search(lowered)
+        while match is not None:
+            start = match.start()
+            mask, checked, resume = self._matches[match.group()]
+            matched |= mask
+            for bit, pattern in checked:
+                if not matched & bit and _matches_at(pattern, command, lowered, start, aligned):
+                    matched |= bit
+            match = search(lowered, start + resume)
+
+        verdict = self._verdicts.get(matched)
+        if verdict is None:
+            verdict = self._verdicts.setdefault(matched, self._verdict(matched))
+        return verdict
+
+    def _verdict(self, matched: int) -> CommandVerdict:
+        is_test = has_coverage_flag = False
+        framework = None
+        coverage_tools: list[str] = []
+        for index, pattern in enumerate(self.patterns):
+            if not matched >> index & 1:
+                continue
+            if pattern.kind == "test":
+                is_test = True
+                framework = framework or pattern.label
+            elif pattern.kind == "coverage_flag":
+                has_coverage_flag = True
+            elif pattern.label not in coverage_tools:
+                coverage_tools.append(pattern.label)
+        return CommandVerdict(is_test, framework, has_coverage_flag, tuple(coverage_tools))
+
+
+def _resume_offset(key: str, keys: Iterable[str]) -> int:
+    """First offset inside ``key`` at which another literal could match."""
+    for offset in range(1, len(key)):
+        rest = key[offset:]
+        if any(rest.startswith(other) or other.startswith(rest) for other in keys):
+            return offset
+    return len(key)
+
+
+def _matches_at(pattern: CommandPattern, command: str, lowered: str, start: int, aligned: bool) -> bool:
+    if pattern.case_sensitive:
+        if aligned:
+            if not command.startswith(pattern.literal, start):
+                return False
+        elif pattern.literal not in command:
+            return False
+    if pattern.command_start:
+        end = start + len(pattern.literal)
+        if end < len(lowered) and lowered[end] not in _COMMAND_END:
+            return False
+        if not _COMMAND_START.search(lowered, 0, start):
+            return False
+    return True
+
+
+def _trie_regex(literals: Iterable[str]) -> str:
+    """Regex matching the longest of the literals at a position."""
+    trie: dict = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def load_command_patterns(path: str | Path) -> list[CommandPattern]:
+    """Read extra patterns from a YAML (or JSON) file.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file or one of its patterns is invalid
+    """
+    try:
+        data = yaml.safe_load(Path(path).read_text())
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid command pattern file {path}: {e}") from e
+
+    entries = data.get("patterns") if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        raise ValueError(f"Command pattern file {path} must contain a 'patterns' list")
+
+    patterns = []
+    for entry in entries:
+        if not isinstance(entry, dict) or not isinstance(entry.get("pattern"), str):
+            raise ValueError(f"Invalid command pattern in {path}: {entry!r}")
+        patterns.append(CommandPattern(
+            kind=entry.get("kind", "test"),
+            literal=entry["pattern"],
+            label=entry.get("label"),
+            case_sensitive=bool(entry.get("case_sensitive", False)),
+            command_start=bool(entry.get("command_start", False)),
+        ))
+    return patterns
+
+
+_default_classifier: CommandClassifier | None = None
+_default_classifier_lock = threading.Lock()
+
+
+def get_command_classifier() -> CommandClassifier:
+    """Process-wide classifier; defaults plus the patterns in ``CODE_SCORE_COMMAND_PATTERNS``."""
+    global _default_classifier
+    with _default_classifier_lock:
+        if _default_classifier is None:
+            patterns = list(DEFAULT_PATTERNS)
+            extra_path = os.environ.get(COMMAND_PATTERNS_ENV)
+            if extra_path:
+                patterns.extend(load_command_patterns(extra_path))
+            _default_classifier = CommandClassifier(patterns)
+        return _default_classifier
+
+
+def set_command_classifier(classifier: CommandClassifier | None) -> None:
+    """Replace the process's classifier (None rebuilds the default on next use)."""
+    global _default_classifier
+    with _default_classifier_lock:
+        _default_classifier = classifier
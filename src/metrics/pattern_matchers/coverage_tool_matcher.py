@@ -1,21 +1,24 @@
 """Pattern matcher for coverage tools in CI/CD configurations.
 
 This module provides CoverageToolMatcher for detecting coverage upload and
-reporting tools (Codecov, Coveralls, SonarQube) in CI configuration steps
-using simple substring matching (per research.md Decision 4).
+reporting tools (Codecov, Coveralls, SonarQube) in CI configuration steps.
+Matching is done by the shared CommandClassifier in a single pass per step.
 
 Constitutional Compliance:
-- Principle II (KISS): Substring matching without regex overhead
+- Principle II (KISS): Declarative tool patterns, one scan per step
 - Principle III (Transparency): Explicit tool patterns and matching logic
 """
 
-from typing import List
+from src.metrics.pattern_matchers.command_classifier import (
+    CommandClassifier,
+    get_command_classifier,
+)
 
 
 class CoverageToolMatcher:
     """Matcher for coverage tools in CI configuration steps.
 
-    Detects three major coverage tools using substring matching:
+    Detects three major coverage tools (more can be added from config):
     - Codecov: codecov/codecov-action, codecov upload, codecov command
     - Coveralls: coveralls command, python-coveralls
     - SonarQube: sonar-scanner, sonarqube keyword
@@ -31,7 +34,15 @@ class CoverageToolMatcher:
         True
     """
 
-    def detect_coverage_tools(self, steps: List[str]) -> List[str]:
+    def __init__(self, classifier: CommandClassifier | None = None):
+        """Initialize matcher.
+
+        Args:
+            classifier: Classifier to use (defaults to the process-wide one)
+        """
+        self.classifier = classifier or get_command_classifier()
+
+    def detect_coverage_tools(self, steps: list[str]) -> list[str]:
         """Detect coverage tools from CI steps.
 
         Scans all steps and returns list of detected coverage tools.
@@ -63,22 +74,14 @@ class CoverageToolMatcher:
         detected_tools = []
 
         for step in steps:
-            if not step:
-                continue
-
-            # Check each tool type (maintain order for consistency)
-            if self._match_codecov(step) and "codecov" not in detected_tools:
-                detected_tools.append("codecov")
-
-            if self._match_coveralls(step) and "coveralls" not in detected_tools:
-                detected_tools.append("coveralls")
-
-            if self._match_sonarqube(step) and "sonarqube" not in detected_tools:
-                detected_tools.append("sonarqube")
+            # Tools of a step come in pattern order (codecov, coveralls, sonarqube)
+            for tool in self.classifier.classify(step).coverage_tools:
+                if tool not in detected_tools:
+                    detected_tools.append(tool)
 
         return detected_tools
 
-    def has_coverage_upload(self, steps: List[str]) -> bool:
+    def has_coverage_upload(self, steps: list[str]) -> bool:
         """Check if any coverage tool detected in steps.
 
         Convenience method for boolean check. Equivalent to
@@ -102,7 +105,7 @@ class CoverageToolMatcher:
     def _match_codecov(self, step: str) -> bool:
         """Match Codecov patterns in CI step.
 
-        Detects Codecov as substring (per research.md - substring matching).
+        Detects Codecov as substring.
         Matches patterns like:
         - codecov/codecov-action (GitHub Actions)
         - codecov upload (command)
@@ -129,13 +132,7 @@ class CoverageToolMatcher:
             >>> matcher._match_codecov("bash <(curl -s https://codecov.io/bash)")
             True
         """
-        if not step:
-            return False
-
-        step_lower = step.lower()
-
-        # Simple substring matching per research.md Decision 4
-        return "codecov" in step_lower
+        return "codecov" in self.classifier.classify(step).coverage_tools
 
     def _match_coveralls(self, step: str) -> bool:
         """Match Coveralls patterns in CI step.
@@ -161,13 +158,7 @@ class CoverageToolMatcher:
             >>> matcher._match_coveralls("coveralls --service=github-actions")
             True
         """
-        if not step:
-            return False
-
-        step_lower = step.lower()
-
-        # Match coveralls keyword (substring matching)
-        return "coveralls" in step_lower
+        return "coveralls" in self.classifier.classify(step).coverage_tools
 
     def _match_sonarqube(self, step: str) -> bool:
         """Match SonarQube patterns in CI step.
@@ -193,10 +184,4 @@ class CoverageToolMatcher:
             >>> matcher._match_sonarqube("sonar-scanner -Dsonar.projectKey=myproject")
             True
         """
-        if not step:
-            return False
-
-        step_lower = step.lower()
-
-        # Match sonar-scanner or sonarqube keyword
-        return "sonar-scanner" in step_lower or "sonarqube" in step_lower
+        return "sonarqube" in self.classifier.classify(step).coverage_tools
@@ -1,26 +1,36 @@
 """Pattern matcher for test commands in CI/CD configurations.
 
 This module provides TestCommandMatcher for detecting test execution commands
-across multiple programming languages (Python, JavaScript, Go, Java) using
-simple substring matching (per research.md Decision 4).
+across multiple programming languages (Python, JavaScript, Go, Java, Rust).
+Matching is done by the shared CommandClassifier, which checks every
+pattern in a single pass over the command.
 
 Constitutional Compliance:
-- Principle II (KISS): Hardcoded pattern list with O(n) substring matching
+- Principle II (KISS): Declarative pattern list, one scan per command
 - Principle III (Transparency): Explicit command list and matching logic
 """
 
 from typing import List, Optional
 
+from src.metrics.pattern_matchers.command_classifier import (
+    DEFAULT_PATTERNS,
+    CommandClassifier,
+    get_command_classifier,
+)
+
 
 class TestCommandMatcher:
     """Matcher for test commands in CI configuration steps.
 
-    Uses hardcoded pattern lists with substring matching for performance
-    and simplicity (per research.md). Supports 4 languages:
-    - Python: pytest, python -m pytest
-    - JavaScript: npm test, npm run test
+    Thin interface over CommandClassifier. The default patterns cover:
+    - Python: pytest, python -m pytest, tox, nox
+    - JavaScript/TypeScript: npm test, npm run test, vitest
     - Go: go test
     - Java: mvn test, gradle test, ./gradlew test
+    - Rust: cargo test
+    - Bazel: bazel test
+
+    More can be added from config (see command_classifier).
 
     Example:
         >>> matcher = TestCommandMatcher()
@@ -32,36 +42,24 @@ class TestCommandMatcher:
         True
     """
 
-    # Test command patterns per FR-007
-    TEST_COMMANDS = [
-        # Python
-        "pytest",
-        "python -m pytest",
-        # JavaScript/TypeScript
-        "npm test",
-        "npm run test",
-        # Go
-        "go test",
-        # Java
-        "mvn test",
-        "gradle test",
-        "./gradlew test",
-        "gradlew test",  # Windows or direct execution
-    ]
-
-    # Coverage flags for detection
-    COVERAGE_FLAGS = [
-        "--cov",           # pytest coverage flag
-        "--coverage",      # generic coverage flag
-        "-cover",          # go test coverage flag
-        "-coverprofile",   # go test coverage profile
-    ]
+    # Default test command patterns per FR-007
+    TEST_COMMANDS = [pattern.literal for pattern in DEFAULT_PATTERNS if pattern.kind == "test"]
+
+    # Default coverage flags (case sensitive)
+    COVERAGE_FLAGS = [pattern.literal for pattern in DEFAULT_PATTERNS if pattern.kind == "coverage_flag"]
+
+    def __init__(self, classifier: Optional[CommandClassifier] = None):
+        """Initialize matcher.
+
+        Args:
+            classifier: Classifier to use (defaults to the process-wide one)
+        """
+        self.classifier = classifier or get_command_classifier()
 
     def is_test_command(self, command: str) -> bool:
         """Check if command contains a test pattern.
 
-        Uses substring matching (not regex) per research.md Decision 4.
-        Time complexity: O(n * m) where n = len(TEST_COMMANDS), m = len(command).
+        Single scan of the command regardless of the number of patterns.
         Case-insensitive to handle varying CI configuration styles.
 
         Args:
@@ -79,12 +77,7 @@ class TestCommandMatcher:
             >>> matcher.is_test_command("npm run build")
             False
         """
-        if not command:
-            return False
-
-        # Case-insensitive substring matching for each test command pattern
-        command_lower = command.lower()
-        return any(test_cmd in command_lower for test_cmd in self.TEST_COMMANDS)
+        return self.classifier.classify(command).is_test
 
     def extract_test_commands(self, steps: List[str]) -> List[str]:
         """Filter test commands from CI steps.
@@ -110,9 +103,14 @@ class TestCommandMatcher:
         Returns standardized framework names per TestStepInfo.framework field:
         - "pytest": Python pytest framework
         - "jest": JavaScript jest framework (via npm test)
+        - "vitest": JavaScript vitest framework
         - "go_test": Go standard testing package
         - "junit": Java JUnit framework (via maven/gradle)
-        - None: Cannot infer framework
+        - "cargo_test": Rust cargo test
+        - None: Cannot infer framework (or not a test command)
+
+        The first matching pattern that names a framework wins, so pytest
+        takes precedence over npm, go and JVM commands.
 
         Case-insensitive to handle varying CI configuration styles.
 
@@ -133,29 +131,7 @@ class TestCommandMatcher:
             >>> matcher.infer_framework("go test ./...")
             'go_test'
         """
-        if not command:
-            return None
-
-        # Case-insensitive matching
-        command_lower = command.lower()
-
-        # Python: pytest
-        if "pytest" in command_lower:
-            return "pytest"
-
-        # JavaScript: jest (most common npm test runner)
-        if "npm test" in command_lower or "npm run test" in command_lower:
-            return "jest"
-
-        # Go: go test
-        if "go test" in command_lower:
-            return "go_test"
-
-        # Java: junit (via maven or gradle)
-        if "mvn test" in command_lower or "gradle test" in command_lower or "gradlew test" in command_lower:
-            return "junit"
-
-        return None
+        return self.classifier.classify(command).framework
 
     def has_coverage_flag(self, command: str) -> bool:
         """Check if command includes coverage flags.
@@ -181,7 +157,4 @@ class TestCommandMatcher:
             >>> matcher.has_coverage_flag("npm test")
             False
         """
-        if not command:
-            return False
-
-        return any(flag in command for flag in self.COVERAGE_FLAGS)
+        return self.classifier.classify(command).has_coverage_flag
@@ -0,0 +1,134 @@
+"""Local history of analysis tool runtimes for predicting stage budgets."""
+
+import logging
+import math
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+TOOL_HISTORY_ENV = "CODE_SCORE_TOOL_HISTORY"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tool_runtimes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    language TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    file_count INTEGER NOT NULL,
+    size_mb REAL NOT NULL,
+    seconds REAL NOT NULL,
+    timed_out INTEGER NOT NULL DEFAULT 0,
+    recorded_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tool_runtimes_stage ON tool_runtimes (language, stage, id);
+"""
+
+
+@dataclass(frozen=True)
+class RepoFeatures:
+    """Repository features runtimes are compared by."""
+    file_count: int
+    size_mb: float
+
+
+@dataclass(frozen=True)
+class RuntimePrediction:
+    """Predicted duration of a stage from similar past runs."""
+    p50: float
+    p95: float
+    samples: int
+
+
+class RuntimeHistory:
+    """Tool runtimes per language and stage, stored in a local SQLite file.
+
+    Predictions use the ``neighbors`` past runs of the same language and
+    stage closest in (log) file count and size. Runs that hit their timeout
+    only bound the true duration from below; they are counted with their
+    timeout, which keeps the prediction at least as long as the budget that
+    was too short. Like ``JobQueue``, every operation opens its own
+    connection, so one instance can be shared between worker threads and
+    processes can share the file.
+    """
+
+    def __init__(self, db_path: str | Path, min_samples: int = 5, neighbors: int = 20,
+                 max_samples: int = 500) -> None:
+        """Open (creating if needed) the history at db_path.
+
+        Args:
+            db_path: SQLite database file
+            min_samples: Runs needed before a stage is predicted at all
+            neighbors: Similar runs a prediction is based on
+            max_samples: Most recent runs kept per language and stage
+        """
+        self.db_path = Path(db_path)
+        self.min_samples = min_samples
+        self.neighbors = max(neighbors, min_samples)
+        self.max_samples = max_samples
+        self.logger = logging.getLogger('code_score.runtime_history')
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path), timeout=30.0, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def record(self, language: str, stage: str, features: RepoFeatures, seconds: float,
+               timed_out: bool = False) -> None:
+        """Store one run and drop the stage's runs beyond ``max_samples``."""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT INTO tool_runtimes (language, stage, file_count, size_mb, seconds, timed_out, recorded_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (language, stage, features.file_count, features.size_mb, seconds, int(timed_out),
+                     datetime.utcnow().isoformat())
+                )
+                conn.execute(
+                    "DELETE FROM tool_runtimes WHERE language = ? AND stage = ? AND id NOT IN "
+                    "(SELECT id FROM tool_runtimes WHERE language = ? AND stage = ? ORDER BY id DESC LIMIT ?)",
+                    (language, stage, language, stage, self.max_samples)
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to record {language} {stage} runtime: {e}")
+
+    def predict(self, language: str, stage: str, features: RepoFeatures) -> RuntimePrediction | None:
+        """Median and p95 duration of similar past runs, or None without enough history."""
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT file_count, size_mb, seconds FROM tool_runtimes WHERE language = ? AND stage = ?",
+                    (language, stage)
+                ).fetchall()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to read {language} {stage} runtimes: {e}")
+            return None
+        if len(rows) < self.min_samples:
+            return None
+
+        def distance(row: tuple[int, float, float]) -> float:
+            return (abs(math.log1p(row[0]) - math.log1p(features.file_count))
+                    + abs(math.log1p(row[1]) - math.log1p(features.size_mb)))
+
+        nearest = sorted(rows, key=distance)[:self.neighbors]
+        durations = sorted(row[2] for row in nearest)
+        return RuntimePrediction(
+            p50=_percentile(durations, 0.50),
+            p95=_percentile(durations, 0.95),
+            samples=len(durations)
+        )
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
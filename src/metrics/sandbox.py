@@ -0,0 +1,374 @@
+"""Resource-limited execution of analysis tool subprocesses."""
+
+import atexit
+import itertools
+import logging
+import os
+import re
+import resource
+import signal
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+
+CGROUP_ROOT_ENV = "CODE_SCORE_CGROUP_ROOT"
+
+# Violation kinds reported in ``limit_exceeded``
+CPU = "cpu"
+MEMORY = "memory"
+PROCESSES = "processes"
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """Limits for one tool invocation; None leaves a resource unlimited.
+
+    The wall-clock limit is the runner's timeout. ``memory_mb`` and
+    ``max_processes`` are enforced through a cgroup's ``memory.max`` and
+    ``pids.max`` only. The rlimit counterparts are opt-in and never set by
+    default: ``address_space_mb`` sets ``RLIMIT_AS``, which breaks tools
+    reserving large virtual ranges (Node, Go, WebAssembly runtimes), and
+    ``user_processes`` sets ``RLIMIT_NPROC``, which counts every process and
+    thread of the user, so a busy desktop session can exhaust it before the
+    tool starts a single thread.
+    """
+    cpu_seconds: int | None = None
+    memory_mb: int | None = None
+    max_processes: int | None = None
+    address_space_mb: int | None = None
+    user_processes: int | None = None
+
+
+DEFAULT_TOOL_LIMITS = {
+    "lint": ResourceLimits(cpu_seconds=600, memory_mb=4096, max_processes=1024),
+    "audit": ResourceLimits(cpu_seconds=600, memory_mb=4096, max_processes=1024),
+    "build": ResourceLimits(cpu_seconds=1800, memory_mb=8192, max_processes=4096),
+    # JVMs reserve address space far beyond their heap, and Gradle/mvnd
+    # daemons outlive the build (and so would accumulate CPU time); only a
+    # cgroup can bound their memory
+    "jvm": ResourceLimits(max_processes=4096),
+}
+
+# Classes whose commands start daemons that serve later commands; they share
+# one cgroup per sandbox that lives until ``ToolSandbox.close``, so its
+# limits bound the daemons and their clients together
+LONG_LIVED_CLASSES = frozenset({"jvm"})
+
+# Tool output when a child process was stopped by a limit, or an
+# allocation, fork or thread creation was refused
+_CPU_ERRORS = re.compile(r"CPU time limit exceeded|SIGXCPU")
+_MEMORY_ERRORS = re.compile(
+    r"MemoryError|Cannot allocate memory|out of memory|std::bad_alloc|OutOfMemoryError|"
+    r"failed to reserve|mmap failed|memory allocation of \d+ bytes failed",
+    re.IGNORECASE
+)
+_PROCESS_ERRORS = re.compile(
+    r"Resource temporarily unavailable|fork: retry|can't start new thread|"
+    r"unable to create (?:new )?native thread|pthread_create failed",
+    re.IGNORECASE
+)
+
+
+class SandboxedProcess(subprocess.CompletedProcess):
+    """``CompletedProcess`` that also reports which limit, if any, was hit."""
+
+    def __init__(self, completed: subprocess.CompletedProcess, limit_exceeded: str | None = None,
+                 limits: ResourceLimits | None = None) -> None:
+        super().__init__(completed.args, completed.returncode, completed.stdout, completed.stderr)
+        self.limit_exceeded = limit_exceeded
+        self.limits = limits or ResourceLimits()
+
+    def limit_message(self) -> str | None:
+        """Human readable description of the violation, e.g. "memory limit (4096 MB)"."""
+        if self.limit_exceeded == CPU:
+            return f"CPU time limit ({self.limits.cpu_seconds}s)"
+        if self.limit_exceeded == MEMORY:
+            if self.limits.memory_mb is None:
+                return f"address space limit ({self.limits.address_space_mb} MB)"
+            return f"memory limit ({self.limits.memory_mb} MB)"
+        if self.limit_exceeded == PROCESSES:
+            if self.limits.max_processes is None:
+                return f"user process limit ({self.limits.user_processes})"
+            return f"process limit ({self.limits.max_processes})"
+        return None
+
+
+class ToolSandbox:
+    """Runs tool commands under per-tool-class CPU, memory and process limits.
+
+    Limits are applied in the child before ``exec`` with ``setrlimit``:
+    ``RLIMIT_CPU`` always, ``RLIMIT_AS`` when ``address_space_mb`` is
+    configured and ``RLIMIT_NPROC`` when ``user_processes`` is configured.
+    Without a cgroup ``memory_mb`` and ``max_processes`` are not enforced.
+
+    With ``cgroup_root`` set to a writable, delegated cgroup v2 directory,
+    each invocation gets its own child cgroup with ``memory.max`` and
+    ``pids.max`` instead, which limit resident memory and the tool's own
+    process tree exactly; the cgroup is removed (and leftover processes
+    killed) when the command exits. Commands of ``LONG_LIVED_CLASSES`` run
+    in one shared cgroup per class instead, so build daemons they start
+    survive until ``close``.
+    """
+
+    def __init__(self, limits: dict[str, ResourceLimits] | None = None,
+                 cgroup_root: str | Path | None = None) -> None:
+        """Initialize the sandbox.
+
+        Args:
+            limits: Limits per tool class, merged over ``DEFAULT_TOOL_LIMITS``
+            cgroup_root: Delegated cgroup v2 directory for per-tool cgroups
+                (default: ``CODE_SCORE_CGROUP_ROOT``); rlimits only when unusable
+        """
+        self.limits = {**DEFAULT_TOOL_LIMITS, **(limits or {})}
+        self.logger = logging.getLogger('code_score.sandbox')
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._shared_cgroups: dict[str, Path | None] = {}
+        cgroup_root = cgroup_root or os.environ.get(CGROUP_ROOT_ENV) or None
+        self.cgroup_root = self._check_cgroup_root(Path(cgroup_root)) if cgroup_root else None
+        if self.cgroup_root is not None:
+            atexit.register(self.close)
+
+    def limits_for(self, tool_class: str) -> ResourceLimits:
+        return self.limits.get(tool_class, ResourceLimits())
+
+    def run(self, tool_class: str, command: list[str], timeout: float | None = None,
+            cwd: str | None = None, env: dict[str, str] | None = None) -> SandboxedProcess:
+        """Run a command like ``subprocess.run(..., capture_output=True, text=True)``.
+
+        Args:
+            tool_class: Limit class ("lint", "audit", "build", "jvm")
+            command: Command and arguments
+            timeout: Wall-clock limit; ``subprocess.TimeoutExpired`` is raised as usual
+            cwd: Working directory
+            env: Environment (default: inherited)
+
+        Returns:
+            The completed process with ``limit_exceeded`` set to "cpu",
+            "memory" or "processes" when the command was stopped by a limit
+        """
+        limits = self.limits_for(tool_class)
+        shared = tool_class in LONG_LIVED_CLASSES
+        cgroup = None
+        if self.cgroup_root is not None:
+            cgroup = self._shared_cgroup(tool_class, limits) if shared else self._create_cgroup(limits)
+        if cgroup is None:
+            limits = replace(limits, memory_mb=None, max_processes=None)
+        # A shared cgroup's event counters include earlier commands
+        events_before = _cgroup_events(cgroup) if shared and cgroup is not None else {}
+        procs_fd = os.open(cgroup / "cgroup.procs", os.O_WRONLY) if cgroup is not None else None
+        try:
+            completed = subprocess.run(
+                command, capture_output=True, text=True, timeout=timeout, cwd=cwd, env=env,
+                preexec_fn=_limit_child(limits, procs_fd)
+            )
+            events = _cgroup_events(cgroup) if cgroup is not None else {}
+            events = {key: count - events_before.get(key, 0) for key, count in events.items()}
+        finally:
+            if procs_fd is not None:
+                os.close(procs_fd)
+            if cgroup is not None and not shared:
+                self._remove_cgroup(cgroup)
+
+        violation = _classify(completed, limits, events)
+        if violation:
+            self.logger.warning(f"{command[0]} exceeded its {violation} limit")
+        return SandboxedProcess(completed, violation, limits)
+
+    def close(self) -> None:
+        """Remove the shared cgroups, killing daemons still running in them."""
+        with self._lock:
+            cgroups = [path for path in self._shared_cgroups.values() if path is not None]
+            self._shared_cgroups.clear()
+        for path in cgroups:
+            self._remove_cgroup(path)
+
+    # ------------------------------------------------------------------
+    # cgroup v2
+    # ------------------------------------------------------------------
+
+    def _check_cgroup_root(self, root: Path) -> Path | None:
+        try:
+            if not (root / "cgroup.controllers").exists():
+                raise OSError("not a cgroup v2 directory")
+            enabled = set((root / "cgroup.subtree_control").read_text().split())
+            missing = {"memory", "pids"} - enabled
+            if missing:
+                (root / "cgroup.subtree_control").write_text(" ".join(f"+{name}" for name in sorted(missing)))
+            return root
+        except OSError as e:
+            self.logger.warning(f"cgroup root {root} is not usable, falling back to rlimits: {e}")
+            return None
+
+    def _create_cgroup(self, limits: ResourceLimits) -> Path | None:
+        assert self.cgroup_root is not None
+        with self._lock:
+            path = self.cgroup_root / f"code-score-{os.getpid()}-{next(self._counter)}"
+        try:
+            path.mkdir()
+            if limits.memory_mb is not None:
+                (path / "memory.max").write_text(str(limits.memory_mb * 1024 * 1024))
+            if limits.max_processes is not None:
+                (path / "pids.max").write_text(str(limits.max_processes))
+            return path
+        except OSError as e:
+            self.logger.warning(f"Failed to create cgroup {path}, using rlimits: {e}")
+            self._remove_cgroup(path)
+            return None
+
+    def _shared_cgroup(self, tool_class: str, limits: ResourceLimits) -> Path | None:
+        with self._lock:
+            if tool_class in self._shared_cgroups:
+                return self._shared_cgroups[tool_class]
+        path = self._create_cgroup(limits)
+        with self._lock:
+            if tool_class in self._shared_cgroups:
+                # Another thread created it first
+                if path is not None:
+                    self._remove_cgroup(path)
+                return self._shared_cgroups[tool_class]
+            self._shared_cgroups[tool_class] = path
+            return path
+
+    def _remove_cgroup(self, path: Path) -> None:
+        try:
+            if (path / "cgroup.kill").exists():
+                # Daemonized leftovers of the tool
+                (path / "cgroup.kill").write_text("1")
+        except OSError:
+            pass
+        # Killed processes leave the cgroup asynchronously
+        deadline = time.monotonic() + 2.0
+        while True:
+            try:
+                path.rmdir()
+                return
+            except FileNotFoundError:
+                return
+            except OSError:
+                if time.monotonic() >= deadline:
+                    return
+                time.sleep(0.05)
+
+
+def _limit_child(limits: ResourceLimits, procs_fd: int | None) -> Callable[[], None]:
+    """``preexec_fn`` applying the limits; runs in the forked child, so no imports or logging."""
+    setrlimit = resource.setrlimit
+    write = os.write
+    getpid = os.getpid
+
+    def apply() -> None:
+        if procs_fd is not None:
+            write(procs_fd, str(getpid()).encode())
+        if limits.cpu_seconds is not None:
+            # SIGXCPU at the soft limit, SIGKILL shortly after for tools ignoring it
+            setrlimit(resource.RLIMIT_CPU, (limits.cpu_seconds, limits.cpu_seconds + 5))
+        if limits.address_space_mb is not None:
+            size = limits.address_space_mb * 1024 * 1024
+            setrlimit(resource.RLIMIT_AS, (size, size))
+        if limits.user_processes is not None:
+            setrlimit(resource.RLIMIT_NPROC, (limits.user_processes, limits.user_processes))
+
+    return apply
+
+
+def _cgroup_events(path: Path) -> dict[str, int]:
+    events = {}
+    for name in ("memory.events", "pids.events"):
+        try:
+            for line in (path / name).read_text().splitlines():
+                key, _, value = line.partition(" ")
+                events[f"{name.split('.')[0]}.{key}"] = int(value)
+        except (OSError, ValueError):
+            continue
+    return events
+
+
+def _classify(completed: subprocess.CompletedProcess, limits: ResourceLimits,
+              events: dict[str, int]) -> str | None:
+    """Which limit stopped the command, if any.
+
+    SIGXCPU and cgroup events are conclusive; limits hit by the tool's
+    children and, with rlimits, refused allocations and forks are
+    recognized from the tool's error output. SIGKILL alone is not a CPU
+    violation: the OOM killer, timeouts and daemon shutdowns send it too.
+    """
+    if completed.returncode == 0:
+        return None
+    if events.get("memory.oom_kill", 0) > 0:
+        return MEMORY
+    if events.get("pids.max", 0) > 0:
+        return PROCESSES
+
+    output = f"{completed.stderr or ''}\n{completed.stdout or ''}"
+    if limits.cpu_seconds is not None:
+        # The tool itself, or a child reported by a shell/npm wrapper
+        if completed.returncode in (-signal.SIGXCPU, 128 + signal.SIGXCPU):
+            return CPU
+        if _CPU_ERRORS.search(output):
+            return CPU
+    if limits.address_space_mb is not None and _MEMORY_ERRORS.search(output):
+        return MEMORY
+    if limits.user_processes is not None and _PROCESS_ERRORS.search(output):
+        return PROCESSES
+    return None
+
+
+def parse_limit_option(value: str) -> tuple[str, str, int | None]:
+    """Parse ``CLASS.FIELD=VALUE`` (e.g. ``build.memory_mb=4096``; ``none`` unsets).
+
+    Raises:
+        ValueError: If the class, field or value is invalid
+    """
+    key, separator, raw = value.partition("=")
+    tool_class, _, field = key.partition(".")
+    names = {f.name for f in fields(ResourceLimits)}
+    if not separator or tool_class not in DEFAULT_TOOL_LIMITS or field not in names:
+        raise ValueError(
+            f"expected CLASS.FIELD=VALUE with CLASS in {sorted(DEFAULT_TOOL_LIMITS)} "
+            f"and FIELD in {sorted(names)}, got {value!r}"
+        )
+    if raw.strip().lower() == "none":
+        return tool_class, field, None
+    number = int(raw)
+    if number < 1:
+        raise ValueError(f"limit must be positive, got {value!r}")
+    return tool_class, field, number
+
+
+def limits_from_options(options: list[str]) -> dict[str, ResourceLimits]:
+    """Per-class limits from ``CLASS.FIELD=VALUE`` overrides of the defaults."""
+    limits = dict(DEFAULT_TOOL_LIMITS)
+    for option in options:
+        tool_class, field, number = parse_limit_option(option)
+        limits[tool_class] = replace(limits[tool_class], **{field: number})
+    return limits
+
+
+_active_sandbox: ToolSandbox | None = None
+_active_sandbox_lock = threading.Lock()
+
+
+def get_tool_sandbox() -> ToolSandbox:
+    """The sandbox tool runners use; created with the default limits on first use."""
+    global _active_sandbox
+    with _active_sandbox_lock:
+        if _active_sandbox is None:
+            _active_sandbox = ToolSandbox()
+        return _active_sandbox
+
+
+def set_tool_sandbox(sandbox: ToolSandbox | None) -> None:
+    """Replace the process's sandbox (None restores the defaults on next use)."""
+    global _active_sandbox
+    with _active_sandbox_lock:
+        _active_sandbox = sandbox
+
+
+def run_tool(tool_class: str, command: list[str], timeout: float | None = None,
+             cwd: str | None = None, env: dict[str, str] | None = None) -> SandboxedProcess:
+    """Run a tool command through the active sandbox (see ``ToolSandbox.run``)."""
+    return get_tool_sandbox().run(tool_class, command, timeout=timeout, cwd=cwd, env=env)
@@ -0,0 +1,465 @@
+"""Lease-based job queue on a shared filesystem directory for multi-node batches.
+
+Several hosts mounting the same directory cooperate without an external
+broker. Layout under the shared root::
+
+    jobs/<name>.json          immutable job spec (URL, commit, timeout)
+    leases/<name>.<gen>.json  claim generations; the highest one owns the job
+    done/<name>.json          completion marker
+    failed/<name>.json        failure marker with the recorded error
+    outputs/<name>/           per-repository outputs
+    summaries/<node>.json     per-node shard summaries for ``merge``
+
+A claim creates lease generation ``g + 1`` with ``os.link``, which fails if the
+file already exists, so exactly one node wins each generation. A lease whose
+``expires_at`` has passed (its owner crashed or was partitioned) may be stolen
+by creating the next generation. Owners renew their leases from a heartbeat
+thread. Hosts are assumed to have reasonably synchronized clocks.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .job_queue import JobQueueError
+from .models.batch_job import BatchJob, JobState, repository_output_name
+
+_LEASE_PATTERN = re.compile(r"^(?P<name>.+)\.(?P<gen>\d{6})\.json$")
+
+
+def parse_shard_spec(spec: str) -> tuple[int, int]:
+    """Parse a ``i/N`` shard specification (1-based) into a 0-based (index, total).
+
+    Raises:
+        ValueError: If the specification is malformed or out of range
+
+    Examples:
+        >>> parse_shard_spec("2/4")
+        (1, 4)
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", spec)
+    if not match:
+        raise ValueError(f"Invalid shard '{spec}', expected i/N (e.g. 1/3)")
+
+    index, total = int(match.group(1)), int(match.group(2))
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"Invalid shard '{spec}', i must be between 1 and N")
+    return index - 1, total
+
+
+def shard_for_repository(repository_url: str, total_shards: int) -> int:
+    """Deterministically assign a repository URL to a 0-based shard."""
+    digest = hashlib.sha256(repository_url.encode("utf-8")).hexdigest()
+    return int(digest, 16) % total_shards
+
+
+def default_node_id() -> str:
+    """Node id unique to this process, so concurrent batches on one host never share leases."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+def _job_id_for(name: str) -> int:
+    """Stable integer job id for a job name, identical on every node."""
+    return int(hashlib.sha256(name.encode("utf-8")).hexdigest()[:12], 16)
+
+
+class SharedDirectoryQueue:
+    """Job queue whose state lives entirely in files under a shared directory.
+
+    Implements the same interface as JobQueue, so BatchRunner can drive either.
+    Nodes prefer jobs from their own shard and, with work stealing enabled,
+    take unclaimed or expired jobs from other shards once their own is empty.
+    """
+
+    def __init__(self, root: str | Path, node_id: str,
+                 shard: tuple[int, int] | None = None,
+                 lease_seconds: float = 600.0,
+                 work_stealing: bool = True) -> None:
+        """Initialize the shared queue.
+
+        Args:
+            root: Shared directory (e.g. an NFS mount) used by all nodes
+            node_id: Name of this node, unique among running processes; a
+                restarted process reusing it resumes the jobs it held
+                (see ``requeue_interrupted``)
+            shard: Optional 0-based (index, total) shard this node prefers
+            lease_seconds: How long a claim stays valid without a heartbeat
+            work_stealing: Claim jobs from other shards when the own shard is empty
+        """
+        self.root = Path(root)
+        self.node_id = node_id
+        self.shard = shard
+        self.lease_seconds = lease_seconds
+        self.work_stealing = work_stealing
+        self.logger = logging.getLogger('code_score.shared_queue')
+
+        self.jobs_dir = self.root / "jobs"
+        self.leases_dir = self.root / "leases"
+        self.done_dir = self.root / "done"
+        self.failed_dir = self.root / "failed"
+        self.outputs_dir = self.root / "outputs"
+        self.summaries_dir = self.root / "summaries"
+        for directory in (self.jobs_dir, self.leases_dir, self.done_dir,
+                          self.failed_dir, self.outputs_dir, self.summaries_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        # job_id -> (name, lease generation) for leases held by this instance
+        self._held: dict[int, tuple[str, int]] = {}
+        self._lock = threading.Lock()
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------
+    # File helpers
+    # ------------------------------------------------------------------
+
+    def _create_exclusive(self, path: Path, data: dict[str, Any]) -> bool:
+        """Atomically create path with JSON content; False if it already exists."""
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        try:
+            os.link(tmp_path, path)
+            return True
+        except FileExistsError:
+            return False
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _replace(self, path: Path, data: dict[str, Any]) -> None:
+        """Atomically overwrite path with JSON content."""
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, Any] | None:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _lease_path(self, name: str, generation: int) -> Path:
+        return self.leases_dir / f"{name}.{generation:06d}.json"
+
+    def _lease_generations(self) -> dict[str, int]:
+        """Map job name → highest lease generation present."""
+        generations: dict[str, int] = {}
+        for entry in os.scandir(self.leases_dir):
+            match = _LEASE_PATTERN.match(entry.name)
+            if match:
+                name, gen = match.group("name"), int(match.group("gen"))
+                if gen > generations.get(name, 0):
+                    generations[name] = gen
+        return generations
+
+    def _job_names(self) -> list[str]:
+        return sorted(
+            entry.name[:-5] for entry in os.scandir(self.jobs_dir)
+            if entry.name.endswith(".json") and not entry.name.startswith(".")
+        )
+
+    def _marker_names(self, directory: Path) -> set[str]:
+        return {
+            entry.name[:-5] for entry in os.scandir(directory)
+            if entry.name.endswith(".json") and not entry.name.startswith(".")
+        }
+
+    # ------------------------------------------------------------------
+    # Queue interface
+    # ------------------------------------------------------------------
+
+    def enqueue(self, repositories: list[tuple[str, str | None]], timeout_seconds: int = 300) -> int:
+        """Publish job specs; specs already published by any node are kept as-is."""
+        added = 0
+        now = datetime.utcnow().isoformat()
+        for url, commit_sha in repositories:
+            name = repository_output_name(url, commit_sha)
+            spec = {
+                "repository_url": url,
+                "commit_sha": commit_sha,
+                "timeout_seconds": timeout_seconds,
+                "created_at": now,
+            }
+            if self._create_exclusive(self.jobs_dir / f"{name}.json", spec):
+                added += 1
+        return added
+
+    def claim(self, worker_id: str) -> BatchJob | None:
+        """Claim a job: own shard first, then (with work stealing) any other."""
+        finished = self._marker_names(self.done_dir) | self._marker_names(self.failed_dir)
+        generations = self._lease_generations()
+        now = time.time()
+
+        own, others = [], []
+        for name in self._job_names():
+            if name in finished:
+                continue
+            generation = generations.get(name, 0)
+            if generation:
+                lease = self._read(self._lease_path(name, generation))
+                if lease and lease.get("expires_at", 0) > now:
+                    continue  # actively held by another worker
+
+            spec = self._read(self.jobs_dir / f"{name}.json")
+            if spec is None:
+                continue
+            if self.shard is None or \
+                    shard_for_repository(spec["repository_url"], self.shard[1]) == self.shard[0]:
+                own.append((name, generation, spec))
+            else:
+                others.append((name, generation, spec))
+
+        candidates = own + (others if self.work_stealing else [])
+        for index, (name, generation, spec) in enumerate(candidates):
+            job = self._try_lease(name, generation + 1, spec, worker_id)
+            if job is not None:
+                if index >= len(own):
+                    self.logger.info(f"Node {self.node_id} stole job {name} from another shard")
+                return job
+        return None
+
+    def _try_lease(self, name: str, generation: int, spec: dict[str, Any],
+                   worker_id: str) -> BatchJob | None:
+        """Try to create lease generation for name; return the job on success."""
+        now = datetime.utcnow().isoformat()
+        lease = {
+            "node_id": self.node_id,
+            "worker_id": worker_id,
+            "state": JobState.CLONING.value,
+            "stage_timestamps": {JobState.CLONING.value: now},
+            "output_dir": None,
+            "expires_at": time.time() + self.lease_seconds,
+            "updated_at": now,
+        }
+        if not self._create_exclusive(self._lease_path(name, generation), lease):
+            return None
+
+        # A finished marker may have appeared between listing and leasing
+        if (self.done_dir / f"{name}.json").exists() or (self.failed_dir / f"{name}.json").exists():
+            self._release(name, generation, lease)
+            return None
+
+        job_id = _job_id_for(name)
+        with self._lock:
+            self._held[job_id] = (name, generation)
+        self._ensure_heartbeat()
+        return self._build_job(name, spec, lease, generation)
+
+    def _build_job(self, name: str, spec: dict[str, Any], record: dict[str, Any] | None,
+                   attempts: int, state: JobState | None = None) -> BatchJob:
+        record = record or {}
+        return BatchJob(
+            job_id=_job_id_for(name),
+            repository_url=spec["repository_url"],
+            commit_sha=spec.get("commit_sha"),
+            state=state or JobState(record.get("state", JobState.PENDING.value)),
+            attempts=attempts,
+            timeout_seconds=spec.get("timeout_seconds", 300),
+            worker_id=f"{record['node_id']}/{record['worker_id']}" if record.get("node_id") else None,
+            output_dir=record.get("output_dir"),
+            error=record.get("error"),
+            stage_timestamps=dict(record.get("stage_timestamps", {})),
+            created_at=spec.get("created_at"),
+            updated_at=record.get("updated_at"),
+        )
+
+    def _held_lease(self, job_id: int) -> tuple[str, int, dict[str, Any]]:
+        with self._lock:
+            if job_id not in self._held:
+                raise JobQueueError(f"Job {job_id} is not leased by node {self.node_id}")
+            name, generation = self._held[job_id]
+        # A newer generation means this lease expired and another node owns the job
+        if self._lease_path(name, generation + 1).exists():
+            with self._lock:
+                self._held.pop(job_id, None)
+            raise JobQueueError(f"Lease on job {name} was taken over by another node")
+        lease = self._read(self._lease_path(name, generation))
+        if lease is None:
+            raise JobQueueError(f"Lease for job {name} disappeared")
+        return name, generation, lease
+
+    def advance(self, job_id: int, state: JobState, output_dir: str | None = None) -> None:
+        """Record the next stage in the lease and renew it."""
+        if state in (JobState.PENDING, JobState.FAILED):
+            raise JobQueueError(f"Use requeue/fail to move job {job_id} to {state.value}")
+        name, generation, lease = self._held_lease(job_id)
+
+        now = datetime.utcnow().isoformat()
+        lease["state"] = state.value
+        lease["stage_timestamps"][state.value] = now
+        lease["updated_at"] = now
+        lease["expires_at"] = time.time() + self.lease_seconds
+        if output_dir is not None:
+            lease["output_dir"] = output_dir
+        self._replace(self._lease_path(name, generation), lease)
+
+    def complete(self, job_id: int) -> None:
+        """Write the done marker and release the lease."""
+        self._finish(job_id, JobState.DONE, self.done_dir)
+
+    def fail(self, job_id: int, error: str) -> None:
+        """Write the failed marker (with error) and release the lease."""
+        self._finish(job_id, JobState.FAILED, self.failed_dir, error=error)
+
+    def _finish(self, job_id: int, state: JobState, marker_dir: Path, error: str | None = None) -> None:
+        try:
+            name, generation, lease = self._held_lease(job_id)
+        except JobQueueError as e:
+            # The current owner records the outcome
+            self.logger.warning(f"Not marking job {job_id} {state.value}: {e}")
+            return
+        spec = self._read(self.jobs_dir / f"{name}.json") or {}
+
+        now = datetime.utcnow().isoformat()
+        lease["state"] = state.value
+        lease["stage_timestamps"][state.value] = now
+        lease["updated_at"] = now
+        if error is not None:
+            lease["error"] = error
+
+        marker = {**spec, **lease, "attempts": generation, "name": name}
+        if not self._create_exclusive(marker_dir / f"{name}.json", marker):
+            self.logger.warning(f"Job {name} was already finished by another node")
+        self._release(name, generation, lease)
+
+    def _release(self, name: str, generation: int, lease: dict[str, Any]) -> None:
+        """Expire a lease immediately and stop renewing it."""
+        # Under the lock, so a concurrent heartbeat cannot re-extend the released lease
+        with self._lock:
+            self._held.pop(_job_id_for(name), None)
+            lease["expires_at"] = 0
+            self._replace(self._lease_path(name, generation), lease)
+
+    def requeue_interrupted(self) -> int:
+        """Expire leases this node held before it crashed so they can be reclaimed.
+
+        Every lease under this ``node_id`` that this instance does not hold
+        is expired, so no other running process may use the same node id.
+        """
+        count = 0
+        finished = self._marker_names(self.done_dir) | self._marker_names(self.failed_dir)
+        with self._lock:
+            held = set(self._held.values())
+        for name, generation in self._lease_generations().items():
+            if name in finished or (name, generation) in held:
+                continue
+            lease = self._read(self._lease_path(name, generation))
+            if lease and lease.get("node_id") == self.node_id and lease.get("expires_at", 0) > 0:
+                lease["expires_at"] = 0
+                self._replace(self._lease_path(name, generation), lease)
+                count += 1
+        if count:
+            self.logger.info(f"Resuming {count} job(s) interrupted on node {self.node_id}")
+        return count
+
+    def retry_failed(self, timeout_seconds: int | None = None) -> int:
+        """Remove failed markers (optionally updating the timeout) so jobs run again."""
+        count = 0
+        for name in self._marker_names(self.failed_dir):
+            if timeout_seconds is not None:
+                spec = self._read(self.jobs_dir / f"{name}.json")
+                if spec is not None:
+                    spec["timeout_seconds"] = timeout_seconds
+                    self._replace(self.jobs_dir / f"{name}.json", spec)
+            try:
+                (self.failed_dir / f"{name}.json").unlink()
+                count += 1
+            except FileNotFoundError:
+                continue  # another node retried it first
+        return count
+
+    def get_job(self, job_id: int) -> BatchJob | None:
+        """Get a job by id."""
+        for job in self.list_jobs():
+            if job.job_id == job_id:
+                return job
+        return None
+
+    def list_jobs(self, state: JobState | None = None) -> list[BatchJob]:
+        """List all jobs with their state as seen from the shared directory."""
+        generations = self._lease_generations()
+        now = time.time()
+        jobs = []
+        for name in self._job_names():
+            spec = self._read(self.jobs_dir / f"{name}.json")
+            if spec is None:
+                continue
+            generation = generations.get(name, 0)
+
+            done = self._read(self.done_dir / f"{name}.json")
+            failed = self._read(self.failed_dir / f"{name}.json")
+            if done is not None:
+                job = self._build_job(name, spec, done, generation, JobState.DONE)
+            elif failed is not None:
+                job = self._build_job(name, spec, failed, generation, JobState.FAILED)
+            else:
+                lease = self._read(self._lease_path(name, generation)) if generation else None
+                if lease and lease.get("expires_at", 0) > now:
+                    job = self._build_job(name, spec, lease, generation)
+                else:
+                    job = self._build_job(name, spec, lease, generation, JobState.PENDING)
+
+            if state is None or job.state == state:
+                jobs.append(job)
+        return jobs
+
+    def get_counts(self) -> dict[str, int]:
+        """Get the number of jobs in each state (all states present, zero-filled)."""
+        counts = {job_state.value: 0 for job_state in JobState}
+        for job in self.list_jobs():
+            counts[job.state.value] += 1
+        return counts
+
+    # ------------------------------------------------------------------
+    # Heartbeat
+    # ------------------------------------------------------------------
+
+    def _ensure_heartbeat(self) -> None:
+        if self._heartbeat_thread is None or not self._heartbeat_thread.is_alive():
+            self._heartbeat_stop.clear()
+            self._heartbeat_thread = threading.Thread(
+                target=self._heartbeat_loop, name=f"lease-heartbeat-{self.node_id}", daemon=True
+            )
+            self._heartbeat_thread.start()
+
+    def _heartbeat_loop(self) -> None:
+        interval = max(0.05, self.lease_seconds / 3)
+        while not self._heartbeat_stop.wait(interval):
+            self.renew_leases()
+
+    def renew_leases(self) -> None:
+        """Extend every lease this node holds; drop ones another node has taken over."""
+        with self._lock:
+            held = list(self._held.items())
+        generations = self._lease_generations()
+
+        for job_id, (name, generation) in held:
+            if generations.get(name, 0) > generation:
+                self.logger.warning(f"Lease on {name} was taken over by another node")
+                with self._lock:
+                    self._held.pop(job_id, None)
+                continue
+            with self._lock:
+                # The job may have been completed or failed since the snapshot above
+                if self._held.get(job_id) != (name, generation):
+                    continue
+                lease = self._read(self._lease_path(name, generation))
+                if lease is None or lease.get("expires_at", 0) == 0:
+                    continue
+                lease["expires_at"] = time.time() + self.lease_seconds
+                self._replace(self._lease_path(name, generation), lease)
+
+    def close(self) -> None:
+        """Stop the heartbeat thread."""
+        self._heartbeat_stop.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join(timeout=5)
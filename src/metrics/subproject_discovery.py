@@ -0,0 +1,261 @@
+"""Subproject discovery and result aggregation for monorepos."""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .offline_audit import HIGH_SEVERITIES
+
+# Manifest file name -> language of the project it defines
+MANIFEST_LANGUAGES = {
+    "package.json": "javascript",
+    "go.mod": "go",
+    "pom.xml": "java",
+    "build.gradle": "java",
+    "build.gradle.kts": "java",
+    "pyproject.toml": "python",
+    "setup.py": "python",
+}
+
+# Directories that never contain independent first-party projects
+SKIP_DIRS = {
+    ".git", "node_modules", "vendor", "target", "build", "dist", "out",
+    ".venv", "venv", "__pycache__", ".tox", ".gradle", ".idea", "testdata", "fixtures",
+}
+
+logger = logging.getLogger('code_score.subprojects')
+
+
+@dataclass
+class Subproject:
+    """An independently buildable package or module inside a repository.
+
+    Attributes:
+        path: Path relative to the repository root ("." for the root)
+        language: Language of the project's manifest
+        manifest: Manifest file that defines the project
+        modules: Nested build modules covered by this project (Maven/Gradle reactors)
+    """
+
+    path: str
+    language: str
+    manifest: str
+    modules: list[str] = field(default_factory=list)
+
+    def absolute_path(self, repo_path: str | Path) -> str:
+        return str(Path(repo_path) / self.path) if self.path != "." else str(repo_path)
+
+
+def discover_subprojects(repo_path: str | Path, max_depth: int = 4,
+                         max_subprojects: int = 20) -> list[Subproject]:
+    """Find independent packages/modules from their manifests.
+
+    - Every ``package.json``, ``go.mod``, ``pyproject.toml``/``setup.py``
+      directory is a subproject. A root ``package.json`` that only declares
+      ``workspaces`` is an aggregator and is skipped.
+    - A Maven/Gradle project is analyzed once at its top-most build file;
+      nested modules are listed in ``modules`` because they usually cannot
+      be built without their siblings.
+
+    Args:
+        repo_path: Repository root
+        max_depth: Maximum directory depth to search
+        max_subprojects: Upper bound on returned subprojects (shallowest first)
+
+    Returns:
+        Subprojects sorted by depth and path
+    """
+    root = Path(repo_path)
+    found: list[Subproject] = []
+    java_roots: list[Subproject] = []
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        relative = current.relative_to(root)
+        depth = len(relative.parts)
+        dirnames[:] = sorted(
+            d for d in dirnames if d not in SKIP_DIRS and not d.startswith(".")
+        ) if depth < max_depth else []
+
+        rel_path = relative.as_posix() if relative.parts else "."
+        languages_here = set()
+        for manifest in sorted(filenames):
+            language = MANIFEST_LANGUAGES.get(manifest)
+            if language is None or language in languages_here:
+                continue
+
+            if language == "java":
+                owner = _enclosing_project(java_roots, rel_path)
+                if owner is not None:
+                    owner.modules.append(rel_path)
+                    languages_here.add(language)
+                    continue
+            if manifest == "package.json" and rel_path == "." and _is_workspace_root(current / manifest):
+                languages_here.add(language)
+                continue
+
+            subproject = Subproject(path=rel_path, language=language, manifest=manifest)
+            if language == "java":
+                java_roots.append(subproject)
+            found.append(subproject)
+            languages_here.add(language)
+
+    found.sort(key=lambda sub: (0 if sub.path == "." else len(Path(sub.path).parts), sub.path))
+    if len(found) > max_subprojects:
+        logger.warning(f"Found {len(found)} subprojects, analyzing the first {max_subprojects}")
+        found = found[:max_subprojects]
+    return found
+
+
+def is_monorepo(subprojects: list[Subproject]) -> bool:
+    """Whether per-subproject analysis differs from analyzing the repository root."""
+    return len(subprojects) > 1 or any(sub.path != "." for sub in subprojects)
+
+
+def _enclosing_project(projects: list[Subproject], rel_path: str) -> Subproject | None:
+    for project in projects:
+        if project.path == "." or rel_path.startswith(project.path + "/"):
+            return project
+    return None
+
+
+def _is_workspace_root(package_json: Path) -> bool:
+    try:
+        return "workspaces" in json.loads(package_json.read_text(encoding="utf-8"))
+    except (OSError, ValueError, TypeError):
+        return False
+
+
+# ----------------------------------------------------------------------
+# Aggregation of per-subproject tool results
+# ----------------------------------------------------------------------
+
+def aggregate_lint_results(results: dict[str, dict[str, Any]],
+                           repo_path: str | Path | None = None) -> dict[str, Any]:
+    """Merge lint results keyed by subproject path; issue files are made repo-relative.
+
+    A target's linter also sees the subprojects nested inside it (the root
+    "." sees all of them). Issues in files owned by a nested target that was
+    linted itself are only counted from that target's run.
+
+    Args:
+        results: Lint result of each target, keyed by its repo-relative path
+        repo_path: Repository root, used to relativize absolute issue paths
+    """
+    merged = {"tool_used": "none", "passed": True, "issues_count": 0, "issues": []}
+    ran = False
+    for path, result in results.items():
+        if result.get("tool_used") and result["tool_used"] != "none":
+            if merged["tool_used"] == "none":
+                merged["tool_used"] = result["tool_used"]
+            ran = True
+            merged["passed"] = merged["passed"] and bool(result.get("passed"))
+        if result.get("limit_exceeded") and "limit_exceeded" not in merged:
+            merged["limit_exceeded"] = result["limit_exceeded"]
+        counted_elsewhere = 0
+        for issue in result.get("issues", []) or []:
+            issue = dict(issue)
+            if issue.get("file"):
+                issue["file"] = _repo_relative(issue["file"], path, repo_path)
+                if _owning_target(issue["file"], results) not in (None, path):
+                    counted_elsewhere += 1
+                    continue
+            merged["issues"].append(issue)
+        merged["issues_count"] += max(0, (result.get("issues_count", 0) or 0) - counted_elsewhere)
+    if not ran:
+        merged["passed"] = False
+    return merged
+
+
+def aggregate_security_results(results: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Sum vulnerability counts over subprojects.
+
+    Audits that list their findings (offline audits) see the lockfiles of
+    nested subprojects too; an advisory for the same package version is
+    counted once per repository.
+    """
+    merged = {"vulnerabilities_found": 0, "high_severity_count": 0, "tool_used": "none"}
+    seen = set()
+    for path, result in results.items():
+        found = result.get("vulnerabilities_found", 0) or 0
+        high = result.get("high_severity_count", 0) or 0
+        if merged["tool_used"] == "none" and result.get("tool_used") not in (None, "none"):
+            merged["tool_used"] = result["tool_used"]
+        # Offline audits also report what they matched
+        if "dependencies_scanned" in result:
+            merged["dependencies_scanned"] = merged.get("dependencies_scanned", 0) + result["dependencies_scanned"]
+        for vulnerability in result.get("vulnerabilities", []) or []:
+            identity = (vulnerability.get("id"), vulnerability.get("ecosystem"),
+                        vulnerability.get("package"), vulnerability.get("version"))
+            if identity in seen:
+                found -= 1
+                high -= vulnerability.get("severity") in HIGH_SEVERITIES
+                continue
+            seen.add(identity)
+            vulnerability = dict(vulnerability)
+            if path != "." and vulnerability.get("source"):
+                vulnerability["source"] = f"{path}/{vulnerability['source']}"
+            merged.setdefault("vulnerabilities", []).append(vulnerability)
+        merged["vulnerabilities_found"] += max(0, found)
+        merged["high_severity_count"] += max(0, high)
+    return merged
+
+
+def _repo_relative(file: str, target: str, repo_path: str | Path | None) -> str:
+    """Path of a file reported by a target's tool, relative to the repository root."""
+    if not os.path.isabs(file):
+        return file if target == "." else f"{target}/{file}"
+    if repo_path is None:
+        return file
+    for root in (os.path.abspath(repo_path), os.path.realpath(repo_path)):
+        for candidate in (file, os.path.realpath(file)):
+            if candidate == root or candidate.startswith(root + os.sep):
+                return Path(os.path.relpath(candidate, root)).as_posix()
+    return file
+
+
+def _owning_target(file: str, targets: dict[str, Any]) -> str | None:
+    """Deepest target containing a repo-relative file (absolute files belong to none)."""
+    if os.path.isabs(file):
+        return None
+    owners = [target for target in targets if target == "." or file.startswith(target + "/")]
+    return max(owners, key=lambda target: 0 if target == "." else target.count("/") + 1, default=None)
+
+
+def aggregate_build_results(results: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Combine build results: any failure fails the build, None only if nothing built."""
+    outcomes = [result.get("success") for result in results.values()]
+    if any(outcome is False for outcome in outcomes):
+        success = False
+    elif any(outcome is True for outcome in outcomes):
+        success = True
+    else:
+        success = None
+
+    tool_used = next(
+        (result["tool_used"] for result in results.values() if result.get("tool_used") not in (None, "none")),
+        "none"
+    )
+    failures = [
+        f"{path}: {result.get('error_message')}"
+        for path, result in results.items()
+        if result.get("success") is False and result.get("error_message")
+    ]
+    exit_code = next(
+        (result.get("exit_code") for result in results.values() if result.get("success") is False),
+        0 if success else None
+    )
+    return {
+        "success": success,
+        "tool_used": tool_used,
+        "execution_time_seconds": sum(result.get("execution_time_seconds", 0.0) or 0.0
+                                      for result in results.values()),
+        "error_message": "; ".join(failures) if failures else None,
+        "exit_code": exit_code,
+        "limit_exceeded": next(
+            (result["limit_exceeded"] for result in results.values() if result.get("limit_exceeded")), None
+        ),
+    }
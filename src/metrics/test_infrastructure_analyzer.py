@@ -14,6 +14,7 @@ from pathlib import Path
 
 from src.metrics.ci_config_analyzer import CIConfigAnalyzer
 from src.metrics.config_parsers import json_parser, makefile_parser, toml_parser, xml_parser
+from src.metrics.manifest_store import ManifestStore
 from src.metrics.models.ci_config import ScoreBreakdown, TestAnalysis
 from src.metrics.models.test_infrastructure import TestInfrastructureResult
 
@@ -77,11 +78,12 @@ class TestInfrastructureAnalyzer:
             >>> result.score_breakdown.phase2_contribution
             10
         """
-        # Phase 1: Static infrastructure analysis
+        # Phase 1: Static infrastructure analysis; every manifest is parsed once
+        manifests = ManifestStore(repo_path)
         if isinstance(language, list):
-            phase1_result = self._analyze_multi_language(repo_path, language)
+            phase1_result = self._analyze_multi_language(repo_path, language, manifests)
         else:
-            phase1_result = self._analyze_single_language(repo_path, language)
+            phase1_result = self._analyze_single_language(repo_path, language, manifests)
 
         # Phase 2: CI configuration analysis (if enabled)
         phase2_result = None
@@ -94,17 +96,21 @@ class TestInfrastructureAnalyzer:
         # Combine Phase 1 and Phase 2
         return self._create_test_analysis(phase1_result, phase2_result)
 
-    def _analyze_single_language(self, repo_path: str, language: str) -> TestInfrastructureResult:
+    def _analyze_single_language(
+        self, repo_path: str, language: str, manifests: ManifestStore | None = None
+    ) -> TestInfrastructureResult:
         """Analyze test infrastructure for a single language.
 
         Args:
             repo_path: Absolute path to repository root
             language: Programming language (python, javascript, go, java)
+            manifests: Manifests of the analysis (default: a new store)
 
         Returns:
             TestInfrastructureResult with detected infrastructure and calculated score
         """
         repo = Path(repo_path)
+        manifests = manifests or ManifestStore(repo)
         logger.info(f"Analyzing test infrastructure for {language} repo at {repo_path}")
 
         # Detect test files (FR-001 through FR-004)
@@ -113,11 +119,11 @@ class TestInfrastructureAnalyzer:
         logger.info(f"Detected {test_files_detected} test files")
 
         # Detect test configuration (FR-005)
-        test_config_detected = self._detect_test_config(repo, language)
+        test_config_detected = self._detect_test_config(repo, language, manifests)
         logger.info(f"Test config detected: {test_config_detected}")
 
         # Detect coverage configuration (FR-006)
-        coverage_config_detected = self._detect_coverage_config(repo, language)
+        coverage_config_detected = self._detect_coverage_config(repo, language, manifests)
         logger.info(f"Coverage config detected: {coverage_config_detected}")
 
         # Calculate test file ratio (FR-010)
@@ -143,7 +149,7 @@ class TestInfrastructureAnalyzer:
         )
 
     def _analyze_multi_language(
-        self, repo_path: str, languages: list[str]
+        self, repo_path: str, languages: list[str], manifests: ManifestStore | None = None
     ) -> TestInfrastructureResult:
         """Analyze test infrastructure for multiple languages, return max score.
 
@@ -155,6 +161,7 @@ class TestInfrastructureAnalyzer:
         Args:
             repo_path: Absolute path to repository root
             languages: List of programming languages to analyze
+            manifests: Manifests of the analysis, shared by all languages
 
         Returns:
             TestInfrastructureResult with highest score among all languages
@@ -163,10 +170,11 @@ class TestInfrastructureAnalyzer:
             f"Multi-language analysis for {len(languages)} languages: {', '.join(languages)}"
         )
 
+        manifests = manifests or ManifestStore(repo_path)
         results = []
         for lang in languages:
             logger.info(f"Analyzing {lang}...")
-            result = self._analyze_single_language(repo_path, lang)
+            result = self._analyze_single_language(repo_path, lang, manifests)
             results.append((lang, result))
             logger.info(f"{lang} score: {result.calculated_score}/25")
 
@@ -300,16 +308,18 @@ class TestInfrastructureAnalyzer:
 
         return test_files
 
-    def _detect_test_config(self, repo: Path, language: str) -> bool:
+    def _detect_test_config(self, repo: Path, language: str, manifests: ManifestStore | None = None) -> bool:
         """Detect test framework configuration (FR-005).
 
         Args:
             repo: Repository root path
             language: Programming language
+            manifests: Manifests of the analysis (default: a new store)
 
         Returns:
             True if valid test configuration detected, False otherwise
         """
+        manifests = manifests or ManifestStore(repo)
         if language == "python":
             # Check pytest.ini, pyproject.toml, tox.ini
             config_files = [
@@ -318,8 +328,8 @@ class TestInfrastructureAnalyzer:
                 repo / "tox.ini",
             ]
             for config_file in config_files:
-                if config_file.exists():
-                    verified, _ = toml_parser.verify_pytest_section(config_file)
+                if manifests.exists(config_file):
+                    verified, _ = toml_parser.verify_pytest_section(config_file, manifests)
                     if verified:
                         return True
 
@@ -327,59 +337,61 @@ class TestInfrastructureAnalyzer:
             # Check package.json, jest.config.js
             config_files = [repo / "package.json", repo / "jest.config.js"]
             for config_file in config_files:
-                if config_file.exists():
-                    verified, _ = json_parser.verify_test_script(config_file)
+                if manifests.exists(config_file):
+                    verified, _ = json_parser.verify_test_script(config_file, manifests)
                     if verified:
                         return True
 
         elif language == "go":
             # go.mod presence combined with test files indicates test setup
-            if (repo / "go.mod").exists():
+            if manifests.exists("go.mod"):
                 return True
 
         elif language == "java":
             # Check pom.xml, build.gradle
             config_files = [repo / "pom.xml", repo / "build.gradle"]
             for config_file in config_files:
-                if config_file.exists():
-                    verified, _ = xml_parser.verify_surefire_plugin(config_file)
+                if manifests.exists(config_file):
+                    verified, _ = xml_parser.verify_surefire_plugin(config_file, manifests)
                     if verified:
                         return True
 
         return False
 
-    def _detect_coverage_config(self, repo: Path, language: str) -> bool:
+    def _detect_coverage_config(self, repo: Path, language: str, manifests: ManifestStore | None = None) -> bool:
         """Detect coverage configuration (FR-006).
 
         Args:
             repo: Repository root path
             language: Programming language
+            manifests: Manifests of the analysis (default: a new store)
 
         Returns:
             True if valid coverage configuration detected, False otherwise
         """
+        manifests = manifests or ManifestStore(repo)
         if language == "python":
             # Check .coveragerc, pyproject.toml
             config_files = [repo / ".coveragerc", repo / "pyproject.toml"]
             for config_file in config_files:
-                if config_file.exists():
-                    verified, _ = toml_parser.verify_coverage_section(config_file)
+                if manifests.exists(config_file):
+                    verified, _ = toml_parser.verify_coverage_section(config_file, manifests)
                     if verified:
                         return True
 
         elif language == "javascript":
             # Check jest.config.json
             config_file = repo / "jest.config.json"
-            if config_file.exists():
-                verified, _ = json_parser.verify_coverage_threshold(config_file)
+            if manifests.exists(config_file):
+                verified, _ = json_parser.verify_coverage_threshold(config_file, manifests)
                 if verified:
                     return True
 
         elif language == "go":
             # Check Makefile for coverage flags
             makefile = repo / "Makefile"
-            if makefile.exists():
-                verified, _ = makefile_parser.verify_coverage_flags(makefile)
+            if manifests.exists(makefile):
+                verified, _ = makefile_parser.verify_coverage_flags(makefile, manifests)
                 if verified:
                     return True
 
@@ -387,8 +399,8 @@ class TestInfrastructureAnalyzer:
             # Check pom.xml, build.gradle for jacoco
             config_files = [repo / "pom.xml", repo / "build.gradle"]
             for config_file in config_files:
-                if config_file.exists():
-                    verified, _ = xml_parser.verify_jacoco_plugin(config_file)
+                if manifests.exists(config_file):
+                    verified, _ = xml_parser.verify_jacoco_plugin(config_file, manifests)
                     if verified:
                         return True
 
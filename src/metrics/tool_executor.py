@@ -1,14 +1,32 @@
 """Tool execution coordinator for managing language-specific analysis."""
 
+import math
+import os
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
+from .dependency_graph import build_dependency_graph
 from .language_detection import LanguageDetector
 from .models.metrics_collection import (
+    LanguageMetrics,
     MetricsCollection,
+    SecurityIssue,
+    SubprojectMetrics,
+)
+from .offline_audit import ADVISORY_DB_ENV, OfflineAuditor
+from .package_cache import PackageCache
+from .runtime_history import TOOL_HISTORY_ENV, RepoFeatures, RuntimeHistory
+from .subproject_discovery import (
+    Subproject,
+    aggregate_build_results,
+    aggregate_lint_results,
+    aggregate_security_results,
+    discover_subprojects,
+    is_monorepo,
 )
 from .tool_runners.golang_tools import GolangToolRunner
 from .tool_runners.java_tools import JavaToolRunner
@@ -16,18 +34,53 @@ from .tool_runners.javascript_tools import JavaScriptToolRunner
 from .tool_runners.python_tools import PythonToolRunner
 
 
+class _Skipped(NamedTuple):
+    """A stage skipped before it ran, with the reason."""
+    reason: str
+
+
 class ToolExecutor:
     """Coordinates execution of language-specific analysis tools."""
 
-    def __init__(self, timeout_seconds: int = 300) -> None:
-        """Initialize tool executor with timeout configuration."""
+    # Stages timed from history, the headroom given over their predicted p95
+    # and the least time a stage gets (absorbs cold caches of fast tools)
+    BUDGETED_STAGES = ("linting", "security_audit", "build_validation")
+    BUDGET_MARGIN = 1.25
+    MIN_STAGE_BUDGET_SECONDS = 10.0
+
+    def __init__(self, timeout_seconds: int = 300, advisory_db: str | None = None,
+                 package_cache: PackageCache | None = None,
+                 tool_history: RuntimeHistory | None = None) -> None:
+        """Initialize tool executor with timeout configuration.
+
+        Args:
+            timeout_seconds: Time budget for all tools
+            advisory_db: Local OSV advisory snapshot; when set (or when
+                ``CODE_SCORE_ADVISORY_DB`` is), dependency audits run offline
+                against it instead of calling pip-audit/npm audit/etc.
+            package_cache: Shared package cache builds run against; hit
+                statistics are recorded in ``execution_metadata.package_cache``
+            tool_history: Runtime history (default: ``CODE_SCORE_TOOL_HISTORY``
+                when set); lint, audit and build stages then get budgets from
+                their predicted durations instead of ``individual_tool_timeout``
+        """
         self.timeout_seconds = timeout_seconds
         self.language_detector = LanguageDetector()
+        self.advisory_db = advisory_db or os.environ.get(ADVISORY_DB_ENV) or None
+        self._offline_auditor: OfflineAuditor | None = None
+        self.package_cache = package_cache
+        self._cache_usage: list[dict[str, Any]] = []
+        self._cache_usage_lock = threading.Lock()
+        if tool_history is None and os.environ.get(TOOL_HISTORY_ENV):
+            tool_history = RuntimeHistory(os.environ[TOOL_HISTORY_ENV])
+        self.tool_history = tool_history
+        self._repo_features: RepoFeatures | None = None
 
         # Performance optimization settings
         self.max_file_size_mb = 500  # Skip repos larger than 500MB
         self.max_files_to_analyze = 10000  # Limit file count for analysis
         self.individual_tool_timeout = min(timeout_seconds // 3, 120)  # Max 2 minutes per tool
+        self.analyze_subprojects = True  # Run tools per package/module in monorepos
 
         # Tool runner registry
         self.tool_runners = {
@@ -47,9 +100,22 @@ class ToolExecutor:
         self.stderr = ""
         self.execution_time_seconds = 0.0
 
-    def execute_tools(self, language: str, repo_path: str) -> MetricsCollection:
-        """Execute all appropriate tools for the detected language."""
+    def execute_tools(self, language: str, repo_path: str,
+                      languages: dict[str, float] | None = None) -> MetricsCollection:
+        """Execute all appropriate tools for the detected language.
+
+        Args:
+            language: Primary language; its results fill the top-level metrics
+            repo_path: Path to the repository checkout
+            languages: Optional languages to analyze as well, mapped to their
+                share of source files (see
+                ``LanguageDetector.get_languages_above_threshold``). Their lint,
+                audit and build stages share one worker pool and the global
+                timeout with the primary language, and each language's results
+                are recorded in ``metrics.language_metrics``.
+        """
         start_time = time.time()
+        deadline = start_time + self.timeout_seconds
 
         # Initialize metrics collection
         metrics = MetricsCollection(
@@ -58,6 +124,7 @@ class ToolExecutor:
         )
 
         # Early performance checks
+        self._repo_features = None
         if not self._is_repository_analyzable(repo_path, metrics):
             metrics.execution_metadata.duration_seconds = time.time() - start_time
             return metrics
@@ -70,72 +137,297 @@ class ToolExecutor:
             metrics.execution_metadata.duration_seconds = time.time() - start_time
             return metrics
 
-        runner = runner_class(timeout_seconds=self.individual_tool_timeout)
+        plan = self._plan_languages(language, languages)
+        multi_language = len(plan) > 1
 
-        # Execute tools in parallel where safe
-        parallel_tasks = []
-        sequential_tasks = []
-
-        # Parallel tasks (independent operations)
-        parallel_tasks.extend([
+        # Parallel tasks (independent operations), scheduled for every language
+        parallel_tasks = [
             ("linting", self._run_linting),
             ("security_audit", self._run_security_audit),
             ("build_validation", self._run_build_validation),
-        ])
+        ]
 
         # Sequential tasks (may modify files or have dependencies)
-        sequential_tasks.extend([
+        sequential_tasks = [
             ("testing", self._run_testing),
             ("documentation", self._analyze_documentation_optimized),
-        ])
+        ]
 
-        # Execute parallel tasks with timeout
-        results = {}
-        remaining_time = self.timeout_seconds - (time.time() - start_time)
+        results: dict[str, dict[str, Any]] = {lang: {} for lang, _ in plan}
+        errors: dict[str, list[str]] = {lang: [] for lang, _ in plan}
+
+        def record_error(lang: str, message: str) -> None:
+            errors[lang].append(message)
+            metrics.execution_metadata.errors.append(f"{lang} {message}" if multi_language else message)
+
+        # Lockfiles are parsed once up front; audits reuse the cached parse
+        try:
+            metrics.dependency_graph = build_dependency_graph(repo_path).to_dict()
+        except Exception as e:
+            metrics.execution_metadata.warnings.append(f"Dependency graph extraction failed: {str(e)}")
+
+        self._cache_usage = []
 
+        # Monorepos: lint, audit and build every discovered package/module
+        subprojects = discover_subprojects(repo_path) if self.analyze_subprojects else []
+        targets = self._plan_targets(plan, subprojects)
+        target_results: dict[tuple[str, str], dict[str, dict[str, Any]]] = {}
+
+        # Execute parallel tasks with timeout
+        remaining_time = deadline - time.time()
         if remaining_time > 0:
-            with ThreadPoolExecutor(max_workers=3) as executor:
+            task_count = sum(len(lang_targets) for lang_targets in targets.values())
+            # Builds first: they are usually the longest stage of each target
+            ordered_tasks = [parallel_tasks[2], parallel_tasks[0], parallel_tasks[1]] if task_count > 1 else parallel_tasks
+            with ThreadPoolExecutor(max_workers=self._parallel_workers(task_count)) as executor:
                 future_to_task = {
-                    executor.submit(task_func, runner, repo_path): task_name
-                    for task_name, task_func in parallel_tasks
+                    executor.submit(self._run_within_deadline, task_func, lang_runner,
+                                    target.absolute_path(repo_path), deadline, lang, task_name):
+                        (lang, target.path, task_name)
+                    for task_name, task_func in ordered_tasks
+                    for lang, lang_runner in plan
+                    for target in targets[lang]
                 }
 
                 try:
                     for future in as_completed(future_to_task, timeout=remaining_time):
-                        task_name = future_to_task[future]
+                        lang, target_path, task_name = future_to_task[future]
+                        label = task_name if target_path == "." else f"{task_name} ({target_path})"
                         try:
-                            results[task_name] = future.result()
+                            result = future.result()
                         except Exception as e:
-                            results[task_name] = {"error": str(e)}
-                            metrics.execution_metadata.errors.append(f"{task_name} failed: {str(e)}")
+                            result = {"error": str(e)}
+                            record_error(lang, f"{label} failed: {str(e)}")
+                        if result is None:
+                            metrics.execution_metadata.warnings.append(
+                                f"Skipped {lang} {label} due to timeout" if multi_language
+                                else f"Skipped {label} due to timeout"
+                            )
+                        elif isinstance(result, _Skipped):
+                            metrics.execution_metadata.warnings.append(
+                                f"Skipped {lang} {label}: {result.reason}" if multi_language
+                                else f"Skipped {label}: {result.reason}"
+                            )
+                        else:
+                            target_results.setdefault((lang, task_name), {})[target_path] = result
                 except TimeoutError:
                     metrics.execution_metadata.errors.append("Parallel tasks timed out")
                     # Cancel remaining futures
                     for future in future_to_task:
                         future.cancel()
 
-        # Execute sequential tasks with remaining time
-        for task_name, task_func in sequential_tasks:
-            remaining_time = self.timeout_seconds - (time.time() - start_time)
-            if remaining_time <= 0:
-                metrics.execution_metadata.warnings.append(f"Skipped {task_name} due to timeout")
-                continue
+        for (lang, task_name), by_target in target_results.items():
+            results[lang][task_name] = self._aggregate_task_results(task_name, by_target, repo_path)
+        if is_monorepo(subprojects):
+            metrics.subprojects = self._build_subproject_metrics(plan, targets, target_results)
 
-            try:
-                results[task_name] = task_func(runner, repo_path)
-            except Exception as e:
-                results[task_name] = {"error": str(e)}
-                metrics.execution_metadata.errors.append(f"{task_name} failed: {str(e)}")
+        # Execute sequential tasks with remaining time; documentation is
+        # language independent and only analyzed once
+        for task_name, task_func in sequential_tasks:
+            task_plan = plan[:1] if task_name == "documentation" else plan
+            for lang, lang_runner in task_plan:
+                remaining_time = deadline - time.time()
+                if remaining_time <= 0:
+                    metrics.execution_metadata.warnings.append(
+                        f"Skipped {lang} {task_name} due to timeout" if multi_language
+                        else f"Skipped {task_name} due to timeout"
+                    )
+                    continue
 
-        # Populate metrics from results
-        self._populate_metrics(metrics, results, language)
+                try:
+                    results[lang][task_name] = task_func(self._make_runner(lang_runner, deadline), repo_path)
+                except Exception as e:
+                    results[lang][task_name] = {"error": str(e)}
+                    record_error(lang, f"{task_name} failed: {str(e)}")
+
+        # Populate metrics from the primary language's results
+        self._populate_metrics(metrics, results[language], language)
+        metrics.execution_metadata.tools_used = self._get_tools_used(results[language])
+
+        if multi_language:
+            for lang, _ in plan:
+                language_metrics = self._build_language_metrics(
+                    lang, results[lang], errors[lang], (languages or {}).get(lang)
+                )
+                metrics.language_metrics[lang] = language_metrics
+                for tool in language_metrics.tools_used:
+                    if tool not in metrics.execution_metadata.tools_used:
+                        metrics.execution_metadata.tools_used.append(tool)
 
         # Update execution metadata
+        if self._cache_usage:
+            metrics.execution_metadata.package_cache = {
+                "root": str(self.package_cache.root),
+                "offline": self.package_cache.offline,
+                "builds": len(self._cache_usage),
+                "hits": sum(1 for usage in self._cache_usage if usage["hit"]),
+                "bytes_downloaded": sum(usage["bytes_downloaded"] for usage in self._cache_usage),
+            }
         metrics.execution_metadata.duration_seconds = time.time() - start_time
-        metrics.execution_metadata.tools_used = self._get_tools_used(results)
 
         return metrics
 
+    def _plan_languages(self, language: str,
+                        languages: dict[str, float] | None) -> list[tuple[str, type]]:
+        """Languages to run tools for: the primary first, then others by share.
+
+        Languages without a tool runner are skipped, and languages sharing a
+        runner (JavaScript/TypeScript) are analyzed only once.
+        """
+        plan = [(language, self.tool_runners[language])]
+        others = sorted((languages or {}).items(), key=lambda item: item[1], reverse=True)
+        for lang, _ in others:
+            runner_class = self.tool_runners.get(lang)
+            if runner_class is None or any(runner_class is planned for _, planned in plan):
+                continue
+            plan.append((lang, runner_class))
+        return plan
+
+    def _parallel_workers(self, target_count: int) -> int:
+        """Worker threads for the lint/audit/build stages of all targets.
+
+        A single language/project keeps the original three workers; more
+        languages or subprojects share the machine's cores instead of each
+        getting three workers.
+        """
+        if target_count <= 1:
+            return 3
+        return max(3, min(3 * target_count, os.cpu_count() or 1))
+
+    def _plan_targets(self, plan: list[tuple[str, type]],
+                      subprojects: list[Subproject]) -> dict[str, list[Subproject]]:
+        """Directories to run each language's tools in.
+
+        In a monorepo every discovered subproject handled by the language's
+        runner is a target; otherwise (or when no manifest of that language
+        was found) the tools run at the repository root as before.
+        """
+        monorepo = is_monorepo(subprojects)
+        targets = {}
+        for lang, runner_class in plan:
+            matching = [
+                sub for sub in subprojects
+                if self.tool_runners.get(sub.language) is runner_class
+            ] if monorepo else []
+            targets[lang] = matching or [Subproject(path=".", language=lang, manifest="")]
+        return targets
+
+    @staticmethod
+    def _aggregate_task_results(task_name: str, by_target: dict[str, dict[str, Any]],
+                                repo_path: str) -> dict[str, Any]:
+        """Merge one task's results over subprojects into a single result."""
+        if list(by_target) == ["."]:
+            return by_target["."]
+        successful = {path: result for path, result in by_target.items() if "error" not in result}
+        if not successful:
+            return next(iter(by_target.values()))
+        if task_name == "linting":
+            return aggregate_lint_results(successful, repo_path)
+        aggregate = {
+            "security_audit": aggregate_security_results,
+            "build_validation": aggregate_build_results,
+        }[task_name]
+        return aggregate(successful)
+
+    def _build_subproject_metrics(self, plan: list[tuple[str, type]],
+                                  targets: dict[str, list[Subproject]],
+                                  target_results: dict[tuple[str, str], dict[str, dict[str, Any]]]
+                                  ) -> list[SubprojectMetrics]:
+        """Per-subproject breakdown of lint, audit and build results."""
+        breakdown = []
+        for lang, _ in plan:
+            for target in targets[lang]:
+                lint, audit, build = (
+                    target_results.get((lang, task_name), {}).get(target.path)
+                    for task_name in ("linting", "security_audit", "build_validation")
+                )
+                breakdown.append(SubprojectMetrics(
+                    path=target.path,
+                    language=lang,
+                    manifest=target.manifest or None,
+                    modules=target.modules,
+                    lint_results=lint if lint and "error" not in lint else None,
+                    dependency_audit=audit if audit and "error" not in audit else None,
+                    build_success=build.get("success") if build and "error" not in build else None,
+                    build_details=build if build and "error" not in build else None,
+                    errors=[
+                        f"{task_name} failed: {result['error']}"
+                        for task_name, result in (("linting", lint), ("security_audit", audit),
+                                                  ("build_validation", build))
+                        if result and "error" in result
+                    ]
+                ))
+        return breakdown
+
+    def _make_runner(self, runner_class: type, deadline: float, budget: float | None = None) -> Any:
+        """Create a runner whose tool timeout never extends past the deadline."""
+        remaining = max(1, int(deadline - time.time()))
+        timeout = self.individual_tool_timeout if budget is None else math.ceil(budget)
+        return runner_class(timeout_seconds=min(timeout, remaining))
+
+    def _stage_budget(self, language: str, stage: str, remaining: float) -> float | _Skipped | None:
+        """Tool timeout for a stage from its predicted runtime.
+
+        Returns None when there is no prediction (``individual_tool_timeout``
+        applies), or ``_Skipped`` when even the stage's median runtime no
+        longer fits into the remaining global budget.
+        """
+        if self.tool_history is None or self._repo_features is None or stage not in self.BUDGETED_STAGES:
+            return None
+        prediction = self.tool_history.predict(language, stage, self._repo_features)
+        if prediction is None:
+            return None
+        if prediction.p50 > remaining:
+            return _Skipped(
+                f"predicted {prediction.p50:.0f}s (p95 {prediction.p95:.0f}s) from "
+                f"{prediction.samples} similar runs exceeds the remaining {remaining:.0f}s"
+            )
+        return max(self.MIN_STAGE_BUDGET_SECONDS, prediction.p95 * self.BUDGET_MARGIN)
+
+    def _run_within_deadline(self, task_func: Any, runner_class: type, repo_path: str,
+                             deadline: float, language: str | None = None,
+                             stage: str | None = None) -> dict[str, Any] | _Skipped | None:
+        """Run a queued task, or skip it if the budget ran out while it waited.
+
+        Returns None when the deadline has passed and ``_Skipped`` when the
+        stage's predicted runtime does not fit into what is left.
+        """
+        remaining = deadline - time.time()
+        if remaining < 1:
+            return None
+        budget = self._stage_budget(language, stage, remaining) if language and stage else None
+        if isinstance(budget, _Skipped):
+            return budget
+
+        runner = self._make_runner(runner_class, deadline, budget)
+        start = time.monotonic()
+        result = task_func(runner, repo_path)
+        self._record_runtime(language, stage, result, time.monotonic() - start, runner.timeout_seconds)
+        return result
+
+    def _record_runtime(self, language: str | None, stage: str | None, result: dict[str, Any],
+                        seconds: float, timeout: float) -> None:
+        """Add a stage's runtime to the history when a tool actually ran."""
+        if (self.tool_history is None or self._repo_features is None or stage not in self.BUDGETED_STAGES
+                or result.get("tool_used") in (None, "none")):
+            return
+        self.tool_history.record(language, stage, self._repo_features, seconds,
+                                 timed_out=seconds >= timeout - 1)
+
+    def _build_language_metrics(self, language: str, results: dict[str, Any],
+                                errors: list[str], share: float | None) -> LanguageMetrics:
+        """Summarize one language's task results as a per-language section."""
+        language_collection = MetricsCollection()
+        self._populate_metrics(language_collection, results, language)
+        return LanguageMetrics(
+            language=language,
+            share=share,
+            code_quality=language_collection.code_quality,
+            testing_metrics=language_collection.testing_metrics,
+            tools_used=self._get_tools_used(results),
+            errors=errors
+        )
+
     def _run_linting(self, runner: Any, repo_path: str) -> dict[str, Any]:
         """Run linting analysis."""
         if hasattr(runner, 'run_linting'):
@@ -144,15 +436,36 @@ class ToolExecutor:
 
     def _run_security_audit(self, runner: Any, repo_path: str) -> dict[str, Any]:
         """Run security audit."""
+        if self.advisory_db:
+            return self._get_offline_auditor().audit(repo_path, language=self._runner_language(runner))
         if hasattr(runner, 'run_security_audit'):
             return runner.run_security_audit(repo_path)
         return {"vulnerabilities_found": 0, "high_severity_count": 0, "tool_used": "none"}
 
+    def _get_offline_auditor(self) -> OfflineAuditor:
+        """Auditor for ``advisory_db``; the snapshot is loaded once per process."""
+        if self._offline_auditor is None:
+            self._offline_auditor = OfflineAuditor.from_path(self.advisory_db)
+        return self._offline_auditor
+
+    def _runner_language(self, runner: Any) -> str | None:
+        """Language handled by a runner instance."""
+        return next(
+            (language for language, runner_class in self.tool_runners.items() if isinstance(runner, runner_class)),
+            None
+        )
+
     def _run_build_validation(self, runner: Any, repo_path: str) -> dict[str, Any]:
         """Run build validation if the runner supports it."""
         if hasattr(runner, "run_build"):
             try:
-                return runner.run_build(repo_path)
+                if self.package_cache is None:
+                    return runner.run_build(repo_path)
+                with self.package_cache.track(self._runner_language(runner) or "") as usage:
+                    result = runner.run_build(repo_path)
+                with self._cache_usage_lock:
+                    self._cache_usage.append(usage)
+                return result
             except Exception as e:
                 return {
                     "success": None,
@@ -249,6 +562,19 @@ class ToolExecutor:
             security_result = results["security_audit"]
             if "error" not in security_result:
                 metrics.code_quality.dependency_audit = security_result
+                # Offline audits list the advisories they matched
+                metrics.code_quality.security_issues = [
+                    SecurityIssue(
+                        severity=vulnerability.get("severity") or "unknown",
+                        title=f"{vulnerability['id']}: {vulnerability['package']} {vulnerability['version']}",
+                        description=f"{vulnerability['package']} {vulnerability['version']} ({vulnerability['source']}) "
+                                    f"is affected; fixed in {', '.join(vulnerability['fixed_versions']) or 'no release'}",
+                        cve_id=next((alias for alias in vulnerability.get("aliases", [])
+                                     if alias.startswith("CVE-")), None),
+                        affected_package=vulnerability["package"]
+                    )
+                    for vulnerability in security_result.get("vulnerabilities", [])
+                ]
 
         # Build validation results
         if "build_validation" in results:
@@ -325,6 +651,8 @@ class ToolExecutor:
 
                         # Early termination if too many files
                         if file_count > self.max_files_to_analyze:
+                            self._repo_features = RepoFeatures(file_count=file_count,
+                                                               size_mb=total_size / (1024 * 1024))
                             metrics.execution_metadata.warnings.append(
                                 f"Repository has {file_count}+ files, analysis may be slow or incomplete"
                             )
@@ -335,6 +663,7 @@ class ToolExecutor:
                         continue
 
             size_mb = total_size / (1024 * 1024)
+            self._repo_features = RepoFeatures(file_count=file_count, size_mb=size_mb)
 
             # Check if repository is too large
             if size_mb > self.max_file_size_mb:
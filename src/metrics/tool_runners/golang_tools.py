@@ -6,6 +6,8 @@ import time
 from pathlib import Path
 from typing import Any
 
+from ..sandbox import run_tool
+
 
 class GolangToolRunner:
     """Executes Go-specific analysis tools."""
@@ -30,16 +32,20 @@ class GolangToolRunner:
             return result
 
         try:
-            cmd_result = subprocess.run(
+            cmd_result = run_tool(
+                "lint",
                 ["golangci-lint", "run", "--out-format", "json"],
-                capture_output=True,
-                text=True,
                 timeout=self.timeout_seconds,
                 cwd=repo_path
             )
 
             result["passed"] = cmd_result.returncode == 0
 
+            if cmd_result.limit_exceeded:
+                result["limit_exceeded"] = cmd_result.limit_exceeded
+                result["issues"] = [{"severity": "error", "message": f"golangci-lint exceeded {cmd_result.limit_message()}", "file": "", "line": 0}]
+                return result
+
             if cmd_result.stdout:
                 try:
                     lint_data = json.loads(cmd_result.stdout)
@@ -175,14 +181,17 @@ class GolangToolRunner:
             return result
 
         try:
-            cmd_result = subprocess.run(
+            cmd_result = run_tool(
+                "audit",
                 ["osv-scanner", "--format", "json", repo_path],
-                capture_output=True,
-                text=True,
                 timeout=self.timeout_seconds,
                 cwd=repo_path
             )
 
+            if cmd_result.limit_exceeded:
+                result["limit_exceeded"] = cmd_result.limit_exceeded
+                return result
+
             if cmd_result.stdout:
                 try:
                     scan_data = json.loads(cmd_result.stdout)
@@ -230,14 +239,18 @@ class GolangToolRunner:
 
         try:
             # Use gofmt -l to list files that need formatting
-            cmd_result = subprocess.run(
+            cmd_result = run_tool(
+                "lint",
                 ["gofmt", "-l", "."],
-                capture_output=True,
-                text=True,
                 timeout=self.timeout_seconds,
                 cwd=repo_path
             )
 
+            if cmd_result.limit_exceeded:
+                result["compliant"] = False
+                result["limit_exceeded"] = cmd_result.limit_exceeded
+                return result
+
             # Files that need formatting are listed in stdout
             if cmd_result.stdout.strip():
                 files = [f.strip() for f in cmd_result.stdout.split('\n') if f.strip()]
@@ -296,10 +309,9 @@ class GolangToolRunner:
 
         # Run go build
         try:
-            cmd_result = subprocess.run(
+            cmd_result = run_tool(
+                "build",
                 ["go", "build", "./..."],
-                capture_output=True,
-                text=True,
                 timeout=self.timeout_seconds,
                 cwd=repo_path
             )
@@ -317,6 +329,8 @@ class GolangToolRunner:
             else:
                 # Build failed - capture error
                 error_msg = cmd_result.stderr or cmd_result.stdout or "Build failed"
+                if cmd_result.limit_exceeded:
+                    error_msg = f"Build exceeded {cmd_result.limit_message()}: {error_msg}"
                 # Truncate to 1000 chars (NFR-002)
                 if len(error_msg) > 1000:
                     error_msg = error_msg[:997] + "..."
@@ -326,7 +340,8 @@ class GolangToolRunner:
                     "tool_used": "go",
                     "execution_time_seconds": execution_time,
                     "error_message": error_msg,
-                    "exit_code": cmd_result.returncode
+                    "exit_code": cmd_result.returncode,
+                    "limit_exceeded": cmd_result.limit_exceeded
                 }
 
         except subprocess.TimeoutExpired:
@@ -6,6 +6,9 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any
 
+from ..jvm_daemons import get_jvm_daemon_pool
+from ..sandbox import SandboxedProcess, run_tool
+
 
 class JavaToolRunner:
     """Executes Java-specific analysis tools."""
@@ -25,19 +28,18 @@ class JavaToolRunner:
         }
 
         # Try Checkstyle first
-        if self._has_maven(repo_path) and self._check_tool_available("mvn"):
+        if self._has_maven(repo_path) and self._maven_available():
             try:
-                cmd_result = subprocess.run(
-                    ["mvn", "checkstyle:check", "-q"],
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout_seconds,
-                    cwd=repo_path
-                )
+                cmd_result = self._run_maven(["checkstyle:check", "-q"], repo_path)
 
                 result["tool_used"] = "checkstyle"
                 result["passed"] = cmd_result.returncode == 0
 
+                if cmd_result.limit_exceeded:
+                    result["limit_exceeded"] = cmd_result.limit_exceeded
+                    result["issues"] = [{"severity": "error", "message": f"Checkstyle exceeded {cmd_result.limit_message()}", "file": "", "line": 0}]
+                    return result
+
                 # Parse Checkstyle output
                 if cmd_result.stdout:
                     result["issues"] = self._parse_checkstyle_output(cmd_result.stdout)
@@ -53,17 +55,16 @@ class JavaToolRunner:
         # Try Gradle with Checkstyle
         elif self._has_gradle(repo_path) and self._check_tool_available("gradle"):
             try:
-                cmd_result = subprocess.run(
-                    ["gradle", "check", "-q"],
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout_seconds,
-                    cwd=repo_path
-                )
+                cmd_result = self._run_gradle(["check", "-q"], repo_path)
 
                 result["tool_used"] = "gradle-checkstyle"
                 result["passed"] = cmd_result.returncode == 0
 
+                if cmd_result.limit_exceeded:
+                    result["limit_exceeded"] = cmd_result.limit_exceeded
+                    result["issues"] = [{"severity": "error", "message": f"Gradle check exceeded {cmd_result.limit_message()}", "file": "", "line": 0}]
+                    return result
+
                 # Basic parsing of Gradle output
                 if cmd_result.stderr:
                     result["issues"] = self._parse_gradle_output(cmd_result.stderr)
@@ -207,7 +208,7 @@ class JavaToolRunner:
 
         # Try Maven build
         if self._has_maven(repo_path):
-            if not self._check_tool_available("mvn"):
+            if not self._maven_available():
                 return {
                     "success": None,
                     "tool_used": "none",
@@ -217,13 +218,7 @@ class JavaToolRunner:
                 }
 
             try:
-                cmd_result = subprocess.run(
-                    ["mvn", "compile", "-q", "-DskipTests"],
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout_seconds,
-                    cwd=repo_path
-                )
+                cmd_result = self._run_maven(["compile", "-q", "-DskipTests"], repo_path)
 
                 execution_time = time.time() - start_time
 
@@ -238,6 +233,8 @@ class JavaToolRunner:
                 else:
                     # Build failed - capture error
                     error_msg = cmd_result.stderr or cmd_result.stdout or "Maven compile failed"
+                    if cmd_result.limit_exceeded:
+                        error_msg = f"Build exceeded {cmd_result.limit_message()}: {error_msg}"
                     # Truncate to 1000 chars (NFR-002)
                     if len(error_msg) > 1000:
                         error_msg = error_msg[:997] + "..."
@@ -247,7 +244,8 @@ class JavaToolRunner:
                         "tool_used": "mvn",
                         "execution_time_seconds": execution_time,
                         "error_message": error_msg,
-                        "exit_code": cmd_result.returncode
+                        "exit_code": cmd_result.returncode,
+                        "limit_exceeded": cmd_result.limit_exceeded
                     }
 
             except subprocess.TimeoutExpired:
@@ -271,13 +269,7 @@ class JavaToolRunner:
                 }
 
             try:
-                cmd_result = subprocess.run(
-                    ["gradle", "compileJava", "--console=plain", "-q"],
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout_seconds,
-                    cwd=repo_path
-                )
+                cmd_result = self._run_gradle(["compileJava", "--console=plain", "-q"], repo_path)
 
                 execution_time = time.time() - start_time
 
@@ -292,6 +284,8 @@ class JavaToolRunner:
                 else:
                     # Build failed - capture error
                     error_msg = cmd_result.stderr or cmd_result.stdout or "Gradle compile failed"
+                    if cmd_result.limit_exceeded:
+                        error_msg = f"Build exceeded {cmd_result.limit_message()}: {error_msg}"
                     # Truncate to 1000 chars (NFR-002)
                     if len(error_msg) > 1000:
                         error_msg = error_msg[:997] + "..."
@@ -301,7 +295,8 @@ class JavaToolRunner:
                         "tool_used": "gradle",
                         "execution_time_seconds": execution_time,
                         "error_message": error_msg,
-                        "exit_code": cmd_result.returncode
+                        "exit_code": cmd_result.returncode,
+                        "limit_exceeded": cmd_result.limit_exceeded
                     }
 
             except subprocess.TimeoutExpired:
@@ -331,15 +326,12 @@ class JavaToolRunner:
         }
 
         # Try OWASP dependency check with Maven
-        if self._has_maven(repo_path) and self._check_tool_available("mvn"):
+        if self._has_maven(repo_path) and self._maven_available():
             try:
-                cmd_result = subprocess.run(
-                    ["mvn", "org.owasp:dependency-check-maven:check", "-q"],
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout_seconds,
-                    cwd=repo_path
-                )
+                cmd_result = self._run_maven(["org.owasp:dependency-check-maven:check", "-q"], repo_path)
+                if cmd_result.limit_exceeded:
+                    result["limit_exceeded"] = cmd_result.limit_exceeded
+                    return result
 
                 # Look for dependency check report
                 report_path = Path(repo_path) / "target" / "dependency-check-report.xml"
@@ -354,6 +346,27 @@ class JavaToolRunner:
         result["tool_used"] = "none"
         return result
 
+    def _maven_available(self) -> bool:
+        """Check for Maven, including the Maven Daemon of an active daemon pool."""
+        pool = get_jvm_daemon_pool()
+        if pool is not None:
+            return pool.maven_available()
+        return self._check_tool_available("mvn")
+
+    def _run_maven(self, args: list[str], repo_path: str) -> SandboxedProcess:
+        """Run Maven, through the warm daemon pool in batch mode."""
+        pool = get_jvm_daemon_pool()
+        if pool is not None:
+            return pool.run("maven", args, repo_path, self.timeout_seconds)
+        return run_tool("jvm", ["mvn", *args], timeout=self.timeout_seconds, cwd=repo_path)
+
+    def _run_gradle(self, args: list[str], repo_path: str) -> SandboxedProcess:
+        """Run Gradle, through the warm daemon pool in batch mode."""
+        pool = get_jvm_daemon_pool()
+        if pool is not None:
+            return pool.run("gradle", args, repo_path, self.timeout_seconds)
+        return run_tool("jvm", ["gradle", *args], timeout=self.timeout_seconds, cwd=repo_path)
+
     def _has_maven(self, repo_path: str) -> bool:
         """Check if repository has Maven configuration."""
         return (Path(repo_path) / "pom.xml").exists()
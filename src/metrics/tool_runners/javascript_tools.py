@@ -6,6 +6,8 @@ import time
 from pathlib import Path
 from typing import Any
 
+from ..sandbox import run_tool
+
 
 class JavaScriptToolRunner:
     """Executes JavaScript-specific analysis tools."""
@@ -30,16 +32,20 @@ class JavaScriptToolRunner:
             return result
 
         try:
-            cmd_result = subprocess.run(
+            cmd_result = run_tool(
+                "lint",
                 ["npx", "eslint", ".", "--format", "json"],
-                capture_output=True,
-                text=True,
                 timeout=self.timeout_seconds,
                 cwd=repo_path
             )
 
             result["passed"] = cmd_result.returncode == 0
 
+            if cmd_result.limit_exceeded:
+                result["limit_exceeded"] = cmd_result.limit_exceeded
+                result["issues"] = [{"severity": "error", "message": f"ESLint exceeded {cmd_result.limit_message()}", "file": "", "line": 0}]
+                return result
+
             if cmd_result.stdout:
                 try:
                     lint_data = json.loads(cmd_result.stdout)
@@ -177,14 +183,17 @@ class JavaScriptToolRunner:
             return result
 
         try:
-            cmd_result = subprocess.run(
+            cmd_result = run_tool(
+                "audit",
                 ["npm", "audit", "--json"],
-                capture_output=True,
-                text=True,
                 timeout=self.timeout_seconds,
                 cwd=repo_path
             )
 
+            if cmd_result.limit_exceeded:
+                result["limit_exceeded"] = cmd_result.limit_exceeded
+                return result
+
             if cmd_result.stdout:
                 try:
                     audit_data = json.loads(cmd_result.stdout)
@@ -233,15 +242,17 @@ class JavaScriptToolRunner:
             return result
 
         try:
-            cmd_result = subprocess.run(
+            cmd_result = run_tool(
+                "lint",
                 ["npx", "prettier", "--check", "**/*.js", "**/*.jsx"],
-                capture_output=True,
-                text=True,
                 timeout=self.timeout_seconds,
                 cwd=repo_path
             )
 
             result["compliant"] = cmd_result.returncode == 0
+            if cmd_result.limit_exceeded:
+                result["limit_exceeded"] = cmd_result.limit_exceeded
+                return result
 
             # Count files that need formatting
             if cmd_result.stderr:
@@ -385,10 +396,9 @@ class JavaScriptToolRunner:
 
         # Run build command
         try:
-            cmd_result = subprocess.run(
+            cmd_result = run_tool(
+                "build",
                 tool_cmd,
-                capture_output=True,
-                text=True,
                 timeout=self.timeout_seconds,
                 cwd=repo_path
             )
@@ -406,6 +416,8 @@ class JavaScriptToolRunner:
             else:
                 # Build failed - capture error
                 error_msg = cmd_result.stderr or cmd_result.stdout or "Build failed"
+                if cmd_result.limit_exceeded:
+                    error_msg = f"Build exceeded {cmd_result.limit_message()}: {error_msg}"
                 # Truncate to 1000 chars (NFR-002)
                 if len(error_msg) > 1000:
                     error_msg = error_msg[:997] + "..."
@@ -415,7 +427,8 @@ class JavaScriptToolRunner:
                     "tool_used": tool_name,
                     "execution_time_seconds": execution_time,
                     "error_message": error_msg,
-                    "exit_code": cmd_result.returncode
+                    "exit_code": cmd_result.returncode,
+                    "limit_exceeded": cmd_result.limit_exceeded
                 }
 
         except subprocess.TimeoutExpired:
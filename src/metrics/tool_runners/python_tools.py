@@ -6,6 +6,8 @@ import time
 from pathlib import Path
 from typing import Any
 
+from ..sandbox import run_tool
+
 
 class PythonToolRunner:
     """Executes Python-specific analysis tools."""
@@ -27,10 +29,9 @@ class PythonToolRunner:
         # Try Ruff first
         if self._check_tool_available("ruff"):
             try:
-                cmd_result = subprocess.run(
+                cmd_result = run_tool(
+                    "lint",
                     ["ruff", "check", "--output-format", "json", repo_path],
-                    capture_output=True,
-                    text=True,
                     timeout=self.timeout_seconds,
                     cwd=repo_path
                 )
@@ -38,6 +39,11 @@ class PythonToolRunner:
                 result["tool_used"] = "ruff"
                 result["passed"] = cmd_result.returncode == 0
 
+                if cmd_result.limit_exceeded:
+                    result["limit_exceeded"] = cmd_result.limit_exceeded
+                    result["issues"] = [{"severity": "error", "message": f"Linting exceeded {cmd_result.limit_message()}", "file": "", "line": 0}]
+                    return result
+
                 if cmd_result.stdout:
                     try:
                         issues = json.loads(cmd_result.stdout)
@@ -56,10 +62,9 @@ class PythonToolRunner:
         # Fallback to Flake8
         if self._check_tool_available("flake8"):
             try:
-                cmd_result = subprocess.run(
+                cmd_result = run_tool(
+                    "lint",
                     ["flake8", "--format=json", repo_path],
-                    capture_output=True,
-                    text=True,
                     timeout=self.timeout_seconds,
                     cwd=repo_path
                 )
@@ -67,6 +72,11 @@ class PythonToolRunner:
                 result["tool_used"] = "flake8"
                 result["passed"] = cmd_result.returncode == 0
 
+                if cmd_result.limit_exceeded:
+                    result["limit_exceeded"] = cmd_result.limit_exceeded
+                    result["issues"] = [{"severity": "error", "message": f"Linting exceeded {cmd_result.limit_message()}", "file": "", "line": 0}]
+                    return result
+
                 if cmd_result.stdout:
                     try:
                         issues = json.loads(cmd_result.stdout)
@@ -205,14 +215,17 @@ class PythonToolRunner:
             return result
 
         try:
-            cmd_result = subprocess.run(
+            cmd_result = run_tool(
+                "audit",
                 ["pip-audit", "--format", "json"],
-                capture_output=True,
-                text=True,
                 timeout=self.timeout_seconds,
                 cwd=repo_path
             )
 
+            if cmd_result.limit_exceeded:
+                result["limit_exceeded"] = cmd_result.limit_exceeded
+                return result
+
             if cmd_result.stdout:
                 try:
                     audit_data = json.loads(cmd_result.stdout)
@@ -246,15 +259,17 @@ class PythonToolRunner:
             return result
 
         try:
-            cmd_result = subprocess.run(
+            cmd_result = run_tool(
+                "lint",
                 ["black", "--check", "--diff", repo_path],
-                capture_output=True,
-                text=True,
                 timeout=self.timeout_seconds,
                 cwd=repo_path
             )
 
             result["compliant"] = cmd_result.returncode == 0
+            if cmd_result.limit_exceeded:
+                result["limit_exceeded"] = cmd_result.limit_exceeded
+                return result
 
             # Count files that need formatting
             if cmd_result.stdout:
@@ -353,10 +368,9 @@ class PythonToolRunner:
         # Try uv build first (Constitutional Principle I: UV-based dependency management)
         if self._check_tool_available("uv"):
             try:
-                cmd_result = subprocess.run(
+                cmd_result = run_tool(
+                    "build",
                     ["uv", "build"],
-                    capture_output=True,
-                    text=True,
                     timeout=self.timeout_seconds,
                     cwd=repo_path
                 )
@@ -374,6 +388,8 @@ class PythonToolRunner:
                 else:
                     # Build failed - capture error
                     error_msg = cmd_result.stderr or cmd_result.stdout or "Build failed"
+                    if cmd_result.limit_exceeded:
+                        error_msg = f"Build exceeded {cmd_result.limit_message()}: {error_msg}"
                     # Truncate to 1000 chars (NFR-002)
                     if len(error_msg) > 1000:
                         error_msg = error_msg[:997] + "..."
@@ -383,7 +399,8 @@ class PythonToolRunner:
                         "tool_used": "uv",
                         "execution_time_seconds": execution_time,
                         "error_message": error_msg,
-                        "exit_code": cmd_result.returncode
+                        "exit_code": cmd_result.returncode,
+                        "limit_exceeded": cmd_result.limit_exceeded
                     }
                     
             except subprocess.TimeoutExpired:
@@ -421,10 +438,9 @@ class PythonToolRunner:
         
         # Run python -m build
         try:
-            cmd_result = subprocess.run(
+            cmd_result = run_tool(
+                "build",
                 ["python3", "-m", "build", "--no-isolation"],
-                capture_output=True,
-                text=True,
                 timeout=self.timeout_seconds,
                 cwd=repo_path
             )
@@ -442,6 +458,8 @@ class PythonToolRunner:
             else:
                 # Build failed - capture error
                 error_msg = cmd_result.stderr or cmd_result.stdout or "Build failed"
+                if cmd_result.limit_exceeded:
+                    error_msg = f"Build exceeded {cmd_result.limit_message()}: {error_msg}"
                 # Truncate to 1000 chars (NFR-002)
                 if len(error_msg) > 1000:
                     error_msg = error_msg[:997] + "..."
@@ -451,7 +469,8 @@ class PythonToolRunner:
                     "tool_used": "build",
                     "execution_time_seconds": execution_time,
                     "error_message": error_msg,
-                    "exit_code": cmd_result.returncode
+                    "exit_code": cmd_result.returncode,
+                    "limit_exceeded": cmd_result.limit_exceeded
                 }
                 
         except subprocess.TimeoutExpired:
@@ -0,0 +1,204 @@
+"""Reusable checkout workspaces on a configurable (e.g. tmpfs) root."""
+
+import fcntl
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TextIO
+
+from .cleanup import get_trash_reaper
+
+# Not prefixed with "code-score-" so force_cleanup_all never removes the pool
+DEFAULT_WORKSPACE_DIR = "code_score_workspaces"
+_METADATA_FILE = "workspace.json"
+
+
+def default_workspace_root() -> Path:
+    """Pool root: ``/dev/shm`` (tmpfs) when writable, otherwise the temp directory."""
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm / DEFAULT_WORKSPACE_DIR
+    return Path(tempfile.gettempdir()) / DEFAULT_WORKSPACE_DIR
+
+
+@dataclass
+class Workspace:
+    """A leased workspace slot.
+
+    The checkout lives in ``<slot>/repo`` so the layout matches a regular
+    clone directory.
+    """
+
+    slot: str
+    path: Path
+    lock_file: TextIO | None = None
+    previous_url: str | None = None
+    reused: bool = False
+    size_mb: float = 0.0
+    prepare_seconds: float = 0.0
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def repo_path(self) -> Path:
+        return self.path / "repo"
+
+    def has_checkout_of(self, url: str) -> bool:
+        """Whether the slot still holds a checkout of ``url`` that can be recycled."""
+        return self.previous_url == url and (self.repo_path / ".git").exists()
+
+
+class WorkspacePool:
+    """Hands out pre-created workspace slots and keeps their checkouts for reuse.
+
+    A slot whose last checkout was the same repository is preferred, so the
+    caller can recycle it (``git clean -ffdx`` + checkout) instead of cloning
+    again. Slots are locked with ``flock`` so several processes, e.g. batch
+    nodes on one machine, can share a pool root. Checkouts larger than
+    ``quota_mb`` are not kept.
+    """
+
+    def __init__(self, root: str | Path | None = None, pool_size: int = 4,
+                 quota_mb: float | None = None, acquire_timeout: float = 600.0) -> None:
+        """Initialize the pool and pre-create its slots.
+
+        Args:
+            root: Directory holding the slots (default: ``default_workspace_root()``)
+            pool_size: Number of workspace slots
+            quota_mb: Maximum checkout size per workspace, None for unlimited
+            acquire_timeout: Seconds to wait for a free slot
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        if quota_mb is not None and quota_mb <= 0:
+            raise ValueError("quota_mb must be positive")
+
+        self.root = Path(root) if root is not None else default_workspace_root()
+        self.pool_size = pool_size
+        self.quota_mb = quota_mb
+        self.acquire_timeout = acquire_timeout
+        self.logger = logging.getLogger('code_score.workspace')
+        self._lock = threading.Lock()
+        self.stats = {"acquired": 0, "reused": 0, "fresh": 0, "quota_rejections": 0}
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.slots = [f"ws-{index:02d}" for index in range(pool_size)]
+        for slot in self.slots:
+            (self.root / slot).mkdir(exist_ok=True)
+
+    def acquire(self, url: str) -> Workspace:
+        """Lease a free slot, preferring one that last held ``url``.
+
+        Raises:
+            TimeoutError: If no slot becomes free within ``acquire_timeout``
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            workspace = self._try_acquire(url)
+            if workspace is not None:
+                with self._lock:
+                    self.stats["acquired"] += 1
+                return workspace
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"No free workspace in {self.root} after {self.acquire_timeout}s")
+            time.sleep(0.1)
+
+    def release(self, workspace: Workspace, keep: bool = True) -> None:
+        """Return a slot to the pool.
+
+        Args:
+            workspace: Workspace returned by ``acquire``
+            keep: Keep the checkout for recycling; otherwise it is discarded
+        """
+        try:
+            if not keep:
+                self.wipe(workspace)
+            self._write_metadata(workspace, keep)
+        finally:
+            if workspace.lock_file is not None:
+                fcntl.flock(workspace.lock_file, fcntl.LOCK_UN)
+                workspace.lock_file.close()
+                workspace.lock_file = None
+
+    def wipe(self, workspace: Workspace) -> None:
+        """Discard the slot's checkout (deleted in the background)."""
+        if workspace.repo_path.exists():
+            get_trash_reaper().discard(workspace.repo_path)
+        workspace.previous_url = None
+
+    def exceeds_quota(self, size_mb: float) -> bool:
+        """Whether a checkout of ``size_mb`` is over the per-workspace quota."""
+        if self.quota_mb is not None and size_mb > self.quota_mb:
+            with self._lock:
+                self.stats["quota_rejections"] += 1
+            return True
+        return False
+
+    def record(self, workspace: Workspace, url: str, commit_sha: str | None,
+               reused: bool, size_mb: float, prepare_seconds: float) -> None:
+        """Record how a workspace was prepared for the current job."""
+        workspace.reused = reused
+        workspace.size_mb = size_mb
+        workspace.prepare_seconds = prepare_seconds
+        workspace.metadata = {
+            "url": url,
+            "commit_sha": commit_sha,
+            "size_mb": size_mb,
+            "last_used": datetime.utcnow().isoformat(),
+        }
+        with self._lock:
+            self.stats["reused" if reused else "fresh"] += 1
+
+    def usage(self, workspace: Workspace) -> dict[str, Any]:
+        """Workspace usage for ``execution_metadata``."""
+        return {
+            "root": str(self.root),
+            "slot": workspace.slot,
+            "reused": workspace.reused,
+            "size_mb": workspace.size_mb,
+            "quota_mb": self.quota_mb,
+            "prepare_seconds": round(workspace.prepare_seconds, 3),
+        }
+
+    def _try_acquire(self, url: str) -> Workspace | None:
+        # Same repository first, then empty slots, then the least recently used
+        candidates = []
+        for slot in self.slots:
+            metadata = self._read_metadata(slot)
+            same_repo = metadata.get("url") == url
+            candidates.append((not same_repo, bool(metadata.get("url")),
+                               metadata.get("last_used", ""), slot, metadata))
+        candidates.sort()
+
+        for _, _, _, slot, metadata in candidates:
+            lock_file = open(self.root / f"{slot}.lock", "a+")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_file.close()
+                continue
+            # Re-read under the lock: another process may have used the slot meanwhile
+            metadata = self._read_metadata(slot)
+            workspace = Workspace(slot=slot, path=self.root / slot, lock_file=lock_file,
+                                  previous_url=metadata.get("url"))
+            workspace.path.mkdir(exist_ok=True)
+            return workspace
+        return None
+
+    def _read_metadata(self, slot: str) -> dict[str, Any]:
+        try:
+            return json.loads((self.root / slot / _METADATA_FILE).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _write_metadata(self, workspace: Workspace, keep: bool) -> None:
+        metadata_path = workspace.path / _METADATA_FILE
+        if keep and workspace.metadata and workspace.repo_path.exists():
+            metadata_path.write_text(json.dumps(workspace.metadata, indent=2))
+        else:
+            metadata_path.unlink(missing_ok=True)
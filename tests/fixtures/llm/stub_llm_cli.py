@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Local stand-in for the Gemini CLI used by LLM report tests.
+
+Invoked like ``gemini [--model M] [flags...] PROMPT``; prints a small
+markdown report derived from the prompt. Set ``STUB_LLM_LOG`` to a file to
+have one line appended per invocation, ``STUB_LLM_DELAY`` to sleep that many
+seconds before answering, ``STUB_LLM_CHUNK_DELAY`` to pause between the
+lines of the report, ``STUB_LLM_FAIL_FIRST=N`` (with a log) to answer
+the first N calls with a rate-limit error, and ``STUB_LLM_TIMES`` to a file
+to have the start and end time of each call appended to it.
+"""
+
+import hashlib
+import os
+import sys
+import time
+
+
+def main() -> int:
+    prompt = sys.argv[-1] if len(sys.argv) > 1 else ""
+    if prompt == "--version":
+        print("stub-llm 1.0")
+        return 0
+
+    started = time.time()
+    call_number = 1
+    log_path = os.environ.get("STUB_LLM_LOG")
+    if log_path:
+        with open(log_path, "a+", encoding="utf-8") as log:
+            log.seek(0)
+            call_number = len(log.readlines()) + 1
+            log.write(f"{len(prompt)}\n")
+
+    time.sleep(float(os.environ.get("STUB_LLM_DELAY", "0")))
+    if call_number <= int(os.environ.get("STUB_LLM_FAIL_FIRST", "0")):
+        print("429 RESOURCE_EXHAUSTED: rate limit exceeded", file=sys.stderr)
+        return 1
+
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+    chunk_delay = float(os.environ.get("STUB_LLM_CHUNK_DELAY", "0"))
+    for index, line in enumerate(["# Code Review Report\n", "## Summary\n", f"Prompt {digest} reviewed.\n"]):
+        if index:
+            time.sleep(chunk_delay)
+        print(line, flush=True)
+
+    times_path = os.environ.get("STUB_LLM_TIMES")
+    if times_path:
+        with open(times_path, "a", encoding="utf-8") as times:
+            times.write(f"{started} {time.time()}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Local stand-in for Gemini and OpenAI-compatible HTTP APIs used by LLM tests.
+
+``StubLLMServer`` serves both request formats on 127.0.0.1 over HTTP/1.1
+keep-alive, streams the report as server-sent events in several chunks,
+and records every request and how many connections were opened.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+REPORT_CHUNKS = ["# Code Review Report\n\n", "## Summary\n\n", "The repository was reviewed.\n"]
+
+
+class StubLLMServer:
+    """
+    Threaded HTTP server answering LLM API requests.
+
+    Attributes:
+        requests: (path, headers, JSON body) of every request received
+        connections: Connections accepted so far
+        fail_first: Answer this many requests with HTTP 429
+        chunk_delay: Seconds to wait before each streamed chunk
+        stream: Stream server-sent events (False: one JSON response)
+    """
+
+    def __init__(self, fail_first: int = 0, chunk_delay: float = 0.0, stream: bool = True):
+        self.requests: list[tuple[str, dict[str, str], dict[str, Any]]] = []
+        self.connections = 0
+        self.fail_first = fail_first
+        self.chunk_delay = chunk_delay
+        self.stream = stream
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self) -> "StubLLMServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _record(self, path: str, headers: dict[str, str], body: dict[str, Any]) -> int:
+        with self._lock:
+            self.requests.append((path, headers, body))
+            return len(self.requests)
+
+
+def _make_handler(stub: StubLLMServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            super().setup()
+            with stub._lock:
+                stub.connections += 1
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def do_POST(self) -> None:
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            request_number = stub._record(self.path, dict(self.headers), body)
+            openai = self.path.endswith("/chat/completions")
+
+            if request_number <= stub.fail_first:
+                error = json.dumps({"error": {"code": 429, "message": "RESOURCE_EXHAUSTED"}}).encode()
+                self.send_response(429)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(error)))
+                self.end_headers()
+                self.wfile.write(error)
+                return
+
+            if not stub.stream:
+                text = "".join(REPORT_CHUNKS)
+                payload = ({"choices": [{"message": {"content": text}}]} if openai else
+                           {"candidates": [{"content": {"parts": [{"text": text}]}}]})
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for text in REPORT_CHUNKS:
+                time.sleep(stub.chunk_delay)
+                payload = ({"choices": [{"delta": {"content": text}}]} if openai else
+                           {"candidates": [{"content": {"parts": [{"text": text}]}}]})
+                self._write_chunk(f"data: {json.dumps(payload)}\n\n".encode())
+            if openai:
+                self._write_chunk(b"data: [DONE]\n\n")
+            self._write_chunk(b"")
+
+        def _write_chunk(self, data: bytes) -> None:
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+
+    return Handler
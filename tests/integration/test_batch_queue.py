@@ -0,0 +1,197 @@
+"""Integration tests for batch execution over the durable job queue.
+
+NO MOCKS - Uses real local Git repositories cloned over file:// URLs.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli.batch import batch, merge
+from src.metrics.batch_runner import BatchRunner, PipelineLimits, load_repository_list
+from src.metrics.job_queue import JobQueue
+from src.metrics.models.batch_job import JobState
+from src.metrics.workspace_pool import WorkspacePool
+
+
+def _make_repo(path: Path) -> str:
+    """Create a small committed Git repository and return its file:// URL."""
+    path.mkdir(parents=True)
+    subprocess.run(["git", "init"], cwd=path, capture_output=True, check=True)
+    subprocess.run(["git", "config", "user.name", "Test User"], cwd=path, capture_output=True)
+    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=path, capture_output=True)
+    (path / "README.md").write_text("# Sample\n\nInstall with pip. Usage example below.\n")
+    subprocess.run(["git", "add", "."], cwd=path, capture_output=True, check=True)
+    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=path, capture_output=True, check=True)
+    return f"file://{path}"
+
+
+@pytest.fixture
+def repo_urls(tmp_path: Path) -> list[str]:
+    return [_make_repo(tmp_path / "repos" / f"sample{i}") for i in range(2)]
+
+
+class TestBatchRunner:
+    """Tests for BatchRunner processing real repositories."""
+
+    def test_batch_processes_all_jobs(self, tmp_path: Path, repo_urls: list[str]):
+        queue = JobQueue(tmp_path / "queue.db")
+        queue.enqueue([(url, None) for url in repo_urls])
+
+        runner = BatchRunner(queue, tmp_path / "output", enable_checklist=False)
+        counts = runner.run(workers=2)
+
+        assert counts["done"] == 2
+        for job in queue.list_jobs():
+            assert job.state == JobState.DONE
+            assert {"cloning", "analyzing", "done"} <= set(job.stage_timestamps)
+            assert (Path(job.output_dir) / "submission.json").exists()
+
+    def test_invalid_repository_fails_with_error(self, tmp_path: Path):
+        queue = JobQueue(tmp_path / "queue.db")
+        queue.enqueue([(f"file://{tmp_path}/missing-repo", None)])
+
+        counts = BatchRunner(queue, tmp_path / "output", enable_checklist=False).run()
+
+        assert counts["failed"] == 1
+        failed = queue.list_jobs(JobState.FAILED)[0]
+        assert failed.attempts == 1
+        assert "Repository operation failed" in failed.error
+
+    def test_restarted_batch_resumes_interrupted_job(self, tmp_path: Path, repo_urls: list[str]):
+        queue = JobQueue(tmp_path / "queue.db")
+        queue.enqueue([(url, None) for url in repo_urls])
+        done_job = queue.claim("crashed-worker")
+        queue.complete(done_job.job_id)
+        interrupted = queue.claim("crashed-worker")
+        queue.advance(interrupted.job_id, JobState.ANALYZING)
+
+        counts = BatchRunner(JobQueue(tmp_path / "queue.db"), tmp_path / "output",
+                             enable_checklist=False).run()
+
+        assert counts["done"] == 2
+        assert queue.get_job(done_job.job_id).attempts == 1
+        assert queue.get_job(interrupted.job_id).attempts == 2
+
+
+class TestBatchCommand:
+    """Tests for the batch CLI command."""
+
+    def test_batch_command_and_status(self, tmp_path: Path, repo_urls: list[str]):
+        repos_file = tmp_path / "repos.txt"
+        repos_file.write_text("# hackathon repos\n" + "\n".join(repo_urls) + "\n")
+        db_path = str(tmp_path / "queue.db")
+        runner = CliRunner()
+
+        result = runner.invoke(batch, [
+            str(repos_file), "--queue-db", db_path,
+            "--output-dir", str(tmp_path / "output"), "--enable-checklist", "false"
+        ])
+        assert result.exit_code == 0, result.output
+        assert "Queued 2 new job(s)" in result.output
+
+        status = runner.invoke(batch, ["--queue-db", db_path, "--status"])
+        assert status.exit_code == 0
+        assert "done: 2" in status.output
+
+    def test_load_repository_list(self, tmp_path: Path):
+        repos_file = tmp_path / "repos.txt"
+        repos_file.write_text("# comment\n\nhttps://example.com/a.git\nhttps://example.com/b.git abc123\n")
+
+        assert load_repository_list(repos_file) == [
+            ("https://example.com/a.git", None),
+            ("https://example.com/b.git", "abc123"),
+        ]
+
+
+class TestMultiNodeBatch:
+    """Simulates several judging nodes as local processes sharing one directory."""
+
+    def test_nodes_share_work_and_merge_leaderboard(self, tmp_path: Path):
+        urls = [_make_repo(tmp_path / "repos" / f"team{i}") for i in range(6)]
+        repos_file = tmp_path / "repos.txt"
+        repos_file.write_text("\n".join(urls) + "\n")
+        shared_dir = tmp_path / "shared"
+        project_root = Path(__file__).parent.parent.parent
+
+        nodes = [
+            subprocess.Popen(
+                [sys.executable, "-m", "src.cli.main", "batch", str(repos_file),
+                 "--shared-dir", str(shared_dir), "--shard", f"{i}/3", "--node-id", f"node-{i}",
+                 "--enable-checklist", "false"],
+                cwd=project_root, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+            )
+            for i in (1, 2, 3)
+        ]
+        outputs = [node.communicate(timeout=300)[0] for node in nodes]
+        assert all(node.returncode == 0 for node in nodes), outputs
+
+        done_markers = list((shared_dir / "done").glob("*.json"))
+        assert len(done_markers) == 6
+        for marker in done_markers:
+            record = json.loads(marker.read_text())
+            assert (Path(record["output_dir"]) / "submission.json").exists()
+            assert record["output_dir"].startswith(str(shared_dir / "outputs"))
+
+        summaries = list((shared_dir / "summaries").glob("*.json"))
+        assert len(summaries) == 3
+
+        result = CliRunner().invoke(merge, [str(shared_dir / "summaries"),
+                                            "--output-dir", str(tmp_path / "board")])
+        assert result.exit_code == 0, result.output
+        leaderboard = json.loads((tmp_path / "board" / "leaderboard.json").read_text())
+        assert sorted(e["repository_url"] for e in leaderboard["entries"]) == sorted(urls)
+
+
+class TestPrefetchPipeline:
+    """Tests for overlapping clone/analyze stages with checkout backpressure."""
+
+    def test_max_checkouts_bounds_checkouts_on_disk(self, tmp_path: Path):
+        urls = [_make_repo(tmp_path / "repos" / f"team{i}") for i in range(4)]
+        queue = JobQueue(tmp_path / "queue.db")
+        queue.enqueue([(url, None) for url in urls])
+
+        limits = PipelineLimits(clone_workers=3, analyze_workers=1, prefetch_depth=3, max_checkouts=2)
+        runner = BatchRunner(queue, tmp_path / "output", enable_checklist=False, limits=limits)
+        counts = runner.run()
+
+        assert counts["done"] == 4
+        assert 1 <= runner.stats["peak_checkouts"] <= 2
+
+    def test_low_disk_space_serializes_clones(self, tmp_path: Path):
+        urls = [_make_repo(tmp_path / "repos" / f"team{i}") for i in range(3)]
+        queue = JobQueue(tmp_path / "queue.db")
+        queue.enqueue([(url, None) for url in urls])
+
+        # No disk can satisfy this, so a clone only starts once no other checkout exists
+        limits = PipelineLimits(clone_workers=2, max_checkouts=3, min_free_disk_mb=10**9)
+        runner = BatchRunner(queue, tmp_path / "output", enable_checklist=False, limits=limits)
+        counts = runner.run()
+
+        assert counts["done"] == 3
+        assert runner.stats["peak_checkouts"] == 1
+
+    def test_workspace_pool_usage_reported(self, tmp_path: Path, repo_urls: list[str]):
+        queue = JobQueue(tmp_path / "queue.db")
+        queue.enqueue([(url, None) for url in repo_urls])
+
+        pool = WorkspacePool(tmp_path / "workspaces", pool_size=2)
+        runner = BatchRunner(queue, tmp_path / "output", enable_checklist=False, workspace_pool=pool)
+        counts = runner.run()
+
+        assert counts["done"] == 2
+        for job in queue.list_jobs():
+            submission = json.loads((Path(job.output_dir) / "submission.json").read_text())
+            workspace = submission["execution"]["workspace"]
+            assert workspace["slot"] in ("ws-00", "ws-01")
+            assert workspace["reused"] is False
+
+    def test_invalid_limits_rejected(self):
+        with pytest.raises(ValueError):
+            PipelineLimits(clone_workers=0)
+        with pytest.raises(ValueError):
+            PipelineLimits(min_free_disk_mb=-1)
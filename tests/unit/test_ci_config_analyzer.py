@@ -452,6 +452,24 @@ jobs:
         # Should aggregate test steps from all workflow files
         assert result.test_job_count >= 2
 
+    def test_workflow_files_are_merged_with_per_file_errors(self, analyzer, tmp_path):
+        """Edge case: Every workflow file counts; a broken one is reported, not fatal."""
+        workflows_dir = tmp_path / ".github" / "workflows"
+        workflows_dir.mkdir(parents=True)
+        (workflows_dir / "lint.yml").write_text("jobs:\n  test:\n    steps:\n      - run: ruff check .\n")
+        (workflows_dir / "test.yml").write_text("jobs:\n  test:\n    steps:\n      - run: pytest tests/\n")
+        (workflows_dir / "release.yaml").write_text("jobs:\n  test:\n    steps:\n      - run: npm test\n")
+        (workflows_dir / "broken.yml").write_text("jobs: [unclosed\n")
+
+        result = analyzer.analyze_ci_config(tmp_path)
+
+        assert result.test_commands == ["npm test", "pytest tests/"]
+        # Equally named jobs of different workflows are different jobs
+        assert result.test_job_count == 2
+        assert result.config_file_path == ".github/workflows/release.yaml"
+        assert len(result.parse_errors) == 1
+        assert result.parse_errors[0].startswith("Failed to parse .github/workflows/broken.yml: ")
+
     def test_ci_config_in_subdirectory(self, analyzer, tmp_path):
         """Edge case: Ensure analyzer only checks root directory."""
         subdir = tmp_path / "subproject"
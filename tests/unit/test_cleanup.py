@@ -0,0 +1,137 @@
+"""Unit tests for background cleanup through the trash reaper.
+
+NO MOCKS - Uses real directory trees on the local filesystem.
+"""
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from src.metrics.cleanup import TRASH_DIR_NAME, RepositoryCleanup, TrashReaper
+
+
+def _make_tree(path: Path, files: int = 20) -> Path:
+    """Create a checkout-like tree with nested directories."""
+    nested = path / "node_modules" / "pkg" / "lib"
+    nested.mkdir(parents=True)
+    for i in range(files):
+        (nested / f"module{i}.js").write_text("module.exports = {};\n")
+    (path / "README.md").write_text("# Sample\n")
+    return path
+
+
+class TestTrashReaper:
+    """Tests for rename-then-delete background cleanup."""
+
+    def test_discard_removes_path_immediately_and_deletes_in_background(self, tmp_path: Path):
+        reaper = TrashReaper(trash_roots=[])
+        checkout = _make_tree(tmp_path / "code-score-abc")
+
+        reaper.discard(checkout)
+
+        assert not checkout.exists()
+        assert reaper.drain(timeout=30)
+        assert reaper.stats["deleted"] == 1
+        assert not (tmp_path / TRASH_DIR_NAME).exists()
+
+    def test_startup_sweeps_trash_left_by_crashed_process(self, tmp_path: Path):
+        leftover = _make_tree(tmp_path / TRASH_DIR_NAME / "code-score-old-1234")
+
+        reaper = TrashReaper(trash_roots=[tmp_path])
+
+        assert reaper.drain(timeout=30)
+        assert not leftover.exists()
+
+    def test_concurrent_deletions_are_bounded(self, tmp_path: Path):
+        reaper = TrashReaper(max_workers=2, trash_roots=[])
+        checkouts = [_make_tree(tmp_path / f"code-score-{i}") for i in range(6)]
+
+        for checkout in checkouts:
+            reaper.discard(checkout)
+
+        assert reaper.drain(timeout=30)
+        assert len(reaper._threads) <= 2
+        assert reaper.stats["deleted"] == 6
+        assert reaper.pending() == 0
+
+    def test_falls_back_to_synchronous_delete_without_trash(self, tmp_path: Path):
+        reaper = TrashReaper(trash_roots=[])
+        checkout = _make_tree(tmp_path / "code-score-abc")
+        # A file in the way makes the trash directory impossible to create
+        (tmp_path / TRASH_DIR_NAME).write_text("")
+
+        reaper.discard(checkout)
+
+        assert not checkout.exists()
+        assert reaper.stats["fallback_sync"] == 1
+
+    def test_trash_directory_is_private(self, tmp_path: Path):
+        reaper = TrashReaper(trash_roots=[])
+        # Pre-created by someone with a permissive umask
+        (tmp_path / TRASH_DIR_NAME).mkdir()
+        (tmp_path / TRASH_DIR_NAME).chmod(0o777)
+        checkout = _make_tree(tmp_path / "code-score-abc")
+        blocker = _make_tree(tmp_path / TRASH_DIR_NAME / "in-use")
+
+        reaper.discard(checkout)
+
+        assert stat.S_IMODE((tmp_path / TRASH_DIR_NAME).stat().st_mode) == 0o700
+        assert reaper.drain(timeout=30)
+        assert not blocker.exists()
+
+    @pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid() != 0, reason="needs root to chown")
+    def test_trash_directory_of_another_user_is_never_used_or_swept(self, tmp_path: Path):
+        foreign = tmp_path / TRASH_DIR_NAME
+        their_file = _make_tree(foreign / "their-checkout")
+        os.chown(foreign, 54321, 54321)
+        checkout = _make_tree(tmp_path / "code-score-abc")
+
+        reaper = TrashReaper(trash_roots=[tmp_path])
+        reaper.discard(checkout)
+
+        assert reaper.drain(timeout=30)
+        assert not checkout.exists()
+        assert reaper.stats["fallback_sync"] == 1
+        assert their_file.exists()
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs POSIX users")
+    def test_trash_name_is_per_user(self):
+        assert TRASH_DIR_NAME == f".code-score-trash-{os.getuid()}"
+
+    def test_discard_missing_path_is_noop(self, tmp_path: Path):
+        reaper = TrashReaper(trash_roots=[])
+
+        reaper.discard(tmp_path / "missing")
+
+        assert reaper.stats["queued"] == 0
+
+
+class TestRepositoryCleanupReaper:
+    """Tests for RepositoryCleanup handing directories to the reaper."""
+
+    def test_cleanup_cloned_repository_uses_reaper(self, tmp_path: Path):
+        reaper = TrashReaper(trash_roots=[])
+        temp_dir = tmp_path / "code-score-xyz"
+        _make_tree(temp_dir / "repo")
+
+        RepositoryCleanup(reaper=reaper).cleanup_cloned_repository(str(temp_dir / "repo"))
+
+        assert not temp_dir.exists()
+        assert reaper.drain(timeout=30)
+        assert reaper.stats["deleted"] == 1
+
+    def test_registered_paths_cleaned_on_exit(self, tmp_path: Path):
+        reaper = TrashReaper(trash_roots=[])
+        directory = _make_tree(tmp_path / "work")
+        single_file = tmp_path / "notes.txt"
+        single_file.write_text("x")
+
+        with RepositoryCleanup(reaper=reaper) as cleanup:
+            cleanup.register_for_cleanup(directory)
+            cleanup.register_for_cleanup(single_file)
+
+        assert not directory.exists()
+        assert not single_file.exists()
+        assert reaper.drain(timeout=30)
@@ -0,0 +1,83 @@
+"""Startup-time budget tests for the CLI entry point.
+
+NO MOCKS - Runs the real CLI in fresh interpreters with ``python -X importtime``.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+import pytest
+
+from src.cli.main import LAZY_SUBCOMMANDS, cli
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Total import time allowed for `--help` / `version`; the eager imports used
+# to cost well over 400 ms on their own
+STARTUP_BUDGET_MS = float(os.environ.get("CODE_SCORE_STARTUP_BUDGET_MS", "250"))
+
+# Modules that only the analysis, evaluation and report subcommands need
+HEAVY_MODULE_PREFIXES = ("pydantic", "jinja2", "yaml", "jsonschema", "src.metrics", "src.llm")
+
+# Runs the `cli` group like the `code-score` console script does; `python -m
+# src.cli.main --help` would go to the legacy analyze command instead
+RUN_CLI_GROUP = "import sys; from src.cli.main import cli; cli(sys.argv[1:], prog_name='code-score')"
+
+
+def _import_profile(*cli_args: str) -> tuple[float, list[str], str]:
+    """Run the CLI group under -X importtime; return (total import ms, imported modules, output)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUN_CLI_GROUP, *cli_args],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+
+    total_us = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.append(name.strip())
+        # Top-level imports are not indented; their cumulative times add up to the total
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000, modules, result.stdout
+
+
+class TestCliStartup:
+    """Tests that light subcommands do not pay for heavy imports."""
+
+    @pytest.mark.parametrize("cli_args", [("version",), ("--help",)])
+    def test_light_commands_skip_heavy_imports(self, cli_args: tuple[str, ...]):
+        _, modules, _ = _import_profile(*cli_args)
+
+        heavy = [name for name in modules if name.startswith(HEAVY_MODULE_PREFIXES)]
+        assert "src.cli.main" in modules
+        assert heavy == []
+
+    def test_help_lists_lazy_subcommands(self):
+        _, _, output = _import_profile("--help")
+
+        assert output.startswith("Usage: code-score [OPTIONS] COMMAND [ARGS]...")
+        for name in LAZY_SUBCOMMANDS:
+            assert name in output
+
+    @pytest.mark.parametrize("cli_args", [("version",), ("--help",)])
+    def test_startup_within_budget(self, cli_args: tuple[str, ...]):
+        # Best of three runs to absorb scheduling noise
+        total_ms = min(_import_profile(*cli_args)[0] for _ in range(3))
+
+        assert total_ms <= STARTUP_BUDGET_MS, (
+            f"`{' '.join(cli_args)}` spent {total_ms:.0f} ms importing modules "
+            f"(budget {STARTUP_BUDGET_MS:.0f} ms)"
+        )
+
+    def test_lazy_help_matches_command_docstrings(self):
+        for name, (_, short_help) in LAZY_SUBCOMMANDS.items():
+            command = cli.get_command(click.Context(cli), name)
+            assert command is not None
+            assert command.get_short_help_str(limit=200) == short_help
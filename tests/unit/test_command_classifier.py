@@ -0,0 +1,148 @@
+"""Unit tests for the single-pass CI command classifier.
+
+NO MOCKS - Uses real pattern files, real CI configuration files and real parsers.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.metrics.ci_parsers.gitlab_ci_parser import GitLabCIParser
+from src.metrics.parse_cache import ParseCache, set_parse_cache
+from src.metrics.pattern_matchers.command_classifier import (
+    COMMAND_PATTERNS_ENV,
+    DEFAULT_PATTERNS,
+    CommandClassifier,
+    CommandPattern,
+    get_command_classifier,
+    load_command_patterns,
+    set_command_classifier,
+)
+from src.metrics.pattern_matchers.test_command_matcher import TestCommandMatcher
+
+PATTERN_FILE = """\
+patterns:
+  - kind: test
+    pattern: yarn test
+    label: jest
+  - kind: coverage_tool
+    pattern: codeclimate
+    label: codeclimate
+"""
+
+
+@pytest.fixture
+def classifier():
+    return CommandClassifier()
+
+
+@pytest.fixture
+def configured(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Process-wide classifier built from a real pattern file."""
+    pattern_file = tmp_path / "patterns.yml"
+    pattern_file.write_text(PATTERN_FILE)
+    monkeypatch.setenv(COMMAND_PATTERNS_ENV, str(pattern_file))
+    set_command_classifier(None)
+    yield get_command_classifier()
+    set_command_classifier(None)
+
+
+class TestCommandClassifier:
+    """Tests for verdicts of the default pattern set."""
+
+    def test_all_verdicts_come_from_one_classification(self, classifier: CommandClassifier):
+        verdict = classifier.classify("python -m pytest --cov=src && bash <(curl -s https://codecov.io/bash)")
+
+        assert verdict.is_test is True
+        assert verdict.framework == "pytest"
+        assert verdict.has_coverage_flag is True
+        assert verdict.coverage_tools == ("codecov",)
+
+    @pytest.mark.parametrize("command,framework", [
+        ("npx vitest run --coverage", "vitest"),
+        ("cargo test --workspace", "cargo_test"),
+        ("bazel test //...", None),
+        ("PYTEST tests/", "pytest"),
+        ("./gradlew test --info", "junit"),
+    ])
+    def test_frameworks(self, classifier: CommandClassifier, command: str, framework: str):
+        verdict = classifier.classify(command)
+
+        assert verdict.is_test is True
+        assert verdict.framework == framework
+
+    @pytest.mark.parametrize("command,is_test", [
+        ("tox -e py311", True),
+        ("pip install tox && tox", True),
+        ("cd app; nox -s tests", True),
+        ("docker run --rm sandbox", False),
+        ("echo detox", False),
+        ("pip install toxic-comments", False),
+    ])
+    def test_short_names_only_match_at_command_start(self, classifier: CommandClassifier,
+                                                    command: str, is_test: bool):
+        assert classifier.classify(command).is_test is is_test
+
+    def test_coverage_flags_are_case_sensitive(self, classifier: CommandClassifier):
+        assert classifier.classify("pytest --COV=src").has_coverage_flag is False
+        assert classifier.classify("go test -coverprofile=c.out").has_coverage_flag is True
+
+    def test_overlapping_literals_are_all_found(self, classifier: CommandClassifier):
+        verdict = classifier.classify("sonar-scanner && sonarqube-report && coveralls")
+
+        assert verdict.coverage_tools == ("coveralls", "sonarqube")
+
+    def test_verdicts_are_memoized(self, classifier: CommandClassifier):
+        assert classifier.classify("go test ./...") is classifier.classify("go test ./...")
+
+    def test_matches_the_substring_matcher_on_the_original_patterns(self):
+        original = CommandClassifier([p for p in DEFAULT_PATTERNS if p.literal not in
+                                      ("vitest", "cargo test", "bazel test", "bazelisk test", "tox", "nox")])
+        commands = ["npm run test:unit", "pip install /path/to/test/requirements.txt", "   ",
+                    "go test -cover ./... | tee GO TEST.log", "mvn test sonar:sonar -Dsonarqube"]
+
+        assert [original.classify(command).is_test for command in commands] == [True, False, False, True, True]
+        assert original.classify(commands[3]).has_coverage_flag is True
+        assert original.classify(commands[4]).coverage_tools == ("sonarqube",)
+
+
+class TestConfiguredPatterns:
+    """Tests for patterns added from a pattern file."""
+
+    def test_patterns_from_the_environment_extend_the_defaults(self, configured: CommandClassifier):
+        matcher = TestCommandMatcher()
+
+        assert matcher.infer_framework("yarn test -- --coverage") == "jest"
+        assert matcher.is_test_command("pytest") is True
+        assert configured.classify("codeclimate-test-reporter").coverage_tools == ("codeclimate",)
+
+    def test_unknown_frameworks_are_rejected_when_loading(self, tmp_path: Path):
+        pattern_file = tmp_path / "patterns.yml"
+        pattern_file.write_text("patterns:\n  - pattern: ctest\n    label: ctest\n")
+
+        with pytest.raises(ValueError, match="test framework"):
+            load_command_patterns(pattern_file)
+
+    def test_file_without_patterns_list_is_rejected(self, tmp_path: Path):
+        pattern_file = tmp_path / "patterns.json"
+        pattern_file.write_text('{"kind": "test"}')
+
+        with pytest.raises(ValueError, match="'patterns' list"):
+            load_command_patterns(pattern_file)
+
+    def test_cached_ci_results_depend_on_the_patterns(self, tmp_path: Path):
+        config = tmp_path / ".gitlab-ci.yml"
+        config.write_text("test:\n  script:\n    - yarn test\n")
+        set_parse_cache(ParseCache())
+        try:
+            steps, _ = GitLabCIParser().parse_file(config)
+            set_command_classifier(CommandClassifier(
+                DEFAULT_PATTERNS + (CommandPattern("test", "yarn test", "jest"),)
+            ))
+            configured_steps, _ = GitLabCIParser().parse_file(config)
+        finally:
+            set_parse_cache(None)
+            set_command_classifier(None)
+
+        assert steps == []
+        assert [step.framework for step in configured_steps] == ["jest"]
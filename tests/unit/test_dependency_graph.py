@@ -0,0 +1,221 @@
+"""Unit tests for lockfile dependency graph extraction and caching.
+
+NO MOCKS - Parses real lockfiles written to temporary directories.
+"""
+
+import json
+from pathlib import Path
+
+from src.metrics.dependency_graph import (
+    LockfileCache,
+    LockfileGraph,
+    build_dependency_graph,
+)
+from src.metrics.models.metrics_collection import MetricsCollection
+from src.metrics.models.repository import Repository
+from src.metrics.output_generators import OutputFormat, OutputManager
+from src.metrics.tool_executor import ToolExecutor
+
+
+def _edges_by_name(graph) -> set[tuple[str, str]]:
+    return {(graph.packages[a].name, graph.packages[b].name) for a, b in graph.edges}
+
+
+def _direct_names(graph) -> set[str]:
+    return {graph.packages[index].name for index in graph.direct}
+
+
+class TestLockfileParsing:
+    """Tests for packages, edges and direct dependencies per lockfile format."""
+
+    def test_package_lock_v3_uses_node_resolution(self, tmp_path: Path):
+        (tmp_path / "package-lock.json").write_text(json.dumps({
+            "lockfileVersion": 3,
+            "packages": {
+                "": {"name": "app", "dependencies": {"express": "^4"}, "devDependencies": {"jest": "^29"}},
+                "node_modules/express": {"version": "4.18.2", "dependencies": {"debug": "2.6.9"}},
+                "node_modules/debug": {"version": "4.3.4"},
+                "node_modules/express/node_modules/debug": {"version": "2.6.9"},
+                "node_modules/jest": {"version": "29.7.0", "dev": True, "dependencies": {"debug": "^4"}},
+            },
+        }))
+
+        graph = build_dependency_graph(tmp_path, cache=LockfileCache())
+
+        assert _direct_names(graph) == {"express", "jest"}
+        nested_debug = graph.packages.index(("npm", "debug", "2.6.9"))
+        express = graph.packages.index(("npm", "express", "4.18.2"))
+        assert (express, nested_debug) in graph.edges
+        assert ("jest", "debug") in _edges_by_name(graph)
+
+    def test_package_lock_v1_requires(self, tmp_path: Path):
+        (tmp_path / "package.json").write_text(json.dumps({"dependencies": {"a": "^1"}}))
+        (tmp_path / "package-lock.json").write_text(json.dumps({
+            "lockfileVersion": 1,
+            "dependencies": {
+                "a": {"version": "1.0.0", "requires": {"b": "^2"},
+                      "dependencies": {"b": {"version": "2.0.0"}}},
+                "b": {"version": "3.0.0"},
+            },
+        }))
+
+        graph = build_dependency_graph(tmp_path, cache=LockfileCache())
+
+        a = graph.packages.index(("npm", "a", "1.0.0"))
+        assert (a, graph.packages.index(("npm", "b", "2.0.0"))) in graph.edges
+        assert _direct_names(graph) == {"a"}
+
+    def test_yarn_classic(self, tmp_path: Path):
+        (tmp_path / "package.json").write_text(json.dumps({"dependencies": {"chalk": "^4.1.0"}}))
+        (tmp_path / "yarn.lock").write_text(
+            "# yarn lockfile v1\n\n"
+            'chalk@^4.1.0:\n  version "4.1.2"\n  dependencies:\n    ansi-styles "^4.1.0"\n'
+            '    supports-color "^7.1.0"\n\n'
+            '"ansi-styles@^4.0.0", ansi-styles@^4.1.0:\n  version "4.3.0"\n\n'
+            'supports-color@^7.1.0:\n  version "7.2.0"\n'
+        )
+
+        graph = build_dependency_graph(tmp_path, cache=LockfileCache())
+
+        assert len(graph) == 3
+        assert _edges_by_name(graph) == {("chalk", "ansi-styles"), ("chalk", "supports-color")}
+        assert _direct_names(graph) == {"chalk"}
+
+    def test_yarn_berry_workspace_dependencies_are_direct(self, tmp_path: Path):
+        (tmp_path / "yarn.lock").write_text(
+            '__metadata:\n  version: 6\n\n'
+            '"app@workspace:.":\n  version: 0.0.0-use.local\n  dependencies:\n    left-pad: ^1.3.0\n\n'
+            '"left-pad@npm:^1.3.0":\n  version: 1.3.0\n'
+        )
+
+        graph = build_dependency_graph(tmp_path, cache=LockfileCache())
+
+        assert [(p.name, p.version) for p in graph.packages] == [("left-pad", "1.3.0")]
+        assert _direct_names(graph) == {"left-pad"}
+
+    def test_uv_lock(self, tmp_path: Path):
+        (tmp_path / "uv.lock").write_text(
+            'version = 1\n\n'
+            '[[package]]\nname = "app"\nversion = "0.1.0"\nsource = { editable = "." }\n'
+            'dependencies = [{ name = "httpx" }]\n\n'
+            '[[package]]\nname = "httpx"\nversion = "0.27.0"\nsource = { registry = "https://pypi.org/simple" }\n'
+            'dependencies = [{ name = "idna" }]\n\n'
+            '[[package]]\nname = "idna"\nversion = "3.7"\nsource = { registry = "https://pypi.org/simple" }\n'
+        )
+
+        graph = build_dependency_graph(tmp_path, cache=LockfileCache())
+
+        assert [p.name for p in graph.packages] == ["httpx", "idna"]
+        assert _edges_by_name(graph) == {("httpx", "idna")}
+        assert _direct_names(graph) == {"httpx"}
+
+    def test_poetry_lock_with_pyproject(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.poetry.dependencies]\npython = "^3.11"\nFlask = "^3.0"\n'
+        )
+        (tmp_path / "poetry.lock").write_text(
+            '[[package]]\nname = "flask"\nversion = "3.0.0"\n\n[package.dependencies]\nWerkzeug = ">=3.0.0"\n\n'
+            '[[package]]\nname = "werkzeug"\nversion = "3.0.1"\n'
+        )
+
+        graph = build_dependency_graph(tmp_path, cache=LockfileCache())
+
+        assert _edges_by_name(graph) == {("flask", "werkzeug")}
+        assert _direct_names(graph) == {"flask"}
+
+    def test_go_mod_marks_indirect_requirements(self, tmp_path: Path):
+        (tmp_path / "go.mod").write_text(
+            "module example.com/app\n\ngo 1.21\n\nrequire github.com/pkg/errors v0.9.1\n\n"
+            "require (\n\tgolang.org/x/text v0.14.0 // indirect\n\tgithub.com/spf13/cobra v1.8.0\n)\n"
+        )
+        (tmp_path / "go.sum").write_text("golang.org/x/text v0.3.0 h1:x=\n")
+
+        graph = build_dependency_graph(tmp_path, cache=LockfileCache())
+
+        # go.sum also checksums versions that were not selected
+        assert {p.version for p in graph.packages if p.name == "golang.org/x/text"} == {"v0.14.0"}
+        assert _direct_names(graph) == {"github.com/pkg/errors", "github.com/spf13/cobra"}
+
+
+class TestDependencyGraph:
+    """Tests for merging, interning and caching."""
+
+    def test_identical_lockfiles_are_parsed_once(self, tmp_path: Path):
+        lockfile = "flask==3.0.0\nrequests==2.31.0\n"
+        for service in ("a", "b"):
+            (tmp_path / service).mkdir()
+            (tmp_path / service / "requirements.txt").write_text(lockfile)
+        cache = LockfileCache()
+
+        graph = build_dependency_graph(tmp_path, cache=cache)
+
+        assert len(graph) == 2
+        assert [lockfile["cached"] for lockfile in graph.lockfiles] == [False, True]
+        assert cache.stats["hits"] == 1
+
+    def test_changed_content_is_reparsed(self, tmp_path: Path):
+        requirements = tmp_path / "requirements.txt"
+        requirements.write_text("flask==3.0.0\n")
+        cache = LockfileCache()
+        build_dependency_graph(tmp_path, cache=cache)
+
+        requirements.write_text("flask==3.0.1\n")
+        graph = build_dependency_graph(tmp_path, cache=cache)
+
+        assert graph.packages[0].version == "3.0.1"
+        assert graph.lockfiles[0]["cached"] is False
+
+    def test_disk_cache_is_shared_between_instances(self, tmp_path: Path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / "requirements.txt").write_text("flask==3.0.0\n")
+        build_dependency_graph(repo, cache=LockfileCache(tmp_path / "cache"))
+
+        cache = LockfileCache(tmp_path / "cache")
+        graph = build_dependency_graph(repo, cache=cache)
+
+        assert graph.lockfiles[0]["cached"] is True
+        assert cache.stats["disk_hits"] == 1
+
+    def test_memory_cache_is_bounded(self):
+        cache = LockfileCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, LockfileGraph("PyPI"))
+
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+
+    def test_graph_in_submission(self, tmp_path: Path):
+        (tmp_path / "requirements.txt").write_text("flask==3.0.0\n")
+        (tmp_path / "app.py").write_text("import flask\n")
+        executor = ToolExecutor(timeout_seconds=60)
+        executor.analyze_subprojects = False
+        metrics = executor.execute_tools("python", str(tmp_path))
+        repository = Repository(url="https://example.com/app.git", detected_language="python")
+
+        output = json.loads(OutputFormat().export_json(repository, metrics))
+
+        dependencies = output["metrics"]["dependencies"]
+        assert dependencies["package_count"] == 1
+        assert dependencies["lockfiles"][0]["path"] == "requirements.txt"
+        assert "packages" not in dependencies
+        assert "edges" not in dependencies
+
+    def test_full_graph_in_separate_file(self, tmp_path: Path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / "requirements.txt").write_text("flask==3.0.0\n")
+        metrics = MetricsCollection(dependency_graph=build_dependency_graph(repo, cache=LockfileCache()).to_dict())
+        repository = Repository(url="https://example.com/app.git", detected_language="python")
+
+        saved = OutputManager(str(tmp_path / "output")).save_results(repository, metrics, "json")
+
+        graph_files = [path for path in saved if path.endswith("_dependencies.json")]
+        assert len(graph_files) == 1
+        graph = json.loads(Path(graph_files[0]).read_text())
+        assert graph["packages"][0] == {
+            "ecosystem": "PyPI", "name": "flask", "version": "3.0.0", "direct": True, "source": "requirements.txt"
+        }
+        submission = json.loads((tmp_path / "output" / "submission.json").read_text())
+        assert "packages" not in submission["metrics"]["dependencies"]
+
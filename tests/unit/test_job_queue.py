@@ -0,0 +1,173 @@
+"""Unit tests for the SQLite-backed batch job queue.
+
+NO MOCKS - All tests use a real SQLite database in a temporary directory.
+"""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.metrics.job_queue import JobQueue, JobQueueError
+from src.metrics.models.batch_job import BatchJob, JobState
+
+
+@pytest.fixture
+def queue(tmp_path: Path) -> JobQueue:
+    """Create a job queue in a temporary directory."""
+    return JobQueue(tmp_path / "queue.db")
+
+
+class TestEnqueue:
+    """Tests for adding jobs to the queue."""
+
+    def test_enqueue_adds_pending_jobs(self, queue: JobQueue):
+        added = queue.enqueue([("https://example.com/a.git", None), ("https://example.com/b.git", "a" * 40)])
+
+        assert added == 2
+        jobs = queue.list_jobs()
+        assert [job.repository_url for job in jobs] == ["https://example.com/a.git", "https://example.com/b.git"]
+        assert all(job.state == JobState.PENDING for job in jobs)
+        assert jobs[0].commit_sha is None
+        assert jobs[1].commit_sha == "a" * 40
+
+    def test_enqueue_ignores_duplicates(self, queue: JobQueue):
+        queue.enqueue([("https://example.com/a.git", None)])
+        added = queue.enqueue([("https://example.com/a.git", None), ("https://example.com/c.git", None)])
+
+        assert added == 1
+        assert len(queue.list_jobs()) == 2
+
+    def test_queue_persists_across_instances(self, tmp_path: Path):
+        JobQueue(tmp_path / "queue.db").enqueue([("https://example.com/a.git", None)], timeout_seconds=42)
+
+        jobs = JobQueue(tmp_path / "queue.db").list_jobs()
+        assert len(jobs) == 1
+        assert jobs[0].timeout_seconds == 42
+
+
+class TestClaimAndTransitions:
+    """Tests for claiming jobs and moving them through stages."""
+
+    def test_claim_moves_job_to_cloning(self, queue: JobQueue):
+        queue.enqueue([("https://example.com/a.git", None)])
+
+        job = queue.claim("worker-0")
+
+        assert job.state == JobState.CLONING
+        assert job.attempts == 1
+        assert job.worker_id == "worker-0"
+        assert "cloning" in job.stage_timestamps
+
+    def test_claim_returns_none_when_empty(self, queue: JobQueue):
+        assert queue.claim("worker-0") is None
+
+    def test_claim_is_atomic_across_threads(self, queue: JobQueue):
+        queue.enqueue([(f"https://example.com/repo{i}.git", None) for i in range(40)])
+        claimed: list[int] = []
+        lock = threading.Lock()
+
+        def worker(name: str) -> None:
+            while (job := queue.claim(name)) is not None:
+                with lock:
+                    claimed.append(job.job_id)
+
+        threads = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(claimed) == 40
+        assert len(set(claimed)) == 40
+
+    def test_advance_records_stage_timestamps(self, queue: JobQueue):
+        queue.enqueue([("https://example.com/a.git", None)])
+        job = queue.claim("worker-0")
+
+        queue.advance(job.job_id, JobState.ANALYZING, output_dir="/tmp/out")
+        queue.advance(job.job_id, JobState.EVALUATING)
+        queue.complete(job.job_id)
+
+        done = queue.get_job(job.job_id)
+        assert done.state == JobState.DONE
+        assert done.output_dir == "/tmp/out"
+        assert set(done.stage_timestamps) == {"cloning", "analyzing", "evaluating", "done"}
+
+    def test_advance_rejects_terminal_states(self, queue: JobQueue):
+        queue.enqueue([("https://example.com/a.git", None)])
+        job = queue.claim("worker-0")
+
+        with pytest.raises(JobQueueError):
+            queue.advance(job.job_id, JobState.FAILED)
+
+    def test_fail_records_error(self, queue: JobQueue):
+        queue.enqueue([("https://example.com/a.git", None)])
+        job = queue.claim("worker-0")
+
+        queue.fail(job.job_id, "Repository operation: clone failed")
+
+        failed = queue.get_job(job.job_id)
+        assert failed.state == JobState.FAILED
+        assert failed.error == "Repository operation: clone failed"
+        assert queue.get_counts()["failed"] == 1
+
+
+class TestResumeAndRetry:
+    """Tests for crash recovery and retrying failed jobs."""
+
+    def test_requeue_interrupted_jobs(self, tmp_path: Path):
+        db_path = tmp_path / "queue.db"
+        first_run = JobQueue(db_path)
+        first_run.enqueue([("https://example.com/a.git", None), ("https://example.com/b.git", None)])
+        job = first_run.claim("worker-0")
+        first_run.advance(job.job_id, JobState.ANALYZING)
+        # Simulated crash: the job never reaches done
+
+        restarted = JobQueue(db_path)
+        assert restarted.requeue_interrupted() == 1
+
+        resumed = restarted.claim("worker-1")
+        assert resumed.job_id == job.job_id
+        assert resumed.attempts == 2
+
+    def test_done_jobs_are_not_reprocessed(self, queue: JobQueue):
+        queue.enqueue([("https://example.com/a.git", None)])
+        job = queue.claim("worker-0")
+        queue.complete(job.job_id)
+
+        queue.requeue_interrupted()
+        assert queue.claim("worker-0") is None
+
+    def test_retry_failed_with_new_timeout(self, queue: JobQueue):
+        queue.enqueue([("https://example.com/a.git", None), ("https://example.com/b.git", None)], timeout_seconds=60)
+        failed_job = queue.claim("worker-0")
+        queue.fail(failed_job.job_id, "timed out")
+        done_job = queue.claim("worker-0")
+        queue.complete(done_job.job_id)
+
+        assert queue.retry_failed(timeout_seconds=600) == 1
+
+        retried = queue.get_job(failed_job.job_id)
+        assert retried.state == JobState.PENDING
+        assert retried.timeout_seconds == 600
+        assert queue.get_job(done_job.job_id).timeout_seconds == 60
+
+        reclaimed = queue.claim("worker-0")
+        assert reclaimed.error is None
+
+
+class TestBatchJobModel:
+    """Tests for BatchJob helpers."""
+
+    def test_output_name_is_stable_and_distinct(self):
+        job_a = BatchJob(job_id=1, repository_url="https://github.com/alice/app.git")
+        job_b = BatchJob(job_id=2, repository_url="https://github.com/bob/app.git")
+
+        assert job_a.output_name.startswith("app-")
+        assert job_a.output_name != job_b.output_name
+        assert job_a.output_name == BatchJob(job_id=3, repository_url="https://github.com/alice/app.git").output_name
+
+    def test_to_dict_serializes_state(self):
+        job = BatchJob(job_id=1, repository_url="https://example.com/a.git", state=JobState.DONE)
+        assert job.to_dict()["state"] == "done"
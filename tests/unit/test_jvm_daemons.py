@@ -0,0 +1,148 @@
+"""Unit tests for the warm JVM build daemon pool.
+
+NO MOCKS - Uses real threads and, when Gradle is installed, real builds.
+"""
+
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.metrics.jvm_daemons import (
+    JvmDaemonPool,
+    count_idle_daemons,
+    get_jvm_daemon_pool,
+    set_jvm_daemon_pool,
+)
+from src.metrics.tool_runners.java_tools import JavaToolRunner
+
+
+@pytest.fixture
+def pool(tmp_path: Path) -> JvmDaemonPool:
+    return JvmDaemonPool(tmp_path / "jvm-cache", pool_size=2, use_mvnd=False)
+
+
+class TestJvmDaemonPool:
+    """Tests for commands, shared caches and reuse accounting."""
+
+    def test_shared_caches_are_created(self, pool: JvmDaemonPool):
+        assert pool.maven_repository.is_dir()
+        assert pool.gradle_user_home.is_dir()
+
+    def test_commands_use_shared_caches(self, pool: JvmDaemonPool):
+        assert pool.maven_command(["compile", "-q"]) == [
+            "mvn", f"-Dmaven.repo.local={pool.maven_repository}", "compile", "-q"
+        ]
+        assert pool.gradle_command(["compileJava"])[:4] == [
+            "gradle", "--daemon", "--gradle-user-home", str(pool.gradle_user_home)
+        ]
+        assert pool.environment()["GRADLE_USER_HOME"] == str(pool.gradle_user_home)
+
+    def test_builds_without_a_live_daemon_are_cold(self, pool: JvmDaemonPool):
+        # Nothing has started a daemon for this pool's fresh Gradle user home
+        outcomes = []
+        for _ in range(3):
+            with pool._slot("gradle") as warm:
+                outcomes.append(warm)
+
+        assert outcomes == [False, False, False]
+
+    def test_idle_daemons_are_counted_from_status_output(self):
+        gradle = (
+            "   PID STATUS   INFO\n"
+            " 41021 IDLE     8.7\n"
+            " 41377 BUSY     8.7\n"
+            " 39812 STOPPED  (by user or operating system)\n"
+            "\nOnly Daemons for the current Gradle version are displayed.\n"
+        )
+        mvnd = (
+            "      ID      PID                   Address  Status    RSS  Last activity  Java home\n"
+            "8a2c1f0e    51234  inet:/127.0.0.1:40321     Idle   412m  2026-10-18T10:02:11  /usr/lib/jvm/21\n"
+            "91bd03aa    51290  inet:/127.0.0.1:40877     Busy   530m  2026-10-18T10:05:40  /usr/lib/jvm/21\n"
+        )
+
+        assert count_idle_daemons(gradle) == 1
+        assert count_idle_daemons(mvnd) == 1
+        assert count_idle_daemons("No Gradle daemons are running.\n") == 0
+
+    def test_plain_maven_is_never_warm(self, pool: JvmDaemonPool):
+        for _ in range(2):
+            with pool._slot("maven") as warm:
+                assert warm is False
+
+    def test_concurrent_builds_are_capped_at_pool_size(self, pool: JvmDaemonPool):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def build():
+            with pool._slot("gradle"):
+                with lock:
+                    running.append(1)
+                    peak.append(len(running))
+                time.sleep(0.05)
+                with lock:
+                    running.pop()
+
+        threads = [threading.Thread(target=build) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2
+
+    def test_report_estimates_saved_startup(self, pool: JvmDaemonPool):
+        pool._record("gradle", False, 30.0)
+        pool._record("gradle", True, 10.0)
+        pool._record("gradle", True, 12.0)
+
+        report = pool.report()
+
+        assert report["gradle"]["builds"] == 3
+        assert report["gradle"]["reuse_rate"] == pytest.approx(0.667)
+        assert report["estimated_seconds_saved"] == pytest.approx(2 * (30.0 - 11.0))
+
+    def test_invalid_pool_size(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            JvmDaemonPool(tmp_path, pool_size=0)
+
+    def test_shutdown_without_builds_is_a_no_op(self, pool: JvmDaemonPool):
+        pool.shutdown()
+
+
+class TestJavaRunnerWithPool:
+    """Tests for JavaToolRunner routing builds through the active pool."""
+
+    def test_pool_activation(self, pool: JvmDaemonPool):
+        set_jvm_daemon_pool(pool)
+        try:
+            assert get_jvm_daemon_pool() is pool
+        finally:
+            set_jvm_daemon_pool(None)
+        assert get_jvm_daemon_pool() is None
+
+    @pytest.mark.skipif(shutil.which("gradle") is None, reason="gradle not available")
+    def test_gradle_build_reuses_daemon(self, pool: JvmDaemonPool, tmp_path: Path):
+        projects = []
+        for name in ("first", "second"):
+            project = tmp_path / name
+            (project / "src" / "main" / "java").mkdir(parents=True)
+            (project / "settings.gradle").write_text(f"rootProject.name = '{name}'\n")
+            (project / "build.gradle").write_text("plugins { id 'java' }\n")
+            (project / "src" / "main" / "java" / "App.java").write_text("public class App {}\n")
+            projects.append(project)
+
+        set_jvm_daemon_pool(pool)
+        try:
+            results = [JavaToolRunner(timeout_seconds=300).run_build(str(project)) for project in projects]
+        finally:
+            set_jvm_daemon_pool(None)
+            pool.shutdown()
+
+        assert [result["success"] for result in results] == [True, True]
+        # Each build wrote its classes into its own checkout
+        assert all((project / "build" / "classes").is_dir() for project in projects)
+        assert pool.report()["gradle"]["warm_builds"] == 1
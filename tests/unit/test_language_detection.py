@@ -246,3 +246,72 @@ class TestLanguageDetectorRealAPI:
             if languages:
                 total_pct = sum(lang.get("percentage", 0) for lang in languages.values())
                 assert 99.0 <= total_pct <= 101.0  # Allow small float errors
+
+
+class TestLanguageDetectorScanning:
+    """Tests for byte weighting, sampling and per-commit caching."""
+
+    def test_extensions_are_matched_without_case_or_hidden_files(self, tmp_path: Path) -> None:
+        (tmp_path / "Main.JAVA").write_text("class Main {}")
+        (tmp_path / ".hidden.py").write_text("")
+        (tmp_path / "archive.tar.gz").write_text("")
+        (tmp_path / "py").write_text("")
+
+        stats = LanguageDetector().get_language_statistics(str(tmp_path))
+
+        assert stats["detected_languages"] == {"java": {"file_count": 1, "percentage": 100.0}}
+        assert stats["sampled"] is False
+
+    def test_skipped_directories_are_not_scanned(self, tmp_path: Path) -> None:
+        (tmp_path / "app.py").write_text("")
+        for directory in ("node_modules", "build", ".git"):
+            (tmp_path / directory).mkdir()
+            (tmp_path / directory / "index.js").write_text("")
+
+        stats = LanguageDetector().get_language_statistics(str(tmp_path))
+
+        assert stats["total_files_analyzed"] == 1
+
+    def test_byte_weighted_statistics(self, tmp_path: Path) -> None:
+        (tmp_path / "engine.go").write_text("x" * 9000)
+        for i in range(3):
+            (tmp_path / f"script_{i}.py").write_text("x" * 100)
+        detector = LanguageDetector()
+
+        by_files = detector.get_language_statistics(str(tmp_path))
+        detector.weight_by_bytes = True
+        by_bytes = detector.get_language_statistics(str(tmp_path))
+
+        assert by_files["primary_language"] == "python"
+        assert by_bytes["primary_language"] == "go"
+        assert by_bytes["detected_languages"]["go"] == {"file_count": 1, "percentage": pytest.approx(9000 / 93),
+                                                       "byte_count": 9000}
+
+    def test_sampling_stops_once_the_share_is_known(self, tmp_path: Path) -> None:
+        for d in range(20):
+            package = tmp_path / f"pkg{d}"
+            package.mkdir()
+            for i in range(100):
+                (package / f"m{i}.py").write_text("")
+        detector = LanguageDetector()
+        detector.sample_margin = 0.05
+        detector.min_sample_files = 200
+
+        stats = detector.get_language_statistics(str(tmp_path))
+
+        assert stats["sampled"] is True
+        assert stats["primary_language"] == "python"
+        assert stats["total_files_analyzed"] < 2000
+
+    def test_statistics_are_cached_per_commit(self, tmp_path: Path) -> None:
+        (tmp_path / "app.py").write_text("")
+        detector = LanguageDetector()
+        first = detector.get_language_statistics(str(tmp_path), commit_sha="a" * 40)
+
+        (tmp_path / "other.js").write_text("")
+        first["detected_languages"]["python"]["file_count"] = 99
+
+        assert detector.get_language_statistics(str(tmp_path), commit_sha="a" * 40)["total_files_analyzed"] == 1
+        assert LanguageDetector().get_languages_above_threshold(str(tmp_path), commit_sha="a" * 40) == {"python": 1.0}
+        assert detector.get_language_statistics(str(tmp_path), commit_sha="b" * 40)["total_files_analyzed"] == 2
+        assert detector.get_language_statistics(str(tmp_path))["total_files_analyzed"] == 2
@@ -0,0 +1,234 @@
+"""Unit tests for rate-limited, concurrent batch LLM report generation.
+
+NO MOCKS - Uses real clocks, real files and a real stand-in CLI process
+(tests/fixtures/llm/stub_llm_cli.py) installed as ``gemini`` on PATH.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli.llm_report import batch_main
+from src.llm.batch_reports import BatchReportGenerator, ReportJob
+from src.llm.rate_limiter import RetryPolicy, TokenBucketLimiter
+from src.llm.report_generator import LLMTransientError, ReportGenerator, ReportGeneratorError
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "llm"
+SCORE_INPUT = FIXTURES / "score_input.json"
+REPO_ROOT = Path(__file__).parent.parent.parent
+FAST_RETRIES = RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.05)
+
+
+@pytest.fixture
+def stub_gemini(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Install the stub CLI as ``gemini``; returns the file logging its calls."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    gemini = bin_dir / "gemini"
+    gemini.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{FIXTURES / "stub_llm_cli.py"}" "$@"\n')
+    gemini.chmod(0o755)
+
+    call_log = tmp_path / "calls.log"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setenv("STUB_LLM_LOG", str(call_log))
+    return call_log
+
+
+def _calls(call_log: Path) -> int:
+    return len(call_log.read_text().splitlines()) if call_log.exists() else 0
+
+
+def _jobs(root: Path, count: int) -> list[ReportJob]:
+    jobs = []
+    for index in range(count):
+        repo_dir = root / f"repo{index}"
+        repo_dir.mkdir(parents=True)
+        score_input = repo_dir / "score_input.json"
+        shutil.copy(SCORE_INPUT, score_input)
+        jobs.append(ReportJob(score_input, repo_dir / "final_report.md"))
+    return jobs
+
+
+class TestTokenBucketLimiter:
+    """Tests for request and token budgets."""
+
+    def test_requests_beyond_the_burst_wait_for_refill(self):
+        limiter = TokenBucketLimiter(requests_per_minute=600, burst_requests=1)
+
+        start = time.monotonic()
+        waits = [limiter.acquire() for _ in range(4)]
+        elapsed = time.monotonic() - start
+
+        assert waits[0] == 0
+        assert 0.27 <= elapsed < 0.6
+
+    def test_token_budget_limits_large_requests(self):
+        limiter = TokenBucketLimiter(tokens_per_minute=6000, burst_tokens=100)
+
+        limiter.acquire(100)
+        waited = limiter.acquire(50)
+
+        assert 0.45 <= waited < 0.8
+
+    def test_charged_tokens_delay_the_next_request(self):
+        limiter = TokenBucketLimiter(tokens_per_minute=6000, burst_tokens=100)
+
+        limiter.acquire(0)
+        limiter.charge(120)
+
+        assert limiter.acquire(0) >= 0.15
+
+    def test_charge_does_not_wait_behind_a_sleeping_acquire(self):
+        limiter = TokenBucketLimiter(requests_per_minute=60, burst_requests=1)
+        limiter.acquire()
+        waiter = threading.Thread(target=limiter.acquire, daemon=True)
+        waiter.start()
+        time.sleep(0.1)
+
+        start = time.monotonic()
+        limiter.charge(10)
+
+        assert time.monotonic() - start < 0.1
+        assert waiter.is_alive()
+
+    def test_unlimited_limiter_never_waits(self):
+        limiter = TokenBucketLimiter()
+
+        assert sum(limiter.acquire(10**6) for _ in range(100)) == 0
+
+    def test_rates_must_be_positive(self):
+        with pytest.raises(ValueError):
+            TokenBucketLimiter(requests_per_minute=0)
+
+
+class TestRetryPolicy:
+    """Tests for jittered exponential backoff."""
+
+    def test_delays_are_bounded_by_the_growing_ceiling(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+        for attempt, ceiling in ((1, 1.0), (2, 2.0), (3, 4.0), (6, 5.0)):
+            delays = [policy.delay(attempt) for _ in range(50)]
+            assert all(0 <= delay <= ceiling for delay in delays)
+        assert len({policy.delay(3) for _ in range(10)}) > 1
+
+    def test_at_least_one_attempt(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestReportGeneratorRetries:
+    """Tests for transient provider failures through the stub CLI."""
+
+    def test_rate_limited_calls_are_retried(self, stub_gemini: Path, monkeypatch: pytest.MonkeyPatch,
+                                            tmp_path: Path):
+        monkeypatch.setenv("STUB_LLM_FAIL_FIRST", "2")
+        generator = ReportGenerator(retry_policy=FAST_RETRIES, show_progress=False)
+
+        result = generator.generate_report(str(SCORE_INPUT), output_path=str(tmp_path / "report.md"))
+
+        assert result['success'] is True
+        assert result['llm_attempts'] == 3
+        assert _calls(stub_gemini) == 3
+
+    def test_retries_give_up_after_max_attempts(self, stub_gemini: Path, monkeypatch: pytest.MonkeyPatch,
+                                                tmp_path: Path):
+        monkeypatch.setenv("STUB_LLM_FAIL_FIRST", "5")
+        generator = ReportGenerator(retry_policy=FAST_RETRIES, show_progress=False)
+
+        with pytest.raises(ReportGeneratorError) as excinfo:
+            generator.generate_report(str(SCORE_INPUT), output_path=str(tmp_path / "report.md"))
+
+        assert isinstance(excinfo.value.__cause__, LLMTransientError)
+        assert _calls(stub_gemini) == 3
+
+
+class TestBatchReportGenerator:
+    """Tests for concurrent batches and checkpoints."""
+
+    def test_reports_are_generated_concurrently(self, stub_gemini: Path, monkeypatch: pytest.MonkeyPatch,
+                                                tmp_path: Path):
+        monkeypatch.setenv("STUB_LLM_DELAY", "1")
+        times = tmp_path / "times.log"
+        monkeypatch.setenv("STUB_LLM_TIMES", str(times))
+        jobs = _jobs(tmp_path / "repos", 4)
+
+        summary = BatchReportGenerator(workers=4).run(jobs)
+
+        assert len(summary.completed) == 4
+        assert all(job.output_path.exists() for job in jobs)
+        assert summary.to_dict()['latency_seconds']['p50'] >= 1
+        # Every call started before any of them finished
+        calls = [tuple(map(float, line.split())) for line in times.read_text().splitlines()]
+        assert len(calls) == 4
+        assert max(start for start, _ in calls) < min(end for _, end in calls)
+
+    def test_shared_limiter_spaces_requests(self, stub_gemini: Path, tmp_path: Path):
+        limiter = TokenBucketLimiter(requests_per_minute=300, burst_requests=1)
+
+        summary = BatchReportGenerator(workers=3, rate_limiter=limiter).run(_jobs(tmp_path / "repos", 3))
+
+        assert len(summary.completed) == 3
+        assert summary.wall_seconds >= 0.4
+
+    def test_checkpoint_skips_unchanged_reports(self, stub_gemini: Path, tmp_path: Path):
+        jobs = _jobs(tmp_path / "repos", 3)
+        checkpoint = tmp_path / "checkpoint.jsonl"
+        BatchReportGenerator(workers=2, checkpoint_path=checkpoint).run(jobs)
+        jobs[0].score_input_path.write_text(jobs[0].score_input_path.read_text() + "\n")
+        jobs[1].output_path.unlink()
+
+        summary = BatchReportGenerator(workers=2, checkpoint_path=checkpoint).run(jobs)
+
+        assert sorted(summary.completed) == [str(jobs[0].score_input_path), str(jobs[1].score_input_path)]
+        assert summary.skipped == [str(jobs[2].score_input_path)]
+        assert _calls(stub_gemini) == 5
+
+    def test_generator_keeps_its_own_limiter_and_policy(self):
+        limiter = TokenBucketLimiter(requests_per_minute=60)
+        generator = ReportGenerator(rate_limiter=limiter, retry_policy=FAST_RETRIES, show_progress=False)
+
+        BatchReportGenerator(generator=generator)
+
+        assert generator.rate_limiter is limiter
+        assert generator.retry_policy is FAST_RETRIES
+
+    def test_failures_are_reported_per_job(self, stub_gemini: Path, tmp_path: Path):
+        jobs = _jobs(tmp_path / "repos", 2)
+        jobs[1].score_input_path.write_text("{not json")
+
+        summary = BatchReportGenerator(workers=2, retry_policy=FAST_RETRIES).run(jobs)
+
+        assert summary.completed == [str(jobs[0].score_input_path)]
+        assert list(summary.failed) == [str(jobs[1].score_input_path)]
+
+
+class TestBatchCommand:
+    """Tests for the llm-batch command."""
+
+    def test_directories_are_searched_for_score_inputs(self, stub_gemini: Path, tmp_path: Path):
+        jobs = _jobs(tmp_path / "repos", 2)
+        checkpoint = tmp_path / "checkpoint.jsonl"
+
+        result = CliRunner().invoke(batch_main, [str(tmp_path / "repos"), "--workers", "2",
+                                                 "--requests-per-minute", "600",
+                                                 "--checkpoint", str(checkpoint)])
+
+        assert result.exit_code == 0, result.output
+        assert all(job.output_path.exists() for job in jobs)
+        assert len(checkpoint.read_text().splitlines()) == 2
+
+    def test_module_entry_point_dispatches_llm_batch(self):
+        result = subprocess.run([sys.executable, "-m", "src.cli.main", "llm-batch", "--help"],
+                                cwd=REPO_ROOT, capture_output=True, text=True, timeout=60)
+
+        assert result.returncode == 0, result.stderr
+        assert "llm-batch [OPTIONS]" in result.stdout
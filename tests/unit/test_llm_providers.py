@@ -0,0 +1,135 @@
+"""Unit tests for the CLI and HTTP LLM provider backends.
+
+NO MOCKS - Uses a real local HTTP server (tests/fixtures/llm/stub_llm_server.py)
+speaking the Gemini and OpenAI-compatible streaming APIs.
+"""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from pydantic import ValidationError
+
+from src.cli.llm_report import main as llm_report
+from src.llm.models.llm_provider_config import LLMProviderConfig
+from src.llm.providers import CLIBackend, HTTPBackend
+from src.llm.rate_limiter import RetryPolicy
+from src.llm.report_generator import LLMTransientError, ReportGenerator
+from tests.fixtures.llm.stub_llm_server import REPORT_CHUNKS, StubLLMServer
+
+SCORE_INPUT = Path(__file__).parent.parent / "fixtures" / "llm" / "score_input.json"
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+
+
+def _config(server: StubLLMServer, api_format: str = "gemini") -> LLMProviderConfig:
+    return LLMProviderConfig.model_validate({
+        **LLMProviderConfig.get_default_configs()["gemini"].model_dump(),
+        "api_base_url": server.base_url,
+        "api_format": api_format,
+    })
+
+
+class TestHTTPBackend:
+    """Tests for requests, streaming and connection reuse."""
+
+    def test_gemini_stream_is_yielded_chunk_by_chunk(self):
+        with StubLLMServer() as server:
+            chunks = list(HTTPBackend().stream("Review this", _config(server)))
+
+        path, headers, body = server.requests[0]
+        assert chunks == REPORT_CHUNKS
+        assert path == "/v1/models/gemini-2.5-pro:streamGenerateContent?alt=sse"
+        assert headers["x-goog-api-key"] == "test-key"
+        assert body["contents"][0]["parts"][0]["text"] == "Review this"
+        assert body["generationConfig"] == {"temperature": 0.1, "maxOutputTokens": 60000}
+
+    def test_openai_compatible_stream(self):
+        with StubLLMServer() as server:
+            response = HTTPBackend().generate("Review this", _config(server, "openai"))
+
+        path, headers, body = server.requests[0]
+        assert response == "".join(REPORT_CHUNKS).strip()
+        assert path == "/v1/chat/completions"
+        assert headers["Authorization"] == "Bearer test-key"
+        assert body["messages"] == [{"role": "user", "content": "Review this"}]
+        assert body["stream"] is True
+
+    @pytest.mark.parametrize("api_format", ["gemini", "openai"])
+    def test_complete_json_responses_are_accepted(self, api_format: str):
+        with StubLLMServer(stream=False) as server:
+            response = HTTPBackend().generate("Review this", _config(server, api_format))
+
+        assert response.startswith("# Code Review Report")
+
+    def test_connections_are_kept_alive_between_calls(self):
+        backend = HTTPBackend()
+        with StubLLMServer() as server:
+            config = _config(server)
+            for _ in range(5):
+                backend.generate("Review this", config)
+            backend.close()
+
+        assert len(server.requests) == 5
+        assert server.connections == 1
+        assert backend.connections_opened == 1
+
+    def test_prompts_larger_than_argv_limits_go_in_the_body(self):
+        prompt = "x" * 3_000_000
+
+        with StubLLMServer() as server:
+            HTTPBackend().generate(prompt, _config(server))
+
+        assert len(server.requests[0][2]["contents"][0]["parts"][0]["text"]) == len(prompt)
+
+    def test_rate_limit_responses_are_transient(self):
+        with StubLLMServer(fail_first=1) as server:
+            with pytest.raises(LLMTransientError, match="HTTP 429"):
+                HTTPBackend().generate("Review this", _config(server))
+
+    def test_unreachable_endpoint_is_reported(self):
+        with StubLLMServer() as server:
+            config = _config(server)
+
+        assert "not reachable" in HTTPBackend().check_available(config)
+        with pytest.raises(LLMTransientError, match="Connection to LLM API failed"):
+            HTTPBackend().generate("Review this", config)
+
+    def test_base_url_must_be_http(self):
+        with pytest.raises(ValidationError, match="http:// or https://"):
+            LLMProviderConfig(provider_name="gemini", cli_command=["gemini"],
+                              api_base_url="ftp://example.com")
+
+
+class TestReportGeneratorBackends:
+    """Tests for backend selection in ReportGenerator."""
+
+    def test_cli_backend_without_endpoint(self):
+        generator = ReportGenerator()
+
+        assert isinstance(generator._backend_for(generator._get_provider_config("gemini", None)), CLIBackend)
+
+    def test_reports_through_http_endpoint_with_retries(self, tmp_path: Path):
+        with StubLLMServer(fail_first=1) as server:
+            generator = ReportGenerator(api_base_url=server.base_url, show_progress=False,
+                                        retry_policy=RetryPolicy(base_delay=0.01))
+            assert generator.validate_prerequisites("gemini")["valid"] is True
+            result = generator.generate_report(str(SCORE_INPUT), output_path=str(tmp_path / "report.md"))
+            generator.close()
+
+        assert result["llm_attempts"] == 2
+        assert "The repository was reviewed." in (tmp_path / "report.md").read_text()
+        assert server.connections == 1
+
+    def test_llm_report_cli_option(self, tmp_path: Path):
+        with StubLLMServer() as server:
+            result = CliRunner().invoke(llm_report, [str(SCORE_INPUT), "--output", str(tmp_path / "report.md"),
+                                                     "--llm-endpoint", server.base_url,
+                                                     "--llm-api-format", "openai"])
+
+        assert result.exit_code == 0, result.output
+        assert server.requests[0][0] == "/v1/chat/completions"
+        assert (tmp_path / "report.md").exists()
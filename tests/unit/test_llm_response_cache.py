@@ -0,0 +1,114 @@
+"""Unit tests for the persistent LLM response cache.
+
+NO MOCKS - Uses real cache directories and a real stand-in CLI process
+(tests/fixtures/llm/stub_llm_cli.py) installed as ``gemini`` on PATH.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli.llm_report import main as llm_report
+from src.llm.report_generator import ReportGenerator
+from src.llm.response_cache import LLMResponseCache
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "llm"
+SCORE_INPUT = FIXTURES / "score_input.json"
+
+
+@pytest.fixture
+def stub_gemini(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Install the stub CLI as ``gemini``; returns the file logging its calls."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    gemini = bin_dir / "gemini"
+    gemini.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{FIXTURES / "stub_llm_cli.py"}" "$@"\n')
+    gemini.chmod(0o755)
+
+    call_log = tmp_path / "calls.log"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setenv("STUB_LLM_LOG", str(call_log))
+    return call_log
+
+
+def _calls(call_log: Path) -> int:
+    return len(call_log.read_text().splitlines()) if call_log.exists() else 0
+
+
+class TestLLMResponseCache:
+    """Tests for keys, expiry and eviction."""
+
+    def test_key_depends_on_prompt_and_settings(self):
+        key = LLMResponseCache.make_key("prompt", "gemini", "gemini-2.5-pro", 0.1, 60000)
+
+        assert key == LLMResponseCache.make_key("prompt", "gemini", "gemini-2.5-pro", 0.1, 60000)
+        assert key != LLMResponseCache.make_key("prompt!", "gemini", "gemini-2.5-pro", 0.1, 60000)
+        assert key != LLMResponseCache.make_key("prompt", "gemini", "gemini-2.5-pro", 0.2, 60000)
+        assert key != LLMResponseCache.make_key("prompt", "gemini", "gemini-2.5-pro", 0.1, 1000)
+
+    def test_responses_survive_a_new_instance(self, tmp_path: Path):
+        LLMResponseCache(tmp_path).put("abc123", "# Report")
+
+        assert LLMResponseCache(tmp_path).get("abc123") == "# Report"
+
+    def test_expired_responses_are_misses(self, tmp_path: Path):
+        cache = LLMResponseCache(tmp_path, ttl_seconds=0.05)
+        cache.put("abc123", "# Report")
+        time.sleep(0.1)
+
+        assert cache.get("abc123") is None
+        assert cache.stats == {"hits": 0, "misses": 1, "evictions": 0}
+        assert list(tmp_path.glob("*/*.json")) == []
+
+    def test_least_recently_used_responses_are_evicted(self, tmp_path: Path):
+        cache = LLMResponseCache(tmp_path, max_bytes=300)
+        for key in ("aa1", "bb2"):
+            cache.put(key, "x" * 100)
+        old = time.time() - 60
+        os.utime(cache._path("aa1"), (old, old))
+        os.utime(cache._path("bb2"), (old + 1, old + 1))
+        cache.get("aa1")
+
+        cache.put("cc3", "x" * 100)
+
+        assert cache.get("bb2") is None
+        assert cache.get("aa1") == "x" * 100
+        assert cache.stats["evictions"] == 1
+
+
+class TestReportGeneratorCache:
+    """Tests for cached report generation through the stub CLI."""
+
+    def test_identical_prompts_call_the_provider_once(self, stub_gemini: Path, tmp_path: Path):
+        generator = ReportGenerator(response_cache=LLMResponseCache(tmp_path / "cache"))
+
+        first = generator.generate_report(str(SCORE_INPUT), output_path=str(tmp_path / "first.md"))
+        second = generator.generate_report(str(SCORE_INPUT), output_path=str(tmp_path / "second.md"))
+
+        assert _calls(stub_gemini) == 1
+        assert first["provider_metadata"]["cache_status"] == "miss"
+        assert second["provider_metadata"]["cache_status"] == "hit"
+        assert "(response cache hit)" in (tmp_path / "second.md").read_text()
+        assert (tmp_path / "first.md").read_text().split("-->")[1] == \
+            (tmp_path / "second.md").read_text().split("-->")[1]
+
+    def test_without_cache_status_is_not_recorded(self, stub_gemini: Path, tmp_path: Path):
+        result = ReportGenerator().generate_report(str(SCORE_INPUT))
+
+        assert result["provider_metadata"]["cache_status"] is None
+        assert _calls(stub_gemini) == 1
+
+    def test_llm_report_cli_option(self, stub_gemini: Path, tmp_path: Path):
+        args = [str(SCORE_INPUT), "--output", str(tmp_path / "report.md"),
+                "--llm-cache", str(tmp_path / "cache")]
+
+        for _ in range(2):
+            result = CliRunner().invoke(llm_report, args)
+            assert result.exit_code == 0, result.output
+
+        assert _calls(stub_gemini) == 1
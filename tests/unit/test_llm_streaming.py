@@ -0,0 +1,139 @@
+"""Unit tests for streamed LLM responses and partial report files.
+
+NO MOCKS - Uses real report files, a real stand-in CLI process
+(tests/fixtures/llm/stub_llm_cli.py) installed as ``gemini`` on PATH and a
+real local HTTP server (tests/fixtures/llm/stub_llm_server.py).
+"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.llm.providers import CLIBackend
+from src.llm.report_generator import ReportGenerator, ReportGeneratorError
+from tests.fixtures.llm.stub_llm_server import StubLLMServer
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "llm"
+SCORE_INPUT = FIXTURES / "score_input.json"
+
+
+@pytest.fixture
+def stub_gemini(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Install the stub CLI as ``gemini``."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    gemini = bin_dir / "gemini"
+    gemini.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{FIXTURES / "stub_llm_cli.py"}" "$@"\n')
+    gemini.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+
+
+def _with_timeout(generator: ReportGenerator, seconds: int) -> ReportGenerator:
+    """Shorten the provider timeout below the 10s the CLI options allow."""
+    config = generator._default_providers["gemini"]
+    generator._default_providers["gemini"] = config.model_copy(update={"timeout_seconds": seconds})
+    return generator
+
+
+class TestStreamedReports:
+    """Tests for incremental output through the CLI backend."""
+
+    def test_cli_output_is_yielded_as_it_is_printed(self, stub_gemini: None,
+                                                    monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("STUB_LLM_CHUNK_DELAY", "0.3")
+        config = ReportGenerator()._get_provider_config("gemini", None)
+
+        arrivals = []
+        start = time.monotonic()
+        for chunk in CLIBackend().stream("Review this", config):
+            arrivals.append((time.monotonic() - start, chunk))
+
+        assert len(arrivals) >= 3
+        assert arrivals[0][1].startswith("# Code Review Report")
+        assert arrivals[-1][0] - arrivals[0][0] >= 0.5
+
+    def test_partial_file_grows_and_is_removed_when_done(self, stub_gemini: None,
+                                                         monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        monkeypatch.setenv("STUB_LLM_CHUNK_DELAY", "0.5")
+        output = tmp_path / "final_report.md"
+        partial = tmp_path / "final_report.md.partial"
+        thread = threading.Thread(target=ReportGenerator(show_progress=False).generate_report,
+                                  args=(str(SCORE_INPUT), str(output)))
+        thread.start()
+
+        seen_partial = ""
+        while thread.is_alive() and not seen_partial:
+            if partial.exists():
+                seen_partial = partial.read_text()
+            time.sleep(0.02)
+        thread.join()
+
+        assert seen_partial.startswith("# Code Review Report")
+        assert output.read_text().split("-->")[1].strip().startswith("# Code Review Report")
+        assert not partial.exists()
+
+    def test_time_to_first_byte_is_recorded(self, stub_gemini: None,
+                                            monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        monkeypatch.setenv("STUB_LLM_DELAY", "0.3")
+        monkeypatch.setenv("STUB_LLM_CHUNK_DELAY", "0.3")
+
+        result = ReportGenerator().generate_report(str(SCORE_INPUT), str(tmp_path / "report.md"))
+
+        metadata = result["provider_metadata"]
+        assert 0.3 <= metadata["time_to_first_byte_seconds"] < metadata["response_time_seconds"]
+
+    def test_timeout_keeps_partial_text_with_marker(self, stub_gemini: None,
+                                                    monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        monkeypatch.setenv("STUB_LLM_CHUNK_DELAY", "5")
+        output = tmp_path / "final_report.md"
+        generator = _with_timeout(ReportGenerator(show_progress=False), 1)
+
+        with pytest.raises(ReportGeneratorError, match="partial report kept in"):
+            generator.generate_report(str(SCORE_INPUT), str(output))
+
+        content = Path(f"{output}.partial").read_text()
+        assert content.startswith("# Code Review Report")
+        assert "<!-- INCOMPLETE REPORT: LLM call timed out after 1s" in content
+        assert not output.exists()
+
+    def test_failed_save_keeps_streamed_text_with_marker(self, stub_gemini: None, tmp_path: Path):
+        output = tmp_path / "final_report.md"
+        output.mkdir()
+
+        with pytest.raises(ReportGeneratorError, match="partial report kept in"):
+            ReportGenerator(show_progress=False).generate_report(str(SCORE_INPUT), str(output))
+
+        content = Path(f"{output}.partial").read_text()
+        assert content.startswith("# Code Review Report")
+        assert "<!-- INCOMPLETE REPORT: report could not be saved" in content
+
+    def test_failure_before_any_text_leaves_no_partial(self, stub_gemini: None,
+                                                       monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        monkeypatch.setenv("STUB_LLM_LOG", str(tmp_path / "calls.log"))
+        monkeypatch.setenv("STUB_LLM_FAIL_FIRST", "1")
+        output = tmp_path / "final_report.md"
+
+        with pytest.raises(ReportGeneratorError, match="exit 1"):
+            ReportGenerator().generate_report(str(SCORE_INPUT), str(output))
+
+        assert list(tmp_path.glob("final_report.md*")) == []
+
+
+class TestStreamedHTTPReports:
+    """Tests for incremental output through the HTTP backend."""
+
+    def test_http_stream_records_time_to_first_byte(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+        with StubLLMServer(chunk_delay=0.2) as server:
+            generator = ReportGenerator(api_base_url=server.base_url, show_progress=False)
+            result = generator.generate_report(str(SCORE_INPUT), str(tmp_path / "report.md"))
+            generator.close()
+
+        metadata = result["provider_metadata"]
+        assert 0.2 <= metadata["time_to_first_byte_seconds"] < metadata["response_time_seconds"]
+        assert not (tmp_path / "report.md.partial").exists()
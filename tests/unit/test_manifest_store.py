@@ -0,0 +1,125 @@
+"""Unit tests for per-analysis manifest parsing.
+
+NO MOCKS - Uses real manifest files and the real config parsers.
+"""
+
+from pathlib import Path
+
+import pytest
+import tomli
+
+from src.metrics.config_parsers import toml_parser, xml_parser
+from src.metrics.manifest_store import ManifestStore
+from src.metrics.parse_cache import ParseCache, set_parse_cache
+from src.metrics.test_infrastructure_analyzer import TestInfrastructureAnalyzer
+
+PYPROJECT = '[tool.pytest.ini_options]\naddopts = "-q"\n[tool.coverage.run]\nbranch = true\n'
+POM_NAMESPACE = "http://maven.apache.org/POM/4.0.0"
+
+
+def _pom(plugins: list[tuple[str, str]], modules: int = 0, tail: str = "</project>") -> str:
+    plugin_xml = "".join(
+        f"<plugin><groupId>{group}</groupId><artifactId>{artifact}</artifactId></plugin>"
+        for group, artifact in plugins
+    )
+    module_xml = "".join(f"<module>module-{i}</module>" for i in range(modules))
+    return (f'<project xmlns="{POM_NAMESPACE}"><build><plugins>{plugin_xml}</plugins></build>'
+            f"<modules>{module_xml}</modules>{tail}")
+
+
+@pytest.fixture(autouse=True)
+def fresh_parse_cache():
+    set_parse_cache(ParseCache())
+    yield
+    set_parse_cache(None)
+
+
+class TestManifestStore:
+    """Tests for reading and parsing each manifest once."""
+
+    def test_documents_are_parsed_once(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text(PYPROJECT)
+        store = ManifestStore(tmp_path)
+
+        document = store.toml("pyproject.toml")
+        (tmp_path / "pyproject.toml").write_text("changed = true\n")
+
+        assert store.toml(tmp_path / "pyproject.toml") is document
+        assert toml_parser.verify_pytest_section(tmp_path / "pyproject.toml", store)[0] is True
+        assert toml_parser.verify_coverage_section(tmp_path / "pyproject.toml", store)[0] is True
+
+    def test_parse_errors_are_raised_on_every_access(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text("[tool\n")
+        store = ManifestStore(tmp_path)
+
+        for _ in range(2):
+            with pytest.raises(tomli.TOMLDecodeError):
+                store.toml("pyproject.toml")
+        assert toml_parser.verify_pytest_section(tmp_path / "pyproject.toml", store)[1].startswith("TOML parse error")
+
+    def test_existence_comes_from_one_directory_listing(self, tmp_path: Path):
+        (tmp_path / "go.mod").write_text("module x\n")
+        store = ManifestStore(tmp_path)
+
+        assert store.exists("go.mod") is True
+        (tmp_path / "pom.xml").write_text("<project/>")
+
+        assert store.exists("pom.xml") is False
+        assert ManifestStore(tmp_path).exists("pom.xml") is True
+
+
+    def test_relative_repository_paths(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "pyproject.toml").write_text(PYPROJECT)
+        monkeypatch.chdir(tmp_path)
+
+        assert toml_parser.verify_pytest_section(Path("sub/pyproject.toml"))[0] is True
+        assert ManifestStore(Path("sub")).toml("pyproject.toml") == ManifestStore("sub").toml("sub/pyproject.toml")
+        assert TestInfrastructureAnalyzer()._detect_test_config(Path("sub"), "python") is True
+
+
+class TestPomScan:
+    """Tests for the streaming pom.xml plugin scan."""
+
+    def test_namespaced_plugins_are_found(self, tmp_path: Path):
+        (tmp_path / "pom.xml").write_text(_pom([
+            ("org.apache.maven.plugins", "maven-surefire-plugin"), ("org.JaCoCo", "jacoco-maven-plugin")
+        ]))
+
+        assert ManifestStore(tmp_path).pom_plugins("pom.xml") == {"surefire": True, "jacoco": True}
+        assert xml_parser.verify_jacoco_plugin(tmp_path / "pom.xml") == (True, "Found jacoco-maven-plugin in pom.xml")
+
+    def test_scan_stops_once_all_plugins_are_found(self, tmp_path: Path):
+        # The unclosed tail is never reached
+        (tmp_path / "pom.xml").write_text(_pom(
+            [("a", "maven-surefire-plugin"), ("org.jacoco", "jacoco-maven-plugin")], modules=5000, tail="<broken"
+        ))
+
+        assert xml_parser.verify_surefire_plugin(tmp_path / "pom.xml") == (True, "Found maven-surefire-plugin in pom.xml")
+
+    def test_missing_plugin_reads_the_whole_pom(self, tmp_path: Path):
+        (tmp_path / "pom.xml").write_text(_pom([("a", "maven-surefire-plugin")], tail="<broken"))
+
+        verified, message = xml_parser.verify_jacoco_plugin(tmp_path / "pom.xml")
+
+        assert verified is False and message.startswith("XML parse error")
+
+    def test_empty_artifact_ids_are_skipped(self, tmp_path: Path):
+        (tmp_path / "pom.xml").write_text(_pom([("a", ""), ("b", "maven-surefire-plugin")]))
+
+        assert xml_parser.verify_surefire_plugin(tmp_path / "pom.xml")[0] is True
+
+
+class TestAnalyzerSharesManifests:
+    """Tests for one store per test infrastructure analysis."""
+
+    def test_polyglot_analysis_detects_configs_of_every_language(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text(PYPROJECT)
+        (tmp_path / "pom.xml").write_text(_pom([("org.jacoco", "jacoco-maven-plugin")]))
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_app.py").write_text("def test_ok(): pass\n")
+
+        result = TestInfrastructureAnalyzer(enable_ci_analysis=False).analyze(str(tmp_path), ["java", "python"])
+
+        assert result.static_infrastructure.test_config_detected is True
+        assert result.static_infrastructure.coverage_config_detected is True
@@ -0,0 +1,83 @@
+"""Unit tests for running tools for every language of a polyglot repository.
+
+NO MOCKS - Executes the real tool runners against a real temporary repository.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.metrics.language_detection import LanguageDetector
+from src.metrics.models.repository import Repository
+from src.metrics.output_generators import OutputFormat
+from src.metrics.tool_executor import ToolExecutor
+
+
+@pytest.fixture
+def polyglot_repo(tmp_path: Path) -> Path:
+    """Go backend and Python ML service in one repository."""
+    (tmp_path / "README.md").write_text("# Full stack\n\nInstall and usage example.\n")
+    backend = tmp_path / "backend"
+    backend.mkdir()
+    (backend / "go.mod").write_text("module example.com/backend\n\ngo 1.21\n")
+    for i in range(4):
+        (backend / f"handler{i}.go").write_text(f"package main\n\nfunc Handler{i}() {{}}\n")
+    ml = tmp_path / "ml"
+    ml.mkdir()
+    for i in range(4):
+        (ml / f"model{i}.py").write_text(f"def predict{i}():\n    return {i}\n")
+    return tmp_path
+
+
+class TestMultiLanguageExecution:
+    """Tests for per-language sections under one shared time budget."""
+
+    def test_all_languages_above_threshold_are_analyzed(self, polyglot_repo: Path):
+        languages = LanguageDetector().get_languages_above_threshold(str(polyglot_repo))
+        assert set(languages) == {"go", "python"}
+
+        metrics = ToolExecutor(timeout_seconds=60).execute_tools("go", str(polyglot_repo), languages=languages)
+
+        assert metrics.language_metrics["go"].code_quality == metrics.code_quality
+        for language in metrics.language_metrics:
+            assert metrics.language_metrics[language].share == languages[language]
+        assert set(metrics.language_metrics) == set(languages)
+
+    def test_single_language_has_no_per_language_sections(self, polyglot_repo: Path):
+        metrics = ToolExecutor(timeout_seconds=60).execute_tools("python", str(polyglot_repo))
+
+        assert metrics.language_metrics == {}
+
+    def test_languages_share_one_time_budget(self, polyglot_repo: Path):
+        languages = {"python": 0.5, "go": 0.5}
+
+        metrics = ToolExecutor(timeout_seconds=6).execute_tools("python", str(polyglot_repo), languages=languages)
+
+        # Two languages must not take two budgets
+        assert metrics.execution_metadata.duration_seconds < 6 + 2
+
+    def test_plan_dedupes_shared_runners_and_skips_unknown(self):
+        executor = ToolExecutor()
+
+        plan = executor._plan_languages("typescript", {"javascript": 0.3, "rust": 0.3, "go": 0.2})
+
+        assert [language for language, _ in plan] == ["typescript", "go"]
+
+    def test_parallel_workers_are_capped(self):
+        executor = ToolExecutor()
+
+        assert executor._parallel_workers(1) == 3
+        assert 3 <= executor._parallel_workers(4) <= 12
+
+    def test_per_language_sections_in_submission(self, polyglot_repo: Path):
+        metrics = ToolExecutor(timeout_seconds=60).execute_tools(
+            "python", str(polyglot_repo), languages={"python": 0.4, "go": 0.3}
+        )
+        repository = Repository(url="https://example.com/app.git", detected_language="python")
+
+        output = json.loads(OutputFormat().export_json(repository, metrics))
+
+        assert set(output["metrics"]["languages"]) == {"python", "go"}
+        assert output["metrics"]["languages"]["go"]["share"] == 0.3
+        assert "## Languages" in OutputFormat().export_markdown(repository, metrics)
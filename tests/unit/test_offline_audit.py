@@ -0,0 +1,257 @@
+"""Unit tests for the offline OSV dependency audit.
+
+NO MOCKS - Parses real lockfiles written to temporary repositories and
+matches them against a real advisory snapshot on disk.
+"""
+
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from src.metrics.offline_audit import (
+    AdvisoryDatabase,
+    Dependency,
+    OfflineAuditor,
+    collect_dependencies,
+    load_advisory_database,
+    version_key,
+)
+from src.metrics.tool_executor import ToolExecutor
+
+ADVISORIES = [
+    {
+        "id": "GHSA-requests-1",
+        "aliases": ["CVE-2023-32681"],
+        "database_specific": {"severity": "MODERATE"},
+        "affected": [{
+            "package": {"ecosystem": "PyPI", "name": "requests"},
+            "ranges": [{"type": "ECOSYSTEM", "events": [{"introduced": "2.3.0"}, {"fixed": "2.31.0"}]}],
+        }],
+    },
+    {
+        "id": "GHSA-jinja-1",
+        "database_specific": {"severity": "HIGH"},
+        "affected": [{
+            "package": {"ecosystem": "PyPI", "name": "Jinja2"},
+            "ranges": [{"type": "ECOSYSTEM", "events": [{"introduced": "0"}, {"last_affected": "3.1.2"}]}],
+        }],
+    },
+    {
+        "id": "GHSA-lodash-1",
+        "database_specific": {"severity": "CRITICAL"},
+        "affected": [{
+            "package": {"ecosystem": "npm", "name": "lodash"},
+            "ranges": [{"type": "SEMVER", "events": [{"introduced": "0"}, {"fixed": "4.17.21"}]}],
+        }],
+    },
+    {
+        "id": "GO-2022-0001",
+        "affected": [{
+            "package": {"ecosystem": "Go", "name": "golang.org/x/text"},
+            "ranges": [{"type": "SEMVER", "events": [{"introduced": "0"}, {"fixed": "0.3.8"}]}],
+        }],
+    },
+    {
+        "id": "GHSA-log4j-1",
+        "aliases": ["CVE-2021-44228"],
+        "database_specific": {"severity": "CRITICAL"},
+        "affected": [{
+            "package": {"ecosystem": "Maven", "name": "org.apache.logging.log4j:log4j-core"},
+            "ranges": [{"type": "ECOSYSTEM", "events": [{"introduced": "2.0-beta9"}, {"fixed": "2.15.0"}]}],
+        }],
+    },
+    {
+        "id": "GHSA-withdrawn",
+        "withdrawn": "2023-01-01T00:00:00Z",
+        "affected": [{"package": {"ecosystem": "PyPI", "name": "flask"}, "versions": ["2.0.0"]}],
+    },
+]
+
+
+@pytest.fixture
+def advisory_dir(tmp_path: Path) -> Path:
+    """OSV export layout: one JSON document per advisory."""
+    database = tmp_path / "osv"
+    database.mkdir()
+    for advisory in ADVISORIES:
+        (database / f"{advisory['id']}.json").write_text(json.dumps(advisory))
+    return database
+
+
+@pytest.fixture
+def locked_repo(tmp_path: Path) -> Path:
+    """Repository with one lockfile or manifest per supported format."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "requirements.txt").write_text("requests==2.28.0  # pinned\nflask==2.0.0\nclick>=8\n")
+    (repo / "poetry.lock").write_text(
+        '[[package]]\nname = "jinja2"\nversion = "3.1.2"\n\n[[package]]\nname = "markupsafe"\nversion = "2.1.3"\n'
+    )
+    (repo / "package-lock.json").write_text(json.dumps({
+        "lockfileVersion": 3,
+        "packages": {
+            "": {"name": "app"},
+            "node_modules/lodash": {"version": "4.17.20"},
+            "node_modules/@scope/pkg": {"version": "1.0.0"},
+        },
+    }))
+    (repo / "web").mkdir()
+    (repo / "web" / "yarn.lock").write_text(
+        '# yarn lockfile v1\n\n"lodash@^4.17.0", lodash@^4.17.15:\n  version "4.17.21"\n  resolved "x"\n'
+    )
+    (repo / "go.sum").write_text(
+        "golang.org/x/text v0.3.7 h1:abc=\ngolang.org/x/text v0.3.7/go.mod h1:def=\n"
+    )
+    (repo / "pom.xml").write_text(
+        '<project xmlns="http://maven.apache.org/POM/4.0.0"><properties><log4j.version>2.14.1</log4j.version>'
+        '</properties><dependencies><dependency><groupId>org.apache.logging.log4j</groupId>'
+        '<artifactId>log4j-core</artifactId><version>${log4j.version}</version></dependency>'
+        '</dependencies></project>'
+    )
+    (repo / "node_modules" / "lodash").mkdir(parents=True)
+    (repo / "node_modules" / "lodash" / "package-lock.json").write_text("{}")
+    return repo
+
+
+class TestVersionKey:
+    """Tests for cross-ecosystem version ordering."""
+
+    @pytest.mark.parametrize("lower, higher", [
+        ("1.0", "1.0.1"),
+        ("1.0rc1", "1.0"),
+        ("1.0.0-beta.2", "1.0.0"),
+        ("v0.3.7", "0.3.8"),
+        ("2.0-beta9", "2.14.1"),
+        ("1.9", "1.10"),
+        ("1.0", "1.0.post1"),
+        ("1.0.post1", "1.0.1"),
+        ("1.0.dev1", "1.0a1"),
+        ("1.0a2", "1.0b1"),
+        ("2.0.0-rc1", "2.0.0.RELEASE"),
+        ("2.0.0-M3", "2.0.0-RC1"),
+        ("3.1.0-SNAPSHOT", "3.1.0"),
+        ("5.3.0", "5.3.0-SP1"),
+        ("2.0.0.RELEASE", "2.0.1.RELEASE"),
+    ])
+    def test_ordering(self, lower: str, higher: str):
+        assert version_key(lower) < version_key(higher)
+
+    def test_equivalent_spellings(self):
+        assert version_key("v1.2.0") == version_key("1.2") == version_key("1.2.0+build.5")
+        assert version_key("5.3.0.Final") == version_key("5.3.0") == version_key("5.3.0-GA")
+        assert version_key("1.0a1") == version_key("1.0-alpha1")
+
+
+class TestCollectDependencies:
+    """Tests for lockfile and manifest parsing."""
+
+    def test_all_formats_are_parsed(self, locked_repo: Path):
+        found = {(dep.ecosystem, dep.name, dep.version) for dep in collect_dependencies(locked_repo)}
+
+        assert {
+            ("PyPI", "requests", "2.28.0"),
+            ("PyPI", "jinja2", "3.1.2"),
+            ("npm", "lodash", "4.17.20"),
+            ("npm", "@scope/pkg", "1.0.0"),
+            ("npm", "lodash", "4.17.21"),
+            ("Go", "golang.org/x/text", "v0.3.7"),
+            ("Maven", "org.apache.logging.log4j:log4j-core", "2.14.1"),
+        } <= found
+        # Unpinned requirements are not resolved versions
+        assert not any(name == "click" for _, name, _ in found)
+
+    def test_duplicates_and_vendored_files_are_skipped(self, locked_repo: Path):
+        dependencies = collect_dependencies(locked_repo)
+
+        assert sum(1 for dep in dependencies if dep.name == "golang.org/x/text") == 1
+        assert not any(dep.source.startswith("node_modules") for dep in dependencies)
+
+    def test_ecosystem_filter(self, locked_repo: Path):
+        dependencies = collect_dependencies(locked_repo, ecosystems=("Go",))
+
+        assert {dep.ecosystem for dep in dependencies} == {"Go"}
+
+    def test_unparseable_lockfile_is_ignored(self, tmp_path: Path):
+        (tmp_path / "package-lock.json").write_text("{not json")
+        (tmp_path / "requirements.txt").write_text("six==1.16.0\n")
+
+        assert [dep.name for dep in collect_dependencies(tmp_path)] == ["six"]
+
+
+class TestAdvisoryDatabase:
+    """Tests for indexed advisory lookup."""
+
+    def test_range_matching(self, advisory_dir: Path):
+        database = AdvisoryDatabase.load(advisory_dir)
+
+        assert [m["id"] for m in database.lookup(Dependency("PyPI", "requests", "2.28.0", "r.txt"))] == ["GHSA-requests-1"]
+        assert database.lookup(Dependency("PyPI", "requests", "2.31.0", "r.txt")) == []
+        assert database.lookup(Dependency("PyPI", "requests", "2.2.0", "r.txt")) == []
+
+    def test_post_releases_of_the_fix_are_not_affected(self, advisory_dir: Path):
+        database = AdvisoryDatabase.load(advisory_dir)
+
+        assert database.lookup(Dependency("PyPI", "requests", "2.31.0rc1", "r.txt"))
+        assert database.lookup(Dependency("PyPI", "requests", "2.31.0.post1", "r.txt")) == []
+
+    def test_last_affected_is_inclusive_and_names_are_normalized(self, advisory_dir: Path):
+        database = AdvisoryDatabase.load(advisory_dir)
+
+        assert database.lookup(Dependency("PyPI", "jinja2", "3.1.2", "poetry.lock"))
+        assert not database.lookup(Dependency("PyPI", "jinja2", "3.1.3", "poetry.lock"))
+
+    def test_withdrawn_advisories_are_ignored(self, advisory_dir: Path):
+        database = AdvisoryDatabase.load(advisory_dir)
+
+        assert database.advisory_count == len(ADVISORIES) - 1
+        assert database.lookup(Dependency("PyPI", "flask", "2.0.0", "r.txt")) == []
+
+    def test_zip_export_is_loaded(self, tmp_path: Path):
+        export = tmp_path / "all.zip"
+        with zipfile.ZipFile(export, "w") as archive:
+            for advisory in ADVISORIES:
+                archive.writestr(f"{advisory['id']}.json", json.dumps(advisory))
+
+        assert AdvisoryDatabase.load(export).advisory_count == len(ADVISORIES) - 1
+
+    def test_snapshot_is_loaded_once_per_process(self, advisory_dir: Path):
+        assert load_advisory_database(advisory_dir) is load_advisory_database(advisory_dir)
+
+    def test_missing_snapshot_raises(self, tmp_path: Path):
+        with pytest.raises(FileNotFoundError):
+            AdvisoryDatabase.load(tmp_path / "missing")
+
+
+class TestOfflineAuditor:
+    """Tests for the dependency_audit result."""
+
+    def test_audit_fills_dependency_audit_shape(self, advisory_dir: Path, locked_repo: Path):
+        result = OfflineAuditor.from_path(advisory_dir).audit(locked_repo)
+
+        assert result["tool_used"] == "osv-offline"
+        assert {v["id"] for v in result["vulnerabilities"]} == {
+            "GHSA-requests-1", "GHSA-jinja-1", "GHSA-lodash-1", "GO-2022-0001", "GHSA-log4j-1"
+        }
+        assert result["vulnerabilities_found"] == 5
+        assert result["high_severity_count"] == 3
+
+    def test_language_restricts_ecosystems(self, advisory_dir: Path, locked_repo: Path):
+        result = OfflineAuditor.from_path(advisory_dir).audit(locked_repo, language="go")
+
+        assert [v["id"] for v in result["vulnerabilities"]] == ["GO-2022-0001"]
+
+    def test_executor_uses_snapshot_instead_of_online_tools(self, advisory_dir: Path, locked_repo: Path):
+        (locked_repo / "app.py").write_text("import requests\n")
+        executor = ToolExecutor(timeout_seconds=60, advisory_db=str(advisory_dir))
+        executor.analyze_subprojects = False
+
+        metrics = executor.execute_tools("python", str(locked_repo))
+
+        audit = metrics.code_quality.dependency_audit
+        assert audit["tool_used"] == "osv-offline"
+        assert audit["vulnerabilities_found"] == 2
+        issues = {issue.affected_package: issue for issue in metrics.code_quality.security_issues}
+        assert issues["requests"].cve_id == "CVE-2023-32681"
+        assert issues["jinja2"].severity == "high"
@@ -0,0 +1,170 @@
+"""Unit tests for the shared package manager caches.
+
+NO MOCKS - Uses real cache directories, real file locks and real builds.
+"""
+
+import fcntl
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.metrics.jvm_daemons import JvmDaemonPool
+from src.metrics.models.repository import Repository
+from src.metrics.output_generators import OutputFormat
+from src.metrics.package_cache import CACHE_DIRS, PackageCache
+from src.metrics.tool_executor import ToolExecutor
+
+
+def _write_entry(path: Path, size: int, age_seconds: float) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    timestamp = time.time() - age_seconds
+    os.utime(path, (timestamp, timestamp))
+
+
+class TestPackageCacheEnvironment:
+    """Tests for directing package managers at the shared root."""
+
+    def test_cache_directories_are_created(self, tmp_path: Path):
+        cache = PackageCache(tmp_path / "cache")
+
+        assert all((cache.root / name).is_dir() for name in CACHE_DIRS)
+
+    def test_environment_points_at_root(self, tmp_path: Path):
+        env = PackageCache(tmp_path).environment()
+
+        assert env["npm_config_cache"] == str(tmp_path / "npm")
+        assert env["UV_CACHE_DIR"] == str(tmp_path / "uv")
+        assert env["GOMODCACHE"] == str(tmp_path / "go-mod")
+        assert env["GOCACHE"] == str(tmp_path / "go-build")
+        assert f"-Dmaven.repo.local={tmp_path / 'm2' / 'repository'}" in env["MAVEN_OPTS"]
+        assert "UV_OFFLINE" not in env
+
+    def test_offline_environment(self, tmp_path: Path):
+        env = PackageCache(tmp_path, offline=True).environment()
+
+        assert env["npm_config_offline"] == "true"
+        assert env["UV_OFFLINE"] == "1"
+        assert env["GOPROXY"] == "off"
+        assert "GOFLAGS" not in env  # -mod=mod would let Go rewrite go.mod/go.sum
+        assert "--offline" in env["MAVEN_ARGS"]
+
+    def test_activate_and_deactivate_restore_environment(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv("UV_CACHE_DIR", "/previous")
+        monkeypatch.delenv("GOMODCACHE", raising=False)
+        cache = PackageCache(tmp_path)
+
+        cache.activate()
+        assert os.environ["UV_CACHE_DIR"] == str(tmp_path / "uv")
+        assert os.environ["GOMODCACHE"] == str(tmp_path / "go-mod")
+        cache.deactivate()
+
+        assert os.environ["UV_CACHE_DIR"] == "/previous"
+        assert "GOMODCACHE" not in os.environ
+
+    def test_jvm_pool_offline_flag(self, tmp_path: Path):
+        pool = JvmDaemonPool(tmp_path, use_mvnd=False, offline=True)
+
+        assert "--offline" in pool.maven_command(["compile"])
+        assert "--offline" in pool.gradle_command(["compileJava"])
+
+
+class TestPackageCacheAccounting:
+    """Tests for hit statistics and eviction."""
+
+    def test_build_adding_packages_is_a_miss(self, tmp_path: Path):
+        cache = PackageCache(tmp_path)
+
+        with cache.track("go") as usage:
+            (tmp_path / "go-mod" / "github.com").mkdir()
+            (tmp_path / "go-mod" / "github.com" / "gin.zip").write_bytes(b"x" * 2048)
+        time.sleep(0.05)  # file times come from a coarse clock
+        with cache.track("go") as second:
+            pass
+
+        assert usage["hit"] is False
+        assert usage["bytes_downloaded"] == 2048
+        assert second["hit"] is True
+        report = cache.report()
+        assert (report["builds"], report["hits"], report["hit_rate"]) == (2, 1, 0.5)
+
+    def test_only_files_added_during_the_build_are_measured(self, tmp_path: Path):
+        cache = PackageCache(tmp_path)
+        _write_entry(tmp_path / "npm" / "_cacache" / "content" / "old", 4096, age_seconds=3600)
+        os.utime(tmp_path / "npm" / "_cacache" / "content", (time.time() - 3600,) * 2)
+        time.sleep(0.05)
+
+        with cache.track("javascript") as usage:
+            (tmp_path / "npm" / "_cacache" / "content" / "new").write_bytes(b"x" * 100)
+
+        assert usage["bytes_downloaded"] == 100
+
+    def test_other_languages_caches_are_not_attributed(self, tmp_path: Path):
+        cache = PackageCache(tmp_path)
+
+        with cache.track("python") as usage:
+            (tmp_path / "npm" / "index").write_bytes(b"x" * 100)
+
+        assert usage["hit"] is True
+
+    def test_eviction_removes_least_recently_used_entries(self, tmp_path: Path):
+        cache = PackageCache(tmp_path, max_size_mb=0.003)  # ~3 KB
+        _write_entry(tmp_path / "uv" / "archive-v0" / "old", 2048, age_seconds=300)
+        _write_entry(tmp_path / "npm" / "_cacache" / "middle", 1024, age_seconds=200)
+        _write_entry(tmp_path / "go-mod" / "cache" / "new", 1024, age_seconds=0)
+
+        removed = cache.evict()
+
+        assert removed == 2048
+        assert not (tmp_path / "uv" / "archive-v0" / "old").exists()
+        assert (tmp_path / "npm" / "_cacache" / "middle").exists()
+        assert cache.report()["evictions"] == 1
+
+    def test_eviction_is_skipped_while_a_build_holds_the_cache(self, tmp_path: Path):
+        cache = PackageCache(tmp_path, max_size_mb=0.001)
+        _write_entry(tmp_path / "pip" / "http" / "wheel", 4096, age_seconds=60)
+
+        with open(tmp_path / ".lock", "a+") as other_process_build:
+            fcntl.flock(other_process_build, fcntl.LOCK_SH)
+            assert cache.evict() == 0
+            fcntl.flock(other_process_build, fcntl.LOCK_UN)
+
+        assert cache.evict() == 4096
+
+    def test_background_eviction_runs_at_most_once_per_interval(self, tmp_path: Path):
+        cache = PackageCache(tmp_path, max_size_mb=0.001, evict_interval_seconds=3600)
+        _write_entry(tmp_path / "pip" / "http" / "wheel", 4096, age_seconds=60)
+
+        assert cache.maybe_evict() is True
+        assert cache.maybe_evict() is False
+        cache.evict(blocking=True)
+
+        assert not (tmp_path / "pip" / "http" / "wheel").exists()
+        assert cache.report()["evictions"] == 1
+
+    def test_invalid_size_limit(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            PackageCache(tmp_path, max_size_mb=0)
+
+
+class TestExecutorWithPackageCache:
+    """Tests for builds run by ToolExecutor against the cache."""
+
+    def test_build_usage_in_submission(self, tmp_path: Path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / "app.py").write_text("print('hello')\n")
+        executor = ToolExecutor(timeout_seconds=60, package_cache=PackageCache(tmp_path / "cache"))
+        executor.analyze_subprojects = False
+
+        metrics = executor.execute_tools("python", str(repo))
+        repository = Repository(url="https://example.com/app.git", detected_language="python")
+        output = json.loads(OutputFormat().export_json(repository, metrics))
+
+        usage = output["execution"]["package_cache"]
+        assert usage["builds"] == 1
+        assert usage["hits"] == 1
+        assert usage["bytes_downloaded"] == 0
@@ -0,0 +1,107 @@
+"""Unit tests for the content-hash parse cache.
+
+NO MOCKS - Uses real configuration files, real parsers and real cache directories.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.metrics.ci_parsers.github_actions_parser import GitHubActionsParser
+from src.metrics.config_parsers import json_parser, toml_parser, xml_parser
+from src.metrics.parse_cache import ParseCache, get_parse_cache, set_parse_cache
+
+WORKFLOW = "jobs:\n  test:\n    steps:\n      - run: pytest --cov=src tests/\n"
+PYPROJECT = '[tool.pytest.ini_options]\naddopts = "-q"\n[tool.coverage.run]\nbranch = true\n'
+
+
+@pytest.fixture
+def cache():
+    cache = ParseCache()
+    set_parse_cache(cache)
+    yield cache
+    set_parse_cache(None)
+
+
+def _write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+class TestParseCache:
+    """Tests for content keyed results and LRU bounds."""
+
+    def test_identical_files_are_parsed_once(self, cache: ParseCache, tmp_path: Path):
+        first = _write(tmp_path / "a" / "pyproject.toml", PYPROJECT)
+        second = _write(tmp_path / "b" / "pyproject.toml", PYPROJECT)
+
+        assert toml_parser.verify_pytest_section(first)[0] is True
+        assert toml_parser.verify_pytest_section(second)[0] is True
+        assert cache.stats == {"hits": 1, "disk_hits": 0, "misses": 1}
+
+    def test_changed_content_is_parsed_again(self, cache: ParseCache, tmp_path: Path):
+        package = _write(tmp_path / "package.json", '{"scripts": {"test": "jest"}}')
+        assert json_parser.verify_test_script(package)[0] is True
+
+        package.write_text('{"scripts": {}}')
+
+        assert json_parser.verify_test_script(package) == (False, "Missing scripts.test key in package.json")
+
+    def test_file_name_is_part_of_the_key(self, cache: ParseCache, tmp_path: Path):
+        config = '{"coverageThreshold": {}}'
+
+        assert json_parser.verify_coverage_threshold(_write(tmp_path / "jest.config.json", config))[1] == \
+            "Found coverageThreshold in jest.config.json"
+        assert json_parser.verify_coverage_threshold(_write(tmp_path / "jest.ci.json", config))[1] == \
+            "Found coverageThreshold in jest.ci.json"
+
+    def test_parse_errors_are_cached_as_verdicts(self, cache: ParseCache, tmp_path: Path):
+        pom = _write(tmp_path / "pom.xml", "<project><build>")
+
+        verified, message = xml_parser.verify_surefire_plugin(pom)
+
+        assert verified is False and message.startswith("XML parse error")
+        assert xml_parser.verify_surefire_plugin(pom) == (verified, message)
+        assert cache.stats["hits"] == 1
+
+    def test_least_recently_used_entries_are_dropped(self, tmp_path: Path):
+        cache = ParseCache(max_entries=2)
+        files = [_write(tmp_path / f"f{i}.txt", str(i)) for i in range(3)]
+
+        for path in files:
+            cache.get("length", path, len)
+        cache.get("length", files[0], len)
+
+        assert cache.stats["misses"] == 4
+
+
+class TestPersistentParseCache:
+    """Tests for results shared between processes through the cache directory."""
+
+    def test_ci_parse_results_survive_a_restart(self, tmp_path: Path):
+        workflow = _write(tmp_path / "repo" / ".github" / "workflows" / "ci.yml", WORKFLOW)
+        set_parse_cache(ParseCache(tmp_path / "cache"))
+        try:
+            steps, error = GitHubActionsParser().parse_file(workflow)
+            set_parse_cache(ParseCache(tmp_path / "cache"))
+            cached_steps, cached_error = GitHubActionsParser().parse_file(workflow)
+
+            assert get_parse_cache().stats["disk_hits"] == 1
+        finally:
+            set_parse_cache(None)
+
+        assert error is None and cached_error is None
+        assert cached_steps == steps
+        assert cached_steps[0].command == "pytest --cov=src tests/"
+        assert cached_steps[0].has_coverage_flag is True
+
+    def test_cached_ci_errors_do_not_mention_the_first_repository(self, cache: ParseCache, tmp_path: Path):
+        broken = "jobs: [unclosed\n"
+        first = _write(tmp_path / "first" / "ci.yml", broken)
+        second = _write(tmp_path / "second" / "ci.yml", broken)
+
+        _, error = GitHubActionsParser().parse_file(first)
+
+        assert GitHubActionsParser().parse_file(second) == (None, error)
+        assert "first" not in error
@@ -0,0 +1,162 @@
+"""Unit tests for token budgeting of LLM prompts.
+
+NO MOCKS - Uses the real default template, real score input data and the
+real PromptBuilder.
+"""
+
+import copy
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.llm.models.template_context import TemplateContext
+from src.llm.prompt_budget import (
+    SUMMARY_LENGTH,
+    PromptBudgeter,
+    estimate_tokens,
+    section_token_estimates,
+)
+from src.llm.prompt_builder import PromptBuilder
+from src.llm.report_generator import ReportGenerator
+
+SCORE_INPUT = Path(__file__).parent.parent / "fixtures" / "llm" / "score_input.json"
+LONG = "Detailed explanation of the finding. " + "It repeats supporting context. " * 4
+
+
+@pytest.fixture
+def score_input() -> dict:
+    """Score input with ten long evidence strings per status."""
+    data = json.loads(SCORE_INPUT.read_text())
+    data["evaluation_result"]["evidence_summary"] = [
+        f"{marker} {status} evidence {index}: {LONG}"
+        for marker, status in (("✅", "met"), ("⚠️", "partial"), ("❌", "unmet"))
+        for index in range(10)
+    ]
+    return data
+
+
+@pytest.fixture
+def builder() -> PromptBuilder:
+    return PromptBuilder()
+
+
+def _prompt(builder: PromptBuilder, score_input: dict, **limits: int):
+    template = builder.template_loader.load_default_template()
+    template.content_limits["max_evidence_items"] = 50
+    return builder.build_prompt_with_budget(score_input, template, limits)
+
+
+class TestPromptBudget:
+    """Tests for fitting prompts into a token budget."""
+
+    def test_prompts_within_budget_are_untouched(self, builder: PromptBuilder, score_input: dict):
+        prompt, report = _prompt(builder, score_input)
+
+        assert report.dropped == [] and report.summarized == []
+        assert report.summary() is None
+        assert report.final_tokens == report.initial_tokens == estimate_tokens(prompt)
+
+    def test_lowest_value_evidence_goes_first(self, builder: PromptBuilder, score_input: dict):
+        _, full = _prompt(builder, score_input)
+        budget = full.initial_tokens - 150
+
+        prompt, report = _prompt(builder, score_input, max_prompt_tokens=budget)
+
+        assert report.within_budget
+        assert estimate_tokens(prompt) <= budget
+        assert len(report.summarized) > 0
+        assert all(label.startswith("met_requirements") for label in report.summarized[:10])
+        assert "unmet evidence 0" in prompt
+        assert "Evidence trimmed to fit the prompt budget" in prompt
+
+    def test_met_evidence_is_dropped_before_unmet(self, builder: PromptBuilder, score_input: dict):
+        _, full = _prompt(builder, score_input)
+
+        prompt, report = _prompt(builder, score_input, max_prompt_tokens=full.initial_tokens - 1250)
+
+        assert report.within_budget
+        assert len(report.dropped) > 10
+        assert all(label.startswith("met_requirements") for label in report.dropped[:10])
+        assert not any(label.startswith("unmet_requirements") for label in report.dropped)
+        assert "partial evidence 9" not in prompt
+        assert "unmet evidence 9" in prompt
+        assert "total items available" in prompt
+
+    def test_budgeting_is_deterministic(self, builder: PromptBuilder, score_input: dict):
+        first = _prompt(builder, copy.deepcopy(score_input), max_prompt_tokens=2500)
+        second = _prompt(builder, copy.deepcopy(score_input), max_prompt_tokens=2500)
+
+        assert first[0] == second[0]
+        assert first[1].dropped == second[1].dropped
+
+    def test_checklist_items_are_never_dropped(self, builder: PromptBuilder, score_input: dict):
+        prompt, report = _prompt(builder, score_input, max_prompt_tokens=500)
+
+        assert not report.within_budget
+        assert len(report.dropped) == 30
+        for name in ("Static Linting Passed", "Automated Tests Present", "README Documentation"):
+            assert name in prompt
+
+    def test_section_estimates(self, score_input: dict):
+        context = TemplateContext.from_score_input(score_input)
+
+        sections = section_token_estimates(context)
+
+        assert set(sections) == {"repository", "checklist_items", "evidence"}
+        assert sections["evidence"] > sections["checklist_items"] > 0
+
+    def test_summaries_are_short(self, score_input: dict):
+        context = TemplateContext.from_score_input(score_input)
+
+        PromptBudgeter(1).fit(context, lambda ctx: "x" * 10_000)
+
+        assert all(summary.items == [] and summary.truncated for summary in context.evidence_summary)
+        assert all(summary.total_items == 10 for summary in context.evidence_summary)
+
+    def test_description_summaries_keep_the_first_sentence(self, score_input: dict):
+        context = TemplateContext.from_score_input(score_input)
+        renders = iter(["x" * 4_400, "x" * 100])
+
+        _, report = PromptBudgeter(1000).fit(context, lambda ctx: next(renders))
+
+        met = context.evidence_summary[0].items
+        assert met[-1].description == "met evidence 9: Detailed explanation of the finding"
+        assert len(met[0].description) > SUMMARY_LENGTH
+        assert report.dropped == []
+
+    def test_budget_must_be_positive(self):
+        with pytest.raises(ValueError):
+            PromptBudgeter(0)
+
+
+class TestReportGeneratorBudget:
+    """Tests for budgeting results in generated reports."""
+
+    def test_dropped_evidence_is_reported(self, builder: PromptBuilder, score_input: dict,
+                                          tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        gemini = bin_dir / "gemini"
+        stub = SCORE_INPUT.parent / "stub_llm_cli.py"
+        gemini.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{stub}" "$@"\n')
+        gemini.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+        score_input["evaluation_result"]["evidence_summary"] = [
+            {"category": "testing", "items": [
+                {"source": f"tests/test_{index}.py", "description": LONG, "confidence": index / 10}
+                for index in range(10)
+            ]}
+        ]
+        input_path = tmp_path / "score_input.json"
+        input_path.write_text(json.dumps(score_input))
+        builder.set_context_limits({"max_evidence_items": 50, "max_prompt_tokens": 500})
+
+        result = ReportGenerator(prompt_builder=builder).generate_report(str(input_path))
+
+        budget = result["prompt_budget"]
+        assert budget["dropped"]
+        assert any(w.startswith("Prompt reduced from") for w in result["report_metadata"]["warnings"])
@@ -0,0 +1,114 @@
+"""Unit tests for tool runtime history and predicted stage budgets.
+
+NO MOCKS - Uses real SQLite history files and real tool runs.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.metrics.runtime_history import RepoFeatures, RuntimeHistory
+from src.metrics.tool_executor import ToolExecutor
+
+SMALL = RepoFeatures(file_count=20, size_mb=0.5)
+LARGE = RepoFeatures(file_count=8000, size_mb=300.0)
+
+
+def _seed(history: RuntimeHistory, features: RepoFeatures, durations: list[float],
+          language: str = "java", stage: str = "build_validation") -> None:
+    for seconds in durations:
+        history.record(language, stage, features, seconds)
+
+
+class TestRuntimeHistory:
+    """Tests for recording runtimes and predicting from similar runs."""
+
+    def test_no_prediction_without_enough_runs(self, tmp_path: Path):
+        history = RuntimeHistory(tmp_path / "history.db", min_samples=5)
+        _seed(history, SMALL, [1.0] * 4)
+
+        assert history.predict("java", "build_validation", SMALL) is None
+
+    def test_prediction_uses_similar_repositories(self, tmp_path: Path):
+        history = RuntimeHistory(tmp_path / "history.db", min_samples=5, neighbors=10)
+        _seed(history, SMALL, [2.0] * 10)
+        _seed(history, LARGE, [100.0] * 9 + [180.0])
+
+        large = history.predict("java", "build_validation", RepoFeatures(file_count=7000, size_mb=250.0))
+        small = history.predict("java", "build_validation", RepoFeatures(file_count=25, size_mb=0.6))
+
+        assert (large.p50, large.p95, large.samples) == (100.0, 180.0, 10)
+        assert small.p95 == 2.0
+
+    def test_stages_and_languages_are_separate(self, tmp_path: Path):
+        history = RuntimeHistory(tmp_path / "history.db", min_samples=1)
+        _seed(history, SMALL, [50.0])
+
+        assert history.predict("java", "linting", SMALL) is None
+        assert history.predict("go", "build_validation", SMALL) is None
+
+    def test_history_is_persisted_and_trimmed(self, tmp_path: Path):
+        _seed(RuntimeHistory(tmp_path / "history.db", max_samples=5), SMALL, [1.0] * 5 + [9.0] * 5)
+
+        prediction = RuntimeHistory(tmp_path / "history.db", min_samples=1).predict("java", "build_validation", SMALL)
+
+        assert (prediction.p50, prediction.samples) == (9.0, 5)
+
+
+class TestStageBudgets:
+    """Tests for budgets and early skips in ToolExecutor."""
+
+    def test_budget_from_predicted_p95(self, tmp_path: Path):
+        history = RuntimeHistory(tmp_path / "history.db", min_samples=5)
+        _seed(history, LARGE, [200.0] * 18 + [240.0] * 2)
+        executor = ToolExecutor(timeout_seconds=900, tool_history=history)
+        executor._repo_features = LARGE
+
+        # Past the fixed 120 s per-tool cap that cut such builds short
+        assert executor._stage_budget("java", "build_validation", remaining=850) == pytest.approx(240.0 * 1.25)
+
+    def test_fast_stages_get_a_minimum_budget(self, tmp_path: Path):
+        history = RuntimeHistory(tmp_path / "history.db", min_samples=5)
+        _seed(history, SMALL, [0.2] * 10, language="python", stage="linting")
+        executor = ToolExecutor(timeout_seconds=300, tool_history=history)
+        executor._repo_features = SMALL
+
+        assert executor._stage_budget("python", "linting", remaining=250) == ToolExecutor.MIN_STAGE_BUDGET_SECONDS
+
+    def test_without_history_the_fixed_timeout_applies(self):
+        executor = ToolExecutor(timeout_seconds=300)
+        executor._repo_features = SMALL
+
+        assert executor._stage_budget("java", "build_validation", remaining=250) is None
+
+    def test_stage_predicted_to_overrun_is_skipped_early(self, tmp_path: Path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / "app.py").write_text("print('hello')\n")
+        history = RuntimeHistory(tmp_path / "history.db", min_samples=5)
+        _seed(history, RepoFeatures(file_count=1, size_mb=0.0), [500.0] * 10, language="python", stage="linting")
+        executor = ToolExecutor(timeout_seconds=60, tool_history=history)
+        executor.analyze_subprojects = False
+
+        metrics = executor.execute_tools("python", str(repo))
+
+        skipped = [warning for warning in metrics.execution_metadata.warnings if warning.startswith("Skipped linting")]
+        assert len(skipped) == 1
+        assert "predicted 500s" in skipped[0]
+        assert metrics.code_quality.lint_results is None
+
+    @pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff not available")
+    def test_tool_runs_are_recorded(self, tmp_path: Path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / "app.py").write_text("import os\n")
+        history = RuntimeHistory(tmp_path / "history.db", min_samples=1)
+        executor = ToolExecutor(timeout_seconds=120, tool_history=history)
+        executor.analyze_subprojects = False
+
+        executor.execute_tools("python", str(repo))
+
+        assert history.predict("python", "linting", RepoFeatures(file_count=1, size_mb=0.0)).samples == 1
+        # No build configuration: the build stage ran no tool and is not recorded
+        assert history.predict("python", "build_validation", RepoFeatures(file_count=1, size_mb=0.0)) is None
@@ -0,0 +1,195 @@
+"""Unit tests for resource-limited tool execution.
+
+NO MOCKS - Runs real processes under real rlimits.
+"""
+
+import os
+import resource
+import shutil
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src.metrics.models.build_validation import BuildValidationResult
+from src.metrics.sandbox import (
+    CGROUP_ROOT_ENV,
+    DEFAULT_TOOL_LIMITS,
+    ResourceLimits,
+    ToolSandbox,
+    get_tool_sandbox,
+    limits_from_options,
+    parse_limit_option,
+    set_tool_sandbox,
+)
+from src.metrics.subproject_discovery import aggregate_build_results
+from src.metrics.tool_runners.javascript_tools import JavaScriptToolRunner
+
+
+@pytest.fixture
+def sandbox() -> ToolSandbox:
+    return ToolSandbox({"lint": ResourceLimits(cpu_seconds=1, address_space_mb=256, max_processes=None)})
+
+
+class TestToolSandbox:
+    """Tests for limits and how violations are classified."""
+
+    def test_ordinary_commands_are_unaffected(self, sandbox: ToolSandbox):
+        result = sandbox.run("lint", [sys.executable, "-c", "print('ok')"], timeout=30)
+
+        assert (result.returncode, result.stdout.strip(), result.limit_exceeded) == (0, "ok", None)
+
+    def test_ordinary_failure_is_not_a_limit_violation(self, sandbox: ToolSandbox):
+        result = sandbox.run("lint", [sys.executable, "-c", "raise SystemExit(3)"], timeout=30)
+
+        assert result.returncode == 3
+        assert result.limit_exceeded is None
+
+    def test_cpu_limit(self, sandbox: ToolSandbox):
+        result = sandbox.run("lint", [sys.executable, "-c", "while True: pass"], timeout=60)
+
+        assert result.limit_exceeded == "cpu"
+        assert result.limit_message() == "CPU time limit (1s)"
+
+    def test_memory_limit(self, sandbox: ToolSandbox):
+        result = sandbox.run("lint", [sys.executable, "-c", "data = bytearray(1024 * 1024 * 1024)"], timeout=60)
+
+        assert result.returncode != 0
+        assert result.limit_exceeded == "memory"
+        assert result.limit_message() == "address space limit (256 MB)"
+
+    def test_default_limits_leave_address_space_unlimited(self):
+        command = [sys.executable, "-c", "import resource; print(resource.getrlimit(resource.RLIMIT_AS)[0])"]
+
+        result = ToolSandbox().run("lint", command, timeout=30)
+
+        assert int(result.stdout) == resource.RLIM_INFINITY
+
+    def test_default_limits_leave_user_processes_unlimited(self):
+        command = [sys.executable, "-c", "import resource; print(resource.getrlimit(resource.RLIMIT_NPROC)[0])"]
+        expected = resource.getrlimit(resource.RLIMIT_NPROC)[0]
+
+        for tool_class in DEFAULT_TOOL_LIMITS:
+            result = ToolSandbox().run(tool_class, command, timeout=30)
+            assert int(result.stdout) == expected
+            assert result.limits.max_processes is None
+
+    def test_user_process_limit_is_opt_in(self):
+        command = [sys.executable, "-c", "import resource; print(resource.getrlimit(resource.RLIMIT_NPROC)[0])"]
+
+        result = ToolSandbox({"lint": ResourceLimits(user_processes=2000)}).run("lint", command, timeout=30)
+
+        assert int(result.stdout) == 2000
+
+    def test_refused_thread_is_reported_against_the_user_process_limit(self):
+        command = [sys.executable, "-c", "import sys; sys.exit(\"RuntimeError: can't start new thread\")"]
+
+        result = ToolSandbox({"lint": ResourceLimits(user_processes=2000)}).run("lint", command, timeout=30)
+
+        assert result.limit_exceeded == "processes"
+        assert result.limit_message() == "user process limit (2000)"
+
+    def test_memory_limit_needs_a_cgroup(self):
+        result = ToolSandbox({"lint": ResourceLimits(memory_mb=64)}).run(
+            "lint", [sys.executable, "-c", "data = bytearray(256 * 1024 * 1024)"], timeout=60
+        )
+
+        assert (result.returncode, result.limit_exceeded) == (0, None)
+
+    def test_sigkill_is_not_a_cpu_violation(self, sandbox: ToolSandbox):
+        result = sandbox.run("lint", [sys.executable, "-c", "import os, signal; os.kill(os.getpid(), signal.SIGKILL)"],
+                             timeout=30)
+
+        assert result.returncode == -signal.SIGKILL
+        assert result.limit_exceeded is None
+
+    def test_wall_clock_timeout_is_still_raised(self, sandbox: ToolSandbox):
+        with pytest.raises(subprocess.TimeoutExpired):
+            sandbox.run("lint", [sys.executable, "-c", "import time; time.sleep(30)"], timeout=0.5)
+
+    def test_unknown_class_is_unlimited(self, sandbox: ToolSandbox):
+        assert sandbox.limits_for("other") == ResourceLimits()
+
+    def test_unusable_cgroup_root_falls_back_to_rlimits(self, tmp_path: Path):
+        assert ToolSandbox(cgroup_root=tmp_path).cgroup_root is None
+
+    @pytest.mark.skipif(not os.environ.get(CGROUP_ROOT_ENV), reason="needs a delegated cgroup v2 root")
+    def test_jvm_daemons_outlive_their_command_until_close(self, tmp_path: Path):
+        pid_file = tmp_path / "daemon.pid"
+        spawn_daemon = [
+            sys.executable, "-c",
+            "import subprocess, sys; "
+            "p = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'], start_new_session=True); "
+            "open(sys.argv[1], 'w').write(str(p.pid))",
+            str(pid_file),
+        ]
+        sandbox = ToolSandbox()
+
+        sandbox.run("jvm", spawn_daemon, timeout=30)
+        sandbox.run("jvm", [sys.executable, "-c", "pass"], timeout=30)
+        pid = int(pid_file.read_text())
+        os.kill(pid, 0)
+
+        sandbox.close()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.05)
+        else:
+            pytest.fail("daemon survived ToolSandbox.close()")
+
+    def test_default_sandbox(self):
+        set_tool_sandbox(None)
+        assert get_tool_sandbox().limits == DEFAULT_TOOL_LIMITS
+
+
+class TestLimitOptions:
+    """Tests for CLASS.FIELD=VALUE overrides."""
+
+    def test_overrides_are_merged_over_defaults(self):
+        limits = limits_from_options(["build.memory_mb=2048", "lint.cpu_seconds=none"])
+
+        assert limits["build"] == ResourceLimits(cpu_seconds=1800, memory_mb=2048, max_processes=4096)
+        assert limits["lint"].cpu_seconds is None
+        assert limits["audit"] == DEFAULT_TOOL_LIMITS["audit"]
+
+    @pytest.mark.parametrize("value", ["build.memory=1", "compile.memory_mb=1", "build.memory_mb", "lint.cpu_seconds=0"])
+    def test_invalid_options(self, value: str):
+        with pytest.raises(ValueError):
+            parse_limit_option(value)
+
+
+class TestRunnerLimitReporting:
+    """Tests for limit violations in build results."""
+
+    @pytest.mark.skipif(shutil.which("npm") is None, reason="npm not available")
+    def test_build_stopped_by_cpu_limit(self, tmp_path: Path):
+        (tmp_path / "package.json").write_text(
+            '{"name": "spin", "version": "1.0.0", "scripts": {"build": "node -e \\"while (true) {}\\""}}'
+        )
+        set_tool_sandbox(ToolSandbox({"build": ResourceLimits(cpu_seconds=1)}))
+        try:
+            result = JavaScriptToolRunner(timeout_seconds=120).run_build(str(tmp_path))
+        finally:
+            set_tool_sandbox(None)
+
+        assert result["success"] is False
+        assert result["limit_exceeded"] == "cpu"
+        assert result["error_message"].startswith("Build exceeded CPU time limit (1s)")
+        assert BuildValidationResult(**result).limit_exceeded == "cpu"
+
+    def test_limit_survives_subproject_aggregation(self):
+        merged = aggregate_build_results({
+            "api": {"success": True, "tool_used": "npm"},
+            "web": {"success": False, "tool_used": "npm", "error_message": "Build exceeded memory limit",
+                    "limit_exceeded": "memory"},
+        })
+
+        assert merged["success"] is False
+        assert merged["limit_exceeded"] == "memory"
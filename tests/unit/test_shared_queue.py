@@ -0,0 +1,269 @@
+"""Unit tests for sharding, the lease-based shared directory queue and leaderboards.
+
+NO MOCKS - Nodes are simulated with real processes sharing a temporary directory.
+"""
+
+import json
+import multiprocessing
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.metrics.job_queue import JobQueueError
+from src.metrics.leaderboard import merge_summaries, write_leaderboard, write_shard_summary
+from src.metrics.models.batch_job import BatchJob, JobState
+from src.metrics.shared_queue import (
+    SharedDirectoryQueue,
+    default_node_id,
+    parse_shard_spec,
+    shard_for_repository,
+)
+
+REPOS = [(f"https://example.com/team{i}/app.git", None) for i in range(30)]
+
+
+def _claim_all(root: str, node_id: str, results: "multiprocessing.Queue") -> None:
+    """Node process: claim and complete jobs until none are left."""
+    queue = SharedDirectoryQueue(root, node_id=node_id, lease_seconds=30)
+    claimed = []
+    while (job := queue.claim("worker-0")) is not None:
+        claimed.append(job.repository_url)
+        queue.advance(job.job_id, JobState.ANALYZING)
+        queue.complete(job.job_id)
+    queue.close()
+    results.put(claimed)
+
+
+class _CompletingDuringRenewal(SharedDirectoryQueue):
+    """Completes a job from another thread while the heartbeat is renewing its lease."""
+
+    complete_during_renewal: int | None = None
+    completer: threading.Thread
+
+    def _read(self, path: Path) -> dict | None:
+        record = super()._read(path)
+        if self.complete_during_renewal is not None and path.parent == self.leases_dir:
+            job_id, self.complete_during_renewal = self.complete_during_renewal, None
+            self.completer = threading.Thread(target=self.complete, args=(job_id,))
+            self.completer.start()
+            self.completer.join(timeout=0.5)
+        return record
+
+
+class TestSharding:
+    """Tests for shard specification parsing and assignment."""
+
+    def test_parse_shard_spec(self):
+        assert parse_shard_spec("1/3") == (0, 3)
+        assert parse_shard_spec(" 3 / 3 ") == (2, 3)
+
+    @pytest.mark.parametrize("spec", ["0/3", "4/3", "1/0", "abc", "1-3"])
+    def test_parse_shard_spec_rejects_invalid(self, spec: str):
+        with pytest.raises(ValueError):
+            parse_shard_spec(spec)
+
+    def test_shards_are_deterministic_and_cover_all_repos(self):
+        shards = [shard_for_repository(url, 4) for url, _ in REPOS]
+
+        assert shards == [shard_for_repository(url, 4) for url, _ in REPOS]
+        assert set(shards) <= {0, 1, 2, 3}
+        assert len(set(shards)) > 1
+
+
+class TestSharedDirectoryQueue:
+    """Tests for lease-based claiming on a shared directory."""
+
+    def test_enqueue_is_idempotent_across_nodes(self, tmp_path: Path):
+        node_a = SharedDirectoryQueue(tmp_path, node_id="a")
+        node_b = SharedDirectoryQueue(tmp_path, node_id="b")
+
+        assert node_a.enqueue(REPOS[:5]) == 5
+        assert node_b.enqueue(REPOS[:5]) == 0
+        assert node_b.get_counts()["pending"] == 5
+
+    def test_node_prefers_own_shard_then_steals(self, tmp_path: Path):
+        queue = SharedDirectoryQueue(tmp_path, node_id="a", shard=(0, 2))
+        queue.enqueue(REPOS[:10])
+        own = sum(1 for url, _ in REPOS[:10] if shard_for_repository(url, 2) == 0)
+
+        claimed = []
+        while (job := queue.claim("w")) is not None:
+            claimed.append(shard_for_repository(job.repository_url, 2))
+            queue.complete(job.job_id)
+        queue.close()
+
+        assert len(claimed) == 10
+        assert claimed[:own] == [0] * own
+
+    def test_no_work_stealing_keeps_to_own_shard(self, tmp_path: Path):
+        queue = SharedDirectoryQueue(tmp_path, node_id="a", shard=(1, 2), work_stealing=False)
+        queue.enqueue(REPOS[:10])
+
+        while (job := queue.claim("w")) is not None:
+            assert shard_for_repository(job.repository_url, 2) == 1
+            queue.complete(job.job_id)
+        queue.close()
+
+    def test_expired_lease_is_taken_over(self, tmp_path: Path):
+        crashed = SharedDirectoryQueue(tmp_path, node_id="crashed", lease_seconds=0.2)
+        crashed.enqueue(REPOS[:1])
+        job = crashed.claim("w")
+        crashed.close()  # node dies: no more heartbeats
+
+        survivor = SharedDirectoryQueue(tmp_path, node_id="survivor", lease_seconds=30)
+        assert survivor.claim("w") is None  # lease still valid
+
+        time.sleep(0.5)
+        stolen = survivor.claim("w")
+        assert stolen.job_id == job.job_id
+        assert stolen.attempts == 2
+        survivor.complete(stolen.job_id)
+        survivor.close()
+
+        assert survivor.get_counts()["done"] == 1
+
+    def test_heartbeat_keeps_lease_alive(self, tmp_path: Path):
+        owner = SharedDirectoryQueue(tmp_path, node_id="owner", lease_seconds=0.3)
+        owner.enqueue(REPOS[:1])
+        owner.claim("w")
+
+        time.sleep(0.8)
+        other = SharedDirectoryQueue(tmp_path, node_id="other", lease_seconds=0.3)
+        assert other.claim("w") is None
+        owner.close()
+
+    def test_heartbeat_never_renews_finished_leases(self, tmp_path: Path):
+        queue = _CompletingDuringRenewal(tmp_path, node_id="a", lease_seconds=600)
+        queue.enqueue(REPOS[:1])
+        job = queue.claim("w")
+        queue.close()
+
+        queue.complete_during_renewal = job.job_id
+        queue.renew_leases()
+        queue.completer.join()
+
+        lease = json.loads(next(queue.leases_dir.glob("*.json")).read_text())
+        assert lease["expires_at"] == 0
+        assert queue.get_counts()["done"] == 1
+
+    def test_restart_requeues_own_interrupted_jobs(self, tmp_path: Path):
+        first = SharedDirectoryQueue(tmp_path, node_id="node-1", lease_seconds=600)
+        first.enqueue(REPOS[:1])
+        first.claim("w")
+        first.close()
+
+        restarted = SharedDirectoryQueue(tmp_path, node_id="node-1", lease_seconds=600)
+        assert restarted.requeue_interrupted() == 1
+        assert restarted.claim("w") is not None
+        restarted.close()
+
+    def test_preempted_owner_does_not_overwrite_the_result(self, tmp_path: Path):
+        stalled = SharedDirectoryQueue(tmp_path, node_id="stalled", lease_seconds=0.2)
+        stalled.enqueue(REPOS[:1])
+        job = stalled.claim("w")
+        stalled.close()  # paused: no heartbeats, but the job is still in hand
+        time.sleep(0.5)
+        owner = SharedDirectoryQueue(tmp_path, node_id="owner", lease_seconds=30)
+        taken = owner.claim("w")
+
+        with pytest.raises(JobQueueError, match="taken over"):
+            stalled.advance(job.job_id, JobState.ANALYZING)
+        stalled.fail(job.job_id, "late failure")
+        assert owner.get_counts()["failed"] == 0
+
+        owner.complete(taken.job_id)
+        owner.close()
+        done = owner.list_jobs(JobState.DONE)
+        assert done[0].worker_id == "owner/w"
+
+    def test_default_node_ids_differ_per_process(self, tmp_path: Path):
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        process = context.Process(target=lambda: results.put(default_node_id()))
+        process.start()
+        other = results.get(timeout=30)
+        process.join(timeout=30)
+
+        assert other != default_node_id()
+        assert default_node_id() != default_node_id()
+
+    def test_fail_and_retry_failed(self, tmp_path: Path):
+        queue = SharedDirectoryQueue(tmp_path, node_id="a")
+        queue.enqueue(REPOS[:1], timeout_seconds=60)
+        job = queue.claim("w")
+        queue.fail(job.job_id, "Repository operation failed")
+
+        failed = queue.list_jobs(JobState.FAILED)
+        assert failed[0].error == "Repository operation failed"
+
+        assert queue.retry_failed(timeout_seconds=900) == 1
+        retried = queue.claim("w")
+        assert retried.timeout_seconds == 900
+        assert retried.attempts == 2
+        queue.close()
+
+    def test_concurrent_nodes_claim_each_job_once(self, tmp_path: Path):
+        SharedDirectoryQueue(tmp_path, node_id="setup").enqueue(REPOS)
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        nodes = [
+            context.Process(target=_claim_all, args=(str(tmp_path), f"node-{i}", results))
+            for i in range(4)
+        ]
+        for node in nodes:
+            node.start()
+        claimed = [url for _ in nodes for url in results.get(timeout=60)]
+        for node in nodes:
+            node.join(timeout=60)
+
+        assert sorted(claimed) == sorted(url for url, _ in REPOS)
+        assert SharedDirectoryQueue(tmp_path, node_id="check").get_counts()["done"] == len(REPOS)
+
+
+class TestLeaderboard:
+    """Tests for shard summaries and leaderboard merging."""
+
+    def _job_with_score(self, tmp_path: Path, name: str, percentage: float) -> BatchJob:
+        output_dir = tmp_path / name
+        output_dir.mkdir()
+        (output_dir / "score_input.json").write_text(json.dumps({
+            "evaluation_result": {
+                "total_score": percentage, "max_possible_score": 100, "score_percentage": percentage
+            }
+        }))
+        return BatchJob(job_id=1, repository_url=f"https://example.com/{name}.git",
+                        state=JobState.DONE, output_dir=str(output_dir),
+                        stage_timestamps={"done": "2026-01-01T00:00:00"})
+
+    def test_merge_ranks_across_shards(self, tmp_path: Path):
+        shard_1 = write_shard_summary(
+            [self._job_with_score(tmp_path, "low", 40.0)], tmp_path / "s" / "1.json", "node-1")
+        shard_2 = write_shard_summary(
+            [self._job_with_score(tmp_path, "high", 90.0),
+             BatchJob(job_id=2, repository_url="https://example.com/broken.git",
+                      state=JobState.FAILED, error="clone failed")],
+            tmp_path / "s" / "2.json", "node-2")
+
+        summaries = [json.loads(Path(path).read_text()) for path in (shard_1, shard_2)]
+        entries = merge_summaries(summaries)
+
+        assert [e["repository_url"] for e in entries] == [
+            "https://example.com/high.git", "https://example.com/low.git", "https://example.com/broken.git"
+        ]
+        assert [e["rank"] for e in entries] == [1, 2, None]
+        assert entries[0]["shard"] == "node-2"
+
+        files = write_leaderboard(entries, tmp_path / "board")
+        assert "| 1 | https://example.com/high.git |" in Path(files[1]).read_text()
+
+    def test_merge_prefers_done_over_failed_duplicate(self):
+        failed = {"repository_url": "https://example.com/a.git", "commit_sha": None,
+                  "state": "failed", "completed_at": "2026-01-02T00:00:00", "score_percentage": None}
+        done = {**failed, "state": "done", "completed_at": "2026-01-01T00:00:00", "score_percentage": 50.0}
+
+        entries = merge_summaries([{"shard": "a", "entries": [failed]}, {"shard": "b", "entries": [done]}])
+
+        assert len(entries) == 1
+        assert entries[0]["state"] == "done"
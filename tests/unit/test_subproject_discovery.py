@@ -0,0 +1,206 @@
+"""Unit tests for monorepo subproject discovery and per-package analysis.
+
+NO MOCKS - Discovers real manifests in real temporary repositories and runs
+the real tool runners against them.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.metrics.models.repository import Repository
+from src.metrics.output_generators import OutputFormat
+from src.metrics.subproject_discovery import (
+    aggregate_build_results,
+    aggregate_lint_results,
+    aggregate_security_results,
+    discover_subprojects,
+    is_monorepo,
+)
+from src.metrics.tool_executor import ToolExecutor
+
+
+@pytest.fixture
+def go_monorepo(tmp_path: Path) -> Path:
+    """Two independent Go modules plus a Python tooling package."""
+    (tmp_path / "README.md").write_text("# Services\n\nInstall and usage example.\n")
+    for service in ("services/api", "services/worker"):
+        module = tmp_path / service
+        module.mkdir(parents=True)
+        (module / "go.mod").write_text(f"module example.com/{service}\n\ngo 1.21\n")
+        (module / "main.go").write_text("package main\n\nfunc main() {}\n")
+    tools = tmp_path / "tools"
+    tools.mkdir()
+    (tools / "pyproject.toml").write_text("[project]\nname = \"tools\"\nversion = \"0.1.0\"\n")
+    (tools / "cli.py").write_text("def main():\n    return 0\n")
+    return tmp_path
+
+
+class TestDiscoverSubprojects:
+    """Tests for manifest-based subproject discovery."""
+
+    def test_single_project_is_not_a_monorepo(self, tmp_path: Path):
+        (tmp_path / "go.mod").write_text("module example.com/app\n")
+
+        subprojects = discover_subprojects(tmp_path)
+
+        assert [(sub.path, sub.language) for sub in subprojects] == [(".", "go")]
+        assert not is_monorepo(subprojects)
+
+    def test_finds_modules_of_each_language(self, go_monorepo: Path):
+        subprojects = discover_subprojects(go_monorepo)
+
+        assert [(sub.path, sub.language) for sub in subprojects] == [
+            ("tools", "python"), ("services/api", "go"), ("services/worker", "go")
+        ]
+        assert is_monorepo(subprojects)
+
+    def test_npm_workspace_root_is_skipped(self, tmp_path: Path):
+        (tmp_path / "package.json").write_text(json.dumps({"private": True, "workspaces": ["packages/*"]}))
+        for name in ("ui", "server"):
+            package = tmp_path / "packages" / name
+            package.mkdir(parents=True)
+            (package / "package.json").write_text(json.dumps({"name": name}))
+        (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+        (tmp_path / "node_modules" / "dep" / "package.json").write_text("{}")
+
+        subprojects = discover_subprojects(tmp_path)
+
+        assert [sub.path for sub in subprojects] == ["packages/server", "packages/ui"]
+
+    def test_maven_modules_belong_to_the_reactor_root(self, tmp_path: Path):
+        (tmp_path / "pom.xml").write_text("<project><modules><module>core</module></modules></project>")
+        for module in ("core", "web"):
+            (tmp_path / module).mkdir()
+            (tmp_path / module / "pom.xml").write_text("<project/>")
+
+        subprojects = discover_subprojects(tmp_path)
+
+        assert len(subprojects) == 1
+        assert subprojects[0].path == "."
+        assert subprojects[0].modules == ["core", "web"]
+
+    def test_subproject_count_is_bounded(self, tmp_path: Path):
+        for i in range(5):
+            module = tmp_path / f"mod{i}"
+            module.mkdir()
+            (module / "go.mod").write_text(f"module example.com/mod{i}\n")
+
+        assert len(discover_subprojects(tmp_path, max_subprojects=3)) == 3
+
+
+class TestAggregation:
+    """Tests for merging per-subproject tool results."""
+
+    def test_lint_results_are_summed_with_repo_relative_files(self):
+        merged = aggregate_lint_results({
+            "packages/a": {"tool_used": "ruff", "passed": True, "issues_count": 0, "issues": []},
+            "packages/b": {"tool_used": "ruff", "passed": False, "issues_count": 1,
+                           "issues": [{"file": "x.py", "line": 3}]},
+        })
+
+        assert merged["passed"] is False
+        assert merged["issues_count"] == 1
+        assert merged["issues"][0]["file"] == "packages/b/x.py"
+
+    def test_nested_issues_are_counted_once(self, tmp_path: Path):
+        nested = {"file": str(tmp_path / "sub" / "x.py"), "line": 1, "code": "F401"}
+        merged = aggregate_lint_results({
+            ".": {"tool_used": "ruff", "passed": False, "issues_count": 2,
+                  "issues": [nested, {"file": str(tmp_path / "setup.py"), "line": 2}]},
+            "sub": {"tool_used": "ruff", "passed": False, "issues_count": 1, "issues": [nested]},
+        }, tmp_path)
+
+        assert merged["issues_count"] == 2
+        assert sorted(issue["file"] for issue in merged["issues"]) == ["setup.py", "sub/x.py"]
+
+    def test_absolute_paths_outside_the_repository_are_kept(self, tmp_path: Path):
+        merged = aggregate_lint_results({
+            "sub": {"tool_used": "ruff", "passed": False, "issues_count": 1,
+                    "issues": [{"file": "/elsewhere/x.py", "line": 1}]},
+        }, tmp_path)
+
+        assert merged["issues"][0]["file"] == "/elsewhere/x.py"
+        assert merged["issues_count"] == 1
+
+    def test_security_counts_are_summed(self):
+        merged = aggregate_security_results({
+            "a": {"vulnerabilities_found": 2, "high_severity_count": 1, "tool_used": "osv"},
+            "b": {"vulnerabilities_found": 1, "high_severity_count": 0, "tool_used": "none"},
+        })
+
+        assert (merged["vulnerabilities_found"], merged["high_severity_count"]) == (3, 1)
+        assert merged["tool_used"] == "osv"
+
+    def test_same_advisory_is_counted_once(self):
+        advisory = {"id": "GHSA-1", "ecosystem": "PyPI", "package": "jinja2", "version": "2.0",
+                    "severity": "high", "source": "sub/requirements.txt"}
+        merged = aggregate_security_results({
+            ".": {"vulnerabilities_found": 1, "high_severity_count": 1, "tool_used": "osv-offline",
+                  "vulnerabilities": [advisory]},
+            "sub": {"vulnerabilities_found": 1, "high_severity_count": 1, "tool_used": "osv-offline",
+                    "vulnerabilities": [{**advisory, "source": "requirements.txt"}]},
+        })
+
+        assert (merged["vulnerabilities_found"], merged["high_severity_count"]) == (1, 1)
+        assert len(merged["vulnerabilities"]) == 1
+
+    def test_any_failed_build_fails_the_repository(self):
+        merged = aggregate_build_results({
+            "a": {"success": True, "tool_used": "go", "execution_time_seconds": 1.0},
+            "b": {"success": False, "tool_used": "go", "execution_time_seconds": 2.0,
+                  "error_message": "undefined: x", "exit_code": 1},
+        })
+
+        assert merged["success"] is False
+        assert merged["error_message"] == "b: undefined: x"
+        assert merged["execution_time_seconds"] == 3.0
+
+    def test_build_is_unknown_when_nothing_built(self):
+        assert aggregate_build_results({"a": {"success": None}})["success"] is None
+
+
+class TestPerSubprojectExecution:
+    """Tests for running lint/audit/build once per subproject."""
+
+    def test_each_subproject_gets_a_section(self, go_monorepo: Path):
+        metrics = ToolExecutor(timeout_seconds=60).execute_tools(
+            "go", str(go_monorepo), languages={"go": 0.6, "python": 0.4}
+        )
+
+        assert [(sub.path, sub.language) for sub in metrics.subprojects] == [
+            ("services/api", "go"), ("services/worker", "go"), ("tools", "python")
+        ]
+        for subproject in metrics.subprojects:
+            assert subproject.lint_results is not None or subproject.errors
+
+    def test_nested_python_package_is_linted_once(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = \"root\"\nversion = \"0.1.0\"\n")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "pyproject.toml").write_text("[project]\nname = \"sub\"\nversion = \"0.1.0\"\n")
+        (tmp_path / "sub" / "x.py").write_text("import os\n")
+
+        metrics = ToolExecutor(timeout_seconds=60).execute_tools("python", str(tmp_path))
+
+        lint = metrics.code_quality.lint_results
+        assert lint["issues_count"] == 1
+        assert [issue["file"] for issue in lint["issues"]] == ["sub/x.py"]
+
+    def test_disabled_discovery_analyzes_the_root_only(self, go_monorepo: Path):
+        executor = ToolExecutor(timeout_seconds=60)
+        executor.analyze_subprojects = False
+
+        metrics = executor.execute_tools("go", str(go_monorepo))
+
+        assert metrics.subprojects == []
+
+    def test_subprojects_in_submission(self, go_monorepo: Path):
+        metrics = ToolExecutor(timeout_seconds=60).execute_tools("go", str(go_monorepo))
+        repository = Repository(url="https://example.com/services.git", detected_language="go")
+        formatter = OutputFormat()
+
+        output = json.loads(formatter.export_json(repository, metrics))
+
+        assert [sub["path"] for sub in output["metrics"]["subprojects"]] == ["services/api", "services/worker"]
+        assert "## Subprojects" in formatter.export_markdown(repository, metrics)
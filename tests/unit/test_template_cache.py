@@ -0,0 +1,160 @@
+"""Unit tests for the on-disk template bytecode and security verdict caches.
+
+NO MOCKS - Uses real template files, real cache directories and separate
+Python processes sharing one cache.
+"""
+
+import json
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.llm.template_loader import TEMPLATE_CACHE_ENV, TemplateLoader, TemplateValidationError
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+LOAD_IN_SUBPROCESS = """
+import json, sys
+from src.llm.template_loader import TemplateLoader
+loader = TemplateLoader()
+template = loader.compile_template(loader.load_template(sys.argv[1]))
+print(json.dumps({"stats": loader.get_cache_stats(), "render": template.render(name="World")}))
+"""
+
+
+@pytest.fixture
+def template_file(tmp_path: Path) -> Path:
+    path = tmp_path / "report.md"
+    path.write_text("# Report for {{ name }}\n{% for i in range(2) %}- item {{ i }}\n{% endfor %}")
+    return path
+
+
+def _load(path: Path, cache_dir: Path) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", LOAD_IN_SUBPROCESS, str(path)], cwd=PROJECT_ROOT,
+        env={"PATH": "", TEMPLATE_CACHE_ENV: str(cache_dir)}, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+class TestBytecodeCache:
+    """Tests for compiled templates shared across processes."""
+
+    def test_second_process_reuses_bytecode(self, template_file: Path, tmp_path: Path):
+        cache_dir = tmp_path / "cache"
+
+        first = _load(template_file, cache_dir)
+        second = _load(template_file, cache_dir)
+
+        assert first["stats"]["bytecode_misses"] == 1
+        assert second["stats"]["bytecode_hits"] == 1 and second["stats"]["bytecode_misses"] == 0
+        assert first["render"] == second["render"] == "# Report for World\n- item 0\n- item 1\n"
+        assert len(list(cache_dir.glob("*.jinja-bytecode"))) == 1
+
+    def test_edited_template_is_recompiled(self, template_file: Path, tmp_path: Path):
+        loader = TemplateLoader(cache_dir=tmp_path / "cache")
+        config = loader.load_template(str(template_file))
+        assert loader.compile_template(config).render(name="A").startswith("# Report for A")
+
+        template_file.write_text("# Edited for {{ name }}")
+
+        assert loader.compile_template(config).render(name="A") == "# Edited for A"
+        assert loader.cache_stats["bytecode_misses"] == 2
+        assert len(loader._template_cache) == 1
+
+    def test_sandbox_is_kept_for_cached_bytecode(self, tmp_path: Path):
+        path = tmp_path / "unsafe.md"
+        path.write_text("{{ value.__class__ }}")
+        cache_dir = tmp_path / "cache"
+        TemplateLoader(cache_dir=cache_dir).compile_template(TemplateLoader().load_template(str(path)))
+
+        loader = TemplateLoader(cache_dir=cache_dir)
+        template = loader.compile_template(loader.load_template(str(path)))
+
+        assert loader.cache_stats["bytecode_hits"] == 1
+        assert template.render(value="x") == ""
+
+    def test_disabled_cache_writes_nothing(self, template_file: Path, tmp_path: Path,
+                                           monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(TEMPLATE_CACHE_ENV, str(tmp_path / "cache"))
+        loader = TemplateLoader(cache_templates=False)
+
+        loader.compile_template(loader.load_template(str(template_file)))
+
+        assert loader.cache_dir is None
+        assert not (tmp_path / "cache").exists()
+
+    def test_default_directory_is_private_to_the_user(self, template_file: Path, tmp_path: Path,
+                                                      monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv(TEMPLATE_CACHE_ENV, raising=False)
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        stale = tmp_path / f"code_score_template_cache-{os.getuid()}"
+        stale.mkdir(mode=0o777)
+        stale.chmod(0o777)
+
+        loader = TemplateLoader()
+
+        assert loader.cache_dir == stale
+        assert stat.S_IMODE(stale.stat().st_mode) == 0o700
+
+    def test_directory_writable_by_others_is_refused(self, template_file: Path, tmp_path: Path):
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        shared.chmod(0o777)
+        (shared / "planted.security.json").write_text(json.dumps({"error": None}))
+
+        loader = TemplateLoader(cache_dir=shared)
+        loader.compile_template(loader.load_template(str(template_file)))
+
+        assert loader.cache_dir is None
+        assert [path.name for path in shared.iterdir()] == ["planted.security.json"]
+
+    def test_clear_cache_on_disk(self, template_file: Path, tmp_path: Path):
+        cache_dir = tmp_path / "cache"
+        loader = TemplateLoader(cache_dir=cache_dir)
+        loader.validate_template_syntax_only(str(template_file))
+        loader.compile_template(loader.load_template(str(template_file)))
+
+        loader.clear_cache(on_disk=True)
+
+        assert list(cache_dir.iterdir()) == []
+
+
+class TestSecurityVerdictCache:
+    """Tests for cached security scan results."""
+
+    def test_verdict_is_shared_across_loaders(self, template_file: Path, tmp_path: Path):
+        cache_dir = tmp_path / "cache"
+        TemplateLoader(cache_dir=cache_dir).validate_template_syntax_only(str(template_file))
+
+        loader = TemplateLoader(cache_dir=cache_dir)
+        assert loader.validate_template_syntax_only(str(template_file)) is True
+        assert loader.cache_stats == {"bytecode_hits": 0, "bytecode_misses": 0,
+                                      "security_hits": 1, "security_misses": 0}
+
+    def test_rejection_is_cached_with_its_message(self, tmp_path: Path):
+        path = tmp_path / "bad.md"
+        path.write_text("{{ os.system('id') }}")
+        cache_dir = tmp_path / "cache"
+        with pytest.raises(TemplateValidationError, match="dangerous pattern: os."):
+            TemplateLoader(cache_dir=cache_dir).validate_template_syntax_only(str(path))
+
+        loader = TemplateLoader(cache_dir=cache_dir)
+        with pytest.raises(TemplateValidationError, match="dangerous pattern: os."):
+            loader.validate_template_syntax_only(str(path))
+        assert loader.cache_stats["security_hits"] == 1
+
+    def test_edited_template_is_rescanned(self, template_file: Path, tmp_path: Path):
+        loader = TemplateLoader(cache_dir=tmp_path / "cache")
+        loader.validate_template_syntax_only(str(template_file))
+
+        template_file.write_text("{{ eval('1') }}")
+
+        with pytest.raises(TemplateValidationError, match="dangerous pattern"):
+            loader.validate_template_syntax_only(str(template_file))
+        assert loader.cache_stats["security_misses"] == 2
@@ -0,0 +1,124 @@
+"""Unit tests for the reusable checkout workspace pool.
+
+NO MOCKS - Uses real Git repositories cloned over file:// URLs.
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.metrics.git_operations import GitOperationError, GitOperations
+from src.metrics.workspace_pool import WorkspacePool
+
+
+def _git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def _make_repo(path: Path) -> Path:
+    path.mkdir(parents=True)
+    _git(path, "init")
+    _git(path, "config", "user.name", "Test User")
+    _git(path, "config", "user.email", "test@example.com")
+    _commit(path, "README.md", "# Sample\n")
+    return path
+
+
+def _commit(repo: Path, name: str, content: str) -> str:
+    (repo / name).write_text(content)
+    _git(repo, "add", name)
+    _git(repo, "commit", "-m", f"Update {name}")
+    return _git(repo, "rev-parse", "HEAD")
+
+
+class TestWorkspacePool:
+    """Tests for slot handout, recycling and quotas."""
+
+    @pytest.fixture
+    def source(self, tmp_path: Path) -> Path:
+        return _make_repo(tmp_path / "source")
+
+    def test_slots_are_precreated(self, tmp_path: Path):
+        pool = WorkspacePool(tmp_path / "pool", pool_size=3)
+
+        assert sorted(p.name for p in pool.root.iterdir() if p.is_dir()) == ["ws-00", "ws-01", "ws-02"]
+
+    def test_same_repository_is_recycled_and_cleaned(self, tmp_path: Path, source: Path):
+        pool = WorkspacePool(tmp_path / "pool", pool_size=2)
+        git_ops = GitOperations(timeout_seconds=30, workspace_pool=pool)
+        url = f"file://{source}"
+
+        first = git_ops.clone_repository(url)
+        checkout = Path(first.local_path)
+        (checkout / "node_modules").mkdir()
+        (checkout / "node_modules" / "junk.js").write_text("x")
+        (checkout / "README.md").write_text("modified\n")
+        assert git_ops.workspace_usage(first)["reused"] is False
+        git_ops.cleanup_repository(first)
+
+        new_head = _commit(source, "app.py", "print('v2')\n")
+        second = git_ops.clone_repository(url)
+
+        assert second.local_path == first.local_path
+        assert git_ops.workspace_usage(second)["reused"] is True
+        assert second.commit_sha == new_head
+        assert not (checkout / "node_modules").exists()
+        assert (checkout / "README.md").read_text() == "# Sample\n"
+        git_ops.cleanup_repository(second)
+        assert pool.stats["reused"] == 1 and pool.stats["fresh"] == 1
+
+    def test_recycle_checks_out_requested_commit(self, tmp_path: Path, source: Path):
+        old_commit = _git(source, "rev-parse", "HEAD")
+        _commit(source, "app.py", "print('v2')\n")
+        git_ops = GitOperations(timeout_seconds=30, workspace_pool=WorkspacePool(tmp_path / "pool"))
+        url = f"file://{source}"
+
+        git_ops.cleanup_repository(git_ops.clone_repository(url))
+        pinned = git_ops.clone_repository(url, old_commit)
+
+        assert pinned.commit_sha == old_commit
+        assert git_ops.workspace_usage(pinned)["reused"] is True
+        assert not (Path(pinned.local_path) / "app.py").exists()
+        git_ops.cleanup_repository(pinned)
+
+    def test_other_repository_gets_empty_slot(self, tmp_path: Path, source: Path):
+        other = _make_repo(tmp_path / "other")
+        git_ops = GitOperations(timeout_seconds=30, workspace_pool=WorkspacePool(tmp_path / "pool", pool_size=2))
+
+        first = git_ops.clone_repository(f"file://{source}")
+        git_ops.cleanup_repository(first)
+        second = git_ops.clone_repository(f"file://{other}")
+
+        assert Path(second.local_path).parent != Path(first.local_path).parent
+        assert Path(first.local_path).exists()  # kept for the next job of that repository
+        git_ops.cleanup_repository(second)
+
+    def test_quota_rejects_large_checkout(self, tmp_path: Path, source: Path):
+        _commit(source, "data.bin", "x" * 200_000)
+        pool = WorkspacePool(tmp_path / "pool", pool_size=1, quota_mb=0.05)
+        git_ops = GitOperations(timeout_seconds=30, workspace_pool=pool)
+
+        with pytest.raises(GitOperationError, match="workspace quota"):
+            git_ops.clone_repository(f"file://{source}")
+
+        assert pool.stats["quota_rejections"] == 1
+        # The slot was released and can be handed out again
+        workspace = pool.acquire("https://example.com/next.git")
+        assert workspace.previous_url is None
+        pool.release(workspace)
+
+    def test_acquire_times_out_when_all_slots_busy(self, tmp_path: Path):
+        pool = WorkspacePool(tmp_path / "pool", pool_size=1, acquire_timeout=0.2)
+        busy = pool.acquire("https://example.com/a.git")
+
+        with pytest.raises(TimeoutError):
+            WorkspacePool(tmp_path / "pool", pool_size=1, acquire_timeout=0.2).acquire("https://example.com/b.git")
+        pool.release(busy)
+
+    def test_invalid_pool_settings_rejected(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            WorkspacePool(tmp_path, pool_size=0)
+        with pytest.raises(ValueError):
+            WorkspacePool(tmp_path, quota_mb=0)